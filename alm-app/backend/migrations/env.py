@@ -19,6 +19,7 @@ import alm.relationship.infrastructure.models  # noqa: F401
 import alm.shared.audit.models  # noqa: F401
 import alm.shared.infrastructure.domain_event_outbox  # noqa: F401 — domain_event_outbox table metadata
 import alm.project_tag.infrastructure.models  # noqa: F401
+import alm.quality.infrastructure.models  # noqa: F401
 
 config = context.config
 config.set_main_option("sqlalchemy.url", str(settings.database_url))
@@ -0,0 +1,28 @@
+"""Composite index for latest-snapshot lookups (DISTINCT ON global_id ORDER BY version DESC).
+
+Revision ID: 060
+Revises: 059
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "060"
+down_revision = "059"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_snapshot_global_id_version",
+        "audit_snapshots",
+        ["global_id", "version"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_snapshot_global_id_version", table_name="audit_snapshots")
@@ -0,0 +1,38 @@
+"""Composite indexes for keyset pagination of artifact lists (sort column + id tiebreaker).
+
+Revision ID: 061
+Revises: 060
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "061"
+down_revision = "060"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_artifacts_project_created_id",
+        "artifacts",
+        ["project_id", "created_at", "id"],
+        unique=False,
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+    op.create_index(
+        "ix_artifacts_project_updated_id",
+        "artifacts",
+        ["project_id", "updated_at", "id"],
+        unique=False,
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_artifacts_project_updated_id", table_name="artifacts")
+    op.drop_index("ix_artifacts_project_created_id", table_name="artifacts")
@@ -0,0 +1,30 @@
+"""Partial index for grouped per-cycle effort aggregation (velocity / burndown).
+
+Revision ID: 062
+Revises: 061
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "062"
+down_revision = "061"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_artifacts_project_cycle_state",
+        "artifacts",
+        ["project_id", "cycle_id", "state"],
+        unique=False,
+        postgresql_where=sa.text("deleted_at IS NULL AND cycle_id IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_artifacts_project_cycle_state", table_name="artifacts")
@@ -0,0 +1,55 @@
+"""Daily per-cycle burndown snapshots (total / completed effort per day).
+
+Revision ID: 063
+Revises: 062
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "063"
+down_revision = "062"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "cycle_burndown_snapshots",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("project_id", sa.Uuid(), nullable=False),
+        sa.Column("cycle_id", sa.Uuid(), nullable=False),
+        sa.Column("effort_field", sa.String(length=100), nullable=False),
+        sa.Column("snapshot_date", sa.Date(), nullable=False),
+        sa.Column("total_effort", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("completed_effort", sa.Float(), nullable=False, server_default="0"),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["project_id"], ["projects.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["cycle_id"], ["cycle_nodes.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "cycle_id",
+            "effort_field",
+            "snapshot_date",
+            name="uq_cycle_burndown_snapshots_cycle_field_date",
+        ),
+    )
+    op.create_index(
+        "ix_cycle_burndown_snapshots_project_id",
+        "cycle_burndown_snapshots",
+        ["project_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_cycle_burndown_snapshots_project_id", table_name="cycle_burndown_snapshots")
+    op.drop_table("cycle_burndown_snapshots")
@@ -0,0 +1,54 @@
+"""Normalized per-test execution results of saved test-runs (last execution status lookups).
+
+Existing runs are indexed by ``scripts/backfill_test_execution_results.py``.
+
+Revision ID: 064
+Revises: 063
+Create Date: 2026-10-17
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision = "064"
+down_revision = "063"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "test_execution_results",
+        sa.Column("run_id", sa.Uuid(), nullable=False),
+        sa.Column("result_index", sa.Integer(), nullable=False),
+        sa.Column("project_id", sa.Uuid(), nullable=False),
+        sa.Column("test_id", sa.Uuid(), nullable=False),
+        sa.Column("status", sa.String(length=20), nullable=False),
+        sa.Column("configuration_id", sa.Text(), nullable=True),
+        sa.Column("configuration_name", sa.Text(), nullable=True),
+        sa.Column("param_row_index", sa.Integer(), nullable=True),
+        sa.Column(
+            "step_results",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            server_default=sa.text("'[]'::jsonb"),
+        ),
+        sa.Column("executed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["run_id"], ["artifacts.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["project_id"], ["projects.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("run_id", "result_index"),
+    )
+    op.create_index(
+        "ix_test_execution_results_project_test_executed",
+        "test_execution_results",
+        ["project_id", "test_id", sa.text("executed_at DESC")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_test_execution_results_project_test_executed", table_name="test_execution_results")
+    op.drop_table("test_execution_results")
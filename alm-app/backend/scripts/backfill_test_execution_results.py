@@ -0,0 +1,92 @@
+#!/usr/bin/env -S uv run python
+"""Backfill test_execution_results from the run_metrics_json of existing test-runs.
+
+Usage:
+  cd alm-app/backend
+  uv run python scripts/backfill_test_execution_results.py --dry-run
+  uv run python scripts/backfill_test_execution_results.py --write [--project-id <uuid>] [--batch-size 500]
+
+Runs are read in id order and each batch is re-indexed in its own transaction (delete + insert per run), so
+the script is idempotent and can be re-run or resumed after an interruption. Runs saved after migration 064 are
+already kept in sync by the artifact repository.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+import uuid
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--write", action="store_true", help="Write index rows (default is a dry run)")
+    parser.add_argument("--dry-run", action="store_true", help="Count runs and result rows without writing")
+    parser.add_argument("--project-id", type=uuid.UUID, default=None, help="Only backfill this project")
+    parser.add_argument("--batch-size", type=int, default=500, help="Runs per transaction")
+    args = parser.parse_args()
+
+    from sqlalchemy import select
+
+    from alm.artifact.domain.entities import Artifact
+    from alm.artifact.infrastructure.models import ArtifactModel
+    from alm.quality.application.run_metrics_v1 import execution_results_from_custom_fields
+    from alm.quality.domain.entities import TEST_RUN_ARTIFACT_TYPE
+    from alm.quality.infrastructure.repositories import SqlAlchemyExecutionResultRepository
+    from alm.shared.infrastructure.db.session import async_session_factory, engine
+
+    write_changes = args.write and not args.dry_run
+    batch_size = max(1, args.batch_size)
+    after_id: uuid.UUID | None = None
+    run_count = 0
+    row_count = 0
+
+    while True:
+        async with async_session_factory() as session:
+            stmt = (
+                select(ArtifactModel)
+                .where(
+                    ArtifactModel.artifact_type == TEST_RUN_ARTIFACT_TYPE,
+                    ArtifactModel.deleted_at.is_(None),
+                )
+                .order_by(ArtifactModel.id)
+                .limit(batch_size)
+            )
+            if args.project_id is not None:
+                stmt = stmt.where(ArtifactModel.project_id == args.project_id)
+            if after_id is not None:
+                stmt = stmt.where(ArtifactModel.id > after_id)
+            models = (await session.execute(stmt)).scalars().all()
+            if not models:
+                break
+            runs = [
+                Artifact(
+                    project_id=m.project_id,
+                    artifact_type=m.artifact_type,
+                    title=m.title,
+                    state=m.state,
+                    id=m.id,
+                    custom_fields=m.custom_fields or {},
+                    updated_at=m.updated_at,
+                )
+                for m in models
+            ]
+            run_count += len(runs)
+            row_count += sum(len(execution_results_from_custom_fields(r.id, r.custom_fields)) for r in runs)
+            if write_changes:
+                await SqlAlchemyExecutionResultRepository(session).replace_for_runs(runs)
+                await session.commit()
+            after_id = models[-1].id
+        print(f"processed {run_count} runs ({row_count} result rows)")
+
+    await engine.dispose()
+    mode = "write" if write_changes else "dry-run"
+    print(f"test_execution_results backfill completed in {mode} mode: {run_count} runs, {row_count} result rows.")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
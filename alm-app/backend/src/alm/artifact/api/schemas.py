@@ -94,7 +94,9 @@ class ArtifactResponse(BaseModel):
 
 class ArtifactListResponse(BaseModel):
     items: list[ArtifactResponse]
-    total: int
+    total: int | None = Field(None, description="Null when total_mode=none and more pages follow")
+    total_is_estimate: bool = False
+    next_cursor: str | None = Field(None, description="Pass as cursor to fetch the next page; null on the last page")
     # Permission-aware UI: same as per-item when list non-empty; set when empty for e.g. "New artifact" button
     allowed_actions: list[str] = Field(default_factory=list)
 
@@ -164,6 +166,13 @@ class BatchTransitionRequest(BaseModel):
     )
     state_reason: str | None = None
     resolution: str | None = None
+    mode: Literal["partial", "atomic"] = Field(
+        default="partial",
+        description="partial: apply every item that passes; atomic: apply nothing unless every item passes",
+    )
+    expected_updated_at: dict[uuid.UUID, str] | None = Field(
+        default=None, description="Optional optimistic lock per artifact id (ISO datetime); mismatch -> conflict_error"
+    )
 
     @model_validator(mode="after")
     def require_new_state_or_trigger(self) -> BatchTransitionRequest:
@@ -184,7 +193,7 @@ class BatchResultResponse(BaseModel):
         default=None,
         description=(
             "Per-artifact result: artifact_id -> "
-            "'ok' | 'validation_error' | 'guard_denied' | 'policy_denied' | 'conflict_error'"
+            "'ok' | 'validation_error' | 'guard_denied' | 'policy_denied' | 'conflict_error' | 'aborted' | 'write_error'"
         ),
     )
 
@@ -0,0 +1,207 @@
+"""Transition many artifacts of one project in a single unit of work."""
+
+from __future__ import annotations
+
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+import structlog
+
+from alm.artifact.application.commands.transition_artifact import TransitionPlan, plan_transition
+from alm.artifact.domain.action_runner import run_actions
+from alm.process_template.domain.ports import ProcessTemplateRepository
+from alm.project.application.services.effective_process_template_version import (
+    effective_compiled_manifest,
+)
+from alm.project.domain.ports import ProjectRepository
+from alm.shared.application.command import Command, CommandHandler
+from alm.shared.domain.exceptions import ConflictError, GuardDeniedError, PolicyDeniedError, ValidationError
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from alm.artifact.domain.entities import Artifact
+    from alm.artifact.domain.ports import ArtifactRepository, IArtifactTransitionMetrics
+
+BATCH_RESULT_OK = "ok"
+BATCH_RESULT_VALIDATION_ERROR = "validation_error"
+BATCH_RESULT_GUARD_DENIED = "guard_denied"
+BATCH_RESULT_POLICY_DENIED = "policy_denied"
+BATCH_RESULT_CONFLICT = "conflict_error"
+BATCH_RESULT_ABORTED = "aborted"  # all_or_nothing: valid item not applied because another item failed
+BATCH_RESULT_WRITE_ERROR = "write_error"  # the database rejected the item's row (constraint or data error)
+
+_CONCURRENT_EDIT_MESSAGE = "Artifact was modified by someone else while the batch was applied."
+_ABORTED_MESSAGE = "Not applied: other artifacts in the batch failed"
+_WRITE_ERROR_MESSAGE = "Not applied: the database rejected the change to this artifact."
+
+
+@dataclass(frozen=True)
+class BatchTransitionArtifacts(Command):
+    tenant_id: uuid.UUID
+    project_id: uuid.UUID
+    artifact_ids: tuple[uuid.UUID, ...]
+    new_state: str | None = None
+    trigger: str | None = None
+    state_reason: str | None = None
+    resolution: str | None = None
+    updated_by: uuid.UUID | None = None
+    actor_roles: tuple[str, ...] | None = None
+    expected_updated_at: dict[uuid.UUID, str] | None = None  # optional per-artifact optimistic lock
+    all_or_nothing: bool = False  # False: apply every valid item; True: apply nothing unless all succeed
+
+
+@dataclass
+class BatchTransitionResult:
+    """Per-artifact outcome (``BATCH_RESULT_*``) plus a message for every item that was not applied."""
+
+    results: dict[uuid.UUID, str] = field(default_factory=dict)
+    errors: dict[uuid.UUID, str] = field(default_factory=dict)
+
+    @property
+    def success_count(self) -> int:
+        return sum(1 for r in self.results.values() if r == BATCH_RESULT_OK)
+
+    def fail(self, artifact_id: uuid.UUID, result: str, message: str) -> None:
+        self.results[artifact_id] = result
+        self.errors[artifact_id] = message
+
+
+class BatchTransitionArtifactsHandler(CommandHandler[BatchTransitionResult]):
+    """Loads all targets in one query, plans against one compiled manifest and writes with one UPDATE.
+
+    Audit snapshots and outbox rows for the written artifacts are flushed in bulk by the mediator.
+    """
+
+    def __init__(
+        self,
+        artifact_repo: ArtifactRepository,
+        project_repo: ProjectRepository,
+        process_template_repo: ProcessTemplateRepository,
+        metrics: IArtifactTransitionMetrics,
+    ) -> None:
+        self._artifact_repo = artifact_repo
+        self._project_repo = project_repo
+        self._process_template_repo = process_template_repo
+        self._metrics = metrics
+
+    async def handle(self, command: Command) -> BatchTransitionResult:
+        assert isinstance(command, BatchTransitionArtifacts)
+        start = time.monotonic()
+        result = await self._handle_impl(command)
+        self._metrics.record_duration_seconds(time.monotonic() - start)
+        for outcome in result.results.values():
+            self._metrics.record_result("success" if outcome == BATCH_RESULT_OK else outcome)
+        return result
+
+    async def _handle_impl(self, command: BatchTransitionArtifacts) -> BatchTransitionResult:
+        if not command.trigger and not command.new_state:
+            raise ValidationError("Either trigger or new_state is required")
+
+        project = await self._project_repo.find_by_id(command.project_id)
+        if project is None or project.tenant_id != command.tenant_id:
+            raise ValidationError("Project not found")
+
+        compiled = await effective_compiled_manifest(self._process_template_repo, project.process_template_version_id)
+        if compiled is None:
+            raise ValidationError("No process template available for this project")
+
+        artifact_ids = list(dict.fromkeys(command.artifact_ids))
+        loaded = {a.id: a for a in await self._artifact_repo.list_by_ids_in_project(command.project_id, artifact_ids)}
+        expected = command.expected_updated_at or {}
+
+        result = BatchTransitionResult()
+        planned: list[tuple[Artifact, TransitionPlan]] = []
+        for artifact_id in artifact_ids:
+            artifact = loaded.get(artifact_id)
+            if artifact is None:
+                result.fail(artifact_id, BATCH_RESULT_VALIDATION_ERROR, "Artifact not found")
+                continue
+            try:
+                plan = plan_transition(
+                    compiled,
+                    artifact,
+                    new_state=command.new_state,
+                    trigger=command.trigger,
+                    state_reason=command.state_reason,
+                    resolution=command.resolution,
+                    expected_updated_at=expected.get(artifact_id),
+                    tenant_id=command.tenant_id,
+                    updated_by=command.updated_by,
+                    actor_roles=command.actor_roles,
+                )
+            except GuardDeniedError as e:
+                result.fail(artifact_id, BATCH_RESULT_GUARD_DENIED, str(e))
+            except PolicyDeniedError as e:
+                result.fail(artifact_id, BATCH_RESULT_POLICY_DENIED, str(e))
+            except ConflictError as e:
+                result.fail(artifact_id, BATCH_RESULT_CONFLICT, str(e))
+            except ValidationError as e:
+                result.fail(artifact_id, BATCH_RESULT_VALIDATION_ERROR, str(e))
+            else:
+                planned.append((artifact, plan))
+
+        if command.all_or_nothing and result.errors:
+            for artifact, _ in planned:
+                result.fail(artifact.id, BATCH_RESULT_ABORTED, _ABORTED_MESSAGE)
+            return result
+        if not planned:
+            return result
+
+        loaded_updated_at: dict[uuid.UUID, datetime | None] = {}
+        from_states: dict[uuid.UUID, str] = {}
+        for artifact, plan in planned:
+            loaded_updated_at[artifact.id] = getattr(artifact, "updated_at", None)
+            from_states[artifact.id] = artifact.state
+            run_actions(
+                plan.actions["on_leave"],
+                artifact_id=artifact.id,
+                project_id=artifact.project_id,
+                from_state=artifact.state,
+                to_state=plan.to_state,
+            )
+            artifact.transition(
+                plan.to_state,
+                state_reason=command.state_reason,
+                resolution=plan.resolution,
+                tenant_id=command.tenant_id,
+            )
+            artifact.updated_by = command.updated_by
+
+        write = await self._artifact_repo.apply_transitions(
+            [a for a, _ in planned],
+            loaded_updated_at,
+            all_or_nothing=command.all_or_nothing,
+        )
+
+        for artifact, plan in planned:
+            if artifact.id in write.failed:
+                result.fail(artifact.id, BATCH_RESULT_WRITE_ERROR, _WRITE_ERROR_MESSAGE)
+                continue
+            if artifact.id in write.conflicted:
+                result.fail(artifact.id, BATCH_RESULT_CONFLICT, _CONCURRENT_EDIT_MESSAGE)
+                continue
+            if artifact.id not in write.written:
+                result.fail(artifact.id, BATCH_RESULT_ABORTED, _ABORTED_MESSAGE)
+                continue
+            run_actions(
+                plan.actions["on_enter"],
+                artifact_id=artifact.id,
+                project_id=artifact.project_id,
+                from_state=from_states[artifact.id],
+                to_state=plan.to_state,
+            )
+            result.results[artifact.id] = BATCH_RESULT_OK
+
+        structlog.get_logger().info(
+            "artifact_batch_transition",
+            project_id=str(command.project_id),
+            requested=len(artifact_ids),
+            applied=result.success_count,
+            all_or_nothing=command.all_or_nothing,
+            trigger=command.trigger,
+            to_state=command.new_state,
+        )
+        return result
@@ -49,6 +49,55 @@ class CreateArtifact(Command):
     tag_ids: list[uuid.UUID] | None = None
 
 
+QUALITY_PARENT_TYPES: dict[str, str] = {
+    "test-case": "quality-folder",
+    "test-suite": "testsuite-folder",
+    "test-run": "testsuite-folder",
+    "test-campaign": "testsuite-folder",
+}
+
+
+def validate_artifact_placement(
+    manifest: dict[str, Any],
+    artifact_type: str,
+    parent_artifact_type: str | None,
+    *,
+    ast: Any,
+) -> None:
+    """Manifest hierarchy rules for a new artifact under a parent of ``parent_artifact_type`` (None = no parent).
+
+    Pure (no I/O) so bulk import can apply the same rules as ``CreateArtifactHandler``.
+    """
+    type_def = get_artifact_type_def(manifest, artifact_type, ast=ast)
+    system_roots = resolve_system_root_artifact_types(manifest)
+    parent_types = (type_def.get("parent_types") or []) if type_def else []
+    expected_parent_type = QUALITY_PARENT_TYPES.get(artifact_type)
+
+    if parent_artifact_type is not None:
+        if not is_valid_parent_child(manifest, parent_artifact_type, artifact_type, ast=ast):
+            raise ValidationError(
+                f"Artifact type '{artifact_type}' cannot be child of '{parent_artifact_type}' per manifest hierarchy"
+            )
+        if expected_parent_type and parent_artifact_type != expected_parent_type:
+            raise ValidationError(f"Artifact type '{artifact_type}' must be created under a '{expected_parent_type}'")
+        return
+
+    if type_def and parent_types and all(p in system_roots for p in parent_types):
+        raise ValidationError(
+            f"Artifact type '{artifact_type}' must be created under a project root (Requirements, Quality, or Defects)"
+        )
+    if expected_parent_type:
+        raise ValidationError(f"Artifact type '{artifact_type}' must be created under a '{expected_parent_type}'")
+    if is_system_root_artifact_type(artifact_type, manifest):
+        raise ValidationError(
+            "System tree roots are created when the project is set up and cannot be added via the artifact API."
+        )
+    raise ValidationError(
+        "A parent artifact is required (parent_id). "
+        "Create work items under the correct root or folder for this process template."
+    )
+
+
 class CreateArtifactHandler(CommandHandler[ArtifactDTO]):
     def __init__(
         self,
@@ -84,7 +133,6 @@ class CreateArtifactHandler(CommandHandler[ArtifactDTO]):
             raise ValidationError(f"Artifact type '{command.artifact_type}' not defined in manifest")
 
         type_def = get_artifact_type_def(manifest, command.artifact_type, ast=ast)
-        system_roots = resolve_system_root_artifact_types(manifest)
         parent_types = (type_def.get("parent_types") or []) if type_def else []
 
         effective_parent_id = command.parent_id
@@ -102,60 +150,13 @@ class CreateArtifactHandler(CommandHandler[ArtifactDTO]):
                 )
             effective_parent_id = roots[0].id
 
-        if (
-            type_def
-            and effective_parent_id is None
-            and parent_types
-            and all(p in system_roots for p in parent_types)
-        ):
-            raise ValidationError(
-                f"Artifact type '{command.artifact_type}' must be created under a project root "
-                "(Requirements, Quality, or Defects)"
-            )
-
+        parent_artifact_type: str | None = None
         if effective_parent_id is not None:
             parent = await self._artifact_repo.find_by_id(effective_parent_id)
             if parent is None or parent.project_id != command.project_id:
                 raise ValidationError("Parent artifact not found or belongs to another project")
-            if not is_valid_parent_child(manifest, parent.artifact_type, command.artifact_type, ast=ast):
-                raise ValidationError(
-                    f"Artifact type '{command.artifact_type}' cannot be child of "
-                    f"'{parent.artifact_type}' per manifest hierarchy"
-                )
-            quality_parent_map = {
-                "test-case": "quality-folder",
-                "test-suite": "testsuite-folder",
-                "test-run": "testsuite-folder",
-                "test-campaign": "testsuite-folder",
-            }
-            expected_parent_type = quality_parent_map.get(command.artifact_type)
-            if expected_parent_type and parent.artifact_type != expected_parent_type:
-                raise ValidationError(
-                    f"Artifact type '{command.artifact_type}' must be created under a '{expected_parent_type}'"
-                )
-        elif effective_parent_id is None:
-            quality_parent_map = {
-                "test-case": "quality-folder",
-                "test-suite": "testsuite-folder",
-                "test-run": "testsuite-folder",
-                "test-campaign": "testsuite-folder",
-            }
-            expected_parent_type = quality_parent_map.get(command.artifact_type)
-            if expected_parent_type:
-                raise ValidationError(
-                    f"Artifact type '{command.artifact_type}' must be created under a '{expected_parent_type}'"
-                )
-
-        if effective_parent_id is None and is_system_root_artifact_type(command.artifact_type, manifest):
-            raise ValidationError(
-                "System tree roots are created when the project is set up and cannot be added via the artifact API."
-            )
-
-        if effective_parent_id is None:
-            raise ValidationError(
-                "A parent artifact is required (parent_id). "
-                "Create work items under the correct root or folder for this process template."
-            )
+            parent_artifact_type = parent.artifact_type
+        validate_artifact_placement(manifest, command.artifact_type, parent_artifact_type, ast=ast)
 
         artifact_key = command.artifact_key
         if artifact_key is None or artifact_key.strip() == "":
@@ -183,6 +184,7 @@ class CreateArtifactHandler(CommandHandler[ArtifactDTO]):
             area_node_id=command.area_node_id,
             area_path_snapshot=area_path_snapshot,
             team_id=command.team_id,
+            tenant_id=command.tenant_id,
         )
         artifact.created_by = command.created_by
         await self._artifact_repo.add(artifact)
@@ -12,13 +12,11 @@ import structlog
 from alm.artifact.application.dtos import ArtifactDTO
 from alm.artifact.domain.action_runner import run_actions
 from alm.artifact.domain.guard_evaluator import evaluate_guard, guard_user_message_for_failure
-from alm.artifact.domain.manifest_merge_defaults import merge_manifest_metadata_defaults
 from alm.artifact.domain.manifest_workflow_metadata import get_resolution_target_state_ids
 from alm.artifact.domain.mpc_resolver import (
     build_artifact_transition_policy_event,
     evaluate_transition_policy,
     get_artifact_type_def,
-    get_manifest_ast,
     get_transition_actions,
     get_workflow_transition_options,
 )
@@ -33,10 +31,12 @@ from alm.shared.domain.exceptions import ConflictError, GuardDeniedError, Policy
 if TYPE_CHECKING:
     import uuid
 
+    from alm.artifact.domain.entities import Artifact
+    from alm.artifact.domain.manifest_cache import CompiledManifest
     from alm.artifact.domain.ports import ArtifactRepository, IArtifactTransitionMetrics
 from alm.process_template.domain.ports import ProcessTemplateRepository
 from alm.project.application.services.effective_process_template_version import (
-    effective_process_template_version,
+    effective_compiled_manifest,
 )
 from alm.project.domain.ports import ProjectRepository
 
@@ -55,6 +55,132 @@ class TransitionArtifact(Command):
     actor_roles: tuple[str, ...] | None = None  # for MPC PolicyEngine (D1)
 
 
+@dataclass(frozen=True)
+class TransitionPlan:
+    """Validated outcome of ``plan_transition``: target state, effective resolution and hook actions."""
+
+    to_state: str
+    resolution: str | None
+    actions: dict[str, list[str]]
+
+
+def plan_transition(
+    compiled: CompiledManifest,
+    artifact: Artifact,
+    *,
+    new_state: str | None,
+    trigger: str | None,
+    state_reason: str | None,
+    resolution: str | None,
+    expected_updated_at: str | None,
+    tenant_id: uuid.UUID,
+    updated_by: uuid.UUID | None,
+    actor_roles: tuple[str, ...] | None,
+) -> TransitionPlan:
+    """Workflow, optimistic-lock, guard, policy and reason/resolution checks for one artifact (no I/O).
+
+    Raises ``ValidationError`` / ``ConflictError`` / ``GuardDeniedError`` / ``PolicyDeniedError``. Shared by
+    ``TransitionArtifactHandler`` and the batch handler so both enforce identical rules.
+    """
+    manifest = compiled.manifest_bundle
+    ast = compiled.ast
+    version_id = compiled.version_id
+
+    # Resolve trigger to target state when client sent trigger
+    if trigger:
+        permitted = get_permitted_triggers(
+            manifest, artifact.artifact_type, artifact.state, ast=ast, version_id=version_id
+        )
+        match = next((p for p in permitted if p[0] == trigger), None)
+        if not match:
+            raise ValidationError(f"Trigger '{trigger}' is not permitted from state '{artifact.state}'")
+        to_state = match[1]
+    else:
+        to_state = (new_state or "").strip()
+        if not to_state:
+            raise ValidationError("new_state is required when trigger is not set")
+
+    if expected_updated_at and (s := expected_updated_at.strip()):
+        try:
+            expected_dt = datetime.fromisoformat(s.replace("Z", "+00:00"))
+        except ValueError:
+            pass
+        else:
+            server_dt = getattr(artifact, "updated_at", None)
+            if server_dt is not None:
+                if server_dt.tzinfo is None:
+                    server_dt = server_dt.replace(tzinfo=UTC)
+                if expected_dt.tzinfo is None:
+                    expected_dt = expected_dt.replace(tzinfo=UTC)
+                if server_dt != expected_dt:
+                    raise ConflictError(
+                        "Artifact was modified by someone else. Refresh or choose Overwrite to apply your change."
+                    )
+
+    if not workflow_is_valid_transition(
+        manifest,
+        artifact.artifact_type,
+        artifact.state,
+        to_state,
+        ast=ast,
+        version_id=version_id,
+    ):
+        raise ValidationError(f"Transition from '{artifact.state}' to '{to_state}' not allowed")
+
+    snapshot = artifact.to_snapshot_dict()
+    guard = get_transition_guard(
+        manifest,
+        artifact.artifact_type,
+        artifact.state,
+        to_state,
+        ast=ast,
+        version_id=version_id,
+    )
+    if not evaluate_guard(guard, snapshot):
+        raise GuardDeniedError(guard_user_message_for_failure(guard))
+
+    event = build_artifact_transition_policy_event(
+        artifact_id=artifact.id,
+        artifact_type=artifact.artifact_type,
+        from_state=artifact.state,
+        to_state=to_state,
+        assignee_id=snapshot.get("assignee_id"),
+        custom_fields=snapshot.get("custom_fields") if isinstance(snapshot.get("custom_fields"), dict) else None,
+        project_id=artifact.project_id,
+        tenant_id=tenant_id,
+        updated_by=updated_by,
+        actor_roles=actor_roles,
+    )
+    allow, policy_violations = evaluate_transition_policy(ast, event, list(actor_roles) if actor_roles else None)
+    if not allow:
+        raise PolicyDeniedError("; ".join(policy_violations) or "Policy check failed")
+
+    at_def = get_artifact_type_def(manifest, artifact.artifact_type, ast=ast)
+    workflow_id = (at_def or {}).get("workflow_id") or ""
+    allowed_reasons, allowed_resolutions = get_workflow_transition_options(manifest, workflow_id)
+    if allowed_reasons and state_reason is not None and state_reason != "" and state_reason not in allowed_reasons:
+        raise ValidationError(f"state_reason must be one of: {', '.join(allowed_reasons)}")
+
+    resolution_targets = get_resolution_target_state_ids(manifest, workflow_id)
+    # When target state requires resolution (per manifest) and workflow has resolution_options
+    effective_resolution = (resolution or "").strip()
+    if allowed_resolutions and resolution is not None and resolution != "" and resolution not in allowed_resolutions:
+        raise ValidationError(f"resolution must be one of: {', '.join(allowed_resolutions)}")
+    if to_state in resolution_targets and allowed_resolutions:
+        if not effective_resolution:
+            non_empty = [r for r in allowed_resolutions if r and str(r).strip()]
+            effective_resolution = (non_empty[0] if non_empty else allowed_resolutions[0]) or ""
+        if not effective_resolution:
+            raise ValidationError(
+                "resolution is required when transitioning to a state that requires resolution (see manifest workflow)"
+            )
+
+    actions = get_transition_actions(
+        manifest, artifact.artifact_type, artifact.state, to_state, ast=ast, version_id=version_id
+    )
+    return TransitionPlan(to_state=to_state, resolution=effective_resolution or resolution, actions=actions)
+
+
 class TransitionArtifactHandler(CommandHandler[ArtifactDTO]):
     def __init__(
         self,
@@ -106,115 +232,25 @@ class TransitionArtifactHandler(CommandHandler[ArtifactDTO]):
         if artifact is None or artifact.project_id != command.project_id:
             raise ValidationError("Artifact not found")
 
-        version = await effective_process_template_version(
-            self._process_template_repo, project.process_template_version_id
-        )
-        if version is None:
+        compiled = await effective_compiled_manifest(self._process_template_repo, project.process_template_version_id)
+        if compiled is None:
             raise ValidationError("No process template available for this project")
-        manifest = merge_manifest_metadata_defaults(version.manifest_bundle or {})
-        ast = get_manifest_ast(version.id, manifest)
-
-        # Resolve trigger to target state when client sent trigger
-        if command.trigger:
-            permitted = get_permitted_triggers(manifest, artifact.artifact_type, artifact.state, ast=ast)
-            match = next((p for p in permitted if p[0] == command.trigger), None)
-            if not match:
-                raise ValidationError(f"Trigger '{command.trigger}' is not permitted from state '{artifact.state}'")
-            new_state = match[1]
-        else:
-            new_state = (command.new_state or "").strip()
-            if not new_state:
-                raise ValidationError("new_state is required when trigger is not set")
-
-        if command.expected_updated_at and (s := command.expected_updated_at.strip()):
-            try:
-                expected_dt = datetime.fromisoformat(s.replace("Z", "+00:00"))
-            except ValueError:
-                pass
-            else:
-                server_dt = getattr(artifact, "updated_at", None)
-                if server_dt is not None:
-                    if server_dt.tzinfo is None:
-                        server_dt = server_dt.replace(tzinfo=UTC)
-                    if expected_dt.tzinfo is None:
-                        expected_dt = expected_dt.replace(tzinfo=UTC)
-                    if server_dt != expected_dt:
-                        raise ConflictError(
-                            "Artifact was modified by someone else. Refresh or choose Overwrite to apply your change."
-                        )
-
-        if not workflow_is_valid_transition(
-            manifest,
-            artifact.artifact_type,
-            artifact.state,
-            new_state,
-            ast=ast,
-        ):
-            raise ValidationError(f"Transition from '{artifact.state}' to '{new_state}' not allowed")
-
-        snapshot = artifact.to_snapshot_dict()
-        guard = get_transition_guard(
-            manifest,
-            artifact.artifact_type,
-            artifact.state,
-            new_state,
-            ast=ast,
-        )
-        if not evaluate_guard(guard, snapshot):
-            raise GuardDeniedError(guard_user_message_for_failure(guard))
 
-        event = build_artifact_transition_policy_event(
-            artifact_id=artifact.id,
-            artifact_type=artifact.artifact_type,
-            from_state=artifact.state,
-            to_state=new_state,
-            assignee_id=snapshot.get("assignee_id"),
-            custom_fields=snapshot.get("custom_fields") if isinstance(snapshot.get("custom_fields"), dict) else None,
-            project_id=command.project_id,
+        plan = plan_transition(
+            compiled,
+            artifact,
+            new_state=command.new_state,
+            trigger=command.trigger,
+            state_reason=command.state_reason,
+            resolution=command.resolution,
+            expected_updated_at=command.expected_updated_at,
             tenant_id=command.tenant_id,
             updated_by=command.updated_by,
             actor_roles=command.actor_roles,
         )
-        allow, policy_violations = evaluate_transition_policy(
-            ast, event, list(command.actor_roles) if command.actor_roles else None
-        )
-        if not allow:
-            raise PolicyDeniedError("; ".join(policy_violations) or "Policy check failed")
-
-        at_def = get_artifact_type_def(manifest, artifact.artifact_type, ast=ast)
-        workflow_id = (at_def or {}).get("workflow_id") or ""
-        allowed_reasons, allowed_resolutions = get_workflow_transition_options(manifest, workflow_id)
-        if (
-            allowed_reasons
-            and command.state_reason is not None
-            and command.state_reason != ""
-            and command.state_reason not in allowed_reasons
-        ):
-            raise ValidationError(f"state_reason must be one of: {', '.join(allowed_reasons)}")
-
-        resolution_targets = get_resolution_target_state_ids(manifest, workflow_id)
-        # When target state requires resolution (per manifest) and workflow has resolution_options
-        effective_resolution = (command.resolution or "").strip()
-        if (
-            allowed_resolutions
-            and command.resolution is not None
-            and command.resolution != ""
-            and command.resolution not in allowed_resolutions
-        ):
-            raise ValidationError(f"resolution must be one of: {', '.join(allowed_resolutions)}")
-        if new_state in resolution_targets and allowed_resolutions:
-            if not effective_resolution:
-                non_empty = [r for r in allowed_resolutions if r and str(r).strip()]
-                effective_resolution = (non_empty[0] if non_empty else allowed_resolutions[0]) or ""
-            if not effective_resolution:
-                raise ValidationError(
-                    "resolution is required when transitioning to a state that requires resolution "
-                    "(see manifest workflow)"
-                )
-
         from_state = artifact.state
-        to_state = new_state
-        actions = get_transition_actions(manifest, artifact.artifact_type, from_state, to_state, ast=ast)
+        to_state = plan.to_state
+        actions = plan.actions
 
         run_actions(
             actions["on_leave"],
@@ -227,7 +263,8 @@ class TransitionArtifactHandler(CommandHandler[ArtifactDTO]):
         artifact.transition(
             to_state,
             state_reason=command.state_reason,
-            resolution=effective_resolution or command.resolution,
+            resolution=plan.resolution,
+            tenant_id=command.tenant_id,
         )
         artifact.updated_by = command.updated_by
         await self._artifact_repo.update(artifact)
@@ -76,6 +76,7 @@ class UpdateArtifactHandler(CommandHandler[ArtifactDTO]):
         old_title = artifact.title
         old_description = artifact.description
         old_custom_fields = dict(artifact.custom_fields or {})
+        old_cycle_id = artifact.cycle_id
         tag_ids_raw = updates.pop("tag_ids", _TAG_IDS_OMITTED)
         manifest: dict = {}
         ast = None
@@ -188,6 +189,8 @@ class UpdateArtifactHandler(CommandHandler[ArtifactDTO]):
             or (artifact.custom_fields or {}) != old_custom_fields
         ):
             artifact.notify_planning_updated_for_traceability()
+        if artifact.cycle_id != old_cycle_id or (artifact.custom_fields or {}) != old_custom_fields:
+            artifact.notify_schedule_changed()
 
         artifact.touch(by=command.updated_by)
         await self._artifact_repo.update(artifact)
@@ -2,35 +2,59 @@
 
 from __future__ import annotations
 
+import asyncio
 import csv
 import io
 import json
+import tempfile
 import uuid
 import zipfile
-from collections import defaultdict
+from collections import defaultdict, deque
+from collections.abc import AsyncIterator, Awaitable, Callable
 from dataclasses import dataclass, field
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
+import structlog
 from openpyxl import Workbook, load_workbook
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from alm.area.infrastructure.repositories import SqlAlchemyAreaRepository
-from alm.artifact.application.commands.create_artifact import CreateArtifact, CreateArtifactHandler
-from alm.artifact.application.commands.update_artifact import UpdateArtifact, UpdateArtifactHandler
-from alm.artifact.application.queries.list_artifacts import ListArtifacts, ListArtifactsHandler
-from alm.artifact.infrastructure.models import ArtifactModel
+from alm.artifact.application.commands.create_artifact import QUALITY_PARENT_TYPES, validate_artifact_placement
+from alm.artifact.application.dtos import ArtifactDTO
+from alm.artifact.application.queries.list_artifacts import (
+    ListArtifacts,
+    ListArtifactsHandler,
+    artifact_to_dto,
+    redact_artifact_dtos,
+)
+from alm.artifact.domain.entities import Artifact
+from alm.artifact.domain.manifest_workflow_metadata import is_system_root_artifact_type
+from alm.artifact.domain.mpc_resolver import get_artifact_type_def, is_valid_parent_child
+from alm.artifact.domain.workflow_sm import get_initial_state as workflow_get_initial_state
 from alm.artifact.infrastructure.repositories import SqlAlchemyArtifactRepository
 from alm.cycle.infrastructure.repositories import SqlAlchemyCycleRepository
 from alm.process_template.infrastructure.repositories import SqlAlchemyProcessTemplateRepository
+from alm.project.application.services.effective_process_template_version import effective_compiled_manifest
 from alm.project.infrastructure.repositories import SqlAlchemyProjectRepository
 from alm.project_tag.infrastructure.repositories import SqlAlchemyProjectTagRepository
+from alm.shared.audit.interceptor import ACTOR_ID_KEY, TENANT_ID_KEY, AuditInterceptor
 from alm.shared.domain.exceptions import ValidationError
 
+if TYPE_CHECKING:
+    from alm.artifact.domain.manifest_cache import CompiledManifest
+
+logger = structlog.get_logger()
+
 ExportFormat = Literal["csv", "xlsx"]
 ImportScope = Literal["generic", "testcases", "runs"]
 ImportMode = Literal["create", "update", "upsert"]
 ImportRowStatus = Literal["created", "updated", "validated", "skipped", "failed"]
 
+_XLSX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+_EXPORT_PAGE_SIZE = 1000
+_EXPORT_READ_CHUNK = 64 * 1024
+
 CORE_EXPORT_COLUMNS = [
     "artifact_key",
     "artifact_type",
@@ -132,6 +156,13 @@ class ArtifactExportResult:
     content: bytes
 
 
+@dataclass(slots=True)
+class ArtifactExportStream:
+    filename: str
+    content_type: str
+    chunks: AsyncIterator[bytes]
+
+
 @dataclass(slots=True)
 class ArtifactImportRowResult:
     row_number: int
@@ -226,42 +257,35 @@ def _coerce_custom_field(raw: str) -> Any:
     return raw
 
 
-def _build_path_map(artifacts: list[ArtifactModel]) -> tuple[dict[uuid.UUID, str], dict[uuid.UUID, str | None]]:
-    by_id = {artifact.id: artifact for artifact in artifacts}
+_HierarchyRow = tuple[uuid.UUID, uuid.UUID | None, str, str | None]  # (id, parent_id, title, artifact_key)
+
+
+def _build_path_map(rows: list[_HierarchyRow]) -> tuple[dict[uuid.UUID, str], dict[uuid.UUID, str | None]]:
+    by_id = {row[0]: row for row in rows}
     cache: dict[uuid.UUID, str] = {}
     parent_keys: dict[uuid.UUID, str | None] = {}
 
     def resolve_path(artifact_id: uuid.UUID) -> str:
         if artifact_id in cache:
             return cache[artifact_id]
-        artifact = by_id[artifact_id]
+        _, parent_id, title, _ = by_id[artifact_id]
         parent_key: str | None = None
-        if artifact.parent_id and artifact.parent_id in by_id:
-            parent_key = by_id[artifact.parent_id].artifact_key
-            path = f"{resolve_path(artifact.parent_id)}/{artifact.title}"
+        if parent_id and parent_id in by_id:
+            parent_key = by_id[parent_id][3]
+            path = f"{resolve_path(parent_id)}/{title}"
         else:
-            path = artifact.title
+            path = title
         cache[artifact_id] = path
         parent_keys[artifact_id] = parent_key
         return path
 
-    for artifact in artifacts:
-        resolve_path(artifact.id)
+    for row in rows:
+        resolve_path(row[0])
     return cache, parent_keys
 
 
-def _iter_custom_field_keys(artifacts: list[ArtifactModel], *, exclude_test_steps: bool = False) -> list[str]:
-    keys: set[str] = set()
-    for artifact in artifacts:
-        for key in artifact.custom_fields or {}:
-            if exclude_test_steps and key == "test_steps_json":
-                continue
-            keys.add(key)
-    return sorted(keys)
-
-
 def _artifact_to_export_row(
-    artifact: ArtifactModel,
+    artifact: ArtifactDTO,
     *,
     path: str,
     parent_key: str | None,
@@ -303,13 +327,19 @@ def _artifact_to_export_row(
     return row
 
 
-def _serialize_rows_to_csv(columns: list[str], rows: list[dict[str, str]]) -> bytes:
+def _csv_bytes(columns: list[str], rows: list[dict[str, str]], *, header: bool) -> bytes:
     buffer = io.StringIO()
     writer = csv.DictWriter(buffer, fieldnames=columns, extrasaction="ignore")
-    writer.writeheader()
+    if header:
+        buffer.write("\ufeff")
+        writer.writeheader()
     for row in rows:
         writer.writerow({column: row.get(column, "") for column in columns})
-    return ("\ufeff" + buffer.getvalue()).encode("utf-8")
+    return buffer.getvalue().encode("utf-8")
+
+
+def _serialize_rows_to_csv(columns: list[str], rows: list[dict[str, str]]) -> bytes:
+    return _csv_bytes(columns, rows, header=True)
 
 
 def _write_rows_to_sheet(
@@ -339,7 +369,7 @@ def _parse_test_steps(raw: Any) -> list[dict[str, Any]]:
     return parsed
 
 
-def _testcase_step_rows(artifacts: list[ArtifactModel]) -> list[dict[str, str]]:
+def _testcase_step_rows(artifacts: list[ArtifactDTO]) -> list[dict[str, str]]:
     rows: list[dict[str, str]] = []
     for artifact in artifacts:
         steps = _parse_test_steps((artifact.custom_fields or {}).get("test_steps_json"))
@@ -417,8 +447,6 @@ def _rows_to_import_artifacts(rows: list[dict[str, str]], *, sheet: str) -> list
         title = (row.get("title") or "").strip()
         if not any(row.values()):
             continue
-        if not artifact_key:
-            raise ValidationError(f"{sheet} row {index}: artifact_key is required")
         if not artifact_type:
             raise ValidationError(f"{sheet} row {index}: artifact_type is required")
         if not title:
@@ -566,6 +594,69 @@ def _detect_cycle(graph: dict[str, set[str]]) -> str | None:
     return None
 
 
+class _ChunkSink(io.RawIOBase):
+    """Write-only, non-seekable buffer: ``zipfile`` writes into it and the response drains it."""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+async def _stream_csv(columns: list[str], row_pages: AsyncIterator[list[dict[str, str]]]) -> AsyncIterator[bytes]:
+    yield _csv_bytes(columns, [], header=True)
+    async for rows in row_pages:
+        if rows:
+            yield _csv_bytes(columns, rows, header=False)
+
+
+async def _stream_zip_csv(
+    files: list[tuple[str, list[str], Callable[[], AsyncIterator[list[dict[str, str]]]]]],
+) -> AsyncIterator[bytes]:
+    """Zip of CSV members written in order; each member's row pages are opened lazily."""
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, columns, open_pages in files:
+            with archive.open(name, "w", force_zip64=True) as member:
+                async for chunk in _stream_csv(columns, open_pages()):
+                    member.write(chunk)
+                    if data := sink.drain():
+                        yield data
+    yield sink.drain()
+
+
+async def _stream_xlsx(
+    sheets: dict[str, list[str]],
+    row_pages: AsyncIterator[dict[str, list[dict[str, str]]]],
+) -> AsyncIterator[bytes]:
+    """Write-only workbook (rows spill to temp files), saved to a temp file and streamed back in chunks."""
+    workbook = Workbook(write_only=True)
+    worksheets = {}
+    for name, columns in sheets.items():
+        worksheets[name] = workbook.create_sheet(name)
+        worksheets[name].append(columns)
+    async for page in row_pages:
+        for name, rows in page.items():
+            columns = sheets[name]
+            for row in rows:
+                worksheets[name].append([row.get(column, "") for column in columns])
+    with tempfile.TemporaryFile() as fh:
+        await asyncio.to_thread(workbook.save, fh)
+        fh.seek(0)
+        while chunk := fh.read(_EXPORT_READ_CHUNK):
+            yield chunk
+
+
 async def export_artifacts(
     session: AsyncSession,
     *,
@@ -586,19 +677,26 @@ async def export_artifacts(
     parent_id: uuid.UUID | None = None,
     tag_id: uuid.UUID | None = None,
     team_id: uuid.UUID | None = None,
-) -> ArtifactExportResult:
+) -> ArtifactExportStream:
+    """Resolve filters eagerly (errors surface before the response starts); rows are streamed page by page.
+
+    Only the lightweight ``(id, parent_id, title, key)`` hierarchy needed for ``path`` / ``parent_key`` is
+    held for the whole export; artifacts themselves are read through a server-side cursor.
+    """
     project_repo = SqlAlchemyProjectRepository(session)
     project = await project_repo.find_by_id(project_id)
     if project is None:
         raise ValidationError("Project not found")
+    artifact_repo = SqlAlchemyArtifactRepository(session)
+    tag_repo = SqlAlchemyProjectTagRepository(session)
     handler = ListArtifactsHandler(
-        artifact_repo=SqlAlchemyArtifactRepository(session),
+        artifact_repo=artifact_repo,
         project_repo=project_repo,
         cycle_repo=SqlAlchemyCycleRepository(session),
         process_template_repo=SqlAlchemyProcessTemplateRepository(session),
-        tag_repo=SqlAlchemyProjectTagRepository(session),
+        tag_repo=tag_repo,
     )
-    query_result = await handler.handle(
+    list_scope = await handler.resolve_scope(
         ListArtifacts(
             tenant_id=project.tenant_id,
             project_id=project_id,
@@ -610,8 +708,6 @@ async def export_artifacts(
             area_node_id=area_node_id,
             sort_by=sort_by,
             sort_order=sort_order,
-            limit=None,
-            offset=None,
             include_deleted=include_deleted,
             include_system_roots=include_system_roots,
             tree=tree,
@@ -620,87 +716,90 @@ async def export_artifacts(
             team_id=team_id,
         )
     )
-    models = query_result.items
-    path_map, parent_key_map = _build_path_map(models)
 
-    if scope == "runs":
+    hierarchy: list[_HierarchyRow] = []
+    stored_keys: list[str] = []
+    if list_scope is not None:
+        hierarchy = await artifact_repo.list_hierarchy_by_project(project_id, **list_scope.filters)
+        if scope != "runs":
+            stored_keys = await artifact_repo.list_custom_field_keys_by_project(project_id, **list_scope.filters)
+    path_map, parent_key_map = _build_path_map(hierarchy)
+    del hierarchy
+
+    run_mode = scope == "runs"
+    if run_mode:
         custom_field_keys = ["environment", "run_status_counts_json", "expanded_results_json"]
-        rows = [
-            _artifact_to_export_row(
-                artifact,
-                path=path_map[artifact.id],
-                parent_key=parent_key_map.get(artifact.id),
-                custom_field_keys=custom_field_keys,
-                run_mode=True,
-            )
-            for artifact in models
-        ]
         columns = RUN_EXPORT_COLUMNS
-        filename_base = "runs"
-    elif scope == "testcases":
-        custom_field_keys = _iter_custom_field_keys(models, exclude_test_steps=True)
-        artifact_rows = [
-            _artifact_to_export_row(
-                artifact,
-                path=path_map[artifact.id],
-                parent_key=parent_key_map.get(artifact.id),
-                custom_field_keys=custom_field_keys,
-            )
-            for artifact in models
-        ]
-        step_rows = _testcase_step_rows(models)
-        if format == "csv":
-            payload = io.BytesIO()
-            with zipfile.ZipFile(payload, "w", compression=zipfile.ZIP_DEFLATED) as archive:
-                artifact_columns = CORE_EXPORT_COLUMNS + [f"cf.{k}" for k in custom_field_keys]
-                archive.writestr("artifacts.csv", _serialize_rows_to_csv(artifact_columns, artifact_rows))
-                archive.writestr("test_case_steps.csv", _serialize_rows_to_csv(TESTCASE_STEP_COLUMNS, step_rows))
-            return ArtifactExportResult(
-                filename="testcases-export.zip",
-                content_type="application/zip",
-                content=payload.getvalue(),
-            )
-        workbook = Workbook()
-        workbook.remove(workbook.active)
-        artifact_columns = CORE_EXPORT_COLUMNS + [f"cf.{k}" for k in custom_field_keys]
-        _write_rows_to_sheet(workbook, "artifacts", artifact_columns, artifact_rows)
-        _write_rows_to_sheet(workbook, "test_case_steps", TESTCASE_STEP_COLUMNS, step_rows)
-        buffer = io.BytesIO()
-        workbook.save(buffer)
-        return ArtifactExportResult(
-            filename="testcases-export.xlsx",
-            content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            content=buffer.getvalue(),
-        )
     else:
-        custom_field_keys = _iter_custom_field_keys(models)
-        rows = [
+        custom_field_keys = [k for k in stored_keys if not (scope == "testcases" and k == "test_steps_json")]
+        columns = CORE_EXPORT_COLUMNS + [f"cf.{k}" for k in custom_field_keys]
+
+    async def artifact_pages(*, with_tags: bool = True) -> AsyncIterator[list[ArtifactDTO]]:
+        if list_scope is None:
+            return
+        async for page in artifact_repo.stream_by_project(
+            project_id,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            page_size=_EXPORT_PAGE_SIZE,
+            **list_scope.filters,
+        ):
+            tag_map = await tag_repo.get_tags_by_artifact_ids([a.id for a in page]) if with_tags else {}
+            dtos = [artifact_to_dto(a, tag_map.get(a.id, ())) for a in page]
+            yield redact_artifact_dtos(list_scope.compiled, dtos, None)
+
+    def export_rows(dtos: list[ArtifactDTO]) -> list[dict[str, str]]:
+        return [
             _artifact_to_export_row(
                 artifact,
-                path=path_map[artifact.id],
+                path=path_map.get(artifact.id, artifact.title),
                 parent_key=parent_key_map.get(artifact.id),
                 custom_field_keys=custom_field_keys,
+                run_mode=run_mode,
             )
-            for artifact in models
+            for artifact in dtos
         ]
-        columns = CORE_EXPORT_COLUMNS + [f"cf.{k}" for k in custom_field_keys]
-        filename_base = "artifacts"
 
+    async def artifact_row_pages() -> AsyncIterator[list[dict[str, str]]]:
+        async for dtos in artifact_pages():
+            yield export_rows(dtos)
+
+    async def step_row_pages() -> AsyncIterator[list[dict[str, str]]]:
+        async for dtos in artifact_pages(with_tags=False):
+            yield _testcase_step_rows(dtos)
+
+    async def workbook_pages(with_steps: bool) -> AsyncIterator[dict[str, list[dict[str, str]]]]:
+        async for dtos in artifact_pages():
+            page = {"artifacts": export_rows(dtos)}
+            if with_steps:
+                page["test_case_steps"] = _testcase_step_rows(dtos)
+            yield page
+
+    filename_base = {"runs": "runs", "testcases": "testcases"}.get(scope, "artifacts")
+    if format == "csv" and scope == "testcases":
+        return ArtifactExportStream(
+            filename="testcases-export.zip",
+            content_type="application/zip",
+            chunks=_stream_zip_csv(
+                [
+                    ("artifacts.csv", columns, artifact_row_pages),
+                    ("test_case_steps.csv", TESTCASE_STEP_COLUMNS, step_row_pages),
+                ]
+            ),
+        )
     if format == "csv":
-        return ArtifactExportResult(
+        return ArtifactExportStream(
             filename=f"{filename_base}-export.csv",
             content_type="text/csv; charset=utf-8",
-            content=_serialize_rows_to_csv(columns, rows),
+            chunks=_stream_csv(columns, artifact_row_pages()),
         )
-    workbook = Workbook()
-    workbook.remove(workbook.active)
-    _write_rows_to_sheet(workbook, "artifacts", columns, rows)
-    buffer = io.BytesIO()
-    workbook.save(buffer)
-    return ArtifactExportResult(
+    sheets = {"artifacts": columns}
+    if scope == "testcases":
+        sheets["test_case_steps"] = TESTCASE_STEP_COLUMNS
+    return ArtifactExportStream(
         filename=f"{filename_base}-export.xlsx",
-        content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        content=buffer.getvalue(),
+        content_type=_XLSX_CONTENT_TYPE,
+        chunks=_stream_xlsx(sheets, workbook_pages(scope == "testcases")),
     )
 
 
@@ -726,7 +825,7 @@ async def export_import_template(format: ExportFormat, scope: ImportScope) -> Ar
         workbook.save(buffer)
         return ArtifactExportResult(
             filename="artifact-import-template-testcases.xlsx",
-            content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            content_type=_XLSX_CONTENT_TYPE,
             content=buffer.getvalue(),
         )
     rows = [GENERIC_TEMPLATE_EXAMPLE]
@@ -743,7 +842,7 @@ async def export_import_template(format: ExportFormat, scope: ImportScope) -> Ar
     workbook.save(buffer)
     return ArtifactExportResult(
         filename="artifact-import-template.xlsx",
-        content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        content_type=_XLSX_CONTENT_TYPE,
         content=buffer.getvalue(),
     )
 
@@ -773,6 +872,311 @@ def _parse_import_payload(
     return artifact_rows, step_rows
 
 
+@dataclass(slots=True)
+class ArtifactImportProgress:
+    phase: Literal["plan", "insert", "update", "tags", "audit"]
+    processed: int
+    total: int
+
+
+ImportProgressCallback = Callable[[ArtifactImportProgress], None]
+
+_IMPORT_WRITE_CHUNK = 1000
+_PARENT_UNRESOLVED_MESSAGE = "Parent dependency could not be resolved from this import batch"
+
+
+def _log_import_progress(progress: ArtifactImportProgress) -> None:
+    logger.info(
+        "artifact_import_progress",
+        phase=progress.phase,
+        processed=progress.processed,
+        total=progress.total,
+    )
+
+
+def _chunks(items: list[Any], size: int = _IMPORT_WRITE_CHUNK) -> list[list[Any]]:
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+@dataclass(slots=True)
+class _PlannedImportRow:
+    row: _ImportArtifactRow
+    artifact: Artifact
+    created: bool
+
+
+class _ImportPlanner:
+    """Resolves parents in dependency order and validates every row in memory (no I/O).
+
+    Rows whose parent (``parent_key`` or ``path`` prefix) is another row of the same file wait on that
+    dependency and are released the moment it is planned, so each row is visited a bounded number of
+    times and the output order always has parents before children.
+    """
+
+    def __init__(
+        self,
+        *,
+        compiled: CompiledManifest,
+        tenant_id: uuid.UUID,
+        project_id: uuid.UUID,
+        actor_id: uuid.UUID | None,
+        scope: ImportScope,
+        mode: ImportMode,
+        existing: list[Artifact],
+        step_rows_by_key: dict[str, list[_ImportStepRow]],
+        known_keys: set[str],
+        root_defect_id: uuid.UUID | None,
+        area_paths: dict[uuid.UUID, str],
+    ) -> None:
+        self._compiled = compiled
+        self._tenant_id = tenant_id
+        self._project_id = project_id
+        self._actor_id = actor_id
+        self._scope = scope
+        self._mode = mode
+        self._step_rows_by_key = step_rows_by_key
+        self._known_keys = known_keys
+        self._root_defect_id = root_defect_id
+        self._area_paths = area_paths
+        self._by_key: dict[str, Artifact] = {a.artifact_key: a for a in existing if a.artifact_key}
+        self._type_by_id: dict[uuid.UUID, str] = {a.id: a.artifact_type for a in existing}
+        paths, _ = _build_path_map([(a.id, a.parent_id, a.title, a.artifact_key) for a in existing])
+        self._path_by_id: dict[uuid.UUID, str] = paths
+        self._id_by_path: dict[str, uuid.UUID] = {path: artifact_id for artifact_id, path in paths.items()}
+
+    def plan(self, rows: list[_ImportArtifactRow], result: ArtifactImportResult) -> list[_PlannedImportRow]:
+        import_keys = {row.artifact_key for row in rows if row.artifact_key}
+        seen_keys: set[str] = set()
+        failed_keys: set[str] = set()
+        waiting: dict[tuple[str, str], list[_ImportArtifactRow]] = defaultdict(list)
+        planned: list[_PlannedImportRow] = []
+        queue = deque(rows)
+        while queue:
+            row = queue.popleft()
+            try:
+                if row.artifact_key and row.artifact_key in seen_keys:
+                    raise ValidationError(
+                        f"{row.sheet} row {row.row_number}: artifact_key '{row.artifact_key}' appears more than once"
+                    )
+                dependency, parent_id = self._resolve_parent(row, import_keys, failed_keys)
+                if dependency is not None:
+                    waiting[dependency].append(row)
+                    continue
+                item = self._plan_row(row, parent_id)
+            except (ValidationError, ValueError) as exc:
+                _record_failed(result, row, str(exc))
+                if row.artifact_key:
+                    failed_keys.add(row.artifact_key)
+                    queue.extend(waiting.pop(("key", row.artifact_key), []))
+                continue
+            if row.artifact_key:
+                seen_keys.add(row.artifact_key)
+            planned.append(item)
+            queue.extend(waiting.pop(("key", item.artifact.artifact_key or ""), []))
+            queue.extend(waiting.pop(("path", self._path_by_id[item.artifact.id]), []))
+        for blocked in waiting.values():
+            for row in blocked:
+                _record_failed(result, row, _PARENT_UNRESOLVED_MESSAGE)
+        return planned
+
+    def _resolve_parent(
+        self,
+        row: _ImportArtifactRow,
+        import_keys: set[str],
+        failed_keys: set[str],
+    ) -> tuple[tuple[str, str] | None, uuid.UUID | None]:
+        """``(dependency, None)`` when the parent is a not-yet-planned row, else ``(None, parent_id)``."""
+        if row.parent_key:
+            parent = self._by_key.get(row.parent_key)
+            if parent is not None:
+                return None, parent.id
+            if row.parent_key in failed_keys:
+                raise ValidationError(_PARENT_UNRESOLVED_MESSAGE)
+            if row.parent_key in import_keys:
+                return ("key", row.parent_key), None
+            raise ValidationError(f"{row.sheet} row {row.row_number}: parent_key '{row.parent_key}' was not found")
+        if row.path and "/" in row.path:
+            parent_path = row.path.rsplit("/", 1)[0]
+            parent_id = self._id_by_path.get(parent_path)
+            if parent_id is None and parent_path:
+                return ("path", parent_path), None
+            return None, parent_id
+        return None, None
+
+    def _plan_row(self, row: _ImportArtifactRow, parent_id: uuid.UUID | None) -> _PlannedImportRow:
+        if not row.artifact_key and self._mode == "update":
+            raise ValidationError(f"{row.sheet} row {row.row_number}: artifact_key is required in update mode")
+        current = self._by_key.get(row.artifact_key) if row.artifact_key else None
+        if self._mode == "create" and current is not None:
+            raise ValidationError(f"{row.sheet} row {row.row_number}: artifact_key '{row.artifact_key}' already exists")
+        if self._mode == "update" and current is None:
+            raise ValidationError(f"{row.sheet} row {row.row_number}: artifact_key '{row.artifact_key}' was not found")
+
+        custom_fields = dict(row.custom_fields)
+        if self._scope == "testcases" and row.artifact_type == "test-case":
+            custom_fields["test_steps_json"] = _build_test_steps_json(
+                self._step_rows_by_key.get(row.artifact_key, []),
+                known_keys=self._known_keys,
+                self_key=row.artifact_key,
+            )
+
+        if current is None:
+            artifact = self._plan_create(row, parent_id, custom_fields)
+        else:
+            artifact = self._plan_update(row, current, parent_id, custom_fields)
+
+        if artifact.artifact_key:
+            self._by_key[artifact.artifact_key] = artifact
+        self._type_by_id[artifact.id] = artifact.artifact_type
+        parent_path = self._path_by_id.get(artifact.parent_id) if artifact.parent_id else None
+        path = f"{parent_path}/{artifact.title}" if parent_path else artifact.title
+        self._path_by_id[artifact.id] = path
+        self._id_by_path[path] = artifact.id
+        return _PlannedImportRow(row=row, artifact=artifact, created=current is None)
+
+    def _plan_create(
+        self, row: _ImportArtifactRow, parent_id: uuid.UUID | None, custom_fields: dict[str, Any]
+    ) -> Artifact:
+        manifest = self._compiled.manifest_bundle
+        ast = self._compiled.ast
+        initial_state = workflow_get_initial_state(
+            manifest, row.artifact_type, ast=ast, version_id=self._compiled.version_id
+        )
+        if initial_state is None:
+            raise ValidationError(f"Artifact type '{row.artifact_type}' not defined in manifest")
+        if parent_id is None:
+            type_def = get_artifact_type_def(manifest, row.artifact_type, ast=ast)
+            if "root-defect" in ((type_def or {}).get("parent_types") or []):
+                if self._root_defect_id is None:
+                    raise ValidationError(
+                        "Project defects root (root-defect) is missing or ambiguous; "
+                        "set an explicit parent or fix project setup"
+                    )
+                parent_id = self._root_defect_id
+        parent_type = self._type_by_id.get(parent_id) if parent_id else None
+        validate_artifact_placement(manifest, row.artifact_type, parent_type, ast=ast)
+
+        artifact = Artifact.create(
+            project_id=self._project_id,
+            artifact_type=row.artifact_type,
+            title=row.title.strip() or "Untitled",
+            description=row.description,
+            state=initial_state,
+            parent_id=parent_id,
+            assignee_id=row.assignee_id or self._actor_id,
+            custom_fields=custom_fields,
+            artifact_key=row.artifact_key or None,
+            cycle_id=row.cycle_id,
+            area_node_id=row.area_node_id,
+            area_path_snapshot=self._area_paths.get(row.area_node_id) if row.area_node_id else None,
+            team_id=row.team_id,
+            tenant_id=self._tenant_id,
+        )
+        artifact.created_by = self._actor_id
+        return artifact
+
+    def _plan_update(
+        self,
+        row: _ImportArtifactRow,
+        artifact: Artifact,
+        parent_id: uuid.UUID | None,
+        custom_fields: dict[str, Any],
+    ) -> Artifact:
+        manifest = self._compiled.manifest_bundle
+        if is_system_root_artifact_type(artifact.artifact_type, manifest):
+            raise ValidationError("Project root artifacts cannot be updated")
+        # Only reparent when the row names a parent; clearing it is invalid for non-root artifacts.
+        if parent_id is not None:
+            parent_type = self._type_by_id[parent_id]
+            expected_parent_type = QUALITY_PARENT_TYPES.get(artifact.artifact_type)
+            if expected_parent_type and parent_type != expected_parent_type:
+                raise ValidationError(
+                    f"Artifact type '{artifact.artifact_type}' must be under a '{expected_parent_type}'"
+                )
+            if not is_valid_parent_child(manifest, parent_type, artifact.artifact_type, ast=self._compiled.ast):
+                raise ValidationError(
+                    f"Artifact type '{artifact.artifact_type}' cannot be child of "
+                    f"'{parent_type}' per manifest hierarchy"
+                )
+            artifact.parent_id = parent_id
+        old_cycle_id, old_custom_fields = artifact.cycle_id, dict(artifact.custom_fields or {})
+        artifact.title = row.title.strip() or artifact.title
+        artifact.description = row.description
+        artifact.assignee_id = row.assignee_id
+        artifact.cycle_id = row.cycle_id
+        artifact.assign_area(row.area_node_id, self._area_paths.get(row.area_node_id) if row.area_node_id else None)
+        artifact.team_id = row.team_id
+        artifact.custom_fields = {**(artifact.custom_fields or {}), **custom_fields}
+        if artifact.cycle_id != old_cycle_id or artifact.custom_fields != old_custom_fields:
+            artifact.notify_schedule_changed()
+        artifact.touch(by=self._actor_id)
+        return artifact
+
+
+def _record_failed(result: ArtifactImportResult, row: _ImportArtifactRow, message: str) -> None:
+    result.failed_count += 1
+    result.rows.append(
+        ArtifactImportRowResult(
+            row_number=row.row_number,
+            sheet=row.sheet,
+            artifact_key=row.artifact_key or None,
+            status="failed",
+            message=message,
+        )
+    )
+
+
+async def _resolve_tag_ids(
+    tag_repo: SqlAlchemyProjectTagRepository,
+    project_id: uuid.UUID,
+    names: set[str],
+) -> dict[str, uuid.UUID]:
+    """Case-insensitive name -> tag id; creates the missing project tags once per import (invalid names skipped)."""
+    by_name = {tag.name.lower(): tag.id for tag in await tag_repo.list_by_project(project_id)}
+    for name in sorted(names):
+        if name.lower() in by_name:
+            continue
+        try:
+            created = await tag_repo.create(project_id, name)
+        except ValueError as exc:
+            logger.warning("artifact_import_tag_skipped", tag=name, reason=str(exc))
+            continue
+        by_name[name.lower()] = created.id
+    return by_name
+
+
+async def _write_in_chunks(
+    session: AsyncSession,
+    planned: list[_PlannedImportRow],
+    write: Callable[[list[Artifact]], Awaitable[None]],
+    *,
+    phase: Literal["insert", "update"],
+    report: ImportProgressCallback,
+    failures: dict[uuid.UUID, str],
+) -> None:
+    """One multi-row statement per chunk inside a savepoint; a failing chunk is retried row by row."""
+    done = 0
+    for chunk in _chunks(planned):
+        savepoint = await session.begin_nested()
+        try:
+            await write([item.artifact for item in chunk])
+        except DBAPIError:
+            await savepoint.rollback()
+            for item in chunk:
+                row_savepoint = await session.begin_nested()
+                try:
+                    await write([item.artifact])
+                except DBAPIError as exc:
+                    await row_savepoint.rollback()
+                    failures[item.artifact.id] = str(exc.orig or exc)
+                else:
+                    await row_savepoint.commit()
+        else:
+            await savepoint.commit()
+        done += len(chunk)
+        report(ArtifactImportProgress(phase=phase, processed=done, total=len(planned)))
+
+
 async def import_artifacts(
     session: AsyncSession,
     *,
@@ -784,26 +1188,28 @@ async def import_artifacts(
     scope: ImportScope,
     mode: ImportMode,
     validate_only: bool,
+    progress: ImportProgressCallback | None = None,
 ) -> ArtifactImportResult:
+    """Set-based import: plan every row in memory, then write with multi-row statements.
+
+    Rows get the same hierarchy checks as ``CreateArtifact`` / ``UpdateArtifact``. Rows without an
+    ``artifact_key`` receive keys from one reserved sequence block; artifacts, tags and audit snapshots are
+    written in chunks of ``_IMPORT_WRITE_CHUNK``. ``validate_only`` stops after planning (nothing is written).
+    """
+    report = progress or _log_import_progress
     artifact_repo = SqlAlchemyArtifactRepository(session)
     project_repo = SqlAlchemyProjectRepository(session)
     area_repo = SqlAlchemyAreaRepository(session)
     process_template_repo = SqlAlchemyProcessTemplateRepository(session)
     tag_repo = SqlAlchemyProjectTagRepository(session)
-    create_handler = CreateArtifactHandler(
-        artifact_repo=artifact_repo,
-        project_repo=project_repo,
-        process_template_repo=process_template_repo,
-        area_repo=area_repo,
-        tag_repo=tag_repo,
-    )
-    update_handler = UpdateArtifactHandler(
-        artifact_repo=artifact_repo,
-        project_repo=project_repo,
-        area_repo=area_repo,
-        process_template_repo=process_template_repo,
-        tag_repo=tag_repo,
-    )
+
+    project = await project_repo.find_by_id(project_id)
+    if project is None or project.tenant_id != tenant_id:
+        raise ValidationError("Project not found")
+    compiled = await effective_compiled_manifest(process_template_repo, project.process_template_version_id)
+    if compiled is None:
+        raise ValidationError("No process template available for this project")
+
     artifacts, step_rows = _parse_import_payload(payload, filename, scope)
     existing = await artifact_repo.list_by_project(
         project_id=project_id,
@@ -811,9 +1217,6 @@ async def import_artifacts(
         offset=None,
         include_deleted=False,
     )
-    existing_by_key = {artifact.artifact_key: artifact for artifact in existing if artifact.artifact_key}
-    paths, _ = _build_path_map(existing)
-    existing_path_to_id = {path: artifact_id for artifact_id, path in paths.items()}
     step_rows_by_key: dict[str, list[_ImportStepRow]] = defaultdict(list)
     for step_row in step_rows:
         step_rows_by_key[step_row.test_case_key].append(step_row)
@@ -825,158 +1228,93 @@ async def import_artifacts(
     if cycle := _detect_cycle(graph):
         raise ValidationError(f"Detected circular test-case call graph involving '{cycle}'")
 
-    pending = list(artifacts)
-    known_keys = {artifact.artifact_key for artifact in artifacts} | set(existing_by_key.keys())
-    result = ArtifactImportResult()
-
-    while pending:
-        progressed = False
-        next_pending: list[_ImportArtifactRow] = []
-        for row in pending:
-            try:
-                current = existing_by_key.get(row.artifact_key)
-                if mode == "create" and current is not None:
-                    raise ValidationError(
-                        f"{row.sheet} row {row.row_number}: artifact_key '{row.artifact_key}' already exists"
-                    )
-                if mode == "update" and current is None:
-                    raise ValidationError(
-                        f"{row.sheet} row {row.row_number}: artifact_key '{row.artifact_key}' was not found"
-                    )
+    root_defects = await artifact_repo.list_by_project(project_id, type_filter="root-defect", limit=2, offset=0)
+    area_paths: dict[uuid.UUID, str] = {}
+    if any(row.area_node_id for row in artifacts):
+        area_paths = {node.id: node.path for node in await area_repo.list_by_project(project_id)}
 
-                parent_id: uuid.UUID | None = None
-                if row.parent_key:
-                    parent = existing_by_key.get(row.parent_key)
-                    if parent is None:
-                        sibling = next((item for item in artifacts if item.artifact_key == row.parent_key), None)
-                        if sibling is not None:
-                            next_pending.append(row)
-                            continue
-                        raise ValidationError(
-                            f"{row.sheet} row {row.row_number}: parent_key '{row.parent_key}' was not found"
-                        )
-                    parent_id = parent.id
-                elif row.path and "/" in row.path:
-                    parent_path = row.path.rsplit("/", 1)[0]
-                    parent_id = existing_path_to_id.get(parent_path)
-                    if parent_id is None and parent_path:
-                        next_pending.append(row)
-                        continue
-
-                custom_fields = dict(row.custom_fields)
-                if scope == "testcases" and row.artifact_type == "test-case":
-                    custom_fields["test_steps_json"] = _build_test_steps_json(
-                        step_rows_by_key.get(row.artifact_key, []),
-                        known_keys=known_keys,
-                        self_key=row.artifact_key,
-                    )
+    result = ArtifactImportResult()
+    planner = _ImportPlanner(
+        compiled=compiled,
+        tenant_id=tenant_id,
+        project_id=project_id,
+        actor_id=actor_id,
+        scope=scope,
+        mode=mode,
+        existing=existing,
+        step_rows_by_key=step_rows_by_key,
+        known_keys={row.artifact_key for row in artifacts if row.artifact_key}
+        | {a.artifact_key for a in existing if a.artifact_key},
+        root_defect_id=root_defects[0].id if len(root_defects) == 1 else None,
+        area_paths=area_paths,
+    )
+    planned = planner.plan(artifacts, result)
+    report(ArtifactImportProgress(phase="plan", processed=len(planned), total=len(artifacts)))
+
+    failures: dict[uuid.UUID, str] = {}
+    if not validate_only and planned:
+        keyless = [item.artifact for item in planned if item.created and not item.artifact.artifact_key]
+        if keyless:
+            first_seq = await project_repo.reserve_artifact_seq_block(project_id, len(keyless))
+            for offset, artifact in enumerate(keyless):
+                artifact.artifact_key = f"{project.code}-{first_seq + offset}"
+
+        await _write_in_chunks(
+            session,
+            [item for item in planned if item.created],
+            artifact_repo.add_many,
+            phase="insert",
+            report=report,
+            failures=failures,
+        )
+        await _write_in_chunks(
+            session,
+            [item for item in planned if not item.created],
+            artifact_repo.update_many,
+            phase="update",
+            report=report,
+            failures=failures,
+        )
 
-                if current is None:
-                    dto = await create_handler.handle(
-                        CreateArtifact(
-                            tenant_id=tenant_id,
-                            project_id=project_id,
-                            artifact_type=row.artifact_type,
-                            title=row.title,
-                            description=row.description,
-                            parent_id=parent_id,
-                            assignee_id=row.assignee_id,
-                            custom_fields=custom_fields,
-                            artifact_key=row.artifact_key,
-                            cycle_id=row.cycle_id,
-                            area_node_id=row.area_node_id,
-                            team_id=row.team_id,
-                            created_by=actor_id,
-                        )
-                    )
-                    entity = await artifact_repo.find_by_id(dto.id)
-                    if entity is not None:
-                        existing_by_key[row.artifact_key] = entity
-                        paths, _ = _build_path_map(list(existing_by_key.values()))
-                        existing_path_to_id = {path: artifact_id for artifact_id, path in paths.items()}
-                    status: ImportRowStatus = "validated" if validate_only else "created"
-                    if validate_only:
-                        result.validated_count += 1
-                    else:
-                        result.created_count += 1
-                    result.rows.append(
-                        ArtifactImportRowResult(
-                            row_number=row.row_number,
-                            sheet=row.sheet,
-                            artifact_key=row.artifact_key,
-                            status=status,
-                            artifact_id=dto.id,
-                        )
-                    )
-                else:
-                    update_payload: dict[str, Any] = {
-                        "title": row.title,
-                        "description": row.description,
-                        "assignee_id": row.assignee_id,
-                        "custom_fields": custom_fields,
-                        "cycle_id": row.cycle_id,
-                        "area_node_id": row.area_node_id,
-                        "team_id": row.team_id,
+        tagged = [item for item in planned if item.row.tag_names and item.artifact.id not in failures]
+        if tagged:
+            tag_ids = await _resolve_tag_ids(tag_repo, project_id, {n for item in tagged for n in item.row.tag_names})
+            for chunk in _chunks(tagged):
+                await tag_repo.replace_artifact_tags_bulk(
+                    {
+                        item.artifact.id: [tag_ids[n.lower()] for n in item.row.tag_names if n.lower() in tag_ids]
+                        for item in chunk
                     }
-                    # Omit parent_id when the row does not specify a parent; passing None would clear the parent,
-                    # which is invalid for non-root artifacts.
-                    if row.parent_key or (row.path and "/" in row.path):
-                        update_payload["parent_id"] = parent_id
-                    dto = await update_handler.handle(
-                        UpdateArtifact(
-                            tenant_id=tenant_id,
-                            project_id=project_id,
-                            artifact_id=current.id,
-                            updates=update_payload,
-                            updated_by=actor_id,
-                        )
-                    )
-                    entity = await artifact_repo.find_by_id(dto.id)
-                    if entity is not None:
-                        existing_by_key[row.artifact_key] = entity
-                        paths, _ = _build_path_map(list(existing_by_key.values()))
-                        existing_path_to_id = {path: artifact_id for artifact_id, path in paths.items()}
-                    status = "validated" if validate_only else "updated"
-                    if validate_only:
-                        result.validated_count += 1
-                    else:
-                        result.updated_count += 1
-                    result.rows.append(
-                        ArtifactImportRowResult(
-                            row_number=row.row_number,
-                            sheet=row.sheet,
-                            artifact_key=row.artifact_key,
-                            status=status,
-                            artifact_id=dto.id,
-                        )
-                    )
-                progressed = True
-            except Exception as exc:  # noqa: BLE001
-                result.failed_count += 1
-                result.rows.append(
-                    ArtifactImportRowResult(
-                        row_number=row.row_number,
-                        sheet=row.sheet,
-                        artifact_key=row.artifact_key,
-                        status="failed",
-                        message=str(exc),
-                    )
                 )
-        if not progressed and next_pending:
-            for row in next_pending:
-                result.failed_count += 1
-                result.rows.append(
-                    ArtifactImportRowResult(
-                        row_number=row.row_number,
-                        sheet=row.sheet,
-                        artifact_key=row.artifact_key,
-                        status="failed",
-                        message="Parent dependency could not be resolved from this import batch",
-                    )
-                )
-            break
-        pending = next_pending
+            report(ArtifactImportProgress(phase="tags", processed=len(tagged), total=len(tagged)))
+
+        session.info[ACTOR_ID_KEY] = actor_id
+        session.info[TENANT_ID_KEY] = tenant_id
+        await AuditInterceptor(session).process()
+        report(ArtifactImportProgress(phase="audit", processed=len(planned), total=len(planned)))
 
-    if validate_only:
-        await session.rollback()
+    for item in planned:
+        if item.artifact.id in failures:
+            _record_failed(result, item.row, failures[item.artifact.id])
+            continue
+        status: ImportRowStatus
+        if validate_only:
+            status = "validated"
+            result.validated_count += 1
+        elif item.created:
+            status = "created"
+            result.created_count += 1
+        else:
+            status = "updated"
+            result.updated_count += 1
+        result.rows.append(
+            ArtifactImportRowResult(
+                row_number=item.row.row_number,
+                sheet=item.row.sheet,
+                artifact_key=item.artifact.artifact_key,
+                status=status,
+                artifact_id=item.artifact.id,
+            )
+        )
+    result.rows.sort(key=lambda r: (r.sheet, r.row_number))
     return result
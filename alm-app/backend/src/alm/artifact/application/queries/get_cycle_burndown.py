@@ -1,13 +1,17 @@
-"""Get cycle burndown (remaining effort vs time)."""
+"""Get cycle burndown (remaining effort vs time) from daily snapshots."""
 
 from __future__ import annotations
 
 import uuid
 from dataclasses import dataclass
-from datetime import date, timedelta
+from datetime import UTC, date, datetime, timedelta
 
 from alm.artifact.domain.ports import ArtifactRepository
-from alm.cycle.domain.ports import CycleRepository
+from alm.cycle.domain.entities import BurndownSnapshot, Cadence
+from alm.cycle.domain.ports import CycleBurndownSnapshotRepository, CycleRepository
+from alm.process_template.domain.ports import ProcessTemplateRepository
+from alm.project.application.services.burndown_snapshots import SNAPSHOT_EFFORT_FIELD, burndown_done_states
+from alm.project.domain.ports import ProjectRepository
 from alm.shared.application.query import Query, QueryHandler
 
 
@@ -16,79 +20,95 @@ class GetCycleBurndown(Query):
     tenant_id: uuid.UUID
     project_id: uuid.UUID
     cycle_id: uuid.UUID
-    effort_field: str = "story_points"
+    effort_field: str = SNAPSHOT_EFFORT_FIELD
 
 
 @dataclass(frozen=True)
 class BurndownPoint:
     date: str
-    remaining_effort: float
+    remaining_effort: float | None
     ideal_effort: float
+    total_effort: float | None = None
+    completed_effort: float | None = None
 
 
 class GetCycleBurndownHandler(QueryHandler[list[BurndownPoint]]):
+    """One point per cycle day; actuals come from ``cycle_burndown_snapshots`` carried forward across
+    days without changes, so the cost is O(days) and independent of the number of artifacts.
+
+    Days after today, and days before the first snapshot, have no actuals (``None``). When a cycle has
+    no snapshots yet (or the effort field is not materialized) today's point is computed live.
+    """
+
     def __init__(
         self,
         artifact_repo: ArtifactRepository,
         cycle_repo: CycleRepository,
+        snapshot_repo: CycleBurndownSnapshotRepository,
+        project_repo: ProjectRepository,
+        process_template_repo: ProcessTemplateRepository,
     ) -> None:
         self._artifact_repo = artifact_repo
         self._cycle_repo = cycle_repo
+        self._snapshot_repo = snapshot_repo
+        self._project_repo = project_repo
+        self._process_template_repo = process_template_repo
 
     async def handle(self, query: Query) -> list[BurndownPoint]:
         assert isinstance(query, GetCycleBurndown)
 
+        project = await self._project_repo.find_by_id(query.project_id)
+        if project is None or project.tenant_id != query.tenant_id:
+            return []
         cycle = await self._cycle_repo.find_by_id(query.cycle_id)
         if not cycle or cycle.project_id != query.project_id:
             return []
-
         start_dt = cycle.start_date
         end_dt = cycle.end_date
-        if not start_dt or not end_dt:
+        if not start_dt or not end_dt or end_dt < start_dt:
             return []
 
-        # 1. Total effort in cycle
-        totals = await self._artifact_repo.sum_total_effort_by_cycles(
-            query.project_id,
-            [cycle.id],
-            query.effort_field,
-        )
-        total_effort = totals[0][1] if totals else 0.0
-
-        # 2. Completed effort per date (convention: daily burndown)
-        # MVP: use daily snapshots or calculate from current state (simpler MVP)
-        # Real burndown needs daily historical data. For now, we will return
-        # a simple start-to-end ideal line + current remaining as latest point.
-
-        # To calculate remaining effort: total - done effort
-        done_states = ("closed", "done", "resolved")
-        done_sums = await self._artifact_repo.sum_effort_by_cycles(
-            query.project_id,
-            [cycle.id],
-            done_states,
-            query.effort_field,
-        )
-        completed_effort = done_sums[0][1] if done_sums else 0.0
-        remaining_now = max(0.0, total_effort - completed_effort)
-
-        points: list[BurndownPoint] = []
-        days = (end_dt - start_dt).days + 1
-        today = date.today()
-
-        for i in range(days):
-            current_date = start_dt + timedelta(days=i)
-            # Ideal: linear from total_effort down to 0
-            ideal = total_effort * (1 - i / (days - 1)) if days > 1 else total_effort
-
-            # Remaining: current remaining if today or before, otherwise None (placeholder)
-            rem = remaining_now if current_date <= today else None
-
-            points.append(
-                BurndownPoint(
-                    date=current_date.isoformat(),
-                    remaining_effort=rem if rem is not None else 0.0,
-                    ideal_effort=round(ideal, 2),
-                )
+        today = datetime.now(UTC).date()
+        last_day = min(end_dt, today)
+        snapshots = await self._snapshot_repo.list_by_cycle(cycle.id, query.effort_field, end_date=last_day)
+        if not snapshots:
+            done_states = await burndown_done_states(self._process_template_repo, project)
+            buckets = await self._artifact_repo.sum_effort_buckets_by_cycles(
+                query.project_id,
+                [cycle.id],
+                done_states,
+                query.effort_field,
             )
+            _, total, completed = buckets[0] if buckets else (cycle.id, 0.0, 0.0)
+            snapshots = [BurndownSnapshot(snapshot_date=last_day, total_effort=total, completed_effort=completed)]
+
+        return _daily_points(cycle, snapshots, today)
+
+
+def _daily_points(cycle: Cadence, snapshots: list[BurndownSnapshot], today: date) -> list[BurndownPoint]:
+    """Walk the cycle days once, carrying the latest snapshot forward; ideal line starts at the first known scope."""
+    assert cycle.start_date is not None and cycle.end_date is not None
+    days = (cycle.end_date - cycle.start_date).days + 1
+    baseline = snapshots[0].total_effort
+    points: list[BurndownPoint] = []
+    idx = 0
+    current: BurndownSnapshot | None = None
+
+    for i in range(days):
+        day = cycle.start_date + timedelta(days=i)
+        while idx < len(snapshots) and snapshots[idx].snapshot_date <= day:
+            current = snapshots[idx]
+            idx += 1
+        ideal = baseline * (1 - i / (days - 1)) if days > 1 else baseline
+        actual = current if current is not None and day <= today else None
+        points.append(
+            BurndownPoint(
+                date=day.isoformat(),
+                remaining_effort=(max(0.0, actual.total_effort - actual.completed_effort) if actual else None),
+                ideal_effort=round(ideal, 2),
+                total_effort=actual.total_effort if actual else None,
+                completed_effort=actual.completed_effort if actual else None,
+            )
+        )
 
-        return points
+    return points
@@ -5,11 +5,10 @@ from __future__ import annotations
 import uuid
 from dataclasses import dataclass
 
-from alm.artifact.domain.manifest_merge_defaults import merge_manifest_metadata_defaults
-from alm.artifact.domain.mpc_resolver import get_manifest_ast
 from alm.artifact.domain.ports import ArtifactRepository
 from alm.artifact.domain.workflow_sm import get_permitted_triggers
 from alm.process_template.domain.ports import ProcessTemplateRepository
+from alm.project.application.services.effective_process_template_version import compiled_manifest_by_version_id
 from alm.project.domain.ports import ProjectRepository
 from alm.shared.application.query import Query, QueryHandler
 
@@ -53,17 +52,18 @@ class GetPermittedTransitionsHandler(QueryHandler[list[PermittedTransitionDTO]])
         if project.process_template_version_id is None:
             return []
 
-        version = await self._process_template_repo.find_version_by_id(project.process_template_version_id)
-        if version is None:
+        compiled = await compiled_manifest_by_version_id(
+            self._process_template_repo, project.process_template_version_id
+        )
+        if compiled is None:
             return []
 
-        manifest = merge_manifest_metadata_defaults(version.manifest_bundle or {})
-        ast = get_manifest_ast(version.id, manifest)
         permitted = get_permitted_triggers(
-            manifest,
+            compiled.manifest_bundle,
             artifact.artifact_type,
             artifact.state,
-            ast=ast,
+            ast=compiled.ast,
+            version_id=compiled.version_id,
             entity_snapshot=artifact.to_snapshot_dict(),
         )
         return [
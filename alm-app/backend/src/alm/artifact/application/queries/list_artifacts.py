@@ -2,32 +2,43 @@
 
 from __future__ import annotations
 
+import base64
+import json
 import uuid
 from dataclasses import dataclass, replace
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Literal
 
 import structlog
 
 from alm.artifact.application.dtos import ArtifactDTO
 from alm.artifact.domain.fulltext_config import resolve_fulltext_regconfig
-from alm.artifact.domain.manifest_merge_defaults import merge_manifest_metadata_defaults
 from alm.artifact.domain.manifest_workflow_metadata import (
     resolve_system_root_artifact_types,
     resolve_tree_root_artifact_type,
 )
-from alm.artifact.domain.mpc_resolver import get_manifest_ast, redact_data
+from alm.artifact.domain.mpc_resolver import redact_data
 from alm.artifact.domain.ports import ArtifactRepository
 from alm.config.settings import settings
 from alm.cycle.domain.ports import CycleRepository
 from alm.process_template.domain.ports import ProcessTemplateRepository
 from alm.project.application.services.effective_process_template_version import (
-    effective_process_template_version,
+    effective_compiled_manifest,
 )
 from alm.project.domain.ports import ProjectRepository
 from alm.project_tag.domain.ports import ProjectTagRepository
 from alm.shared.application.query import Query, QueryHandler
+from alm.shared.domain.exceptions import ValidationError
+
+if TYPE_CHECKING:
+    from alm.artifact.domain.entities import Artifact
+    from alm.artifact.domain.manifest_cache import CompiledManifest
+    from alm.project_tag.application.dtos import ProjectTagDTO
 
 logger = structlog.get_logger()
 
+TotalMode = Literal["exact", "estimate", "none"]
+
 
 @dataclass(frozen=True)
 class ListArtifacts(Query):
@@ -53,12 +64,114 @@ class ListArtifacts(Query):
     assignee_id: uuid.UUID | None = None  # filter by assignee user
     unassigned_only: bool = False  # when True, only artifacts with no assignee
     stale_traceability_only: bool = False  # S4b: only artifacts flagged stale_traceability
+    cursor: str | None = None  # opaque keyset cursor (next_cursor of the previous page); offset is ignored
+    total_mode: TotalMode = "exact"  # "estimate": planner estimate, "none": skip counting
 
 
 @dataclass
 class ListArtifactsResult:
     items: list[ArtifactDTO]
-    total: int
+    total: int | None
+    next_cursor: str | None = None  # set when more rows follow this page
+    total_is_estimate: bool = False
+
+
+# Must match SqlAlchemyArtifactRepository._SORT_COLUMNS; anything else sorts by created_at.
+_CURSOR_SORT_KEYS = frozenset({"artifact_key", "title", "state", "artifact_type", "created_at", "updated_at"})
+_CURSOR_DATETIME_KEYS = frozenset({"created_at", "updated_at"})
+
+
+def _cursor_sort(sort_by: str | None, sort_order: str | None) -> tuple[str, str]:
+    key = sort_by if sort_by in _CURSOR_SORT_KEYS else "created_at"
+    return key, "asc" if (sort_order or "desc").lower() == "asc" else "desc"
+
+
+def encode_artifact_cursor(artifact: Artifact, sort_by: str | None, sort_order: str | None) -> str:
+    """Opaque cursor: sort key/direction plus the ``(sort value, id)`` of the page's last row."""
+    key, direction = _cursor_sort(sort_by, sort_order)
+    value = getattr(artifact, key, None)
+    payload = {
+        "k": key,
+        "d": direction,
+        "v": value.isoformat() if isinstance(value, datetime) else value,
+        "id": str(artifact.id),
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_artifact_cursor(cursor: str, sort_by: str | None, sort_order: str | None) -> tuple[Any, uuid.UUID]:
+    """Return the repository keyset ``(sort value, id)``; raises ``ValidationError`` for foreign/garbled cursors."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        key, direction, value = payload["k"], payload["d"], payload["v"]
+        last_id = uuid.UUID(payload["id"])
+        if value is not None and key in _CURSOR_DATETIME_KEYS:
+            value = datetime.fromisoformat(value)
+    except (ValueError, KeyError, TypeError) as exc:
+        raise ValidationError("Invalid cursor") from exc
+    if (key, direction) != _cursor_sort(sort_by, sort_order):
+        raise ValidationError("Cursor does not match the requested sort")
+    return value, last_id
+
+
+@dataclass(frozen=True)
+class ArtifactListScope:
+    """Repository filter kwargs resolved from a ``ListArtifacts`` query.
+
+    ``filters`` are the keyword arguments shared by ``count_by_project`` / ``list_by_project`` /
+    ``stream_by_project`` (release cycles, tree root, system-root exclusion and FTS config already applied).
+    """
+
+    compiled: CompiledManifest | None
+    filters: dict[str, Any]
+
+
+def artifact_to_dto(a: Artifact, tags: tuple[ProjectTagDTO, ...] = ()) -> ArtifactDTO:
+    return ArtifactDTO(
+        id=a.id,
+        project_id=a.project_id,
+        artifact_type=a.artifact_type,
+        title=a.title,
+        description=a.description,
+        state=a.state,
+        assignee_id=a.assignee_id,
+        parent_id=a.parent_id,
+        custom_fields=a.custom_fields,
+        artifact_key=a.artifact_key,
+        state_reason=a.state_reason,
+        resolution=a.resolution,
+        rank_order=a.rank_order,
+        cycle_id=getattr(a, "cycle_id", None),
+        area_node_id=getattr(a, "area_node_id", None),
+        area_path_snapshot=getattr(a, "area_path_snapshot", None),
+        team_id=getattr(a, "team_id", None),
+        created_at=getattr(a, "created_at", None),
+        updated_at=getattr(a, "updated_at", None),
+        stale_traceability=getattr(a, "stale_traceability", False),
+        stale_traceability_reason=getattr(a, "stale_traceability_reason", None),
+        stale_traceability_at=getattr(a, "stale_traceability_at", None),
+        tags=tags,
+    )
+
+
+def redact_artifact_dtos(
+    compiled: CompiledManifest | None,
+    items: list[ArtifactDTO],
+    actor_roles: list[str] | None,
+) -> list[ArtifactDTO]:
+    """Apply manifest redaction rules for the actor's roles (no-op without a compiled manifest)."""
+    if not compiled or not items:
+        return items
+    ast = compiled.ast
+    roles = actor_roles or []
+    redacted_items: list[ArtifactDTO] = []
+    for dto in items:
+        redacted_snapshot = redact_data(ast, dto.__dict__, roles)
+        dto_fields = dto.__dataclass_fields__
+        updates = {k: v for k, v in redacted_snapshot.items() if k in dto_fields}
+        redacted_items.append(replace(dto, **updates) if updates else dto)
+    return redacted_items
 
 
 class ListArtifactsHandler(QueryHandler[ListArtifactsResult]):
@@ -76,22 +189,21 @@ class ListArtifactsHandler(QueryHandler[ListArtifactsResult]):
         self._process_template_repo = process_template_repo
         self._tag_repo = tag_repo
 
-    async def handle(self, query: Query) -> ListArtifactsResult:
-        assert isinstance(query, ListArtifacts)
-
+    async def resolve_scope(self, query: ListArtifacts) -> ArtifactListScope | None:
+        """Resolve query filters to repository kwargs; ``None`` when the result is known to be empty."""
         project = await self._project_repo.find_by_id(query.project_id)
         if project is None or project.tenant_id != query.tenant_id:
-            return ListArtifactsResult(items=[], total=0)
+            return None
 
-        version = await effective_process_template_version(
-            self._process_template_repo, project.process_template_version_id
-        )
-        manifest_bundle: dict | None = None
-        if version:
-            manifest_bundle = merge_manifest_metadata_defaults(version.manifest_bundle or {})
-        system_roots = resolve_system_root_artifact_types(manifest_bundle)
+        compiled = await effective_compiled_manifest(self._process_template_repo, project.process_template_version_id)
+        manifest_bundle: dict | None = compiled.manifest_bundle if compiled else None
+        if compiled:
+            system_roots = compiled.system_root_types
+            fts_cfg = compiled.fulltext_regconfig
+        else:
+            system_roots = resolve_system_root_artifact_types(None)
+            fts_cfg = resolve_fulltext_regconfig(None, settings.fulltext_search_config)
         exclude_roots = not query.include_system_roots
-        fts_cfg = resolve_fulltext_regconfig(manifest_bundle, settings.fulltext_search_config)
 
         cycle_ids: list[uuid.UUID] | None = None
         cycle_id_single: uuid.UUID | None = query.cycle_id
@@ -105,7 +217,7 @@ class ListArtifactsHandler(QueryHandler[ListArtifactsResult]):
                     c.id for c in all_cycles if c.path != release_path and c.path.startswith(release_path + "/")
                 ]
                 if not cycle_ids:
-                    return ListArtifactsResult(items=[], total=0)
+                    return None
                 cycle_id_single = None
         elif query.cycle_id:
             cycle_id_single = query.cycle_id
@@ -114,7 +226,11 @@ class ListArtifactsHandler(QueryHandler[ListArtifactsResult]):
         tree_slug = (query.tree or "").strip()
         resolved_root_type: str | None = None
         if tree_slug:
-            resolved_root_type = resolve_tree_root_artifact_type(query.tree, manifest_bundle)
+            resolved_root_type = (
+                compiled.tree_root_type(query.tree)
+                if compiled
+                else resolve_tree_root_artifact_type(query.tree, manifest_bundle)
+            )
             if resolved_root_type:
                 roots = await self._artifact_repo.list_by_project(
                     query.project_id,
@@ -134,92 +250,71 @@ class ListArtifactsHandler(QueryHandler[ListArtifactsResult]):
                             tree=tree_slug,
                             resolved_root_type=resolved_root_type,
                         )
-                    return ListArtifactsResult(items=[], total=0)
+                    return None
 
-        total = await self._artifact_repo.count_by_project(
-            query.project_id,
-            query.state_filter,
-            type_filter=query.type_filter,
-            search_query=query.search_query,
-            cycle_id=cycle_id_single,
-            cycle_ids=cycle_ids,
-            area_node_id=query.area_node_id,
-            parent_id=query.parent_id,
-            include_deleted=query.include_deleted,
-            root_artifact_id=root_artifact_id,
-            exclude_root_artifact_types=exclude_roots,
-            root_type_ids_exclude=system_roots if exclude_roots else None,
-            fts_regconfig=fts_cfg,
-            tag_id=query.tag_id,
-            team_id=query.team_id,
-            assignee_id=query.assignee_id,
-            unassigned_only=query.unassigned_only,
-            stale_traceability_only=query.stale_traceability_only,
+        return ArtifactListScope(
+            compiled=compiled,
+            filters={
+                "state_filter": query.state_filter,
+                "type_filter": query.type_filter,
+                "search_query": query.search_query,
+                "cycle_id": cycle_id_single,
+                "cycle_ids": cycle_ids,
+                "area_node_id": query.area_node_id,
+                "parent_id": query.parent_id,
+                "include_deleted": query.include_deleted,
+                "root_artifact_id": root_artifact_id,
+                "exclude_root_artifact_types": exclude_roots,
+                "root_type_ids_exclude": system_roots if exclude_roots else None,
+                "fts_regconfig": fts_cfg,
+                "tag_id": query.tag_id,
+                "team_id": query.team_id,
+                "assignee_id": query.assignee_id,
+                "unassigned_only": query.unassigned_only,
+                "stale_traceability_only": query.stale_traceability_only,
+            },
         )
+
+    async def handle(self, query: Query) -> ListArtifactsResult:
+        assert isinstance(query, ListArtifacts)
+
+        after = decode_artifact_cursor(query.cursor, query.sort_by, query.sort_order) if query.cursor else None
+        scope = await self.resolve_scope(query)
+        if scope is None:
+            return ListArtifactsResult(items=[], total=0)
+
+        offset = query.offset if after is None else None
         artifacts = await self._artifact_repo.list_by_project(
             query.project_id,
-            query.state_filter,
-            type_filter=query.type_filter,
-            search_query=query.search_query,
-            cycle_id=cycle_id_single,
-            cycle_ids=cycle_ids,
-            area_node_id=query.area_node_id,
-            parent_id=query.parent_id,
             sort_by=query.sort_by,
             sort_order=query.sort_order,
-            limit=query.limit,
-            offset=query.offset,
-            include_deleted=query.include_deleted,
-            root_artifact_id=root_artifact_id,
-            exclude_root_artifact_types=exclude_roots,
-            root_type_ids_exclude=system_roots if exclude_roots else None,
-            fts_regconfig=fts_cfg,
-            tag_id=query.tag_id,
-            team_id=query.team_id,
-            assignee_id=query.assignee_id,
-            unassigned_only=query.unassigned_only,
-            stale_traceability_only=query.stale_traceability_only,
+            limit=query.limit + 1 if query.limit is not None else None,  # one extra row: is there a next page?
+            offset=offset,
+            after=after,
+            **scope.filters,
         )
+        has_more = query.limit is not None and len(artifacts) > query.limit
+        next_cursor: str | None = None
+        if has_more:
+            artifacts = artifacts[: query.limit]
+            if artifacts:
+                next_cursor = encode_artifact_cursor(artifacts[-1], query.sort_by, query.sort_order)
+
+        total: int | None = None
+        total_is_estimate = False
+        seen = (offset or 0) + len(artifacts)
+        if after is None and not has_more and (artifacts or not offset):
+            total = seen  # last page of an offset walk: the total is known without counting
+        elif query.total_mode == "exact":
+            total = await self._artifact_repo.count_by_project(query.project_id, **scope.filters)
+        elif query.total_mode == "estimate":
+            estimate = await self._artifact_repo.estimate_count_by_project(query.project_id, **scope.filters)
+            total = max(estimate, seen if after is None else 0)
+            total_is_estimate = True
+
         tag_map = await self._tag_repo.get_tags_by_artifact_ids([a.id for a in artifacts])
-        items = [
-            ArtifactDTO(
-                id=a.id,
-                project_id=a.project_id,
-                artifact_type=a.artifact_type,
-                title=a.title,
-                description=a.description,
-                state=a.state,
-                assignee_id=a.assignee_id,
-                parent_id=a.parent_id,
-                custom_fields=a.custom_fields,
-                artifact_key=a.artifact_key,
-                state_reason=a.state_reason,
-                resolution=a.resolution,
-                rank_order=a.rank_order,
-                cycle_id=getattr(a, "cycle_id", None),
-                area_node_id=getattr(a, "area_node_id", None),
-                area_path_snapshot=getattr(a, "area_path_snapshot", None),
-                team_id=getattr(a, "team_id", None),
-                created_at=getattr(a, "created_at", None),
-                updated_at=getattr(a, "updated_at", None),
-                stale_traceability=getattr(a, "stale_traceability", False),
-                stale_traceability_reason=getattr(a, "stale_traceability_reason", None),
-                stale_traceability_at=getattr(a, "stale_traceability_at", None),
-                tags=tag_map.get(a.id, ()),
-            )
-            for a in artifacts
-        ]
-
-        if version and manifest_bundle and items:
-            ast = get_manifest_ast(version.id, manifest_bundle)
-            roles = query.actor_roles or []
-            redacted_items: list[ArtifactDTO] = []
-            for dto in items:
-                redacted_snapshot = redact_data(ast, dto.__dict__, roles)
-                dto_fields = dto.__dataclass_fields__
-                updates = {k: v for k, v in redacted_snapshot.items() if k in dto_fields}
-                redacted_items.append(replace(dto, **updates) if updates else dto)
-            items = redacted_items
+        items = [artifact_to_dto(a, tag_map.get(a.id, ())) for a in artifacts]
+        items = redact_artifact_dtos(scope.compiled, items, query.actor_roles)
 
         if settings.debug:
             logger.debug(
@@ -228,8 +323,13 @@ class ListArtifactsHandler(QueryHandler[ListArtifactsResult]):
                 tree=query.tree,
                 total=total,
                 page_items=len(items),
-                root_artifact_id=str(root_artifact_id) if root_artifact_id else None,
+                root_artifact_id=str(root_id) if (root_id := scope.filters["root_artifact_id"]) else None,
                 include_system_roots=query.include_system_roots,
             )
 
-        return ListArtifactsResult(items=items, total=total)
+        return ListArtifactsResult(
+            items=items,
+            total=total,
+            next_cursor=next_cursor,
+            total_is_estimate=total_is_estimate,
+        )
@@ -6,7 +6,14 @@ import uuid
 from datetime import datetime
 from typing import Any
 
-from alm.artifact.domain.events import ArtifactCreated, ArtifactStateChanged, ArtifactUpdated
+from alm.artifact.domain.events import (
+    ArtifactCreated,
+    ArtifactDeleted,
+    ArtifactRestored,
+    ArtifactScheduleChanged,
+    ArtifactStateChanged,
+    ArtifactUpdated,
+)
 from alm.shared.domain.aggregate import AggregateRoot
 
 
@@ -82,8 +89,9 @@ class Artifact(AggregateRoot):
         area_node_id: uuid.UUID | None = None,
         area_path_snapshot: str | None = None,
         team_id: uuid.UUID | None = None,
+        tenant_id: uuid.UUID | None = None,
     ) -> Artifact:
-        """Create artifact and register ArtifactCreated domain event."""
+        """Create artifact and register ArtifactCreated domain event (``tenant_id`` is carried on the event)."""
         artifact = cls(
             project_id=project_id,
             artifact_type=artifact_type,
@@ -108,6 +116,7 @@ class Artifact(AggregateRoot):
                 artifact_type=artifact_type,
                 title=title,
                 state=state,
+                tenant_id=tenant_id,
             )
         )
         return artifact
@@ -123,8 +132,9 @@ class Artifact(AggregateRoot):
         *,
         state_reason: str | None = None,
         resolution: str | None = None,
+        tenant_id: uuid.UUID | None = None,
     ) -> None:
-        """Change workflow state (validated by manifest workflow engine)."""
+        """Change workflow state (validated by manifest workflow engine); ``tenant_id`` is carried on the event."""
         from_state = self.state
         self.state = new_state
         if state_reason is not None:
@@ -138,6 +148,8 @@ class Artifact(AggregateRoot):
                 project_id=self.project_id,
                 from_state=from_state,
                 to_state=new_state,
+                tenant_id=tenant_id,
+                artifact_type=self.artifact_type,
             )
         )
 
@@ -150,6 +162,23 @@ class Artifact(AggregateRoot):
             )
         )
 
+    def notify_schedule_changed(self) -> None:
+        """Register domain event so cycle burndown snapshots are refreshed (cycle or effort fields changed)."""
+        self._register_event(
+            ArtifactScheduleChanged(
+                artifact_id=self.id,
+                project_id=self.project_id,
+            )
+        )
+
+    def soft_delete(self, by: uuid.UUID) -> None:
+        super().soft_delete(by)
+        self._register_event(ArtifactDeleted(artifact_id=self.id, project_id=self.project_id))
+
+    def restore(self, by: uuid.UUID | None = None) -> None:
+        super().restore(by)
+        self._register_event(ArtifactRestored(artifact_id=self.id, project_id=self.project_id))
+
     def clear_stale_traceability(self) -> None:
         self.stale_traceability = False
         self.stale_traceability_reason = None
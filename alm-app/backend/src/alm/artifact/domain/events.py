@@ -15,6 +15,8 @@ class ArtifactCreated(DomainEvent):
     artifact_type: str
     title: str
     state: str
+    # None on events persisted before tenant_id was carried; handlers then resolve it from the project.
+    tenant_id: uuid.UUID | None = None
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -23,6 +25,9 @@ class ArtifactStateChanged(DomainEvent):
     project_id: uuid.UUID
     from_state: str
     to_state: str
+    # Optional context so handlers need no lookups (None on events persisted before these fields existed).
+    tenant_id: uuid.UUID | None = None
+    artifact_type: str | None = None
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -31,3 +36,23 @@ class ArtifactUpdated(DomainEvent):
 
     artifact_id: uuid.UUID
     project_id: uuid.UUID
+
+
+@dataclass(frozen=True, kw_only=True)
+class ArtifactScheduleChanged(DomainEvent):
+    """Cycle assignment or custom fields (effort estimates) changed — cycle burndown totals may be stale."""
+
+    artifact_id: uuid.UUID
+    project_id: uuid.UUID
+
+
+@dataclass(frozen=True, kw_only=True)
+class ArtifactDeleted(DomainEvent):
+    artifact_id: uuid.UUID
+    project_id: uuid.UUID
+
+
+@dataclass(frozen=True, kw_only=True)
+class ArtifactRestored(DomainEvent):
+    artifact_id: uuid.UUID
+    project_id: uuid.UUID
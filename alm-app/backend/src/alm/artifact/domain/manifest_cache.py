@@ -1,31 +1,259 @@
-"""Process-scoped AST cache keyed by immutable manifest version id."""
+"""Process-scoped manifest caches keyed by immutable process template version id.
+
+Process template versions are never mutated after insert (``UpdateProjectManifest`` always adds a new
+version row), so everything derived from a version's ``manifest_bundle`` can be computed once per
+process and shared across requests. ``CompiledManifest`` bundles the merged manifest with the derived
+lookups hot handlers need (AST, system roots, FTS config, burndown done states, tree roots, workflow
+defs per artifact type).
+"""
 
 from __future__ import annotations
 
+import threading
+import time
 import uuid
-from typing import Any
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
+from alm.artifact.domain.fulltext_config import resolve_fulltext_regconfig
 from alm.artifact.domain.manifest_ast import to_ast_fallback
+from alm.artifact.domain.manifest_merge_defaults import merge_manifest_metadata_defaults
+from alm.artifact.domain.manifest_workflow_metadata import (
+    get_tree_root_type_map,
+    resolve_burndown_done_states,
+    resolve_system_root_artifact_types,
+)
 from alm.artifact.domain.mpc_facade import HAS_MPC, mpc_normalize
 
-_CACHE: dict[uuid.UUID, Any] = {}
-_CACHE_MAX_SIZE = 128
+if TYPE_CHECKING:
+    from alm.artifact.domain.ports import IManifestCacheMetrics
 
+COMPILED_MANIFEST_CACHE_MAX_SIZE = 256
+_AST_CACHE_MAX_SIZE = 128
 
-def get_manifest_ast(version_id: uuid.UUID, manifest_bundle: dict[str, Any]) -> Any:
-    """Parse manifest to AST, cached by process_template_version_id."""
+
+class _NullManifestCacheMetrics:
+    def record_hit(self, cache: str) -> None:
+        return None
+
+    def record_miss(self, cache: str) -> None:
+        return None
+
+    def record_eviction(self, cache: str) -> None:
+        return None
+
+    def record_build_seconds(self, cache: str, duration: float) -> None:
+        return None
+
+
+_metrics: IManifestCacheMetrics | _NullManifestCacheMetrics = _NullManifestCacheMetrics()
+
+
+def set_manifest_cache_metrics(metrics: IManifestCacheMetrics | None) -> None:
+    """Install the observability port (called once at startup from handler registry)."""
+    global _metrics
+    _metrics = metrics if metrics is not None else _NullManifestCacheMetrics()
+
+
+class BoundedLRUCache:
+    """Small thread-safe LRU keyed by hashable ids; reports hit/miss/eviction to the metrics port."""
+
+    def __init__(self, name: str, max_size: int) -> None:
+        self._name = name
+        self._max_size = max(1, max_size)
+        self._data: OrderedDict[Any, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any | None:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+        if value is None:
+            _metrics.record_miss(self._name)
+        else:
+            _metrics.record_hit(self._name)
+        return value
+
+    def peek(self, key: Any) -> Any | None:
+        """Lookup without touching recency or hit/miss counters."""
+        with self._lock:
+            return self._data.get(key)
+
+    def put(self, key: Any, value: Any) -> None:
+        evicted = 0
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self._max_size:
+                self._data.popitem(last=False)
+                evicted += 1
+        for _ in range(evicted):
+            _metrics.record_eviction(self._name)
+
+    def record_build_seconds(self, duration: float) -> None:
+        """Time spent producing a value after a miss (compile / engine build)."""
+        _metrics.record_build_seconds(self._name, duration)
+
+    def pop(self, key: Any) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def pop_where(self, predicate: Callable[[Any], bool]) -> None:
+        with self._lock:
+            for k in [k for k in self._data if predicate(k)]:
+                del self._data[k]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+@dataclass(frozen=True)
+class CompiledManifest:
+    """Immutable, request-independent view of one process template version.
+
+    ``manifest_bundle`` is the merged bundle (``merge_manifest_metadata_defaults``) and is shared
+    between requests — callers must treat it as read-only.
+    """
+
+    version_id: uuid.UUID
+    manifest_bundle: dict[str, Any]
+    ast: Any
+    system_root_types: frozenset[str]
+    fulltext_regconfig: str
+    burndown_done_states: tuple[str, ...]
+    tree_root_types: Mapping[str, str]
+    workflow_defs: Mapping[str, dict[str, Any]] = field(default_factory=lambda: MappingProxyType({}))
+
+    def workflow_def_for(self, artifact_type: str) -> dict[str, Any] | None:
+        return self.workflow_defs.get(artifact_type)
+
+    def tree_root_type(self, tree_slug: str | None) -> str | None:
+        if not tree_slug or not str(tree_slug).strip():
+            return None
+        return self.tree_root_types.get(str(tree_slug).strip().lower())
+
+
+def _parse_ast(manifest_bundle: dict[str, Any]) -> Any:
     if HAS_MPC:
-        if version_id in _CACHE:
-            return _CACHE[version_id]
-        ast = mpc_normalize(manifest_bundle)
-        if len(_CACHE) >= _CACHE_MAX_SIZE:
-            for k in list(_CACHE.keys())[: _CACHE_MAX_SIZE // 2]:
-                del _CACHE[k]
-        _CACHE[version_id] = ast
-        return ast
+        return mpc_normalize(manifest_bundle)
     return to_ast_fallback(manifest_bundle)
 
 
+def _workflow_defs_by_type(manifest_bundle: dict[str, Any], ast: Any) -> dict[str, dict[str, Any]]:
+    from alm.artifact.domain.workflow_sm import get_workflow_def  # noqa: PLC0415 — workflow_sm imports resolver
+
+    out: dict[str, dict[str, Any]] = {}
+    for d in manifest_bundle.get("defs") or []:
+        if not isinstance(d, dict) or d.get("kind") != "ArtifactType" or not d.get("id"):
+            continue
+        type_id = str(d["id"])
+        wf_def = get_workflow_def(manifest_bundle, type_id, ast=ast)
+        if wf_def:
+            out[type_id] = wf_def
+    return out
+
+
+def compile_manifest(
+    version_id: uuid.UUID,
+    raw_manifest_bundle: dict[str, Any] | None,
+    *,
+    fulltext_default: str,
+) -> CompiledManifest:
+    """Merge defaults and precompute every per-version lookup (pure; no caching)."""
+    merged = merge_manifest_metadata_defaults(raw_manifest_bundle or {})
+    ast = _parse_ast(merged)
+    return CompiledManifest(
+        version_id=version_id,
+        manifest_bundle=merged,
+        ast=ast,
+        system_root_types=resolve_system_root_artifact_types(merged),
+        fulltext_regconfig=resolve_fulltext_regconfig(merged, fulltext_default),
+        burndown_done_states=resolve_burndown_done_states(merged),
+        tree_root_types=MappingProxyType(get_tree_root_type_map(merged)),
+        workflow_defs=MappingProxyType(_workflow_defs_by_type(merged, ast)),
+    )
+
+
+_COMPILED_CACHE = BoundedLRUCache("compiled_manifest", COMPILED_MANIFEST_CACHE_MAX_SIZE)
+_AST_CACHE = BoundedLRUCache("manifest_ast", _AST_CACHE_MAX_SIZE)
+
+
+def get_cached_compiled_manifest(version_id: uuid.UUID) -> CompiledManifest | None:
+    """Warm-path lookup (counts as hit or miss)."""
+    return _COMPILED_CACHE.get(version_id)
+
+
+def cache_compiled_manifest(
+    version_id: uuid.UUID,
+    raw_manifest_bundle: dict[str, Any] | None,
+    *,
+    fulltext_default: str,
+) -> CompiledManifest:
+    """Compile and store after a miss; a concurrent request that already compiled the version wins."""
+    compiled = _COMPILED_CACHE.peek(version_id)
+    if compiled is None:
+        start = time.perf_counter()
+        compiled = compile_manifest(version_id, raw_manifest_bundle, fulltext_default=fulltext_default)
+        _COMPILED_CACHE.record_build_seconds(time.perf_counter() - start)
+        _COMPILED_CACHE.put(version_id, compiled)
+    return compiled
+
+
+def get_peeked_compiled_manifest(version_id: uuid.UUID | None) -> CompiledManifest | None:
+    """Compiled manifest if already cached, without counting a hit/miss (for derived caches)."""
+    if version_id is None:
+        return None
+    return _COMPILED_CACHE.peek(version_id)
+
+
+_VERSION_SCOPED_CACHES: list[BoundedLRUCache] = []
+
+
+def register_version_scoped_cache(cache: BoundedLRUCache) -> BoundedLRUCache:
+    """Register a derived cache whose keys are tuples starting with the template version id.
+
+    ``invalidate_compiled_manifest`` evicts matching entries from every registered cache.
+    """
+    _VERSION_SCOPED_CACHES.append(cache)
+    return cache
+
+
+def invalidate_compiled_manifest(version_id: uuid.UUID) -> None:
+    """Drop all state derived from a version (e.g. after a project moves to a newly published version)."""
+    _COMPILED_CACHE.pop(version_id)
+    _AST_CACHE.pop(version_id)
+    for cache in _VERSION_SCOPED_CACHES:
+        cache.pop_where(lambda k: isinstance(k, tuple) and bool(k) and k[0] == version_id)
+
+
+def get_manifest_ast(version_id: uuid.UUID, manifest_bundle: dict[str, Any]) -> Any:
+    """Parse manifest to AST, cached by process_template_version_id.
+
+    Reuses the compiled manifest's AST when one exists for the version.
+    """
+    compiled = _COMPILED_CACHE.peek(version_id)
+    if compiled is not None:
+        return compiled.ast
+    if not HAS_MPC:
+        return to_ast_fallback(manifest_bundle)
+    ast = _AST_CACHE.get(version_id)
+    if ast is None:
+        ast = mpc_normalize(manifest_bundle)
+        _AST_CACHE.put(version_id, ast)
+    return ast
+
+
 def clear_manifest_ast_cache_for_tests() -> None:
     """Test helper."""
-    _CACHE.clear()
+    _COMPILED_CACHE.clear()
+    _AST_CACHE.clear()
+    for cache in _VERSION_SCOPED_CACHES:
+        cache.clear()
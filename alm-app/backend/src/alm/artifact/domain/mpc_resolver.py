@@ -14,7 +14,7 @@ from alm.artifact.domain import mpc_facade
 from alm.artifact.domain.fallback_policy import acl_result_without_mpc_engine as _acl_fallback_result
 from alm.artifact.domain.fallback_policy import audit_mpc_degraded, effective_mpc_mode, policy_result_without_mpc_engine
 from alm.artifact.domain.manifest_ast import get_def as _get_def
-from alm.artifact.domain.manifest_cache import get_manifest_ast
+from alm.artifact.domain.manifest_cache import BoundedLRUCache, get_manifest_ast, register_version_scoped_cache
 from alm.artifact.domain.manifest_transform import (
     get_workflow_transition_options,
     manifest_defs_to_flat,
@@ -28,6 +28,11 @@ _log = logging.getLogger(__name__)
 
 _to_ast = to_ast
 
+ACL_DECISION_CACHE_MAX_SIZE = 4096
+
+# Keys: (process_template_version_id, action, resource, sorted role tuple) -> (allowed, reasons).
+_ACL_DECISION_CACHE = register_version_scoped_cache(BoundedLRUCache("acl_decision", ACL_DECISION_CACHE_MAX_SIZE))
+
 
 def get_type_def(
     manifest_bundle: dict[str, Any],
@@ -88,10 +93,13 @@ def get_transition_actions(
     *,
     type_kind: str = TYPE_KIND_ARTIFACT,
     ast: Any | None = None,
+    version_id: uuid.UUID | None = None,
 ) -> dict[str, list[str]]:
     from alm.artifact.domain.workflow_sm import get_transition_actions as _get_transition_actions
 
-    return _get_transition_actions(manifest_bundle, type_id, from_state, to_state, type_kind=type_kind, ast=ast)
+    return _get_transition_actions(
+        manifest_bundle, type_id, from_state, to_state, type_kind=type_kind, ast=ast, version_id=version_id
+    )
 
 
 def build_artifact_transition_policy_event(
@@ -197,11 +205,41 @@ def acl_check(
     try:
         return mpc_facade.acl_engine_check(ast, action, resource, actor_roles)
     except Exception as e:  # noqa: BLE001
-        _log.warning("ACLEngine.check failed: %s", e, exc_info=True)
-        if effective_mpc_mode() == "strict":
-            return (False, ["ACL check failed; strict mode denies on engine error."])
-        audit_mpc_degraded("acl_check", mpc_available=True, detail=str(e))
-        return (False, ["ACL check temporarily unavailable"])
+        return _acl_engine_error_result(e)
+
+
+def _acl_engine_error_result(e: Exception) -> tuple[bool, list[str]]:
+    _log.warning("ACLEngine.check failed: %s", e, exc_info=True)
+    if effective_mpc_mode() == "strict":
+        return (False, ["ACL check failed; strict mode denies on engine error."])
+    audit_mpc_degraded("acl_check", mpc_available=True, detail=str(e))
+    return (False, ["ACL check temporarily unavailable"])
+
+
+def acl_check_memoized(
+    version_id: uuid.UUID,
+    ast: Any,
+    action: str,
+    resource: str,
+    actor_roles: list[str],
+) -> tuple[bool, list[str]]:
+    """``acl_check`` memoized per (version, action, resource, role set).
+
+    ``ast`` must be the AST of ``version_id`` (immutable). Fallback and engine-error results are not cached.
+    """
+    if not _HAS_MPC:
+        return _acl_fallback_result()
+
+    key = (version_id, action, resource, tuple(sorted(set(actor_roles or []))))
+    cached = _ACL_DECISION_CACHE.get(key)
+    if cached is not None:
+        return (cached[0], list(cached[1]))
+    try:
+        allowed, reasons = mpc_facade.acl_engine_check(ast, action, resource, list(key[3]))
+    except Exception as e:  # noqa: BLE001
+        return _acl_engine_error_result(e)
+    _ACL_DECISION_CACHE.put(key, (allowed, tuple(reasons)))
+    return (allowed, list(reasons))
 
 
 def redact_data(
@@ -228,6 +266,7 @@ __all__ = [
     "_HAS_MPC",
     "_to_ast",
     "acl_check",
+    "acl_check_memoized",
     "build_artifact_transition_policy_event",
     "check_transition_policies",
     "evaluate_transition_policy",
@@ -4,7 +4,10 @@ from __future__ import annotations
 
 import uuid
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from collections.abc import AsyncIterator, Mapping
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
 
 from alm.artifact.domain.entities import Artifact
 
@@ -12,6 +15,16 @@ if TYPE_CHECKING:
     from alm.shared.domain.specification import Specification
 
 
+@dataclass(frozen=True)
+class TransitionWrite:
+    """Outcome of ``ArtifactRepository.apply_transitions``: ids written, ids skipped by the ``updated_at`` guard
+    and ids whose row the database rejected (constraint or data error)."""
+
+    written: frozenset[uuid.UUID] = field(default_factory=frozenset)
+    conflicted: frozenset[uuid.UUID] = field(default_factory=frozenset)
+    failed: frozenset[uuid.UUID] = field(default_factory=frozenset)
+
+
 class ArtifactRepository(ABC):
     """Port for artifact persistence."""
 
@@ -48,7 +61,13 @@ class ArtifactRepository(ABC):
         assignee_id: uuid.UUID | None = None,
         unassigned_only: bool = False,
         stale_traceability_only: bool = False,
-    ) -> list[Artifact]: ...
+        after: tuple[Any, uuid.UUID] | None = None,
+    ) -> list[Artifact]:
+        """Ordered by the sort column (NULLS LAST) with ``id`` as tiebreaker.
+
+        ``after`` is the ``(sort value, id)`` of the previous page's last row (keyset pagination).
+        """
+        ...
 
     @abstractmethod
     async def count_by_project(
@@ -79,6 +98,41 @@ class ArtifactRepository(ABC):
         """
         ...
 
+    @abstractmethod
+    async def estimate_count_by_project(self, project_id: uuid.UUID, **filters: Any) -> int:
+        """Planner row estimate for the ``count_by_project`` filters (no table scan; may be inexact)."""
+        ...
+
+    @abstractmethod
+    def stream_by_project(
+        self,
+        project_id: uuid.UUID,
+        *,
+        sort_by: str | None = None,
+        sort_order: str | None = None,
+        page_size: int = 1000,
+        **filters: Any,
+    ) -> AsyncIterator[list[Artifact]]:
+        """Iterate artifacts matching the ``count_by_project`` filters in pages of ``page_size``.
+
+        Rows are read through a server-side cursor, so memory stays bounded by one page.
+        """
+        ...
+
+    @abstractmethod
+    async def list_hierarchy_by_project(
+        self,
+        project_id: uuid.UUID,
+        **filters: Any,
+    ) -> list[tuple[uuid.UUID, uuid.UUID | None, str, str | None]]:
+        """``(id, parent_id, title, artifact_key)`` for artifacts matching the ``count_by_project`` filters."""
+        ...
+
+    @abstractmethod
+    async def list_custom_field_keys_by_project(self, project_id: uuid.UUID, **filters: Any) -> list[str]:
+        """Sorted distinct top-level ``custom_fields`` keys of artifacts matching the ``count_by_project`` filters."""
+        ...
+
     @abstractmethod
     async def list_by_spec(self, spec: Specification[Artifact]) -> list[Artifact]:
         """List artifacts satisfying specification (in-memory filter after fetch)."""
@@ -90,6 +144,16 @@ class ArtifactRepository(ABC):
     @abstractmethod
     async def update(self, artifact: Artifact) -> Artifact: ...
 
+    @abstractmethod
+    async def add_many(self, artifacts: list[Artifact]) -> None:
+        """Insert many new artifacts in one round trip (parents before children); buffers audit entries."""
+        ...
+
+    @abstractmethod
+    async def update_many(self, artifacts: list[Artifact]) -> None:
+        """Persist many modified artifacts in one round trip; buffers audit entries."""
+        ...
+
     @abstractmethod
     async def count_open_defects_by_project_ids(self, project_ids: list[uuid.UUID]) -> int:
         """Count defects not in a final state (closed, done)."""
@@ -107,6 +171,20 @@ class ArtifactRepository(ABC):
         """List recent artifacts (id, project_id, title, state, artifact_type, updated_at) by updated_at desc."""
         ...
 
+    @abstractmethod
+    async def sum_effort_buckets_by_cycles(
+        self,
+        project_id: uuid.UUID,
+        cycle_ids: list[uuid.UUID],
+        done_states: tuple[str, ...],
+        effort_field: str,
+    ) -> list[tuple[uuid.UUID, float, float]]:
+        """Total and done-state effort (custom_fields[effort_field]) per cycle in one grouped query.
+
+        Returns [(cycle_id, total, done), ...] in ``cycle_ids`` order; non-numeric values are ignored.
+        """
+        ...
+
     @abstractmethod
     async def sum_effort_by_cycles(
         self,
@@ -142,6 +220,17 @@ class ArtifactRepository(ABC):
     ) -> list[Artifact]:
         """Non-deleted artifacts in the project whose id is in the list (any type)."""
 
+    @abstractmethod
+    async def list_ancestors_in_project(
+        self,
+        project_id: uuid.UUID,
+        artifact_ids: list[uuid.UUID],
+    ) -> list[Artifact]:
+        """Non-deleted ancestors (the ``parent_id`` chains) of the given artifacts, in one query.
+
+        A chain stops at its first deleted parent; each ancestor is returned once.
+        """
+
     @abstractmethod
     async def list_by_project_and_artifact_keys(
         self,
@@ -150,6 +239,23 @@ class ArtifactRepository(ABC):
     ) -> list[Artifact]:
         """Artifacts in project whose artifact_key matches any hint (case-insensitive). Empty hints ignored."""
 
+    @abstractmethod
+    async def apply_transitions(
+        self,
+        artifacts: list[Artifact],
+        expected_updated_at: Mapping[uuid.UUID, datetime | None],
+        *,
+        all_or_nothing: bool = False,
+    ) -> TransitionWrite:
+        """Persist state/reason/resolution of already transitioned artifacts in one statement.
+
+        Rows whose ``updated_at`` no longer equals ``expected_updated_at[id]`` are skipped (concurrent edit) and
+        reported as ``conflicted``. Without ``all_or_nothing`` a row the database rejects is retried alone and
+        reported as ``failed``; with it the error propagates. With ``all_or_nothing`` any skipped row rolls the whole
+        write back: nothing is ``written`` and only the skipped rows are ``conflicted``. Events and audit entries
+        are buffered only for written artifacts.
+        """
+
 
 class IArtifactTransitionMetrics(ABC):
     """Port for recording artifact transition metrics (observability). Implemented in infrastructure."""
@@ -159,3 +265,19 @@ class IArtifactTransitionMetrics(ABC):
 
     @abstractmethod
     def record_result(self, result: str) -> None: ...
+
+
+class IManifestCacheMetrics(ABC):
+    """Port for process-wide manifest cache observability (hit / miss / eviction per cache name)."""
+
+    @abstractmethod
+    def record_hit(self, cache: str) -> None: ...
+
+    @abstractmethod
+    def record_miss(self, cache: str) -> None: ...
+
+    @abstractmethod
+    def record_eviction(self, cache: str) -> None: ...
+
+    @abstractmethod
+    def record_build_seconds(self, cache: str, duration: float) -> None: ...
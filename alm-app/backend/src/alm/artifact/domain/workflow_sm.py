@@ -5,15 +5,25 @@ manifest and uses it for initial state, valid transitions, permitted triggers, a
 action names. Policy/ACL (``TransitionPolicy``, ``Policy`` kind, ACL defs) are evaluated in
 ``mpc_resolver`` / ``evaluate_transition_policy``, not here.
 
+Pass ``version_id`` (process template version) when the manifest is the version's compiled bundle:
+engines are then built once per (version, type) and reused from a process-wide LRU registry.
+
 See ``docs/WORKFLOW_ENGINE_BOUNDARY.md``.
 """
 
 from __future__ import annotations
 
+import time
+import uuid
 from typing import Any
 
 from alm.artifact.domain.guard_evaluator import evaluate_guard
 from alm.artifact.domain.manifest_ast import get_def, to_ast_fallback
+from alm.artifact.domain.manifest_cache import (
+    BoundedLRUCache,
+    get_peeked_compiled_manifest,
+    register_version_scoped_cache,
+)
 from alm.artifact.domain.mpc_resolver import TYPE_KIND_ARTIFACT
 
 try:
@@ -27,6 +37,22 @@ except ImportError:
     WorkflowEngine = Any  # type: ignore[misc, assignment]
     ExprEngine = Any  # type: ignore[misc, assignment]
 
+WORKFLOW_ENGINE_CACHE_MAX_SIZE = 1024
+
+# Keys: (process_template_version_id, type_kind, type_id). Evicted with the version's compiled manifest.
+_ENGINE_CACHE = register_version_scoped_cache(BoundedLRUCache("workflow_engine", WORKFLOW_ENGINE_CACHE_MAX_SIZE))
+
+
+def _build_workflow_engine(wf_def: dict[str, Any]) -> WorkflowEngine:
+    try:
+        expr_engine = ExprEngine(meta=DomainMeta())
+    except TypeError:
+        expr_engine = ExprEngine()
+    return WorkflowEngine.from_fixture_input(
+        wf_def,
+        expr_engine=expr_engine,
+    )
+
 
 def get_workflow_engine(
     manifest_bundle: dict[str, Any],
@@ -35,30 +61,36 @@ def get_workflow_engine(
     type_kind: str = TYPE_KIND_ARTIFACT,
     ast: Any | None = None,
     workflow_def: dict[str, Any] | None = None,
+    version_id: uuid.UUID | None = None,
 ) -> WorkflowEngine | None:
-    """Build a native MPC WorkflowEngine for the given artifact type.
+    """Build (or reuse) a native MPC WorkflowEngine for the given artifact type.
 
     Pass ``workflow_def`` when already resolved to avoid a second ``get_workflow_def`` call.
+    With ``version_id`` the engine comes from the process-wide registry; callers must set
+    ``active_states`` right before querying it (engines are shared between requests).
     """
     if not _HAS_MPC:
         return None
 
+    key = (version_id, type_kind, type_id) if version_id is not None else None
+    if key is not None:
+        cached = _ENGINE_CACHE.get(key)
+        if cached is not None:
+            return cached
+
     wf_def = (
         workflow_def
         if workflow_def is not None
-        else get_workflow_def(manifest_bundle, type_id, type_kind=type_kind, ast=ast)
+        else get_workflow_def(manifest_bundle, type_id, type_kind=type_kind, ast=ast, version_id=version_id)
     )
     if not wf_def:
         return None
 
-    try:
-        expr_engine = ExprEngine(meta=DomainMeta())
-    except TypeError:
-        expr_engine = ExprEngine()
-    engine = WorkflowEngine.from_fixture_input(
-        wf_def,
-        expr_engine=expr_engine,
-    )
+    start = time.perf_counter()
+    engine = _build_workflow_engine(wf_def)
+    if key is not None:
+        _ENGINE_CACHE.record_build_seconds(time.perf_counter() - start)
+        _ENGINE_CACHE.put(key, engine)
     return engine
 
 
@@ -100,8 +132,12 @@ def get_workflow_def(
     *,
     type_kind: str = TYPE_KIND_ARTIFACT,
     ast: Any | None = None,
+    version_id: uuid.UUID | None = None,
 ) -> dict[str, Any] | None:
     """Get workflow definition (states, transitions, initial) for the given artifact type."""
+    compiled = get_peeked_compiled_manifest(version_id)
+    if compiled is not None:
+        return compiled.workflow_def_for(type_id)
     if ast is None:
         if not (manifest_bundle or {}).get("defs"):
             return None
@@ -115,9 +151,10 @@ def get_initial_state(
     *,
     type_kind: str = TYPE_KIND_ARTIFACT,
     ast: Any | None = None,
+    version_id: uuid.UUID | None = None,
 ) -> str | None:
     """Return initial state for the artifact type's workflow."""
-    engine = get_workflow_engine(manifest_bundle, type_id, type_kind=type_kind, ast=ast)
+    engine = get_workflow_engine(manifest_bundle, type_id, type_kind=type_kind, ast=ast, version_id=version_id)
     if not engine:
         return None
     return engine.initial_state
@@ -131,9 +168,10 @@ def is_valid_transition(
     *,
     type_kind: str = TYPE_KIND_ARTIFACT,
     ast: Any | None = None,
+    version_id: uuid.UUID | None = None,
 ) -> bool:
     """Return True if (from_state, to_state) is allowed by the workflow."""
-    engine = get_workflow_engine(manifest_bundle, type_id, type_kind=type_kind, ast=ast)
+    engine = get_workflow_engine(manifest_bundle, type_id, type_kind=type_kind, ast=ast, version_id=version_id)
     if not engine:
         return False
     if hasattr(engine, "is_valid_transition"):
@@ -176,10 +214,13 @@ def get_transition_actions(
     *,
     type_kind: str = TYPE_KIND_ARTIFACT,
     ast: Any | None = None,
+    version_id: uuid.UUID | None = None,
 ) -> dict[str, list[str]]:
     """Return on_leave and on_enter action names for the transition (from manifest)."""
-    wf_def = get_workflow_def(manifest_bundle, type_id, type_kind=type_kind, ast=ast)
-    engine = get_workflow_engine(manifest_bundle, type_id, type_kind=type_kind, ast=ast, workflow_def=wf_def)
+    wf_def = get_workflow_def(manifest_bundle, type_id, type_kind=type_kind, ast=ast, version_id=version_id)
+    engine = get_workflow_engine(
+        manifest_bundle, type_id, type_kind=type_kind, ast=ast, workflow_def=wf_def, version_id=version_id
+    )
     if engine and hasattr(engine, "get_transition_actions"):
         return engine.get_transition_actions(from_state, to_state)
     return _transition_actions_from_wf_def(wf_def, from_state, to_state)
@@ -193,9 +234,10 @@ def get_transition_guard(
     *,
     type_kind: str = TYPE_KIND_ARTIFACT,
     ast: Any | None = None,
+    version_id: uuid.UUID | None = None,
 ) -> Any:
     """Return the guard value for the transition (from, to) or None if no guard."""
-    wf_def = get_workflow_def(manifest_bundle, type_id, type_kind=type_kind, ast=ast)
+    wf_def = get_workflow_def(manifest_bundle, type_id, type_kind=type_kind, ast=ast, version_id=version_id)
     if not wf_def:
         return None
     # This helper was removed, so we need to re-implement the logic here
@@ -217,10 +259,13 @@ def get_permitted_triggers(
     type_kind: str = TYPE_KIND_ARTIFACT,
     ast: Any | None = None,
     entity_snapshot: dict[str, Any] | None = None,
+    version_id: uuid.UUID | None = None,
 ) -> list[tuple[str, str, str]]:
     """Return list of (trigger, to_state, label) permitted from current_state."""
-    wf_def = get_workflow_def(manifest_bundle, type_id, type_kind=type_kind, ast=ast)
-    engine = get_workflow_engine(manifest_bundle, type_id, type_kind=type_kind, ast=ast, workflow_def=wf_def)
+    wf_def = get_workflow_def(manifest_bundle, type_id, type_kind=type_kind, ast=ast, version_id=version_id)
+    engine = get_workflow_engine(
+        manifest_bundle, type_id, type_kind=type_kind, ast=ast, workflow_def=wf_def, version_id=version_id
+    )
     if not engine:
         return []
 
@@ -253,6 +298,7 @@ def get_permitted_triggers(
                 to_state,
                 type_kind=type_kind,
                 ast=ast,
+                version_id=version_id,
             )
             if evaluate_guard(guard, entity_snapshot):
                 filtered.append((on, to_state, lab))
@@ -1,10 +1,10 @@
-"""Artifact transition metrics for Prometheus — implements domain port IArtifactTransitionMetrics."""
+"""Artifact metrics for Prometheus — implements domain ports IArtifactTransitionMetrics and IManifestCacheMetrics."""
 
 from __future__ import annotations
 
 from prometheus_client import Counter, Histogram
 
-from alm.artifact.domain.ports import IArtifactTransitionMetrics
+from alm.artifact.domain.ports import IArtifactTransitionMetrics, IManifestCacheMetrics
 
 alm_artifact_transition_total = Counter(
     "alm_artifact_transition_total",
@@ -18,6 +18,31 @@ alm_artifact_transition_duration_seconds = Histogram(
     buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
 )
 
+alm_manifest_cache_hits_total = Counter(
+    "alm_manifest_cache_hits_total",
+    "Process-wide manifest cache hits by cache name",
+    ["cache"],
+)
+
+alm_manifest_cache_misses_total = Counter(
+    "alm_manifest_cache_misses_total",
+    "Process-wide manifest cache misses by cache name",
+    ["cache"],
+)
+
+alm_manifest_cache_evictions_total = Counter(
+    "alm_manifest_cache_evictions_total",
+    "Process-wide manifest cache LRU evictions by cache name",
+    ["cache"],
+)
+
+alm_manifest_cache_build_duration_seconds = Histogram(
+    "alm_manifest_cache_build_duration_seconds",
+    "Time to build a cached value after a miss (compiled manifest, workflow engine) in seconds",
+    ["cache"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25),
+)
+
 
 class PrometheusArtifactTransitionMetrics(IArtifactTransitionMetrics):
     """Infrastructure implementation of artifact transition metrics."""
@@ -27,3 +52,19 @@ class PrometheusArtifactTransitionMetrics(IArtifactTransitionMetrics):
 
     def record_result(self, result: str) -> None:
         alm_artifact_transition_total.labels(result=result).inc()
+
+
+class PrometheusManifestCacheMetrics(IManifestCacheMetrics):
+    """Infrastructure implementation of manifest cache metrics."""
+
+    def record_hit(self, cache: str) -> None:
+        alm_manifest_cache_hits_total.labels(cache=cache).inc()
+
+    def record_miss(self, cache: str) -> None:
+        alm_manifest_cache_misses_total.labels(cache=cache).inc()
+
+    def record_eviction(self, cache: str) -> None:
+        alm_manifest_cache_evictions_total.labels(cache=cache).inc()
+
+    def record_build_seconds(self, cache: str, duration: float) -> None:
+        alm_manifest_cache_build_duration_seconds.labels(cache=cache).observe(duration)
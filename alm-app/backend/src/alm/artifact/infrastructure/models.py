@@ -6,7 +6,7 @@ import uuid
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import Boolean, DateTime, Float, ForeignKey, String, Text, UniqueConstraint, Uuid
+from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Index, String, Text, UniqueConstraint, Uuid, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -15,7 +15,32 @@ from alm.shared.infrastructure.db.base_model import Base, SoftDeleteMixin, Times
 
 class ArtifactModel(Base, TimestampMixin, SoftDeleteMixin):
     __tablename__ = "artifacts"
-    __table_args__ = (UniqueConstraint("project_id", "artifact_key", name="uq_artifact_project_key"),)
+    __table_args__ = (
+        UniqueConstraint("project_id", "artifact_key", name="uq_artifact_project_key"),
+        # Keyset pagination of the default list sorts (sort column + id tiebreaker).
+        Index(
+            "ix_artifacts_project_created_id",
+            "project_id",
+            "created_at",
+            "id",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_artifacts_project_updated_id",
+            "project_id",
+            "updated_at",
+            "id",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        # Grouped effort aggregation per cycle and state (velocity / burndown).
+        Index(
+            "ix_artifacts_project_cycle_state",
+            "project_id",
+            "cycle_id",
+            "state",
+            postgresql_where=text("deleted_at IS NULL AND cycle_id IS NOT NULL"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
     artifact_key: Mapped[str] = mapped_column(String(50), nullable=True, index=True)
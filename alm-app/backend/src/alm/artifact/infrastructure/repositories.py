@@ -2,29 +2,61 @@
 
 from __future__ import annotations
 
+import json
 import uuid
+from collections.abc import AsyncIterator, Mapping
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import func, select, text, update
+import structlog
+from sqlalchemy import (
+    DateTime,
+    Numeric,
+    String,
+    Uuid,
+    and_,
+    case,
+    cast,
+    column,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    text,
+    tuple_,
+    update,
+    values,
+)
+from sqlalchemy.exc import DataError, IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
 
 from alm.artifact.domain.entities import Artifact
 from alm.artifact.domain.fulltext_config import normalize_fulltext_regconfig
 from alm.artifact.domain.manifest_workflow_metadata import DEFAULT_SYSTEM_ROOT_TYPES
-from alm.artifact.domain.ports import ArtifactRepository
+from alm.artifact.domain.ports import ArtifactRepository, TransitionWrite
 from alm.config.settings import settings
 
 if TYPE_CHECKING:
     from alm.shared.domain.specification import Specification
-import contextlib
 
 from alm.artifact.infrastructure.models import ArtifactModel
 from alm.project_tag.infrastructure.models import ArtifactTagModel
+from alm.quality.domain.entities import TEST_RUN_ARTIFACT_TYPE
+from alm.quality.domain.events import RunMetricsRecorded
+from alm.quality.infrastructure.repositories import SqlAlchemyExecutionResultRepository
 from alm.shared.application.mediator import buffer_events
 from alm.shared.audit.core import ChangeType
 from alm.shared.audit.interceptor import buffer_audit
 from alm.task.infrastructure.models import TaskModel
 
+logger = structlog.get_logger()
+
+# Text accepted by float() for plain decimal/scientific numbers; other effort values are ignored (as before).
+_NUMERIC_TEXT_PATTERN = r"^\s*[-+]?([0-9]+(\.[0-9]*)?|\.[0-9]+)([eE][-+]?[0-9]+)?\s*$"
+
 
 def _effective_fts_regconfig(explicit: str | None) -> str:
     if explicit is not None:
@@ -32,6 +64,20 @@ def _effective_fts_regconfig(explicit: str | None) -> str:
     return normalize_fulltext_regconfig(settings.fulltext_search_config)
 
 
+class _ExplainJson(Executable, ClauseElement):
+    """``EXPLAIN (FORMAT JSON) <select>`` keeping the statement's bind parameters (planner row estimate)."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Any) -> None:
+        self.statement = statement
+
+
+@compiles(_ExplainJson)
+def _compile_explain_json(element: _ExplainJson, compiler: Any, **kw: Any) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
 class SqlAlchemyArtifactRepository(ArtifactRepository):
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
@@ -149,20 +195,20 @@ class SqlAlchemyArtifactRepository(ArtifactRepository):
         unassigned_only: bool = False,
         stale_traceability_only: bool = False,
     ) -> int:
-        q = select(func.count(ArtifactModel.id)).where(
-            ArtifactModel.project_id == project_id,
-            ArtifactModel.deleted_at.is_(None) if not include_deleted else ArtifactModel.deleted_at.isnot(None),
-        )
-        q = self._list_by_project_filters(
-            q,
-            state_filter,
-            type_filter,
-            search_query,
+        q = self._project_scope(
+            select(func.count(ArtifactModel.id)),
+            project_id,
+            state_filter=state_filter,
+            type_filter=type_filter,
+            search_query=search_query,
             cycle_id=cycle_id,
             cycle_ids=cycle_ids,
             area_node_id=area_node_id,
             parent_id=parent_id,
+            include_deleted=include_deleted,
             root_artifact_id=root_artifact_id,
+            exclude_root_artifact_types=exclude_root_artifact_types,
+            root_type_ids_exclude=root_type_ids_exclude,
             fts_regconfig=fts_regconfig,
             tag_id=tag_id,
             team_id=team_id,
@@ -170,9 +216,6 @@ class SqlAlchemyArtifactRepository(ArtifactRepository):
             unassigned_only=unassigned_only,
             stale_traceability_only=stale_traceability_only,
         )
-        to_ex = self._root_types_to_exclude(exclude_root_artifact_types, root_type_ids_exclude)
-        if to_ex:
-            q = q.where(ArtifactModel.artifact_type.notin_(to_ex))
         result = await self._session.execute(q)
         return result.scalar_one() or 0
 
@@ -186,6 +229,60 @@ class SqlAlchemyArtifactRepository(ArtifactRepository):
         to_ex = tuple(root_type_ids_exclude) if root_type_ids_exclude is not None else tuple(DEFAULT_SYSTEM_ROOT_TYPES)
         return to_ex if to_ex else None
 
+    def _project_scope(
+        self,
+        q: Any,
+        project_id: uuid.UUID,
+        *,
+        state_filter: str | None = None,
+        type_filter: str | None = None,
+        search_query: str | None = None,
+        include_deleted: bool = False,
+        exclude_root_artifact_types: bool = False,
+        root_type_ids_exclude: frozenset[str] | None = None,
+        **filters: Any,
+    ) -> Any:
+        """Project + deleted scope, common filters and system-root exclusion (list, count and stream)."""
+        q = q.where(
+            ArtifactModel.project_id == project_id,
+            ArtifactModel.deleted_at.is_(None) if not include_deleted else ArtifactModel.deleted_at.isnot(None),
+        )
+        q = self._list_by_project_filters(q, state_filter, type_filter, search_query, **filters)
+        to_ex = self._root_types_to_exclude(exclude_root_artifact_types, root_type_ids_exclude)
+        if to_ex:
+            q = q.where(ArtifactModel.artifact_type.notin_(to_ex))
+        return q
+
+    def _sort_column(self, sort_by: str | None) -> Any:
+        column_name = (self._SORT_COLUMNS.get(sort_by) if sort_by else None) or "created_at"
+        return getattr(ArtifactModel, column_name)
+
+    def _order_by(self, q: Any, sort_by: str | None, sort_order: str | None) -> Any:
+        """Sort column (NULLS LAST) plus ``id`` tiebreaker in the same direction: a total order for keysets.
+
+        ``NULLS LAST`` is only spelled out for nullable columns: on NOT NULL ``created_at`` / ``updated_at`` it
+        would keep PostgreSQL from scanning the ``(project_id, <column>, id)`` indexes backwards for DESC pages.
+        """
+        column = self._sort_column(sort_by)
+        if (sort_order or "desc").lower() == "asc":
+            # ASC already sorts NULLs last.
+            return q.order_by(column.asc(), ArtifactModel.id.asc())
+        ordered = column.desc().nulls_last() if column.nullable else column.desc()
+        return q.order_by(ordered, ArtifactModel.id.desc())
+
+    def _keyset_after(self, sort_by: str | None, sort_order: str | None, after: tuple[Any, uuid.UUID]) -> Any:
+        """Rows strictly after ``(sort value, id)`` of the previous page's last row in ``_order_by`` order."""
+        column = self._sort_column(sort_by)
+        value, last_id = after
+        ascending = (sort_order or "desc").lower() == "asc"
+        if value is None:
+            # NULLS LAST: only the remaining NULL rows follow, ordered by id.
+            return and_(column.is_(None), ArtifactModel.id > last_id if ascending else ArtifactModel.id < last_id)
+        row = tuple_(column, ArtifactModel.id)
+        bound = tuple_(literal(value, column.type), literal(last_id, ArtifactModel.id.type))
+        beyond = row > bound if ascending else row < bound
+        return or_(beyond, column.is_(None)) if column.nullable else beyond
+
     async def list_by_project(
         self,
         project_id: uuid.UUID,
@@ -210,21 +307,22 @@ class SqlAlchemyArtifactRepository(ArtifactRepository):
         assignee_id: uuid.UUID | None = None,
         unassigned_only: bool = False,
         stale_traceability_only: bool = False,
+        after: tuple[Any, uuid.UUID] | None = None,
     ) -> list[Artifact]:
-        q = select(ArtifactModel).where(
-            ArtifactModel.project_id == project_id,
-            ArtifactModel.deleted_at.is_(None) if not include_deleted else ArtifactModel.deleted_at.isnot(None),
-        )
-        q = self._list_by_project_filters(
-            q,
-            state_filter,
-            type_filter,
-            search_query,
+        q = self._project_scope(
+            select(ArtifactModel),
+            project_id,
+            state_filter=state_filter,
+            type_filter=type_filter,
+            search_query=search_query,
             cycle_id=cycle_id,
             cycle_ids=cycle_ids,
             area_node_id=area_node_id,
             parent_id=parent_id,
+            include_deleted=include_deleted,
             root_artifact_id=root_artifact_id,
+            exclude_root_artifact_types=exclude_root_artifact_types,
+            root_type_ids_exclude=root_type_ids_exclude,
             fts_regconfig=fts_regconfig,
             tag_id=tag_id,
             team_id=team_id,
@@ -232,16 +330,9 @@ class SqlAlchemyArtifactRepository(ArtifactRepository):
             unassigned_only=unassigned_only,
             stale_traceability_only=stale_traceability_only,
         )
-        to_ex = self._root_types_to_exclude(exclude_root_artifact_types, root_type_ids_exclude)
-        if to_ex:
-            q = q.where(ArtifactModel.artifact_type.notin_(to_ex))
-        column_name = self._SORT_COLUMNS.get(sort_by) if sort_by else "created_at"
-        order_asc = (sort_order or "desc").lower() == "asc"
-        column = getattr(ArtifactModel, column_name or "created_at", None)
-        if column is not None:
-            q = q.order_by(column.asc() if order_asc else column.desc())
-        else:
-            q = q.order_by(ArtifactModel.created_at.desc())
+        if after is not None:
+            q = q.where(self._keyset_after(sort_by, sort_order, after))
+        q = self._order_by(q, sort_by, sort_order)
         if offset is not None:
             q = q.offset(offset)
         if limit is not None:
@@ -249,6 +340,51 @@ class SqlAlchemyArtifactRepository(ArtifactRepository):
         result = await self._session.execute(q)
         return [self._to_entity(m) for m in result.scalars().all()]
 
+    async def stream_by_project(
+        self,
+        project_id: uuid.UUID,
+        *,
+        sort_by: str | None = None,
+        sort_order: str | None = None,
+        page_size: int = 1000,
+        **filters: Any,
+    ) -> AsyncIterator[list[Artifact]]:
+        q = self._order_by(self._project_scope(select(ArtifactModel), project_id, **filters), sort_by, sort_order)
+        result = await self._session.stream(q.execution_options(yield_per=page_size))
+        try:
+            async for page in result.scalars().partitions(page_size):
+                yield [self._to_entity(m) for m in page]
+        finally:
+            await result.close()
+
+    async def estimate_count_by_project(self, project_id: uuid.UUID, **filters: Any) -> int:
+        q = self._project_scope(select(ArtifactModel.id), project_id, **filters)
+        result = await self._session.execute(_ExplainJson(q))
+        plan = result.scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return max(0, int(plan[0]["Plan"]["Plan Rows"]))
+
+    async def list_hierarchy_by_project(
+        self,
+        project_id: uuid.UUID,
+        **filters: Any,
+    ) -> list[tuple[uuid.UUID, uuid.UUID | None, str, str | None]]:
+        q = self._project_scope(
+            select(ArtifactModel.id, ArtifactModel.parent_id, ArtifactModel.title, ArtifactModel.artifact_key),
+            project_id,
+            **filters,
+        )
+        result = await self._session.execute(q)
+        return [(r[0], r[1], r[2], r[3]) for r in result.all()]
+
+    async def list_custom_field_keys_by_project(self, project_id: uuid.UUID, **filters: Any) -> list[str]:
+        key = func.jsonb_object_keys(ArtifactModel.custom_fields)
+        q = self._project_scope(select(key).distinct(), project_id, **filters)
+        q = q.where(func.jsonb_typeof(ArtifactModel.custom_fields) == "object")
+        result = await self._session.execute(q)
+        return sorted(str(k) for k in result.scalars().all())
+
     async def count_open_defects_by_project_ids(self, project_ids: list[uuid.UUID]) -> int:
         if not project_ids:
             return 0
@@ -321,6 +457,39 @@ class SqlAlchemyArtifactRepository(ArtifactRepository):
         )
         return [self._to_entity(m) for m in result.scalars().all()]
 
+    async def list_ancestors_in_project(
+        self,
+        project_id: uuid.UUID,
+        artifact_ids: list[uuid.UUID],
+    ) -> list[Artifact]:
+        if not artifact_ids:
+            return []
+        # UNION deduplicates shared ancestors and stops on a parent cycle; deleted parents are not walked past.
+        chain = (
+            select(ArtifactModel.parent_id.label("id"))
+            .where(
+                ArtifactModel.project_id == project_id,
+                ArtifactModel.id.in_(artifact_ids),
+                ArtifactModel.parent_id.is_not(None),
+            )
+            .cte("ancestor_chain", recursive=True)
+        )
+        chain = chain.union(
+            select(ArtifactModel.parent_id).where(
+                ArtifactModel.id == chain.c.id,
+                ArtifactModel.parent_id.is_not(None),
+                ArtifactModel.deleted_at.is_(None),
+            )
+        )
+        result = await self._session.execute(
+            select(ArtifactModel).where(
+                ArtifactModel.project_id == project_id,
+                ArtifactModel.id.in_(select(chain.c.id)),
+                ArtifactModel.deleted_at.is_(None),
+            )
+        )
+        return [self._to_entity(m) for m in result.scalars().all()]
+
     async def list_by_project_and_artifact_keys(
         self,
         project_id: uuid.UUID,
@@ -339,33 +508,13 @@ class SqlAlchemyArtifactRepository(ArtifactRepository):
         return [self._to_entity(m) for m in result.scalars().all()]
 
     async def add(self, artifact: Artifact) -> Artifact:
-        model = ArtifactModel(
-            id=artifact.id,
-            project_id=artifact.project_id,
-            artifact_type=artifact.artifact_type,
-            title=artifact.title,
-            description=artifact.description,
-            state=artifact.state,
-            assignee_id=artifact.assignee_id,
-            parent_id=artifact.parent_id,
-            custom_fields=artifact.custom_fields or {},
-            artifact_key=artifact.artifact_key,
-            state_reason=artifact.state_reason,
-            resolution=artifact.resolution,
-            rank_order=artifact.rank_order,
-            cycle_id=artifact.cycle_id,
-            area_node_id=artifact.area_node_id,
-            area_path_snapshot=artifact.area_path_snapshot,
-            team_id=artifact.team_id,
-            stale_traceability=getattr(artifact, "stale_traceability", False),
-            stale_traceability_reason=getattr(artifact, "stale_traceability_reason", None),
-            stale_traceability_at=getattr(artifact, "stale_traceability_at", None),
-        )
+        model = ArtifactModel(**self._insert_values(artifact))
         self._session.add(model)
         await self._session.flush()
         await self._session.refresh(model)
         artifact.created_at = model.created_at
         artifact.updated_at = model.updated_at
+        await self._sync_execution_results([artifact])
         buffer_events(self._session, artifact.collect_events())
         buffer_audit(
             self._session,
@@ -377,6 +526,94 @@ class SqlAlchemyArtifactRepository(ArtifactRepository):
         return artifact
 
     async def update(self, artifact: Artifact) -> Artifact:
+        values = self._update_values(artifact)
+        await self._session.execute(update(ArtifactModel).where(ArtifactModel.id == artifact.id).values(**values))
+        await self._session.flush()
+        result = await self._session.execute(select(ArtifactModel).where(ArtifactModel.id == artifact.id))
+        refreshed = result.scalar_one_or_none()
+        if refreshed is not None:
+            artifact.created_at = refreshed.created_at
+            artifact.updated_at = refreshed.updated_at
+        await self._sync_execution_results([artifact])
+        buffer_events(self._session, artifact.collect_events())
+        buffer_audit(
+            self._session,
+            "Artifact",
+            artifact.id,
+            artifact.to_snapshot_dict(),
+            ChangeType.UPDATE,
+        )
+        return artifact
+
+    async def add_many(self, artifacts: list[Artifact]) -> None:
+        """Multi-row INSERT (executemany) for bulk import; events and audit entries buffered, no per-row refresh.
+
+        Callers order ``artifacts`` so parents precede children (self-referencing ``parent_id`` FK).
+        """
+        if not artifacts:
+            return
+        await self._session.execute(insert(ArtifactModel), [self._insert_values(a) for a in artifacts])
+        await self._sync_execution_results(artifacts)
+        for artifact in artifacts:
+            buffer_events(self._session, artifact.collect_events())
+            buffer_audit(self._session, "Artifact", artifact.id, artifact.to_snapshot_dict(), ChangeType.INITIAL)
+
+    async def update_many(self, artifacts: list[Artifact]) -> None:
+        """UPDATE by primary key as one executemany; events and audit entries buffered for every row."""
+        if not artifacts:
+            return
+        now = datetime.now(UTC)
+        rows = []
+        for artifact in artifacts:
+            artifact.updated_at = now
+            rows.append({"id": artifact.id, **self._update_values(artifact), "updated_at": now})
+        await self._session.execute(update(ArtifactModel), rows)
+        await self._sync_execution_results(artifacts)
+        for artifact in artifacts:
+            buffer_events(self._session, artifact.collect_events())
+            buffer_audit(self._session, "Artifact", artifact.id, artifact.to_snapshot_dict(), ChangeType.UPDATE)
+
+    async def _sync_execution_results(self, artifacts: list[Artifact]) -> None:
+        """Keep ``test_execution_results`` in step with saved test-runs (same transaction)."""
+        runs = [a for a in artifacts if a.artifact_type == TEST_RUN_ARTIFACT_TYPE]
+        if not runs:
+            return
+        await SqlAlchemyExecutionResultRepository(self._session).replace_for_runs(runs)
+        by_project: dict[uuid.UUID, list[uuid.UUID]] = {}
+        for run in runs:
+            by_project.setdefault(run.project_id, []).append(run.id)
+        buffer_events(
+            self._session,
+            [RunMetricsRecorded(project_id=pid, run_ids=run_ids) for pid, run_ids in by_project.items()],
+        )
+
+    @staticmethod
+    def _insert_values(artifact: Artifact) -> dict[str, Any]:
+        return {
+            "id": artifact.id,
+            "project_id": artifact.project_id,
+            "artifact_type": artifact.artifact_type,
+            "title": artifact.title,
+            "description": artifact.description,
+            "state": artifact.state,
+            "assignee_id": artifact.assignee_id,
+            "parent_id": artifact.parent_id,
+            "custom_fields": artifact.custom_fields or {},
+            "artifact_key": artifact.artifact_key,
+            "state_reason": artifact.state_reason,
+            "resolution": artifact.resolution,
+            "rank_order": artifact.rank_order,
+            "cycle_id": artifact.cycle_id,
+            "area_node_id": artifact.area_node_id,
+            "area_path_snapshot": artifact.area_path_snapshot,
+            "team_id": artifact.team_id,
+            "stale_traceability": getattr(artifact, "stale_traceability", False),
+            "stale_traceability_reason": getattr(artifact, "stale_traceability_reason", None),
+            "stale_traceability_at": getattr(artifact, "stale_traceability_at", None),
+        }
+
+    @staticmethod
+    def _update_values(artifact: Artifact) -> dict[str, Any]:
         values: dict[str, Any] = {
             "title": artifact.title,
             "description": artifact.description,
@@ -400,22 +637,108 @@ class SqlAlchemyArtifactRepository(ArtifactRepository):
             values["deleted_at"] = artifact.deleted_at
         if hasattr(artifact, "deleted_by"):
             values["deleted_by"] = artifact.deleted_by
-        await self._session.execute(update(ArtifactModel).where(ArtifactModel.id == artifact.id).values(**values))
-        await self._session.flush()
-        result = await self._session.execute(select(ArtifactModel).where(ArtifactModel.id == artifact.id))
-        refreshed = result.scalar_one_or_none()
-        if refreshed is not None:
-            artifact.created_at = refreshed.created_at
-            artifact.updated_at = refreshed.updated_at
-        buffer_events(self._session, artifact.collect_events())
-        buffer_audit(
-            self._session,
-            "Artifact",
-            artifact.id,
-            artifact.to_snapshot_dict(),
-            ChangeType.UPDATE,
+        return values
+
+    async def apply_transitions(
+        self,
+        artifacts: list[Artifact],
+        expected_updated_at: Mapping[uuid.UUID, datetime | None],
+        *,
+        all_or_nothing: bool = False,
+    ) -> TransitionWrite:
+        if not artifacts:
+            return TransitionWrite()
+        rows = [
+            {
+                "id": a.id,
+                "state": a.state,
+                "state_reason": a.state_reason,
+                "resolution": a.resolution,
+                "updated_by": a.updated_by,
+                "expected_updated_at": expected_updated_at.get(a.id),
+            }
+            for a in artifacts
+        ]
+        failed: set[uuid.UUID] = set()
+        savepoint = await self._session.begin_nested()
+        try:
+            written = await self._update_transitions(rows)
+        except (IntegrityError, DataError):
+            await savepoint.rollback()
+            if all_or_nothing:
+                raise
+            logger.warning("artifact_bulk_transition_fallback_per_item", count=len(rows))
+            written = {}
+            for row in rows:
+                # Savepoint per item so one failing row does not abort the rest of the batch.
+                item_savepoint = await self._session.begin_nested()
+                try:
+                    written.update(await self._update_transitions([row]))
+                except (IntegrityError, DataError):
+                    # The row itself was rejected (not a version conflict); anything else propagates.
+                    await item_savepoint.rollback()
+                    failed.add(row["id"])
+                else:
+                    await item_savepoint.commit()
+        else:
+            if all_or_nothing and len(written) != len(rows):
+                await savepoint.rollback()
+                return TransitionWrite(conflicted=frozenset(a.id for a in artifacts if a.id not in written))
+            await savepoint.commit()
+
+        for artifact in artifacts:
+            if artifact.id not in written:
+                continue
+            artifact.updated_at = written[artifact.id]
+            buffer_events(self._session, artifact.collect_events())
+            buffer_audit(
+                self._session,
+                "Artifact",
+                artifact.id,
+                artifact.to_snapshot_dict(),
+                ChangeType.UPDATE,
+            )
+        await self._sync_execution_results([a for a in artifacts if a.id in written])
+        return TransitionWrite(
+            written=frozenset(written),
+            conflicted=frozenset(a.id for a in artifacts if a.id not in written and a.id not in failed),
+            failed=frozenset(failed),
         )
-        return artifact
+
+    async def _update_transitions(self, rows: list[dict[str, Any]]) -> dict[uuid.UUID, datetime]:
+        """``UPDATE artifacts ... FROM (VALUES ...)`` guarded by updated_at; returns id -> new updated_at.
+
+        ``None`` values render as untyped NULL literals, so every VALUES column is cast explicitly.
+        """
+        v = values(
+            column("id", Uuid),
+            column("state", String),
+            column("state_reason", String),
+            column("resolution", String),
+            column("updated_by", Uuid),
+            column("expected_updated_at", DateTime(timezone=True)),
+            name="v",
+        ).data([tuple(r.values()) for r in rows])
+        expected = cast(v.c.expected_updated_at, DateTime(timezone=True))
+        stmt = (
+            update(ArtifactModel)
+            .where(
+                ArtifactModel.id == cast(v.c.id, Uuid),
+                ArtifactModel.deleted_at.is_(None),
+                or_(v.c.expected_updated_at.is_(None), ArtifactModel.updated_at == expected),
+            )
+            .values(
+                state=cast(v.c.state, String),
+                state_reason=cast(v.c.state_reason, String),
+                resolution=cast(v.c.resolution, String),
+                updated_by=cast(v.c.updated_by, Uuid),
+                updated_at=func.now(),
+            )
+            .returning(ArtifactModel.id, ArtifactModel.updated_at)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._session.execute(stmt)
+        return {row.id: row.updated_at for row in result}
 
     @staticmethod
     def _to_entity(m: ArtifactModel) -> Artifact:
@@ -447,6 +770,37 @@ class SqlAlchemyArtifactRepository(ArtifactRepository):
         entity.deleted_by = getattr(m, "deleted_by", None)
         return entity
 
+    @staticmethod
+    def _effort_value(effort_field: str) -> Any:
+        """``custom_fields[effort_field]`` as numeric; NULL when missing or not a number (never raises)."""
+        raw = ArtifactModel.custom_fields[effort_field].astext
+        return case((raw.regexp_match(_NUMERIC_TEXT_PATTERN), cast(raw, Numeric)), else_=None)
+
+    async def sum_effort_buckets_by_cycles(
+        self,
+        project_id: uuid.UUID,
+        cycle_ids: list[uuid.UUID],
+        done_states: tuple[str, ...],
+        effort_field: str,
+    ) -> list[tuple[uuid.UUID, float, float]]:
+        if not cycle_ids:
+            return []
+        effort = self._effort_value(effort_field)
+        done_effort = (
+            func.sum(effort).filter(ArtifactModel.state.in_(done_states)) if done_states else literal(0, Numeric)
+        )
+        result = await self._session.execute(
+            select(ArtifactModel.cycle_id, func.sum(effort), done_effort)
+            .where(
+                ArtifactModel.project_id == project_id,
+                ArtifactModel.cycle_id.in_(cycle_ids),
+                ArtifactModel.deleted_at.is_(None),
+            )
+            .group_by(ArtifactModel.cycle_id)
+        )
+        sums = {row[0]: (float(row[1] or 0), float(row[2] or 0)) for row in result.all()}
+        return [(cid, *sums.get(cid, (0.0, 0.0))) for cid in cycle_ids]
+
     async def sum_effort_by_cycles(
         self,
         project_id: uuid.UUID,
@@ -457,24 +811,8 @@ class SqlAlchemyArtifactRepository(ArtifactRepository):
         """Sum effort from custom_fields[effort_field] per cycle (artifacts in done_states)."""
         if not cycle_ids or not done_states:
             return []
-        totals: dict[uuid.UUID, float] = {c: 0.0 for c in cycle_ids}
-        for cid in cycle_ids:
-            artifacts = await self.list_by_project(
-                project_id,
-                state_filter=None,
-                cycle_id=cid,
-                limit=5000,
-                include_deleted=False,
-            )
-            for a in artifacts:
-                if a.state not in done_states:
-                    continue
-                cf = a.custom_fields or {}
-                val = cf.get(effort_field)
-                if val is not None:
-                    with contextlib.suppress(TypeError, ValueError):
-                        totals[cid] += float(val)
-        return [(cid, totals[cid]) for cid in cycle_ids]
+        buckets = await self.sum_effort_buckets_by_cycles(project_id, cycle_ids, done_states, effort_field)
+        return [(cid, done) for cid, _, done in buckets]
 
     async def sum_total_effort_by_cycles(
         self,
@@ -483,21 +821,5 @@ class SqlAlchemyArtifactRepository(ArtifactRepository):
         effort_field: str,
     ) -> list[tuple[uuid.UUID, float]]:
         """Sum effort from custom_fields[effort_field] per cycle (all artifacts in cycle)."""
-        if not cycle_ids:
-            return []
-        totals: dict[uuid.UUID, float] = {c: 0.0 for c in cycle_ids}
-        for cid in cycle_ids:
-            artifacts = await self.list_by_project(
-                project_id,
-                state_filter=None,
-                cycle_id=cid,
-                limit=5000,
-                include_deleted=False,
-            )
-            for a in artifacts:
-                cf = a.custom_fields or {}
-                val = cf.get(effort_field)
-                if val is not None:
-                    with contextlib.suppress(TypeError, ValueError):
-                        totals[cid] += float(val)
-        return [(cid, totals[cid]) for cid in cycle_ids]
+        buckets = await self.sum_effort_buckets_by_cycles(project_id, cycle_ids, (), effort_field)
+        return [(cid, total) for cid, total, _ in buckets]
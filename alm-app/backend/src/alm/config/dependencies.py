@@ -3,6 +3,7 @@ from collections.abc import AsyncGenerator
 from fastapi import Depends
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.requests import HTTPConnection
 
 from alm.artifact.infrastructure.manifest_acl_adapter import ManifestACLCheckerAdapter
 from alm.artifact.infrastructure.manifest_flattener import ManifestDefsFlattenerAdapter
@@ -13,7 +14,8 @@ from alm.shared.application.mediator import Mediator
 from alm.shared.audit.interceptor import ACTOR_ID_KEY, TENANT_ID_KEY
 from alm.shared.domain.ports import IManifestACLChecker, IManifestDefsFlattener
 from alm.shared.infrastructure.db.session import async_session_factory
-from alm.shared.infrastructure.security.jwt import InvalidTokenError, decode_token
+from alm.shared.infrastructure.security.auth_context import token_payload_for
+from alm.shared.infrastructure.security.jwt import InvalidTokenError
 
 _optional_bearer = HTTPBearer(auto_error=False)
 _file_storage: FileStoragePort | None = None
@@ -56,6 +58,7 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
 
 
 async def get_mediator(
+    connection: HTTPConnection,
     credentials: HTTPAuthorizationCredentials | None = Depends(_optional_bearer),
 ) -> AsyncGenerator[Mediator, None]:
     """Request-scoped Mediator. Uses the same commit/rollback pattern as ``get_db``.
@@ -69,7 +72,7 @@ async def get_mediator(
     async with async_session_factory() as session:
         if credentials is not None:
             try:
-                payload = decode_token(credentials.credentials)
+                payload = token_payload_for(connection.scope, credentials.credentials)
                 session.info[ACTOR_ID_KEY] = payload.sub
                 if payload.tid is not None:
                     session.info[TENANT_ID_KEY] = payload.tid
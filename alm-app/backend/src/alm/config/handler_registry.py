@@ -6,6 +6,8 @@ Each factory receives an AsyncSession and returns a fully-wired handler.
 
 from __future__ import annotations
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from alm.area.application.commands.activate_area import ActivateAreaNode, ActivateAreaNodeHandler
 from alm.ai.application.commands.execute_pending_action import (
     ExecutePendingAction,
@@ -53,6 +55,10 @@ from alm.artifact.application.commands.delete_artifact import (
     DeleteArtifact,
     DeleteArtifactHandler,
 )
+from alm.artifact.application.commands.batch_transition_artifacts import (
+    BatchTransitionArtifacts,
+    BatchTransitionArtifactsHandler,
+)
 from alm.artifact.application.commands.restore_artifact import (
     RestoreArtifact,
     RestoreArtifactHandler,
@@ -70,6 +76,7 @@ from alm.artifact.application.event_handlers import (
     on_artifact_state_changed,
 )
 from alm.artifact.application.queries.get_artifact import GetArtifact, GetArtifactHandler
+from alm.artifact.application.queries.get_cycle_burndown import GetCycleBurndown, GetCycleBurndownHandler
 from alm.artifact.application.queries.get_permitted_transitions import (
     GetPermittedTransitions,
     GetPermittedTransitionsHandler,
@@ -85,7 +92,8 @@ from alm.artifact.application.stale_traceability_side_effects import (
 )
 from alm.artifact.domain.events import ArtifactCreated, ArtifactStateChanged, ArtifactUpdated
 from alm.artifact.domain.governance_adapter import ALMGovernanceAdapter
-from alm.artifact.infrastructure.metrics import PrometheusArtifactTransitionMetrics
+from alm.artifact.domain.manifest_cache import set_manifest_cache_metrics
+from alm.artifact.infrastructure.metrics import PrometheusArtifactTransitionMetrics, PrometheusManifestCacheMetrics
 from alm.artifact.infrastructure.repositories import SqlAlchemyArtifactRepository
 
 # ── Attachment commands ──
@@ -160,7 +168,10 @@ from alm.cycle.application.queries.list_cycles_by_project import (
     ListCadencesByProject,
     ListCadencesByProjectHandler,
 )
-from alm.cycle.infrastructure.repositories import SqlAlchemyCycleRepository
+from alm.cycle.infrastructure.repositories import (
+    SqlAlchemyCycleBurndownSnapshotRepository,
+    SqlAlchemyCycleRepository,
+)
 
 # ── Deployment events (S4a) ──
 from alm.deployment.application.commands.create_deployment_event import (
@@ -220,6 +231,10 @@ from alm.project.application.commands.update_project_member import (
     UpdateProjectMember,
     UpdateProjectMemberHandler,
 )
+from alm.project.application.event_handlers import (
+    BURNDOWN_INPUT_EVENTS,
+    on_artifact_changed_refresh_burndown_snapshots,
+)
 from alm.project.application.queries.get_burndown import (
     GetBurndown,
     GetBurndownHandler,
@@ -234,6 +249,8 @@ from alm.project.application.queries.get_org_dashboard_stats import (
 )
 from alm.project.application.queries.get_project import GetProject, GetProjectHandler
 from alm.project.application.queries.get_project_manifest import (
+    GetProjectCompiledManifest,
+    GetProjectCompiledManifestHandler,
     GetProjectManifest,
     GetProjectManifestHandler,
 )
@@ -269,6 +286,7 @@ from alm.project_tag.application.queries.list_project_tags import (
     ListProjectTagsHandler,
 )
 from alm.project_tag.infrastructure.repositories import SqlAlchemyProjectTagRepository
+from alm.quality.application.event_handlers import TRACEABILITY_INPUT_EVENTS, create_traceability_cache_handler
 from alm.quality.application.queries.batch_last_test_execution_status import (
     BatchLastTestExecutionStatus,
     BatchLastTestExecutionStatusHandler,
@@ -282,11 +300,16 @@ from alm.quality.application.queries.requirement_traceability_matrix import (
     RequirementTraceabilityMatrixHandler,
     RequirementTraceabilityMatrixSummary,
     RequirementTraceabilityMatrixSummaryHandler,
+    RequirementTraceabilityMatrixTile,
+    RequirementTraceabilityMatrixTileHandler,
 )
 from alm.quality.application.queries.resolve_test_execution_config import (
     ResolveTestExecutionConfig,
     ResolveTestExecutionConfigHandler,
 )
+from alm.quality.domain.ports import TraceabilityResultCache
+from alm.quality.infrastructure.repositories import SqlAlchemyExecutionResultRepository
+from alm.quality.infrastructure.result_cache import LocalTraceabilityIndexCache, RedisTraceabilityResultCache
 from alm.realtime.event_handlers import on_artifact_state_changed_realtime
 from alm.relationship.application.commands.create_relationship import (
     CreateRelationship,
@@ -312,6 +335,14 @@ from alm.relationship.application.queries.list_relationships_for_artifact import
     ListRelationshipsForArtifact,
     ListRelationshipsForArtifactHandler,
 )
+from alm.relationship.application.event_handlers import (
+    RELATIONSHIP_GRAPH_EVENTS,
+    create_relationship_graph_handler,
+)
+from alm.relationship.infrastructure.graph_index import (
+    GraphIndexedRelationshipRepository,
+    RedisRelationshipGraphIndex,
+)
 from alm.relationship.infrastructure.repositories import SqlAlchemyRelationshipRepository
 from alm.report_definition.application.commands import (
     CreateReportDefinition,
@@ -383,8 +414,13 @@ from alm.shared.application.mediator import (
 )
 
 # ── Audit queries ──
-from alm.shared.audit.queries import GetEntityHistory, GetEntityHistoryHandler
-from alm.shared.infrastructure.cache import PermissionCache
+from alm.shared.audit.queries import (
+    GetEntityHistory,
+    GetEntityHistoryHandler,
+    GetSnapshotVersion,
+    GetSnapshotVersionHandler,
+)
+from alm.shared.infrastructure.cache import TenantLookupCache, TwoTierPermissionCache
 from alm.shared.infrastructure.email import SmtpEmailSender
 from alm.shared.infrastructure.event_dispatcher import (
     DomainEventDispatcher,
@@ -448,6 +484,10 @@ from alm.tenant.application.commands.soft_delete_user import (
 )
 from alm.tenant.application.commands.update_role import UpdateRole, UpdateRoleHandler
 from alm.tenant.application.commands.update_tenant import UpdateTenant, UpdateTenantHandler
+from alm.tenant.application.event_handlers import (
+    TENANT_LOOKUP_EVENTS,
+    create_tenant_lookup_cache_handler,
+)
 from alm.tenant.application.queries.get_member_permissions import (
     GetMemberEffectivePermissions,
     GetMemberEffectivePermissionsHandler,
@@ -511,8 +551,27 @@ def register_all_handlers() -> None:
     _password_hasher = BcryptPasswordHasher()
     _token_service = JwtTokenService()
     _email_sender = SmtpEmailSender()
-    _permission_cache = PermissionCache()
+    _permission_cache = TwoTierPermissionCache()
+    _tenant_lookup_cache = TenantLookupCache()
     _manifest_flattener = get_manifest_flattener()
+    set_manifest_cache_metrics(PrometheusManifestCacheMetrics())
+    _traceability_cache = RedisTraceabilityResultCache() if settings.traceability_cache_enabled else None
+    # Tiles need the O(matrix) index on every request; without the shared cache keep it per worker.
+    _tile_index_cache: TraceabilityResultCache = (
+        _traceability_cache
+        if _traceability_cache is not None
+        else LocalTraceabilityIndexCache(
+            settings.traceability_cache_l1_max_entries,
+            settings.traceability_tile_index_local_ttl_seconds,
+        )
+    )
+    _relationship_graph = RedisRelationshipGraphIndex() if settings.relationship_graph_enabled else None
+
+    def _traversal_relationship_repo(s: AsyncSession) -> SqlAlchemyRelationshipRepository:
+        """Relationship repo for traversal-heavy queries: adjacency reads come from the project graph when enabled."""
+        if _relationship_graph is None:
+            return SqlAlchemyRelationshipRepository(s)
+        return GraphIndexedRelationshipRepository(s, _relationship_graph)
 
     # Workflow rule event handlers use runner port (no application → infrastructure import)
     _workflow_rule_runner = WorkflowRuleRunner()
@@ -527,6 +586,19 @@ def register_all_handlers() -> None:
     register_event_handler(ArtifactStateChanged, on_artifact_state_changed_realtime)
     register_event_handler(ArtifactStateChanged, on_upstream_planning_changed_mark_linked_tests_stale)
     register_event_handler(ArtifactUpdated, on_upstream_planning_changed_mark_linked_tests_stale)
+    for event_type in BURNDOWN_INPUT_EVENTS:
+        register_event_handler(event_type, on_artifact_changed_refresh_burndown_snapshots)
+    # Graph generation first: a traceability result cached under the new generation must be built from the new graph.
+    if _relationship_graph is not None:
+        _on_relationship_changed = create_relationship_graph_handler(_relationship_graph)
+        for event_type in RELATIONSHIP_GRAPH_EVENTS:
+            register_event_handler(event_type, _on_relationship_changed)
+    _on_traceability_input_changed = create_traceability_cache_handler(_tile_index_cache)
+    for event_type in TRACEABILITY_INPUT_EVENTS:
+        register_event_handler(event_type, _on_traceability_input_changed)
+    _on_tenant_changed = create_tenant_lookup_cache_handler(_tenant_lookup_cache)
+    for event_type in TENANT_LOOKUP_EVENTS:
+        register_event_handler(event_type, _on_tenant_changed)
     set_domain_event_dispatcher(dispatcher)
 
     # ── AI Commands / Queries ──
@@ -956,6 +1028,17 @@ def register_all_handlers() -> None:
         ),
     )
 
+    register_query_handler(
+        GetCycleBurndown,
+        lambda s: GetCycleBurndownHandler(
+            artifact_repo=SqlAlchemyArtifactRepository(s),
+            cycle_repo=SqlAlchemyCycleRepository(s),
+            snapshot_repo=SqlAlchemyCycleBurndownSnapshotRepository(s),
+            project_repo=SqlAlchemyProjectRepository(s),
+            process_template_repo=SqlAlchemyProcessTemplateRepository(s),
+        ),
+    )
+
     register_query_handler(
         GetOrgDashboardStats,
         lambda s: GetOrgDashboardStatsHandler(
@@ -989,6 +1072,13 @@ def register_all_handlers() -> None:
             process_template_repo=SqlAlchemyProcessTemplateRepository(s),
         ),
     )
+    register_query_handler(
+        GetProjectCompiledManifest,
+        lambda s: GetProjectCompiledManifestHandler(
+            project_repo=SqlAlchemyProjectRepository(s),
+            process_template_repo=SqlAlchemyProcessTemplateRepository(s),
+        ),
+    )
     register_query_handler(
         GetListSchema,
         lambda s: GetListSchemaHandler(
@@ -1027,6 +1117,15 @@ def register_all_handlers() -> None:
             tag_repo=SqlAlchemyProjectTagRepository(s),
         ),
     )
+    register_command_handler(
+        BatchTransitionArtifacts,
+        lambda s: BatchTransitionArtifactsHandler(
+            artifact_repo=SqlAlchemyArtifactRepository(s),
+            project_repo=SqlAlchemyProjectRepository(s),
+            process_template_repo=SqlAlchemyProcessTemplateRepository(s),
+            metrics=PrometheusArtifactTransitionMetrics(),
+        ),
+    )
     register_command_handler(
         UpdateArtifact,
         lambda s: UpdateArtifactHandler(
@@ -1230,7 +1329,7 @@ def register_all_handlers() -> None:
         lambda s: GetArtifactImpactAnalysisHandler(
             project_repo=SqlAlchemyProjectRepository(s),
             artifact_repo=SqlAlchemyArtifactRepository(s),
-            relationship_repo=SqlAlchemyRelationshipRepository(s),
+            relationship_repo=_traversal_relationship_repo(s),
         ),
     )
     register_query_handler(
@@ -1238,7 +1337,8 @@ def register_all_handlers() -> None:
         lambda s: BatchLastTestExecutionStatusHandler(
             project_repo=SqlAlchemyProjectRepository(s),
             artifact_repo=SqlAlchemyArtifactRepository(s),
-            relationship_repo=SqlAlchemyRelationshipRepository(s),
+            relationship_repo=_traversal_relationship_repo(s),
+            execution_result_repo=SqlAlchemyExecutionResultRepository(s),
         ),
     )
     register_query_handler(
@@ -1246,8 +1346,10 @@ def register_all_handlers() -> None:
         lambda s: RequirementCoverageAnalysisHandler(
             project_repo=SqlAlchemyProjectRepository(s),
             artifact_repo=SqlAlchemyArtifactRepository(s),
-            relationship_repo=SqlAlchemyRelationshipRepository(s),
+            relationship_repo=_traversal_relationship_repo(s),
             process_template_repo=SqlAlchemyProcessTemplateRepository(s),
+            execution_result_repo=SqlAlchemyExecutionResultRepository(s),
+            result_cache=_traceability_cache,
         ),
     )
     register_query_handler(
@@ -1255,8 +1357,9 @@ def register_all_handlers() -> None:
         lambda s: RequirementTraceabilityMatrixSummaryHandler(
             project_repo=SqlAlchemyProjectRepository(s),
             artifact_repo=SqlAlchemyArtifactRepository(s),
-            relationship_repo=SqlAlchemyRelationshipRepository(s),
+            relationship_repo=_traversal_relationship_repo(s),
             process_template_repo=SqlAlchemyProcessTemplateRepository(s),
+            result_cache=_traceability_cache,
         ),
     )
     register_query_handler(
@@ -1264,8 +1367,21 @@ def register_all_handlers() -> None:
         lambda s: RequirementTraceabilityMatrixHandler(
             project_repo=SqlAlchemyProjectRepository(s),
             artifact_repo=SqlAlchemyArtifactRepository(s),
-            relationship_repo=SqlAlchemyRelationshipRepository(s),
+            relationship_repo=_traversal_relationship_repo(s),
             process_template_repo=SqlAlchemyProcessTemplateRepository(s),
+            execution_result_repo=SqlAlchemyExecutionResultRepository(s),
+            result_cache=_traceability_cache,
+        ),
+    )
+    register_query_handler(
+        RequirementTraceabilityMatrixTile,
+        lambda s: RequirementTraceabilityMatrixTileHandler(
+            project_repo=SqlAlchemyProjectRepository(s),
+            artifact_repo=SqlAlchemyArtifactRepository(s),
+            relationship_repo=_traversal_relationship_repo(s),
+            process_template_repo=SqlAlchemyProcessTemplateRepository(s),
+            execution_result_repo=SqlAlchemyExecutionResultRepository(s),
+            result_cache=_tile_index_cache,
         ),
     )
     register_query_handler(
@@ -1720,3 +1836,9 @@ def register_all_handlers() -> None:
             audit_reader=SqlAlchemyAuditReader(s),
         ),
     )
+    register_query_handler(
+        GetSnapshotVersion,
+        lambda s: GetSnapshotVersionHandler(
+            audit_reader=SqlAlchemyAuditReader(s),
+        ),
+    )
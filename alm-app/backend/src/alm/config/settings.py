@@ -25,8 +25,18 @@ class Settings(BaseSettings):
     db_max_overflow: int = 10
 
     # Background retry for transactional domain-event outbox (same DB transaction as aggregates).
+    # Fallback poll interval; the worker also wakes on NOTIFY when rows are handed to it (see domain_event_outbox).
     domain_event_outbox_poll_interval_seconds: float = 5.0  # ALM_DOMAIN_EVENT_OUTBOX_POLL_INTERVAL_SECONDS; <=0 disables worker
-    domain_event_outbox_batch_size: int = 50  # ALM_DOMAIN_EVENT_OUTBOX_BATCH_SIZE
+    domain_event_outbox_batch_size: int = 200  # ALM_DOMAIN_EVENT_OUTBOX_BATCH_SIZE — rows claimed per statement
+    domain_event_outbox_dispatch_concurrency: int = 16  # ALM_DOMAIN_EVENT_OUTBOX_DISPATCH_CONCURRENCY — aggregates in flight
+    domain_event_outbox_listen_enabled: bool = True  # ALM_DOMAIN_EVENT_OUTBOX_LISTEN_ENABLED — LISTEN for wake-ups
+    # Lease set on insert while the request path dispatches; the worker only sees the rows after it lapses or is released.
+    domain_event_outbox_sync_lease_seconds: int = 15  # ALM_DOMAIN_EVENT_OUTBOX_SYNC_LEASE_SECONDS
+    domain_event_outbox_gauge_refresh_seconds: float = 30.0  # ALM_DOMAIN_EVENT_OUTBOX_GAUGE_REFRESH_SECONDS
+    # Opt-in: hand committed events to an in-process queue so handlers run after the response (outbox covers loss).
+    domain_event_async_dispatch_enabled: bool = False  # ALM_DOMAIN_EVENT_ASYNC_DISPATCH_ENABLED
+    domain_event_async_dispatch_queue_size: int = 10000  # ALM_DOMAIN_EVENT_ASYNC_DISPATCH_QUEUE_SIZE — batches
+    domain_event_async_dispatch_workers: int = 4  # ALM_DOMAIN_EVENT_ASYNC_DISPATCH_WORKERS
     domain_event_outbox_max_attempts: int = 50  # ALM_DOMAIN_EVENT_OUTBOX_MAX_ATTEMPTS — rows stop polling after this
     domain_event_outbox_lease_seconds: int = 300  # ALM_DOMAIN_EVENT_OUTBOX_LEASE_SECONDS — claim TTL; exceed only if handlers stay shorter
     # If set, /health/ready returns status=degraded when domain_event_outbox row count exceeds this (ALM_...).
@@ -37,6 +47,36 @@ class Settings(BaseSettings):
     domain_event_outbox_requeue_max_per_request: int = 500
 
     redis_url: str = "redis://localhost:6379/0"
+    # In-process L1 in front of the Redis permission cache; Redis pub/sub invalidation evicts it on every worker.
+    permission_cache_l1_ttl_seconds: float = 30.0  # ALM_PERMISSION_CACHE_L1_TTL_SECONDS; <=0 disables L1
+    permission_cache_l1_max_entries: int = 10000  # ALM_PERMISSION_CACHE_L1_MAX_ENTRIES
+    # In-process org slug -> tenant cache used by resolve_org; tenant update/archive evict it on every worker.
+    tenant_slug_cache_ttl_seconds: float = 60.0  # ALM_TENANT_SLUG_CACHE_TTL_SECONDS; <=0 disables it
+    tenant_slug_cache_max_entries: int = 10000  # ALM_TENANT_SLUG_CACHE_MAX_ENTRIES
+    # Traceability matrix / coverage results: in-process L1 over Redis L2 (zlib-compressed), keyed by a per-project
+    # generation that relationship, artifact and test-run events bump (ALM_TRACEABILITY_CACHE_ENABLED).
+    traceability_cache_enabled: bool = True
+    traceability_cache_l1_max_entries: int = 64  # ALM_TRACEABILITY_CACHE_L1_MAX_ENTRIES
+    # ALM_TRACEABILITY_CACHE_L2_TTL_SECONDS — L1 and L2; bounds staleness after writes that emit no event.
+    traceability_cache_l2_ttl_seconds: int = 90
+    # ALM_TRACEABILITY_TILE_INDEX_LOCAL_TTL_SECONDS — per-worker tile index cache used when the shared cache is off.
+    traceability_tile_index_local_ttl_seconds: int = 60
+    # Per-project in-memory relationship graphs (CSR adjacency) for impact / coverage / matrix traversals, kept in
+    # step by relationship events and a Redis generation per project (ALM_RELATIONSHIP_GRAPH_ENABLED).
+    relationship_graph_enabled: bool = True
+    relationship_graph_max_bytes: int = 268_435_456  # ALM_RELATIONSHIP_GRAPH_MAX_BYTES — per worker, LRU past it
+    relationship_graph_idle_seconds: int = 900  # ALM_RELATIONSHIP_GRAPH_IDLE_SECONDS
+    # ALM_RELATIONSHIP_GRAPH_MAX_AGE_SECONDS — reload bound; caps staleness when a generation bump is lost.
+    relationship_graph_max_age_seconds: int = 600
+
+    # WebSocket delivery: bounded outbound queue per connection; when it is full the slow client either loses its
+    # oldest queued message or is disconnected (ALM_REALTIME_SEND_QUEUE_SIZE / ALM_REALTIME_SLOW_CONSUMER_POLICY).
+    realtime_send_queue_size: int = 256
+    realtime_slow_consumer_policy: Literal["drop_oldest", "disconnect"] = "drop_oldest"
+    # Events published within the window are merged per tenant/project (latest per artifact) into one
+    # {"type": "batch"} frame (ALM_REALTIME_COALESCE_WINDOW_MS; <=0 publishes every event immediately).
+    realtime_coalesce_window_ms: int = 150
+    realtime_coalesce_max_events: int = 200  # ALM_REALTIME_COALESCE_MAX_EVENTS — flush early at this size
 
     jwt_secret_key: str = "CHANGE-ME-IN-PRODUCTION"
     jwt_algorithm: str = "HS256"
@@ -47,6 +87,16 @@ class Settings(BaseSettings):
 
     rate_limit_requests_per_minute: int = 60
     rate_limit_window_seconds: int = 60  # Sliding window size (Faz D2)
+    # Per-worker token bucket in front of Redis (ALM_RATE_LIMIT_LOCAL_BUCKET_ENABLED / ALM_RATE_LIMIT_LOCAL_BURST;
+    # burst defaults to the per-window limit).
+    rate_limit_local_bucket_enabled: bool = True
+    rate_limit_local_burst: int | None = None
+    # Locally granted cost is charged to Redis in one call once it reaches ALM_RATE_LIMIT_LOCAL_SYNC_COST or is
+    # ALM_RATE_LIMIT_LOCAL_SYNC_SECONDS old; 1 charges every request (each worker may overshoot by sync_cost - 1).
+    rate_limit_local_sync_cost: int = 10
+    rate_limit_local_sync_seconds: float = 1.0
+    # Request cost by path suffix (ALM_RATE_LIMIT_ROUTE_COSTS as JSON); unmatched routes cost 1.
+    rate_limit_route_costs: dict[str, int] = {"/artifacts/export": 5, "/artifacts/import": 10}
 
     smtp_host: str = "localhost"
     smtp_port: int = 1025
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import uuid
+from dataclasses import dataclass
 from datetime import date, datetime
 from typing import Any, Literal
 
@@ -134,3 +135,12 @@ class Cadence(AggregateRoot):
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
+
+
+@dataclass(frozen=True)
+class BurndownSnapshot:
+    """Effort totals of one cycle as of the end of ``snapshot_date`` (last change that day wins)."""
+
+    snapshot_date: date
+    total_effort: float
+    completed_effort: float
@@ -1,11 +1,12 @@
-"""Cadence repository port."""
+"""Cadence and burndown snapshot repository ports."""
 
 from __future__ import annotations
 
 import uuid
 from abc import abstractmethod
+from datetime import date
 
-from alm.cycle.domain.entities import Cadence
+from alm.cycle.domain.entities import BurndownSnapshot, Cadence
 
 
 class CycleRepository:
@@ -25,3 +26,27 @@ class CycleRepository:
 
     @abstractmethod
     async def delete(self, cadence_id: uuid.UUID) -> bool: ...
+
+
+class CycleBurndownSnapshotRepository:
+    @abstractmethod
+    async def upsert_many(
+        self,
+        project_id: uuid.UUID,
+        snapshot_date: date,
+        effort_field: str,
+        buckets: list[tuple[uuid.UUID, float, float]],
+    ) -> None:
+        """Write ``(cycle_id, total, completed)`` for ``snapshot_date``, replacing that day's row per cycle."""
+        ...
+
+    @abstractmethod
+    async def list_by_cycle(
+        self,
+        cycle_id: uuid.UUID,
+        effort_field: str,
+        *,
+        end_date: date,
+    ) -> list[BurndownSnapshot]:
+        """Snapshots dated on or before ``end_date``, ordered by date."""
+        ...
@@ -1,11 +1,11 @@
-"""CycleNode SQLAlchemy model."""
+"""CycleNode and daily burndown snapshot SQLAlchemy models."""
 
 from __future__ import annotations
 
 import uuid
-from datetime import date
+from datetime import date, datetime
 
-from sqlalchemy import Date, ForeignKey, Integer, String, Text, Uuid
+from sqlalchemy import Date, DateTime, Float, ForeignKey, Integer, String, Text, UniqueConstraint, Uuid, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from alm.shared.infrastructure.db.base_model import Base, TimestampMixin
@@ -36,3 +36,39 @@ class CycleNodeModel(Base, TimestampMixin):
     goal: Mapped[str] = mapped_column(Text, nullable=False, default="")
     state: Mapped[str] = mapped_column(String(50), nullable=False, server_default="planned")
     type: Mapped[str] = mapped_column("kind", String(20), nullable=False, server_default="cycle")
+
+
+class CycleBurndownSnapshotModel(Base):
+    """One row per cycle, effort field and day: effort totals as of the last change that day."""
+
+    __tablename__ = "cycle_burndown_snapshots"
+    __table_args__ = (
+        UniqueConstraint(
+            "cycle_id",
+            "effort_field",
+            "snapshot_date",
+            name="uq_cycle_burndown_snapshots_cycle_field_date",
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    project_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid,
+        ForeignKey("projects.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    cycle_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid,
+        ForeignKey("cycle_nodes.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    effort_field: Mapped[str] = mapped_column(String(100), nullable=False)
+    snapshot_date: Mapped[date] = mapped_column(Date, nullable=False)
+    total_effort: Mapped[float] = mapped_column(Float, nullable=False, server_default="0")
+    completed_effort: Mapped[float] = mapped_column(Float, nullable=False, server_default="0")
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
@@ -1,15 +1,17 @@
-"""Cadence SQLAlchemy repository."""
+"""Cadence and burndown snapshot SQLAlchemy repositories."""
 
 from __future__ import annotations
 
 import uuid
+from datetime import date
 
-from sqlalchemy import delete, select, update
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from alm.cycle.domain.entities import Cadence
-from alm.cycle.domain.ports import CycleRepository
-from alm.cycle.infrastructure.models import CycleNodeModel
+from alm.cycle.domain.entities import BurndownSnapshot, Cadence
+from alm.cycle.domain.ports import CycleBurndownSnapshotRepository, CycleRepository
+from alm.cycle.infrastructure.models import CycleBurndownSnapshotModel, CycleNodeModel
 
 
 class SqlAlchemyCycleRepository(CycleRepository):
@@ -87,3 +89,66 @@ class SqlAlchemyCycleRepository(CycleRepository):
             created_at=m.created_at,
             updated_at=m.updated_at,
         )
+
+
+class SqlAlchemyCycleBurndownSnapshotRepository(CycleBurndownSnapshotRepository):
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def upsert_many(
+        self,
+        project_id: uuid.UUID,
+        snapshot_date: date,
+        effort_field: str,
+        buckets: list[tuple[uuid.UUID, float, float]],
+    ) -> None:
+        if not buckets:
+            return
+        stmt = insert(CycleBurndownSnapshotModel).values(
+            [
+                {
+                    "id": uuid.uuid4(),
+                    "project_id": project_id,
+                    "cycle_id": cycle_id,
+                    "effort_field": effort_field,
+                    "snapshot_date": snapshot_date,
+                    "total_effort": total,
+                    "completed_effort": completed,
+                }
+                for cycle_id, total, completed in buckets
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_cycle_burndown_snapshots_cycle_field_date",
+            set_={
+                "total_effort": stmt.excluded.total_effort,
+                "completed_effort": stmt.excluded.completed_effort,
+                "updated_at": func.now(),
+            },
+        )
+        await self._session.execute(stmt)
+
+    async def list_by_cycle(
+        self,
+        cycle_id: uuid.UUID,
+        effort_field: str,
+        *,
+        end_date: date,
+    ) -> list[BurndownSnapshot]:
+        result = await self._session.execute(
+            select(
+                CycleBurndownSnapshotModel.snapshot_date,
+                CycleBurndownSnapshotModel.total_effort,
+                CycleBurndownSnapshotModel.completed_effort,
+            )
+            .where(
+                CycleBurndownSnapshotModel.cycle_id == cycle_id,
+                CycleBurndownSnapshotModel.effort_field == effort_field,
+                CycleBurndownSnapshotModel.snapshot_date <= end_date,
+            )
+            .order_by(CycleBurndownSnapshotModel.snapshot_date.asc())
+        )
+        return [
+            BurndownSnapshot(snapshot_date=d, total_effort=float(total), completed_effort=float(done))
+            for d, total, done in result.all()
+        ]
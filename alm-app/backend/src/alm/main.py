@@ -10,6 +10,7 @@ from prometheus_client import make_asgi_app
 # Import so artifact transition metrics are registered and appear in /metrics from first scrape
 import alm.artifact.infrastructure.metrics  # noqa: F401
 import alm.scm.infrastructure.metrics  # noqa: F401 — SCM Prometheus counters (links + webhook unmatched / push no_match)
+import alm.shared.infrastructure.event_dispatch_metrics  # noqa: F401 — command time vs. event dispatch lag
 import alm.shared.infrastructure.outbox_metrics  # noqa: F401 — transactional outbox worker counters
 from alm.admin.api.router import router as admin_router
 from alm.auth.api.router import router as auth_router
@@ -19,8 +20,11 @@ from alm.orgs.api.router import router as orgs_router
 from alm.process_template.api.router import router as process_template_router
 from alm.project.api.router import router as project_router
 from alm.realtime.api.router import router as realtime_router
-from alm.realtime.pubsub import run_subscriber
+from alm.realtime.pubsub import flush_realtime_events, run_subscriber
+from alm.shared.application.mediator import get_domain_event_dispatcher
 from alm.shared.audit.api.router import router as audit_router
+from alm.shared.infrastructure.async_event_dispatch import start_async_event_dispatch, stop_async_event_dispatch
+from alm.shared.infrastructure.cache import run_permission_invalidation_subscriber
 from alm.shared.infrastructure.correlation import CorrelationIdMiddleware
 from alm.shared.infrastructure.db.session import async_session_factory
 from alm.shared.infrastructure.db.tenant_context import setup_tenant_rls
@@ -31,6 +35,7 @@ from alm.shared.infrastructure.domain_event_outbox import (
 from alm.shared.infrastructure.error_handler import register_exception_handlers
 from alm.shared.infrastructure.health import health_router
 from alm.shared.infrastructure.rate_limit_middleware import RateLimitMiddleware
+from alm.shared.infrastructure.security.auth_context import AuthContextMiddleware
 from alm.shared.infrastructure.security_headers import SecureHeadersMiddleware
 from alm.shared.infrastructure.tenant_middleware import TenantContextMiddleware
 from alm.team.api.router import router as team_router
@@ -55,16 +60,23 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         logger.exception("outbox_prometheus_gauges_startup_failed")
 
     subscriber_task = asyncio.create_task(run_subscriber())
+    permission_subscriber_task = asyncio.create_task(run_permission_invalidation_subscriber())
     outbox_task = asyncio.create_task(run_domain_event_outbox_worker(async_session_factory))
+    dispatch_task = start_async_event_dispatch(get_domain_event_dispatcher(), async_session_factory)
 
     yield
 
+    await stop_async_event_dispatch(dispatch_task)
+    await flush_realtime_events()
     outbox_task.cancel()
     with suppress(asyncio.CancelledError):
         await outbox_task
     subscriber_task.cancel()
     with suppress(asyncio.CancelledError):
         await subscriber_task
+    permission_subscriber_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await permission_subscriber_task
     logger.info("application_shutting_down")
 
 
@@ -83,6 +95,8 @@ def create_app() -> FastAPI:
 
     app.add_middleware(TenantContextMiddleware)
     app.add_middleware(RateLimitMiddleware)
+    # Outside tenant context / rate limit: verifies the bearer token once for everything below it.
+    app.add_middleware(AuthContextMiddleware)
     app.add_middleware(SecureHeadersMiddleware)
     app.add_middleware(
         CORSMiddleware,
@@ -39,12 +39,18 @@ from alm.artifact.api.schemas import (
     PermittedTransitionsResponse,
     artifact_response_from_dto,
 )
+from alm.artifact.application.commands.batch_transition_artifacts import (
+    BATCH_RESULT_OK,
+    BatchTransitionArtifacts,
+    BatchTransitionResult,
+)
 from alm.artifact.application.commands.create_artifact import CreateArtifact
 from alm.artifact.application.commands.delete_artifact import DeleteArtifact
 from alm.artifact.application.commands.restore_artifact import RestoreArtifact
 from alm.artifact.application.commands.transition_artifact import TransitionArtifact
 from alm.artifact.application.commands.update_artifact import UpdateArtifact
 from alm.artifact.application.queries.get_artifact import GetArtifact
+from alm.artifact.application.queries.get_cycle_burndown import GetCycleBurndown
 from alm.artifact.application.queries.get_permitted_transitions import GetPermittedTransitions
 from alm.artifact.application.queries.list_artifacts import ListArtifacts
 from alm.artifact.domain.mpc_resolver import manifest_defs_to_flat
@@ -3,6 +3,7 @@
 from typing import Literal
 
 from fastapi import APIRouter, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from alm.artifact.api.schemas import ArtifactImportResponse, ArtifactImportResponseRow
@@ -35,7 +36,7 @@ async def export_artifacts_file(
     user: CurrentUser = require_permission("artifact:read"),
     _acl: None = require_manifest_acl("artifact", "read"),
     session: AsyncSession = Depends(get_db),
-) -> Response:
+) -> StreamingResponse:
     result = await export_artifacts(
         session,
         project_id=project_id,
@@ -56,8 +57,8 @@ async def export_artifacts_file(
         tag_id=tag_id,
         team_id=team_id,
     )
-    return Response(
-        content=result.content,
+    return StreamingResponse(
+        result.chunks,
         media_type=result.content_type,
         headers={"Content-Disposition": f'attachment; filename="{result.filename}"'},
     )
@@ -105,6 +106,8 @@ async def import_artifacts_file(
         mode=mode,
         validate_only=validate_only,
     )
+    # Bulk writes buffer their domain events like command handlers do: outbox, commit, then dispatch.
+    await Mediator(session).finalize_transaction()
     return ArtifactImportResponse(
         created_count=result.created_count,
         updated_count=result.updated_count,
@@ -293,6 +296,12 @@ async def list_artifacts(
     sort_order: str | None = None,
     limit: int = 20,
     offset: int = 0,
+    cursor: str | None = Query(
+        None, description="Opaque next_cursor from the previous page (keyset pagination; offset is ignored)"
+    ),
+    total_mode: Literal["exact", "estimate", "none"] = Query(
+        "exact", description="exact: COUNT(*); estimate: query planner estimate; none: skip counting"
+    ),
     include_deleted: bool = False,
     include_system_roots: bool = False,
     tree: str | None = None,
@@ -330,6 +339,8 @@ async def list_artifacts(
             sort_order=sort_order,
             limit=limit,
             offset=offset,
+            cursor=cursor,
+            total_mode=total_mode,
             include_deleted=include_deleted,
             include_system_roots=include_system_roots,
             tree=tree,
@@ -349,7 +360,13 @@ async def list_artifacts(
         if items
         else allowed_actions_for_artifact(await get_user_privileges(user.tenant_id, user.id))
     )
-    return ArtifactListResponse(items=items, total=result.total, allowed_actions=list_actions)
+    return ArtifactListResponse(
+        items=items,
+        total=result.total,
+        total_is_estimate=result.total_is_estimate,
+        next_cursor=result.next_cursor,
+        allowed_actions=list_actions,
+    )
 
 
 @router.post(
@@ -364,47 +381,27 @@ async def batch_transition_artifacts(
     _acl: None = require_manifest_acl("artifact", "update"),
     mediator: Mediator = Depends(get_mediator),
 ) -> BatchResultResponse:
-    success_count = 0
-    errors: list[str] = []
-    results: dict[str, str] = {}
-    for artifact_id in body.artifact_ids:
-        aid = str(artifact_id)
-        try:
-            await mediator.send(
-                TransitionArtifact(
-                    tenant_id=org.tenant_id,
-                    project_id=project_id,
-                    artifact_id=artifact_id,
-                    new_state=body.new_state,
-                    trigger=body.trigger,
-                    state_reason=body.state_reason,
-                    resolution=body.resolution,
-                    updated_by=user.id,
-                    actor_roles=tuple(user.roles) if user.roles else None,
-                )
-            )
-            success_count += 1
-            results[aid] = "ok"
-        except GuardDeniedError as e:
-            results[aid] = "guard_denied"
-            errors.append(f"{artifact_id}: {e!s}")
-        except PolicyDeniedError as e:
-            results[aid] = "policy_denied"
-            errors.append(f"{artifact_id}: {e!s}")
-        except ConflictError as e:
-            results[aid] = "conflict_error"
-            errors.append(f"{artifact_id}: {e!s}")
-        except ValidationError as e:
-            results[aid] = "validation_error"
-            errors.append(f"{artifact_id}: {e!s}")
-        except Exception as e:  # noqa: BLE001
-            results[aid] = "validation_error"
-            errors.append(f"{artifact_id}: {e!s}")
+    result: BatchTransitionResult = await mediator.send(
+        BatchTransitionArtifacts(
+            tenant_id=org.tenant_id,
+            project_id=project_id,
+            artifact_ids=tuple(body.artifact_ids),
+            new_state=body.new_state,
+            trigger=body.trigger,
+            state_reason=body.state_reason,
+            resolution=body.resolution,
+            updated_by=user.id,
+            actor_roles=tuple(user.roles) if user.roles else None,
+            expected_updated_at=body.expected_updated_at,
+            all_or_nothing=body.mode == "atomic",
+        )
+    )
+    errors = [f"{artifact_id}: {message}" for artifact_id, message in result.errors.items()]
     return BatchResultResponse(
-        success_count=success_count,
-        error_count=len(errors),
+        success_count=result.success_count,
+        error_count=sum(1 for r in result.results.values() if r != BATCH_RESULT_OK),
         errors=errors[:20],
-        results=results,
+        results={str(artifact_id): r for artifact_id, r in result.results.items()},
     )
 
 
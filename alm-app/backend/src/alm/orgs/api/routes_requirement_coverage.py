@@ -14,18 +14,25 @@ from alm.quality.api.schemas import (
     RequirementCoverageTestRefResponse,
     RequirementTraceabilityMatrixResponse,
     RequirementTraceabilityMatrixSummaryResponse,
+    RequirementTraceabilityMatrixTileResponse,
     TraceabilityMatrixCellResponse,
     TraceabilityMatrixColumnResponse,
     TraceabilityMatrixRowResponse,
     TraceabilityMatrixSummaryChildResponse,
+    TraceabilityMatrixTileCellResponse,
+    TraceabilityMatrixTileColumnResponse,
+    TraceabilityMatrixTileRowResponse,
     TraceabilityRelationshipResponse,
 )
 from alm.quality.application.queries.requirement_coverage_analysis import (
     RequirementCoverageAnalysis,
 )
 from alm.quality.application.queries.requirement_traceability_matrix import (
+    MAX_TILE_COLUMNS,
+    MAX_TILE_ROWS,
     RequirementTraceabilityMatrix,
     RequirementTraceabilityMatrixSummary,
+    RequirementTraceabilityMatrixTile,
 )
 from alm.shared.domain.exceptions import ValidationError
 
@@ -317,3 +324,116 @@ async def get_requirement_traceability_matrix(
             for rel in result.relationships
         ],
     )
+
+
+@router.get(
+    "/projects/{project_id}/requirements/traceability-matrix/tiles",
+    response_model=RequirementTraceabilityMatrixTileResponse,
+)
+async def get_requirement_traceability_matrix_tile(
+    project_id: uuid.UUID,
+    org: ResolvedOrg = Depends(resolve_org),
+    user: CurrentUser = require_permission("artifact:read"),
+    _acl: None = require_manifest_acl("artifact", "read"),
+    mediator: Mediator = Depends(get_mediator),
+    under: uuid.UUID | None = Query(None, description="Subtree root artifact id"),
+    relationship_types: str | None = Query(
+        None,
+        description="Comma-separated link types (default: verifies)",
+    ),
+    include_reverse_verifies: bool = Query(
+        True,
+        description="Also count verifies links from requirement to test-case",
+    ),
+    scope_run_id: uuid.UUID | None = None,
+    scope_suite_id: uuid.UUID | None = None,
+    scope_campaign_id: uuid.UUID | None = None,
+    search: str | None = Query(
+        None,
+        description="Optional text filter against requirement and test title/key",
+    ),
+    row_offset: int = Query(0, ge=0),
+    row_limit: int = Query(100, ge=1, le=MAX_TILE_ROWS),
+    column_offset: int = Query(0, ge=0),
+    column_limit: int = Query(100, ge=1, le=MAX_TILE_COLUMNS),
+    refresh: bool = Query(False, description="Rebuild the server-side matrix index"),
+) -> RequirementTraceabilityMatrixTileResponse:
+    """One row x column window of the sparse matrix (no matrix size limits); page with the offsets."""
+    scopes = sum(
+        1 for x in (scope_run_id, scope_suite_id, scope_campaign_id) if x is not None
+    )
+    if scopes > 1:
+        raise HTTPException(
+            status_code=422,
+            detail="At most one of scope_run_id, scope_suite_id, scope_campaign_id",
+        )
+    lt_raw = (relationship_types or "verifies").strip()
+    lt_tuple = tuple(s.strip() for s in lt_raw.split(",") if s.strip())
+    if not lt_tuple:
+        lt_tuple = ("verifies",)
+    try:
+        result = await mediator.query(
+            RequirementTraceabilityMatrixTile(
+                tenant_id=org.tenant_id,
+                project_id=project_id,
+                under_artifact_id=under,
+                relationship_types=lt_tuple,
+                include_reverse_verifies=include_reverse_verifies,
+                scope_run_id=scope_run_id,
+                scope_suite_id=scope_suite_id,
+                scope_campaign_id=scope_campaign_id,
+                search=search,
+                row_offset=row_offset,
+                row_limit=row_limit,
+                column_offset=column_offset,
+                column_limit=column_limit,
+                refresh=refresh,
+            )
+        )
+    except ValidationError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+
+    return RequirementTraceabilityMatrixTileResponse(
+        computed_at=result.computed_at,
+        cache_hit=result.cache_hit,
+        total_rows=result.total_rows,
+        total_columns=result.total_columns,
+        relationship_count=result.relationship_count,
+        coverage_counts=result.coverage_counts,
+        row_offset=result.row_offset,
+        column_offset=result.column_offset,
+        rows=[
+            TraceabilityMatrixTileRowResponse(
+                row_index=row.row_index,
+                requirement_id=row.ref.requirement_id,
+                parent_id=row.ref.parent_id,
+                artifact_key=row.ref.artifact_key,
+                title=row.ref.title,
+                leaf_status=row.leaf_status,
+                linked_test_count=row.linked_test_count,
+                status_counts=row.status_counts,
+            )
+            for row in result.rows
+        ],
+        columns=[
+            TraceabilityMatrixTileColumnResponse(
+                column_index=col.column_index,
+                test_id=col.ref.test_id,
+                artifact_key=col.ref.artifact_key,
+                title=col.ref.title,
+                status=col.ref.status,
+                run_id=col.ref.run_id,
+                run_title=col.ref.run_title,
+                linked_requirement_count=col.linked_requirement_count,
+            )
+            for col in result.columns
+        ],
+        cells=[
+            TraceabilityMatrixTileCellResponse(
+                row_index=cell.row_index,
+                column_index=cell.column_index,
+                relationship_type=cell.relationship_type,
+            )
+            for cell in result.cells
+        ],
+    )
@@ -89,3 +89,43 @@ async def get_burndown(
         )
         for d in dtos
     ]
+
+
+class CycleBurndownPointResponse(BaseModel):
+    date: str
+    remaining_effort: float | None
+    ideal_effort: float
+    total_effort: float | None = None
+    completed_effort: float | None = None
+
+
+@router.get(
+    "/projects/{project_id}/cadences/{cadence_id}/burndown",
+    response_model=list[CycleBurndownPointResponse],
+)
+async def get_cycle_burndown(
+    project_id: uuid.UUID,
+    cadence_id: uuid.UUID,
+    effort_field: str = Query("story_points", description="Custom field key for effort"),
+    org: ResolvedOrg = Depends(resolve_org),
+    user: CurrentUser = require_permission("project:read"),
+    mediator: Mediator = Depends(get_mediator),
+) -> list[CycleBurndownPointResponse]:
+    points = await mediator.query(
+        GetCycleBurndown(
+            tenant_id=org.tenant_id,
+            project_id=project_id,
+            cycle_id=cadence_id,
+            effort_field=effort_field,
+        )
+    )
+    return [
+        CycleBurndownPointResponse(
+            date=p.date,
+            remaining_effort=p.remaining_effort,
+            ideal_effort=p.ideal_effort,
+            total_effort=p.total_effort,
+            completed_effort=p.completed_effort,
+        )
+        for p in points
+    ]
@@ -9,6 +9,7 @@ from datetime import UTC, datetime
 from typing import Any
 
 from alm.artifact.domain.governance_adapter import ALMGovernanceAdapter
+from alm.artifact.domain.manifest_cache import invalidate_compiled_manifest
 from alm.process_template.domain.entities import ProcessTemplateVersion
 from alm.process_template.domain.ports import ProcessTemplateRepository
 from alm.project.domain.ports import ProjectRepository
@@ -102,6 +103,8 @@ class UpdateProjectManifestHandler(CommandHandler[dict[str, Any] | None]):
 
         project.process_template_version_id = new_version.id
         await self._project_repo.update(project)
+        # Superseded version: drop its compiled manifest and workflow engines; rebuilt on demand if still used.
+        invalidate_compiled_manifest(current_version.id)
 
         # Governance: run activation protocol for the new version (fire-and-forget)
         if self._governance and not self._governance.activate_new_version(new_version.manifest_bundle):
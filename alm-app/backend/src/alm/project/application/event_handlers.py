@@ -0,0 +1,75 @@
+"""Project domain event handlers: keep daily burndown snapshots current as artifacts change."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import structlog
+
+from alm.artifact.domain.events import (
+    ArtifactCreated,
+    ArtifactDeleted,
+    ArtifactRestored,
+    ArtifactScheduleChanged,
+    ArtifactStateChanged,
+)
+from alm.artifact.infrastructure.repositories import SqlAlchemyArtifactRepository
+from alm.cycle.infrastructure.repositories import (
+    SqlAlchemyCycleBurndownSnapshotRepository,
+    SqlAlchemyCycleRepository,
+)
+from alm.process_template.infrastructure.repositories import SqlAlchemyProcessTemplateRepository
+from alm.project.application.services.burndown_snapshots import refresh_burndown_snapshots
+from alm.project.infrastructure.repositories import SqlAlchemyProjectRepository
+from alm.shared.domain.events import DomainEvent
+from alm.shared.infrastructure.db.session import async_session_factory
+from alm.shared.infrastructure.event_lookups import current_event_lookup_scope
+
+logger = structlog.get_logger()
+
+# Events that change a cycle's total or done effort: membership, effort estimates, done state, deletion.
+BURNDOWN_INPUT_EVENTS: tuple[type[DomainEvent], ...] = (
+    ArtifactCreated,
+    ArtifactStateChanged,
+    ArtifactScheduleChanged,
+    ArtifactDeleted,
+    ArtifactRestored,
+)
+
+
+async def on_artifact_changed_refresh_burndown_snapshots(event: DomainEvent) -> None:
+    """Rewrite today's burndown snapshot rows for the event's project (runs after commit / from the outbox).
+
+    The refresh covers every in-progress cycle of the project, so it runs once per project per dispatched batch:
+    the batch's events were all committed before dispatch.
+    """
+    if not isinstance(event, BURNDOWN_INPUT_EVENTS):
+        return
+    project_id = event.project_id
+    scope = current_event_lookup_scope()
+    if scope is not None and not scope.once(("burndown_snapshots", project_id)):
+        return
+
+    try:
+        async with async_session_factory() as session:
+            try:
+                await refresh_burndown_snapshots(
+                    project_id,
+                    today=datetime.now(UTC).date(),
+                    project_repo=SqlAlchemyProjectRepository(session),
+                    cycle_repo=SqlAlchemyCycleRepository(session),
+                    artifact_repo=SqlAlchemyArtifactRepository(session),
+                    process_template_repo=SqlAlchemyProcessTemplateRepository(session),
+                    snapshot_repo=SqlAlchemyCycleBurndownSnapshotRepository(session),
+                )
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+    except Exception:
+        logger.exception(
+            "burndown_snapshot_refresh_failed",
+            artifact_id=str(event.artifact_id),
+            project_id=str(project_id),
+            event_type=type(event).__name__,
+        )
@@ -5,13 +5,11 @@ from __future__ import annotations
 import uuid
 from dataclasses import dataclass
 
-from alm.artifact.domain.manifest_workflow_metadata import (
-    DEFAULT_BURNDOWN_DONE_STATES,
-    resolve_burndown_done_states,
-)
+from alm.artifact.domain.manifest_workflow_metadata import DEFAULT_BURNDOWN_DONE_STATES
 from alm.artifact.domain.ports import ArtifactRepository
 from alm.cycle.domain.ports import CycleRepository
 from alm.process_template.domain.ports import ProcessTemplateRepository
+from alm.project.application.services.effective_process_template_version import compiled_manifest_by_version_id
 from alm.project.domain.ports import ProjectRepository
 from alm.shared.application.query import Query, QueryHandler
 
@@ -58,12 +56,13 @@ class GetBurndownHandler(QueryHandler[list[BurndownPointDTO]]):
         if project is None or project.tenant_id != query.tenant_id:
             return []
 
-        manifest: dict = {}
+        manifest_done = DEFAULT_BURNDOWN_DONE_STATES
         if project.process_template_version_id:
-            ver = await self._process_template_repo.find_version_by_id(project.process_template_version_id)
-            if ver and ver.manifest_bundle:
-                manifest = ver.manifest_bundle
-        manifest_done = resolve_burndown_done_states(manifest)
+            compiled = await compiled_manifest_by_version_id(
+                self._process_template_repo, project.process_template_version_id
+            )
+            if compiled is not None:
+                manifest_done = compiled.burndown_done_states
         effective_done = query.done_states if query.done_states != DEFAULT_BURNDOWN_DONE_STATES else manifest_done
 
         cycle_ids = query.cycle_ids
@@ -78,21 +77,14 @@ class GetBurndownHandler(QueryHandler[list[BurndownPointDTO]]):
         if not cycle_ids:
             return []
 
-        total_by_id = dict(
-            await self._artifact_repo.sum_total_effort_by_cycles(
-                query.project_id,
-                cycle_ids,
-                query.effort_field,
-            )
-        )
-        completed_by_id = dict(
-            await self._artifact_repo.sum_effort_by_cycles(
-                query.project_id,
-                cycle_ids,
-                effective_done,
-                query.effort_field,
-            )
+        buckets = await self._artifact_repo.sum_effort_buckets_by_cycles(
+            query.project_id,
+            cycle_ids,
+            effective_done,
+            query.effort_field,
         )
+        total_by_id = {cid: total for cid, total, _ in buckets}
+        completed_by_id = {cid: done for cid, _, done in buckets}
         cycles = await self._cycle_repo.list_by_project(query.project_id)
         name_by_id = {c.id: c.name for c in cycles}
 
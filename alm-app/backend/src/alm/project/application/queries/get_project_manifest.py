@@ -8,9 +8,11 @@ from typing import Any
 
 import structlog
 
+from alm.artifact.domain.manifest_cache import CompiledManifest
 from alm.artifact.domain.manifest_merge_defaults import merge_manifest_metadata_defaults
 from alm.process_template.domain.ports import ProcessTemplateRepository
 from alm.project.application.services.effective_process_template_version import (
+    effective_compiled_manifest,
     effective_process_template_version,
 )
 from alm.project.domain.ports import ProjectRepository
@@ -80,3 +82,29 @@ class GetProjectManifestHandler(QueryHandler[ProjectManifestResult | None]):
             template_slug=template_slug,
             version=version.version,
         )
+
+
+@dataclass(frozen=True)
+class GetProjectCompiledManifest(Query):
+    """Process-wide cached compiled manifest for hot paths (ACL guards); the bundle is shared and read-only."""
+
+    tenant_id: uuid.UUID
+    project_id: uuid.UUID
+
+
+class GetProjectCompiledManifestHandler(QueryHandler[CompiledManifest | None]):
+    def __init__(
+        self,
+        project_repo: ProjectRepository,
+        process_template_repo: ProcessTemplateRepository,
+    ) -> None:
+        self._project_repo = project_repo
+        self._process_template_repo = process_template_repo
+
+    async def handle(self, query: Query) -> CompiledManifest | None:
+        assert isinstance(query, GetProjectCompiledManifest)
+
+        project = await self._project_repo.find_by_id(query.project_id)
+        if project is None or project.tenant_id != query.tenant_id:
+            return None
+        return await effective_compiled_manifest(self._process_template_repo, project.process_template_version_id)
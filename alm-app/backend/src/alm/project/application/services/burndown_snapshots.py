@@ -0,0 +1,67 @@
+"""Daily burndown snapshots: rewrite today's effort totals for the cycles of a project that are in progress."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import date
+
+from alm.artifact.domain.manifest_workflow_metadata import DEFAULT_BURNDOWN_DONE_STATES
+from alm.artifact.domain.ports import ArtifactRepository
+from alm.cycle.domain.entities import Cadence
+from alm.cycle.domain.ports import CycleBurndownSnapshotRepository, CycleRepository
+from alm.process_template.domain.ports import ProcessTemplateRepository
+from alm.project.application.services.effective_process_template_version import compiled_manifest_by_version_id
+from alm.project.domain.entities import Project
+from alm.project.domain.ports import ProjectRepository
+
+SNAPSHOT_EFFORT_FIELD = "story_points"
+
+
+async def burndown_done_states(
+    process_template_repo: ProcessTemplateRepository,
+    project: Project,
+) -> tuple[str, ...]:
+    """Manifest ``burndown_done_states`` for the project's process template, else the defaults."""
+    if project.process_template_version_id:
+        compiled = await compiled_manifest_by_version_id(process_template_repo, project.process_template_version_id)
+        if compiled is not None:
+            return compiled.burndown_done_states
+    return DEFAULT_BURNDOWN_DONE_STATES
+
+
+def cycles_in_progress(cycles: list[Cadence], on: date) -> list[Cadence]:
+    """Cycles whose start/end window contains ``on``; undated cycles have no burndown."""
+    return [c for c in cycles if c.start_date and c.end_date and c.start_date <= on <= c.end_date]
+
+
+async def refresh_burndown_snapshots(
+    project_id: uuid.UUID,
+    *,
+    today: date,
+    project_repo: ProjectRepository,
+    cycle_repo: CycleRepository,
+    artifact_repo: ArtifactRepository,
+    process_template_repo: ProcessTemplateRepository,
+    snapshot_repo: CycleBurndownSnapshotRepository,
+    effort_field: str = SNAPSHOT_EFFORT_FIELD,
+) -> int:
+    """Upsert today's snapshot for every in-progress cycle of the project; returns the number of rows written.
+
+    All in-progress cycles are refreshed (one grouped aggregate), so an artifact moved between cycles
+    updates both sides without the event carrying the previous cycle.
+    """
+    project = await project_repo.find_by_id(project_id)
+    if project is None:
+        return 0
+    cycles = cycles_in_progress(await cycle_repo.list_by_project(project_id), today)
+    if not cycles:
+        return 0
+    done_states = await burndown_done_states(process_template_repo, project)
+    buckets = await artifact_repo.sum_effort_buckets_by_cycles(
+        project_id,
+        [c.id for c in cycles],
+        done_states,
+        effort_field,
+    )
+    await snapshot_repo.upsert_many(project_id, today, effort_field, buckets)
+    return len(buckets)
@@ -4,6 +4,12 @@ from __future__ import annotations
 
 import uuid
 
+from alm.artifact.domain.manifest_cache import (
+    CompiledManifest,
+    cache_compiled_manifest,
+    get_cached_compiled_manifest,
+)
+from alm.config.settings import settings
 from alm.process_template.domain.entities import ProcessTemplateVersion
 from alm.process_template.domain.ports import ProcessTemplateRepository
 
@@ -19,3 +25,41 @@ async def effective_process_template_version(
     if version is None:
         version = await process_template_repo.find_default_version()
     return version
+
+
+def compiled_manifest_for_version(version: ProcessTemplateVersion) -> CompiledManifest:
+    """Compiled (merged + derived) manifest for an already loaded version row."""
+    return cache_compiled_manifest(
+        version.id,
+        version.manifest_bundle,
+        fulltext_default=settings.fulltext_search_config,
+    )
+
+
+async def compiled_manifest_by_version_id(
+    process_template_repo: ProcessTemplateRepository,
+    process_template_version_id: uuid.UUID,
+) -> CompiledManifest | None:
+    """Process-wide cached compiled manifest; loads the JSONB bundle only on a cache miss."""
+    compiled = get_cached_compiled_manifest(process_template_version_id)
+    if compiled is not None:
+        return compiled
+    version = await process_template_repo.find_version_by_id(process_template_version_id)
+    if version is None:
+        return None
+    return compiled_manifest_for_version(version)
+
+
+async def effective_compiled_manifest(
+    process_template_repo: ProcessTemplateRepository,
+    process_template_version_id: uuid.UUID | None,
+) -> CompiledManifest | None:
+    """Same resolution order as ``effective_process_template_version`` but served from the compiled cache."""
+    if process_template_version_id is not None:
+        compiled = await compiled_manifest_by_version_id(process_template_repo, process_template_version_id)
+        if compiled is not None:
+            return compiled
+    version = await process_template_repo.find_default_version()
+    if version is None:
+        return None
+    return compiled_manifest_for_version(version)
@@ -91,6 +91,7 @@ async def _ensure_default_tree_folder_artifacts(
                 state=state,
                 parent_id=root_row.id,
                 artifact_key=f"{project.code}-{suffix}",
+                tenant_id=project.tenant_id,
             )
             await artifact_repo.add(folder)
             created += 1
@@ -145,6 +146,7 @@ async def ensure_project_tree_roots(
             state=state,
             parent_id=None,
             artifact_key=f"{project.code}-{suffix}",
+            tenant_id=project.tenant_id,
         )
         await artifact_repo.add(root)
         created += 1
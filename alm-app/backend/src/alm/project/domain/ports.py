@@ -28,6 +28,11 @@ class ProjectRepository(ABC):
         """Increment project artifact sequence and return new value (for artifact_key)."""
         ...
 
+    @abstractmethod
+    async def reserve_artifact_seq_block(self, project_id: uuid.UUID, count: int) -> int:
+        """Advance the artifact sequence by ``count`` in one statement; return the first reserved value."""
+        ...
+
     @abstractmethod
     async def update(self, project: Project) -> Project:
         """Update project (name, description, status, settings, metadata_)."""
@@ -73,6 +73,18 @@ class SqlAlchemyProjectRepository(ProjectRepository):
             raise ValueError(f"Project {project_id} not found")
         return int(row[0])
 
+    async def reserve_artifact_seq_block(self, project_id: uuid.UUID, count: int) -> int:
+        result = await self._session.execute(
+            update(ProjectModel)
+            .where(ProjectModel.id == project_id)
+            .values(artifact_seq=ProjectModel.artifact_seq + count)
+            .returning(ProjectModel.artifact_seq)
+        )
+        row = result.one_or_none()
+        if row is None:
+            raise ValueError(f"Project {project_id} not found")
+        return int(row[0]) - count + 1
+
     async def add(self, project: Project) -> Project:
         model = ProjectModel(
             id=project.id,
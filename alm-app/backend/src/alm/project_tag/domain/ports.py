@@ -36,6 +36,11 @@ class ProjectTagRepository(ABC):
         """Replace all tags on artifact (artifact must belong to project)."""
         ...
 
+    @abstractmethod
+    async def replace_artifact_tags_bulk(self, tag_ids_by_artifact: dict[uuid.UUID, list[uuid.UUID]]) -> None:
+        """Replace tags for many artifacts with one DELETE and one multi-row INSERT (ids already validated)."""
+        ...
+
     @abstractmethod
     async def get_tags_by_artifact_ids(
         self, artifact_ids: list[uuid.UUID]
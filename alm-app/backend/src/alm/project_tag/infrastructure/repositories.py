@@ -5,7 +5,7 @@ from __future__ import annotations
 import uuid
 from collections import defaultdict
 
-from sqlalchemy import delete, func, select
+from sqlalchemy import delete, func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from alm.artifact.infrastructure.models import ArtifactModel
@@ -116,6 +116,20 @@ class SqlAlchemyProjectTagRepository(ProjectTagRepository):
             self._session.add(ArtifactTagModel(artifact_id=artifact_id, tag_id=tid))
         await self._session.flush()
 
+    async def replace_artifact_tags_bulk(self, tag_ids_by_artifact: dict[uuid.UUID, list[uuid.UUID]]) -> None:
+        if not tag_ids_by_artifact:
+            return
+        await self._session.execute(
+            delete(ArtifactTagModel).where(ArtifactTagModel.artifact_id.in_(list(tag_ids_by_artifact)))
+        )
+        rows = [
+            {"artifact_id": artifact_id, "tag_id": tag_id}
+            for artifact_id, tag_ids in tag_ids_by_artifact.items()
+            for tag_id in dict.fromkeys(tag_ids)
+        ]
+        if rows:
+            await self._session.execute(insert(ArtifactTagModel), rows)
+
     async def get_tags_by_artifact_ids(
         self, artifact_ids: list[uuid.UUID]
     ) -> dict[uuid.UUID, tuple[ProjectTagDTO, ...]]:
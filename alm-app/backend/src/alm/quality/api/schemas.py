@@ -187,3 +187,45 @@ class RequirementTraceabilityMatrixSummaryResponse(BaseModel):
     exceeds_column_limit: bool
     applied_search: str | None = None
     child_subtrees: list[TraceabilityMatrixSummaryChildResponse] = Field(default_factory=list)
+
+
+class TraceabilityMatrixTileRowResponse(BaseModel):
+    row_index: int
+    requirement_id: uuid.UUID
+    parent_id: uuid.UUID | None = None
+    artifact_key: str | None = None
+    title: str
+    leaf_status: str
+    linked_test_count: int
+    status_counts: dict[str, int]
+
+
+class TraceabilityMatrixTileColumnResponse(BaseModel):
+    column_index: int
+    test_id: uuid.UUID
+    artifact_key: str | None = None
+    title: str
+    status: str | None = None
+    run_id: uuid.UUID | None = None
+    run_title: str | None = None
+    linked_requirement_count: int
+
+
+class TraceabilityMatrixTileCellResponse(BaseModel):
+    row_index: int
+    column_index: int
+    relationship_type: str
+
+
+class RequirementTraceabilityMatrixTileResponse(BaseModel):
+    computed_at: datetime
+    cache_hit: bool
+    total_rows: int
+    total_columns: int
+    relationship_count: int
+    coverage_counts: dict[str, int]
+    row_offset: int
+    column_offset: int
+    rows: list[TraceabilityMatrixTileRowResponse] = Field(default_factory=list)
+    columns: list[TraceabilityMatrixTileColumnResponse] = Field(default_factory=list)
+    cells: list[TraceabilityMatrixTileCellResponse] = Field(default_factory=list)
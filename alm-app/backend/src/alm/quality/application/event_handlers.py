@@ -0,0 +1,38 @@
+"""Invalidate cached traceability results when a project's links, artifacts or test-run results change."""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Awaitable, Callable
+
+from alm.artifact.domain.events import ArtifactCreated, ArtifactDeleted, ArtifactRestored, ArtifactUpdated
+from alm.quality.domain.events import RunMetricsRecorded
+from alm.quality.domain.ports import TraceabilityResultCache
+from alm.relationship.domain.events import RelationshipCreated, RelationshipDeleted
+from alm.shared.domain.events import DomainEvent
+
+# Events that change matrix / coverage inputs (state transitions do not: neither result shows workflow state).
+TRACEABILITY_INPUT_EVENTS: tuple[type[DomainEvent], ...] = (
+    ArtifactCreated,
+    ArtifactUpdated,
+    ArtifactDeleted,
+    ArtifactRestored,
+    RelationshipCreated,
+    RelationshipDeleted,
+    RunMetricsRecorded,
+)
+
+
+def create_traceability_cache_handler(
+    cache: TraceabilityResultCache,
+) -> Callable[[DomainEvent], Awaitable[None]]:
+    """Returns a handler (register it for ``TRACEABILITY_INPUT_EVENTS``) that bumps the project's generation."""
+
+    async def on_traceability_input_changed(event: DomainEvent) -> None:
+        if not isinstance(event, TRACEABILITY_INPUT_EVENTS):
+            return
+        project_id = getattr(event, "project_id", None)
+        if isinstance(project_id, uuid.UUID):
+            await cache.bump_generation(project_id)
+
+    return on_traceability_input_changed
@@ -6,19 +6,11 @@ import uuid
 from dataclasses import dataclass, field
 from typing import Any
 
-from alm.artifact.domain.entities import Artifact
 from alm.artifact.domain.ports import ArtifactRepository
 from alm.project.domain.ports import ProjectRepository
 from alm.quality.application.execution_linked_tests import linked_execution_test_ids_for_run
-from alm.quality.application.run_metrics_v1 import (
-    configuration_id_from_metrics_row,
-    configuration_name_from_metrics_row,
-    metrics_row_for_test_id,
-    normalize_execution_status,
-    step_attachment_ids_from_metrics_row,
-    step_defect_ids_from_metrics_row,
-    step_statuses_from_metrics_row,
-)
+from alm.quality.domain.entities import TEST_RUN_ARTIFACT_TYPE, ExecutionResult
+from alm.quality.domain.ports import ExecutionResultRepository
 from alm.relationship.domain.entities import Relationship
 from alm.relationship.domain.ports import RelationshipRepository
 from alm.relationship.domain.types import RUN_FOR_SUITE
@@ -88,16 +80,56 @@ def _group_suite_includes_by_suite(links: list[Relationship]) -> dict[uuid.UUID,
     return m
 
 
+def _empty_status(test_id: uuid.UUID) -> LastTestExecutionStatusDTO:
+    return LastTestExecutionStatusDTO(
+        test_id=test_id,
+        status=None,
+        run_id=None,
+        run_title=None,
+        run_updated_at=None,
+        configuration_id=None,
+        configuration_name=None,
+        param_row_index=None,
+        step_results=[],
+    )
+
+
+def _status_from_result(row: ExecutionResult) -> LastTestExecutionStatusDTO:
+    return LastTestExecutionStatusDTO(
+        test_id=row.test_id,
+        status=row.status,
+        run_id=row.run_id,
+        run_title=row.run_title,
+        run_updated_at=row.executed_at,
+        configuration_id=row.configuration_id,
+        configuration_name=row.configuration_name,
+        param_row_index=row.param_row_index,
+        step_results=[
+            LastExecutionStepStatusDTO(
+                step_id=step.step_id,
+                status=step.status,
+                linked_defect_ids=list(step.linked_defect_ids),
+                attachment_ids=list(step.attachment_ids),
+            )
+            for step in row.step_results
+        ],
+    )
+
+
 class BatchLastTestExecutionStatusHandler(QueryHandler[list[LastTestExecutionStatusDTO]]):
+    """Run scope and linked tests come from relationships; statuses from one ``test_execution_results`` query."""
+
     def __init__(
         self,
         project_repo: ProjectRepository,
         artifact_repo: ArtifactRepository,
         relationship_repo: RelationshipRepository,
+        execution_result_repo: ExecutionResultRepository,
     ) -> None:
         self._project_repo = project_repo
         self._artifact_repo = artifact_repo
         self._relationship_repo = relationship_repo
+        self._execution_result_repo = execution_result_repo
 
     async def handle(self, query: Query) -> list[LastTestExecutionStatusDTO]:
         assert isinstance(query, BatchLastTestExecutionStatus)
@@ -116,7 +148,7 @@ class BatchLastTestExecutionStatusHandler(QueryHandler[list[LastTestExecutionSta
             runs_check = await self._artifact_repo.list_by_ids_in_project(
                 query.project_id, [query.scope_run_id]
             )
-            if len(runs_check) != 1 or runs_check[0].artifact_type != "test-run":
+            if len(runs_check) != 1 or runs_check[0].artifact_type != TEST_RUN_ARTIFACT_TYPE:
                 raise ValidationError("scope_run_id must be a test-run in this project")
             run_ids = [query.scope_run_id]
         else:
@@ -146,28 +178,7 @@ class BatchLastTestExecutionStatusHandler(QueryHandler[list[LastTestExecutionSta
                     candidates = [(r, t) for r, t in candidates if r in allowed]
             run_ids = list({r for r, _ in candidates})
         if not run_ids:
-            return [
-                LastTestExecutionStatusDTO(
-                    test_id=tid,
-                    status=None,
-                    run_id=None,
-                    run_title=None,
-                    run_updated_at=None,
-                    configuration_id=None,
-                    configuration_name=None,
-                    param_row_index=None,
-                    step_results=[],
-                )
-                for tid in ordered_unique
-            ]
-
-        runs = await self._artifact_repo.list_by_ids_in_project(query.project_id, run_ids)
-        run_by_id: dict[uuid.UUID, Artifact] = {r.id: r for r in runs}
-        runs_sorted = sorted(
-            runs,
-            key=lambda r: (r.updated_at.timestamp() if r.updated_at else 0.0, str(r.id)),
-            reverse=True,
-        )
+            return [_empty_status(tid) for tid in ordered_unique]
 
         outgoing_all = await self._relationship_repo.list_outgoing_relationships_from_artifacts(query.project_id, run_ids)
         outgoing_by_run = _group_outgoing_by_from(outgoing_all)
@@ -184,67 +195,14 @@ class BatchLastTestExecutionStatusHandler(QueryHandler[list[LastTestExecutionSta
         )
         suite_out_by_suite = _group_suite_includes_by_suite(suite_links)
 
-        linked_by_run: dict[uuid.UUID, set[uuid.UUID]] = {}
-        for run in runs_sorted:
-            rid = run.id
-            outgoing = outgoing_by_run.get(rid, [])
-            linked_by_run[rid] = linked_execution_test_ids_for_run(outgoing, suite_out_by_suite)
-
-        results: dict[uuid.UUID, LastTestExecutionStatusDTO] = {}
-        for tid in ordered_unique:
-            results[tid] = LastTestExecutionStatusDTO(
-                test_id=tid,
-                status=None,
-                run_id=None,
-                run_title=None,
-                run_updated_at=None,
-                configuration_id=None,
-                configuration_name=None,
-                param_row_index=None,
-                step_results=[],
-            )
+        wanted = set(ordered_unique)
+        run_test_pairs: list[tuple[uuid.UUID, uuid.UUID]] = []
+        for rid in run_ids:
+            linked = linked_execution_test_ids_for_run(outgoing_by_run.get(rid, []), suite_out_by_suite)
+            run_test_pairs.extend((rid, tid) for tid in linked & wanted)
 
-        for run in runs_sorted:
-            rid = run.id
-            art = run_by_id.get(rid)
-            if art is None:
-                continue
-            linked = linked_by_run.get(rid, set())
-            cf = art.custom_fields or {}
-            for tid in ordered_unique:
-                if tid in results and results[tid].status is not None:
-                    continue
-                if tid not in linked:
-                    continue
-                row = metrics_row_for_test_id(cf, tid)
-                if query.scope_configuration_id is not None:
-                    row = metrics_row_for_test_id(cf, tid, query.scope_configuration_id)
-                if row is None:
-                    continue
-                st = normalize_execution_status(row.get("status")) or "not-executed"
-                pri = row.get("paramRowIndex")
-                pidx: int | None = pri if isinstance(pri, int) else None
-                step_defects = step_defect_ids_from_metrics_row(row)
-                step_attachments = step_attachment_ids_from_metrics_row(row)
-                steps = [
-                    LastExecutionStepStatusDTO(
-                        step_id=sid,
-                        status=sst,
-                        linked_defect_ids=step_defects.get(sid, []),
-                        attachment_ids=step_attachments.get(sid, []),
-                    )
-                    for sid, sst in step_statuses_from_metrics_row(row)
-                ]
-                results[tid] = LastTestExecutionStatusDTO(
-                    test_id=tid,
-                    status=st,
-                    run_id=rid,
-                    run_title=art.title,
-                    run_updated_at=art.updated_at,
-                    configuration_id=configuration_id_from_metrics_row(row),
-                    configuration_name=configuration_name_from_metrics_row(row),
-                    param_row_index=pidx,
-                    step_results=steps,
-                )
+        latest = await self._execution_result_repo.latest_for_tests(
+            query.project_id, run_test_pairs, query.scope_configuration_id
+        )
 
-        return [results[tid] for tid in ordered_unique]
+        return [_status_from_result(latest[tid]) if tid in latest else _empty_status(tid) for tid in ordered_unique]
@@ -2,16 +2,12 @@
 
 from __future__ import annotations
 
-import threading
-import time
 import uuid
 from collections import defaultdict
 from dataclasses import dataclass
 from datetime import UTC, datetime
-from typing import Any
 
 from alm.artifact.domain.fulltext_config import resolve_fulltext_regconfig
-from alm.artifact.domain.manifest_merge_defaults import merge_manifest_metadata_defaults
 from alm.artifact.domain.manifest_workflow_metadata import (
     resolve_system_root_artifact_types,
     resolve_tree_root_artifact_type,
@@ -19,6 +15,7 @@ from alm.artifact.domain.manifest_workflow_metadata import (
 from alm.artifact.domain.ports import ArtifactRepository
 from alm.config.settings import settings
 from alm.process_template.domain.ports import ProcessTemplateRepository
+from alm.project.application.services.effective_process_template_version import compiled_manifest_by_version_id
 from alm.project.domain.ports import ProjectRepository
 from alm.quality.application.queries.batch_last_test_execution_status import (
     BatchLastTestExecutionStatus,
@@ -31,6 +28,8 @@ from alm.quality.application.requirement_coverage_rollups import (
     accumulate_subtree_counts_for_leaves,
     worst_status_among_tests,
 )
+from alm.quality.application.traceability_result_cache import cached_result
+from alm.quality.domain.ports import ExecutionResultRepository, TraceabilityResultCache
 from alm.relationship.domain.ports import RelationshipRepository
 from alm.relationship.domain.types import VERIFIES
 from alm.shared.application.query import Query, QueryHandler
@@ -40,7 +39,6 @@ MAX_COVERAGE_ARTIFACTS_WITHOUT_UNDER = 650
 MAX_COVERAGE_SUBTREE_NODES = 2400
 LINK_QUERY_CHUNK = 450
 TEST_STATUS_CHUNK = 200
-_CACHE_TTL_SEC = 90.0
 
 
 @dataclass(frozen=True)
@@ -94,32 +92,11 @@ class RequirementCoverageAnalysisResult:
     leaves: list[RequirementCoverageLeafDTO]
 
 
-_coverage_cache: dict[str, tuple[float, RequirementCoverageAnalysisResult]] = {}
-_coverage_lock = threading.Lock()
-
-
-def _cache_get(key: str) -> RequirementCoverageAnalysisResult | None:
-    now = time.monotonic()
-    with _coverage_lock:
-        hit = _coverage_cache.get(key)
-        if not hit:
-            return None
-        exp, val = hit
-        if now >= exp:
-            del _coverage_cache[key]
-            return None
-        return val
-
-
-def _cache_set(key: str, val: RequirementCoverageAnalysisResult) -> None:
-    with _coverage_lock:
-        _coverage_cache[key] = (time.monotonic() + _CACHE_TTL_SEC, val)
-
-
 def _cache_key(q: RequirementCoverageAnalysis) -> str:
     lt = ",".join(sorted(q.relationship_types))
     return "|".join(
         [
+            str(q.tenant_id),
             str(q.project_id),
             str(q.under_artifact_id or ""),
             lt,
@@ -138,11 +115,15 @@ class RequirementCoverageAnalysisHandler(QueryHandler[RequirementCoverageAnalysi
         artifact_repo: ArtifactRepository,
         relationship_repo: RelationshipRepository,
         process_template_repo: ProcessTemplateRepository,
+        execution_result_repo: ExecutionResultRepository,
+        result_cache: TraceabilityResultCache | None = None,
     ) -> None:
         self._project_repo = project_repo
         self._artifact_repo = artifact_repo
         self._relationship_repo = relationship_repo
         self._process_template_repo = process_template_repo
+        self._execution_result_repo = execution_result_repo
+        self._result_cache = result_cache
 
     async def handle(self, query: Query) -> RequirementCoverageAnalysisResult:
         assert isinstance(query, RequirementCoverageAnalysis)
@@ -154,32 +135,32 @@ class RequirementCoverageAnalysisHandler(QueryHandler[RequirementCoverageAnalysi
         if scope_n > 1:
             raise ValidationError("At most one of scope_run_id, scope_suite_id, scope_campaign_id")
 
-        ck = _cache_key(query)
-        if not query.refresh:
-            cached = _cache_get(ck)
-            if cached is not None:
-                return RequirementCoverageAnalysisResult(
-                    computed_at=cached.computed_at,
-                    cache_hit=True,
-                    nodes=cached.nodes,
-                    leaves=cached.leaves,
-                )
+        return await cached_result(
+            self._result_cache,
+            query.project_id,
+            _cache_key(query),
+            lambda: self._compute(query),
+            refresh=query.refresh,
+        )
 
+    async def _compute(self, query: RequirementCoverageAnalysis) -> RequirementCoverageAnalysisResult:
         project = await self._project_repo.find_by_id(query.project_id)
         if project is None or project.tenant_id != query.tenant_id:
             raise ValidationError("Project not found")
 
-        manifest_bundle: dict[str, Any] = {}
+        compiled = None
         if project.process_template_version_id:
-            version = await self._process_template_repo.find_version_by_id(
-                project.process_template_version_id
+            compiled = await compiled_manifest_by_version_id(
+                self._process_template_repo, project.process_template_version_id
             )
-            if version and version.manifest_bundle:
-                manifest_bundle = merge_manifest_metadata_defaults(version.manifest_bundle)
-
-        fts_cfg = resolve_fulltext_regconfig(manifest_bundle, settings.fulltext_search_config)
-        system_roots = resolve_system_root_artifact_types(manifest_bundle)
-        root_type = resolve_tree_root_artifact_type("requirement", manifest_bundle)
+        if compiled is not None:
+            fts_cfg = compiled.fulltext_regconfig
+            system_roots = compiled.system_root_types
+            root_type = compiled.tree_root_type("requirement")
+        else:
+            fts_cfg = resolve_fulltext_regconfig(None, settings.fulltext_search_config)
+            system_roots = resolve_system_root_artifact_types(None)
+            root_type = resolve_tree_root_artifact_type("requirement", None)
         if not root_type:
             raise ValidationError("Project manifest has no requirement tree root")
 
@@ -196,7 +177,6 @@ class RequirementCoverageAnalysisHandler(QueryHandler[RequirementCoverageAnalysi
                 nodes=[],
                 leaves=[],
             )
-            _cache_set(ck, result)
             return result
 
         root_artifact_id = roots[0].id
@@ -297,6 +277,7 @@ class RequirementCoverageAnalysisHandler(QueryHandler[RequirementCoverageAnalysi
             project_repo=self._project_repo,
             artifact_repo=self._artifact_repo,
             relationship_repo=self._relationship_repo,
+            execution_result_repo=self._execution_result_repo,
         )
         status_by_test: dict[uuid.UUID, LastTestExecutionStatusDTO] = {}
         for i in range(0, len(all_test_ids), TEST_STATUS_CHUNK):
@@ -385,5 +366,4 @@ class RequirementCoverageAnalysisHandler(QueryHandler[RequirementCoverageAnalysi
             nodes=nodes_out,
             leaves=leaves_out,
         )
-        _cache_set(ck, result)
         return result
@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-import threading
-import time
 import uuid
 from collections import defaultdict
 from dataclasses import dataclass
@@ -11,7 +9,6 @@ from datetime import UTC, datetime
 from typing import Any
 
 from alm.artifact.domain.fulltext_config import resolve_fulltext_regconfig
-from alm.artifact.domain.manifest_merge_defaults import merge_manifest_metadata_defaults
 from alm.artifact.domain.manifest_workflow_metadata import (
     resolve_system_root_artifact_types,
     resolve_tree_root_artifact_type,
@@ -19,12 +16,24 @@ from alm.artifact.domain.manifest_workflow_metadata import (
 from alm.artifact.domain.ports import ArtifactRepository
 from alm.config.settings import settings
 from alm.process_template.domain.ports import ProcessTemplateRepository
+from alm.project.application.services.effective_process_template_version import compiled_manifest_by_version_id
 from alm.project.domain.ports import ProjectRepository
 from alm.quality.application.queries.batch_last_test_execution_status import (
     BatchLastTestExecutionStatus,
     BatchLastTestExecutionStatusHandler,
     LastTestExecutionStatusDTO,
 )
+from alm.quality.application.traceability_matrix_index import (
+    MatrixColumnRef,
+    MatrixRowRef,
+    MatrixTileCell,
+    MatrixTileColumn,
+    MatrixTileRow,
+    TraceabilityMatrixIndex,
+    build_traceability_matrix_index,
+)
+from alm.quality.application.traceability_result_cache import cached_result
+from alm.quality.domain.ports import ExecutionResultRepository, TraceabilityResultCache
 from alm.relationship.domain.ports import RelationshipRepository
 from alm.relationship.domain.types import VERIFIES
 from alm.shared.application.query import Query, QueryHandler
@@ -36,7 +45,9 @@ MAX_MATRIX_ROWS = 250
 MAX_MATRIX_COLUMNS = 180
 LINK_QUERY_CHUNK = 450
 TEST_STATUS_CHUNK = 200
-_CACHE_TTL_SEC = 90.0
+# Tiled matrix: no size limits on the matrix itself, only on one requested window.
+MAX_TILE_ROWS = 500
+MAX_TILE_COLUMNS = 250
 
 
 @dataclass(frozen=True)
@@ -147,51 +158,46 @@ class RequirementTraceabilityMatrixSummaryResult:
     child_subtrees: list[TraceabilityMatrixSummaryChildDTO]
 
 
-_matrix_cache: dict[str, tuple[float, RequirementTraceabilityMatrixResult]] = {}
-_summary_cache: dict[str, tuple[float, RequirementTraceabilityMatrixSummaryResult]] = {}
-_matrix_lock = threading.Lock()
-
-
-def _cache_get(key: str) -> RequirementTraceabilityMatrixResult | None:
-    now = time.monotonic()
-    with _matrix_lock:
-        hit = _matrix_cache.get(key)
-        if not hit:
-            return None
-        exp, val = hit
-        if now >= exp:
-            del _matrix_cache[key]
-            return None
-        return val
-
-
-def _summary_cache_get(key: str) -> RequirementTraceabilityMatrixSummaryResult | None:
-    now = time.monotonic()
-    with _matrix_lock:
-        hit = _summary_cache.get(key)
-        if not hit:
-            return None
-        exp, val = hit
-        if now >= exp:
-            del _summary_cache[key]
-            return None
-        return val
-
+@dataclass(frozen=True)
+class RequirementTraceabilityMatrixTile(Query):
+    """One window of the sparse matrix; rows/columns are ordered as in ``RequirementTraceabilityMatrix``."""
 
-def _cache_set(key: str, val: RequirementTraceabilityMatrixResult) -> None:
-    with _matrix_lock:
-        _matrix_cache[key] = (time.monotonic() + _CACHE_TTL_SEC, val)
+    tenant_id: uuid.UUID
+    project_id: uuid.UUID
+    under_artifact_id: uuid.UUID | None = None
+    relationship_types: tuple[str, ...] = (VERIFIES,)
+    include_reverse_verifies: bool = True
+    scope_run_id: uuid.UUID | None = None
+    scope_suite_id: uuid.UUID | None = None
+    scope_campaign_id: uuid.UUID | None = None
+    search: str | None = None
+    row_offset: int = 0
+    row_limit: int = 100
+    column_offset: int = 0
+    column_limit: int = 100
+    refresh: bool = False
 
 
-def _summary_cache_set(key: str, val: RequirementTraceabilityMatrixSummaryResult) -> None:
-    with _matrix_lock:
-        _summary_cache[key] = (time.monotonic() + _CACHE_TTL_SEC, val)
+@dataclass
+class RequirementTraceabilityMatrixTileResult:
+    computed_at: datetime
+    cache_hit: bool
+    total_rows: int
+    total_columns: int
+    relationship_count: int
+    coverage_counts: dict[str, int]
+    row_offset: int
+    column_offset: int
+    rows: list[MatrixTileRow]
+    columns: list[MatrixTileColumn]
+    cells: list[MatrixTileCell]
 
 
 def _cache_key(q: RequirementTraceabilityMatrix) -> str:
     lt = ",".join(sorted(q.relationship_types))
     return "|".join(
         [
+            str(q.tenant_id),
             str(q.project_id),
             str(q.under_artifact_id or ""),
             lt,
@@ -209,6 +215,25 @@ def _summary_cache_key(q: RequirementTraceabilityMatrixSummary) -> str:
     return "|".join(
         [
             "summary",
+            str(q.tenant_id),
+            str(q.project_id),
+            str(q.under_artifact_id or ""),
+            lt,
+            str(q.include_reverse_verifies),
+            str(q.scope_run_id or ""),
+            str(q.scope_suite_id or ""),
+            str(q.scope_campaign_id or ""),
+            (q.search or "").strip().lower(),
+        ]
+    )
+
+
+def _tile_index_cache_key(q: RequirementTraceabilityMatrixTile) -> str:
+    lt = ",".join(sorted(q.relationship_types))
+    return "|".join(
+        [
+            "tile-index",
+            str(q.tenant_id),
             str(q.project_id),
             str(q.under_artifact_id or ""),
             lt,
@@ -247,21 +272,23 @@ async def _prepare_matrix_context(
     project_repo: ProjectRepository,
     artifact_repo: ArtifactRepository,
     process_template_repo: ProcessTemplateRepository,
-    query: RequirementTraceabilityMatrix | RequirementTraceabilityMatrixSummary,
+    query: RequirementTraceabilityMatrix | RequirementTraceabilityMatrixSummary | RequirementTraceabilityMatrixTile,
 ) -> _MatrixPreparedContext:
     project = await project_repo.find_by_id(query.project_id)
     if project is None or project.tenant_id != query.tenant_id:
         raise ValidationError("Project not found")
 
-    manifest_bundle: dict[str, Any] = {}
+    compiled = None
     if project.process_template_version_id:
-        version = await process_template_repo.find_version_by_id(project.process_template_version_id)
-        if version and version.manifest_bundle:
-            manifest_bundle = merge_manifest_metadata_defaults(version.manifest_bundle)
-
-    fts_cfg = resolve_fulltext_regconfig(manifest_bundle, settings.fulltext_search_config)
-    system_roots = resolve_system_root_artifact_types(manifest_bundle)
-    root_type = resolve_tree_root_artifact_type("requirement", manifest_bundle)
+        compiled = await compiled_manifest_by_version_id(process_template_repo, project.process_template_version_id)
+    if compiled is not None:
+        fts_cfg = compiled.fulltext_regconfig
+        system_roots = compiled.system_root_types
+        root_type = compiled.tree_root_type("requirement")
+    else:
+        fts_cfg = resolve_fulltext_regconfig(None, settings.fulltext_search_config)
+        system_roots = resolve_system_root_artifact_types(None)
+        root_type = resolve_tree_root_artifact_type("requirement", None)
     if not root_type:
         raise ValidationError("Project manifest has no requirement tree root")
 
@@ -331,6 +358,102 @@ async def _prepare_matrix_context(
     )
 
 
+def _requirement_tree(ctx: _MatrixPreparedContext) -> tuple[list[Any], dict[uuid.UUID, list[uuid.UUID]], list[Any]]:
+    """(nodes below the root, children per node, leaf requirements) of the prepared subtree."""
+    nodes_cover = [a for a in ctx.artifacts if a.artifact_type != "root-requirement"]
+    node_ids = {a.id for a in nodes_cover}
+    children: dict[uuid.UUID, list[uuid.UUID]] = {n: [] for n in node_ids}
+    for a in nodes_cover:
+        if a.parent_id is not None and a.parent_id in node_ids:
+            children[a.parent_id].append(a.id)
+    return nodes_cover, children, [a for a in nodes_cover if not children[a.id]]
+
+
+async def _load_requirement_test_links(
+    *,
+    relationship_repo: RelationshipRepository,
+    artifact_repo: ArtifactRepository,
+    project_id: uuid.UUID,
+    requirement_ids: list[uuid.UUID],
+    relationship_types: list[str],
+    include_reverse_verifies: bool,
+) -> dict[uuid.UUID, dict[uuid.UUID, str]]:
+    """Requirement id -> {test id: relationship type}; requirement -> test links count only for test-cases."""
+    links: dict[uuid.UUID, dict[uuid.UUID, str]] = defaultdict(dict)
+    for i in range(0, len(requirement_ids), LINK_QUERY_CHUNK):
+        chunk = requirement_ids[i : i + LINK_QUERY_CHUNK]
+        links_in = await relationship_repo.list_relationships_to_artifacts(project_id, chunk, relationship_types)
+        for ln in links_in:
+            links[ln.target_artifact_id][ln.source_artifact_id] = ln.relationship_type
+
+    if include_reverse_verifies:
+        for i in range(0, len(requirement_ids), LINK_QUERY_CHUNK):
+            chunk = requirement_ids[i : i + LINK_QUERY_CHUNK]
+            out_links = await relationship_repo.list_outgoing_relationships_from_artifacts(project_id, chunk)
+            cand_tos = {ln.target_artifact_id for ln in out_links if ln.relationship_type in relationship_types}
+            if not cand_tos:
+                continue
+            arts = await artifact_repo.list_by_ids_in_project(project_id, list(cand_tos))
+            test_ids = {a.id for a in arts if a.artifact_type == "test-case"}
+            for ln in out_links:
+                if ln.relationship_type in relationship_types and ln.target_artifact_id in test_ids:
+                    links[ln.source_artifact_id][ln.target_artifact_id] = ln.relationship_type
+    return links
+
+
+def _filter_rows_by_search(
+    search: str,
+    leaf_artifacts: list[Any],
+    links: dict[uuid.UUID, dict[uuid.UUID, str]],
+    test_artifact_by_id: dict[uuid.UUID, Any],
+) -> list[tuple[Any, set[uuid.UUID]]]:
+    """Leaves (title order) with their visible tests: all tests when the requirement matches ``search``, else the
+    matching ones. Leaves without visible tests are dropped."""
+    out: list[tuple[Any, set[uuid.UUID]]] = []
+    for art in sorted(leaf_artifacts, key=lambda x: (str(x.title or ""), str(x.id))):
+        tids = set(links.get(art.id, ()))
+        row_matches = _search_matches(search, [art.title, art.artifact_key])
+        if search and not row_matches:
+            tids = {
+                tid
+                for tid in tids
+                if _search_matches(
+                    search,
+                    [
+                        art.title,
+                        art.artifact_key,
+                        test_artifact_by_id[tid].title if tid in test_artifact_by_id else None,
+                        test_artifact_by_id[tid].artifact_key if tid in test_artifact_by_id else None,
+                    ],
+                )
+            }
+        if tids:
+            out.append((art, tids))
+    return out
+
+
+async def _last_status_by_test(
+    batch_handler: BatchLastTestExecutionStatusHandler,
+    query: RequirementTraceabilityMatrix | RequirementTraceabilityMatrixTile,
+    test_ids: list[uuid.UUID],
+) -> dict[uuid.UUID, LastTestExecutionStatusDTO]:
+    status_by_test: dict[uuid.UUID, LastTestExecutionStatusDTO] = {}
+    for i in range(0, len(test_ids), TEST_STATUS_CHUNK):
+        rows = await batch_handler.handle(
+            BatchLastTestExecutionStatus(
+                tenant_id=query.tenant_id,
+                project_id=query.project_id,
+                test_ids=test_ids[i : i + TEST_STATUS_CHUNK],
+                scope_run_id=query.scope_run_id,
+                scope_suite_id=query.scope_suite_id,
+                scope_campaign_id=query.scope_campaign_id,
+            )
+        )
+        for row in rows:
+            status_by_test[row.test_id] = row
+    return status_by_test
+
+
 class RequirementTraceabilityMatrixHandler(
     QueryHandler[RequirementTraceabilityMatrixResult]
 ):
@@ -340,11 +463,15 @@ class RequirementTraceabilityMatrixHandler(
         artifact_repo: ArtifactRepository,
         relationship_repo: RelationshipRepository,
         process_template_repo: ProcessTemplateRepository,
+        execution_result_repo: ExecutionResultRepository,
+        result_cache: TraceabilityResultCache | None = None,
     ) -> None:
         self._project_repo = project_repo
         self._artifact_repo = artifact_repo
         self._relationship_repo = relationship_repo
         self._process_template_repo = process_template_repo
+        self._execution_result_repo = execution_result_repo
+        self._result_cache = result_cache
 
     async def handle(self, query: Query) -> RequirementTraceabilityMatrixResult:
         assert isinstance(query, RequirementTraceabilityMatrix)
@@ -356,18 +483,15 @@ class RequirementTraceabilityMatrixHandler(
         if scope_n > 1:
             raise ValidationError("At most one of scope_run_id, scope_suite_id, scope_campaign_id")
 
-        ck = _cache_key(query)
-        if not query.refresh:
-            cached = _cache_get(ck)
-            if cached is not None:
-                return RequirementTraceabilityMatrixResult(
-                    computed_at=cached.computed_at,
-                    cache_hit=True,
-                    rows=cached.rows,
-                    columns=cached.columns,
-                    relationships=cached.relationships,
-                    truncated=cached.truncated,
-                )
+        return await cached_result(
+            self._result_cache,
+            query.project_id,
+            _cache_key(query),
+            lambda: self._compute(query),
+            refresh=query.refresh,
+        )
+
+    async def _compute(self, query: RequirementTraceabilityMatrix) -> RequirementTraceabilityMatrixResult:
         ctx = await _prepare_matrix_context(
             project_repo=self._project_repo,
             artifact_repo=self._artifact_repo,
@@ -383,7 +507,6 @@ class RequirementTraceabilityMatrixHandler(
                 relationships=[],
                 truncated=False,
             )
-            _cache_set(ck, result)
             return result
         if (
             ctx.full_tree_total > MAX_MATRIX_ARTIFACTS_WITHOUT_UNDER
@@ -397,60 +520,24 @@ class RequirementTraceabilityMatrixHandler(
             raise ValidationError(
                 f"Subtree too large for matrix (max {MAX_MATRIX_SUBTREE_NODES}). Choose a deeper under root."
             )
-        nodes_cover = [a for a in ctx.artifacts if a.artifact_type != "root-requirement"]
-        node_ids = {a.id for a in nodes_cover}
-        children: dict[uuid.UUID, list[uuid.UUID]] = {n: [] for n in node_ids}
-        for a in nodes_cover:
-            if a.parent_id is not None and a.parent_id in node_ids:
-                children[a.parent_id].append(a.id)
-        leaf_ids = {n for n in node_ids if not children[n]}
-        leaf_artifacts = [a for a in nodes_cover if a.id in leaf_ids]
-
-        relationship_types = ctx.relationship_types
-        req_ids_list = list(leaf_ids)
-        tests_by_req: dict[uuid.UUID, set[uuid.UUID]] = defaultdict(set)
-        relationship_type_by_pair: dict[tuple[uuid.UUID, uuid.UUID], str] = {}
-
-        for i in range(0, len(req_ids_list), LINK_QUERY_CHUNK):
-            chunk = req_ids_list[i : i + LINK_QUERY_CHUNK]
-            links_in = await self._relationship_repo.list_relationships_to_artifacts(
-                query.project_id, chunk, relationship_types
-            )
-            for ln in links_in:
-                tests_by_req[ln.target_artifact_id].add(ln.source_artifact_id)
-                relationship_type_by_pair[(ln.target_artifact_id, ln.source_artifact_id)] = ln.relationship_type
-
-        if query.include_reverse_verifies:
-            for i in range(0, len(req_ids_list), LINK_QUERY_CHUNK):
-                chunk = req_ids_list[i : i + LINK_QUERY_CHUNK]
-                out_links = await self._relationship_repo.list_outgoing_relationships_from_artifacts(
-                    query.project_id, chunk
-                )
-                cand_tos: list[uuid.UUID] = []
-                for ln in out_links:
-                    if ln.relationship_type not in relationship_types:
-                        continue
-                    cand_tos.append(ln.target_artifact_id)
-                if not cand_tos:
-                    continue
-                uniq = list({x for x in cand_tos})
-                arts = await self._artifact_repo.list_by_ids_in_project(query.project_id, uniq)
-                test_ids = {a.id for a in arts if a.artifact_type == "test-case"}
-                for ln in out_links:
-                    if ln.relationship_type not in relationship_types:
-                        continue
-                    if ln.target_artifact_id in test_ids:
-                        tests_by_req[ln.source_artifact_id].add(ln.target_artifact_id)
-                        relationship_type_by_pair[(ln.source_artifact_id, ln.target_artifact_id)] = ln.relationship_type
+        _, _, leaf_artifacts = _requirement_tree(ctx)
+        links = await _load_requirement_test_links(
+            relationship_repo=self._relationship_repo,
+            artifact_repo=self._artifact_repo,
+            project_id=query.project_id,
+            requirement_ids=[a.id for a in leaf_artifacts],
+            relationship_types=ctx.relationship_types,
+            include_reverse_verifies=query.include_reverse_verifies,
+        )
 
         # Drop empty rows early so the matrix stays requirement-leaf oriented and bounded.
-        candidate_leafs = [a for a in leaf_artifacts if tests_by_req.get(a.id)]
+        candidate_leafs = [a for a in leaf_artifacts if links.get(a.id)]
         if len(candidate_leafs) > MAX_MATRIX_ROWS:
             raise ValidationError(
                 f"Matrix row count too large (max {MAX_MATRIX_ROWS}). Choose a deeper under root."
             )
 
-        all_test_ids = list({t for s in tests_by_req.values() for t in s})
+        all_test_ids = list({t for tests in links.values() for t in tests})
         if len(all_test_ids) > MAX_MATRIX_COLUMNS:
             raise ValidationError(
                 f"Matrix column count too large (max {MAX_MATRIX_COLUMNS}). Narrow scope or search."
@@ -467,49 +554,13 @@ class RequirementTraceabilityMatrixHandler(
             project_repo=self._project_repo,
             artifact_repo=self._artifact_repo,
             relationship_repo=self._relationship_repo,
+            execution_result_repo=self._execution_result_repo,
         )
-        status_by_test: dict[uuid.UUID, LastTestExecutionStatusDTO] = {}
-        for i in range(0, len(all_test_ids), TEST_STATUS_CHUNK):
-            chunk = all_test_ids[i : i + TEST_STATUS_CHUNK]
-            rows = await batch_handler.handle(
-                BatchLastTestExecutionStatus(
-                    tenant_id=query.tenant_id,
-                    project_id=query.project_id,
-                    test_ids=chunk,
-                    scope_run_id=query.scope_run_id,
-                    scope_suite_id=query.scope_suite_id,
-                    scope_campaign_id=query.scope_campaign_id,
-                )
-            )
-            for row in rows:
-                status_by_test[row.test_id] = row
+        status_by_test = await _last_status_by_test(batch_handler, query, all_test_ids)
 
         search = query.search.strip() if query.search else ""
-        filtered_leafs = []
-        filtered_test_ids: set[uuid.UUID] = set()
-        for art in sorted(candidate_leafs, key=lambda x: (str(x.title or ""), str(x.id))):
-            tids = tests_by_req.get(art.id, set())
-            matched_tests = {
-                tid
-                for tid in tids
-                if _search_matches(
-                    search,
-                    [
-                        art.title,
-                        art.artifact_key,
-                        test_artifact_by_id.get(tid).title if tid in test_artifact_by_id else None,
-                        test_artifact_by_id.get(tid).artifact_key
-                        if tid in test_artifact_by_id
-                        else None,
-                    ],
-                )
-            }
-            row_matches = _search_matches(search, [art.title, art.artifact_key])
-            if search and not row_matches and not matched_tests:
-                continue
-            visible_tests = tids if row_matches or not search else matched_tests
-            filtered_leafs.append((art, visible_tests))
-            filtered_test_ids.update(visible_tests)
+        filtered_leafs = _filter_rows_by_search(search, candidate_leafs, links, test_artifact_by_id)
+        filtered_test_ids = {tid for _, tids in filtered_leafs for tid in tids}
 
         if len(filtered_leafs) > MAX_MATRIX_ROWS:
             raise ValidationError(
@@ -576,7 +627,7 @@ class RequirementTraceabilityMatrixHandler(
                         test_title=test_artifact_by_id.get(tid).title
                         if tid in test_artifact_by_id
                         else str(tid),
-                        relationship_type=relationship_type_by_pair.get((art.id, tid), "verifies"),
+                        relationship_type=links[art.id].get(tid, "verifies"),
                         status=dto.status if dto else None,
                         run_id=dto.run_id if dto else None,
                         run_title=dto.run_title if dto else None,
@@ -609,7 +660,6 @@ class RequirementTraceabilityMatrixHandler(
             ),
             truncated=False,
         )
-        _cache_set(ck, result)
         return result
 
 
@@ -622,11 +672,13 @@ class RequirementTraceabilityMatrixSummaryHandler(
         artifact_repo: ArtifactRepository,
         relationship_repo: RelationshipRepository,
         process_template_repo: ProcessTemplateRepository,
+        result_cache: TraceabilityResultCache | None = None,
     ) -> None:
         self._project_repo = project_repo
         self._artifact_repo = artifact_repo
         self._relationship_repo = relationship_repo
         self._process_template_repo = process_template_repo
+        self._result_cache = result_cache
 
     async def handle(self, query: Query) -> RequirementTraceabilityMatrixSummaryResult:
         assert isinstance(query, RequirementTraceabilityMatrixSummary)
@@ -638,27 +690,17 @@ class RequirementTraceabilityMatrixSummaryHandler(
         if scope_n > 1:
             raise ValidationError("At most one of scope_run_id, scope_suite_id, scope_campaign_id")
 
-        ck = _summary_cache_key(query)
-        if not query.refresh:
-          cached = _summary_cache_get(ck)
-          if cached is not None:
-              return RequirementTraceabilityMatrixSummaryResult(
-                  computed_at=cached.computed_at,
-                  cache_hit=True,
-                  project_node_count=cached.project_node_count,
-                  subtree_node_count=cached.subtree_node_count,
-                  candidate_requirement_row_count=cached.candidate_requirement_row_count,
-                  distinct_test_count=cached.distinct_test_count,
-                  relationship_count=cached.relationship_count,
-                  can_render_matrix=cached.can_render_matrix,
-                  exceeds_project_without_under_limit=cached.exceeds_project_without_under_limit,
-                  exceeds_subtree_limit=cached.exceeds_subtree_limit,
-                  exceeds_row_limit=cached.exceeds_row_limit,
-                  exceeds_column_limit=cached.exceeds_column_limit,
-                  applied_search=cached.applied_search,
-                  child_subtrees=cached.child_subtrees,
-              )
+        return await cached_result(
+            self._result_cache,
+            query.project_id,
+            _summary_cache_key(query),
+            lambda: self._compute(query),
+            refresh=query.refresh,
+        )
 
+    async def _compute(
+        self, query: RequirementTraceabilityMatrixSummary
+    ) -> RequirementTraceabilityMatrixSummaryResult:
         ctx = await _prepare_matrix_context(
             project_repo=self._project_repo,
             artifact_repo=self._artifact_repo,
@@ -682,71 +724,27 @@ class RequirementTraceabilityMatrixSummaryHandler(
                 applied_search=query.search.strip() if query.search else None,
                 child_subtrees=[],
             )
-            _summary_cache_set(ck, result)
             return result
 
-        nodes_cover = [a for a in ctx.artifacts if a.artifact_type != "root-requirement"]
-        node_ids = {a.id for a in nodes_cover}
-        children: dict[uuid.UUID, list[uuid.UUID]] = {n: [] for n in node_ids}
-        for a in nodes_cover:
-            if a.parent_id is not None and a.parent_id in node_ids:
-                children[a.parent_id].append(a.id)
-        leaf_ids = {n for n in node_ids if not children[n]}
-        leaf_artifacts = [a for a in nodes_cover if a.id in leaf_ids]
-
-        req_ids_list = list(leaf_ids)
-        tests_by_req: dict[uuid.UUID, set[uuid.UUID]] = defaultdict(set)
-        for i in range(0, len(req_ids_list), LINK_QUERY_CHUNK):
-            chunk = req_ids_list[i : i + LINK_QUERY_CHUNK]
-            links_in = await self._relationship_repo.list_relationships_to_artifacts(query.project_id, chunk, ctx.relationship_types)
-            for ln in links_in:
-                tests_by_req[ln.target_artifact_id].add(ln.source_artifact_id)
-
-        if query.include_reverse_verifies:
-            for i in range(0, len(req_ids_list), LINK_QUERY_CHUNK):
-                chunk = req_ids_list[i : i + LINK_QUERY_CHUNK]
-                out_links = await self._relationship_repo.list_outgoing_relationships_from_artifacts(query.project_id, chunk)
-                cand_tos = [ln.target_artifact_id for ln in out_links if ln.relationship_type in ctx.relationship_types]
-                if not cand_tos:
-                    continue
-                uniq = list({x for x in cand_tos})
-                arts = await self._artifact_repo.list_by_ids_in_project(query.project_id, uniq)
-                test_ids = {a.id for a in arts if a.artifact_type == "test-case"}
-                for ln in out_links:
-                    if ln.relationship_type in ctx.relationship_types and ln.target_artifact_id in test_ids:
-                        tests_by_req[ln.source_artifact_id].add(ln.target_artifact_id)
-
-        test_ids_all = list({tid for tids in tests_by_req.values() for tid in tids})
+        nodes_cover, children, leaf_artifacts = _requirement_tree(ctx)
+        links = await _load_requirement_test_links(
+            relationship_repo=self._relationship_repo,
+            artifact_repo=self._artifact_repo,
+            project_id=query.project_id,
+            requirement_ids=[a.id for a in leaf_artifacts],
+            relationship_types=ctx.relationship_types,
+            include_reverse_verifies=query.include_reverse_verifies,
+        )
+
+        test_ids_all = list({tid for tids in links.values() for tid in tids})
         test_artifact_by_id: dict[uuid.UUID, Any] = {}
         if test_ids_all:
             test_artifacts = await self._artifact_repo.list_by_ids_in_project(query.project_id, test_ids_all)
             test_artifact_by_id = {a.id: a for a in test_artifacts if a.artifact_type == "test-case"}
 
         search = query.search.strip() if query.search else ""
-        filtered_leafs: list[tuple[Any, set[uuid.UUID]]] = []
-        filtered_test_ids: set[uuid.UUID] = set()
-        for art in sorted(leaf_artifacts, key=lambda x: (str(x.title or ""), str(x.id))):
-            tids = tests_by_req.get(art.id, set())
-            matched_tests = {
-                tid
-                for tid in tids
-                if _search_matches(
-                    search,
-                    [
-                        art.title,
-                        art.artifact_key,
-                        test_artifact_by_id.get(tid).title if tid in test_artifact_by_id else None,
-                        test_artifact_by_id.get(tid).artifact_key if tid in test_artifact_by_id else None,
-                    ],
-                )
-            }
-            row_matches = _search_matches(search, [art.title, art.artifact_key])
-            if search and not row_matches and not matched_tests:
-                continue
-            visible_tests = tids if row_matches or not search else matched_tests
-            if visible_tests:
-                filtered_leafs.append((art, visible_tests))
-                filtered_test_ids.update(visible_tests)
+        filtered_leafs = _filter_rows_by_search(search, leaf_artifacts, links, test_artifact_by_id)
+        filtered_test_ids = {tid for _, tids in filtered_leafs for tid in tids}
 
         direct_children = [a for a in nodes_cover if a.parent_id == ctx.effective_root]
         child_subtrees: list[TraceabilityMatrixSummaryChildDTO] = []
@@ -802,5 +800,127 @@ class RequirementTraceabilityMatrixSummaryHandler(
             applied_search=search or None,
             child_subtrees=child_subtrees,
         )
-        _summary_cache_set(ck, result)
         return result
+
+
+class RequirementTraceabilityMatrixTileHandler(QueryHandler[RequirementTraceabilityMatrixTileResult]):
+    """Serves matrix windows from a ``TraceabilityMatrixIndex`` built once per filter set and cached.
+
+    Building the index is O(matrix) and happens on a cache miss; each tile is O(tile).
+    """
+
+    def __init__(
+        self,
+        project_repo: ProjectRepository,
+        artifact_repo: ArtifactRepository,
+        relationship_repo: RelationshipRepository,
+        process_template_repo: ProcessTemplateRepository,
+        execution_result_repo: ExecutionResultRepository,
+        result_cache: TraceabilityResultCache | None = None,
+    ) -> None:
+        self._project_repo = project_repo
+        self._artifact_repo = artifact_repo
+        self._relationship_repo = relationship_repo
+        self._process_template_repo = process_template_repo
+        self._execution_result_repo = execution_result_repo
+        self._result_cache = result_cache
+
+    async def handle(self, query: Query) -> RequirementTraceabilityMatrixTileResult:
+        assert isinstance(query, RequirementTraceabilityMatrixTile)
+        scope_n = sum(1 for x in (query.scope_run_id, query.scope_suite_id, query.scope_campaign_id) if x is not None)
+        if scope_n > 1:
+            raise ValidationError("At most one of scope_run_id, scope_suite_id, scope_campaign_id")
+        if query.row_offset < 0 or query.column_offset < 0:
+            raise ValidationError("row_offset and column_offset must be >= 0")
+        if not 1 <= query.row_limit <= MAX_TILE_ROWS:
+            raise ValidationError(f"row_limit must be between 1 and {MAX_TILE_ROWS}")
+        if not 1 <= query.column_limit <= MAX_TILE_COLUMNS:
+            raise ValidationError(f"column_limit must be between 1 and {MAX_TILE_COLUMNS}")
+
+        if self._result_cache is None:
+            index, hit = await self._build_index(query), False
+        else:
+            index, hit = await self._result_cache.get_or_compute(
+                query.project_id,
+                _tile_index_cache_key(query),
+                lambda: self._build_index(query),
+                refresh=query.refresh,
+            )
+        tile = index.tile(query.row_offset, query.row_limit, query.column_offset, query.column_limit)
+        return RequirementTraceabilityMatrixTileResult(
+            computed_at=index.computed_at,
+            cache_hit=hit,
+            total_rows=len(index.rows),
+            total_columns=len(index.columns),
+            relationship_count=index.relationship_count,
+            coverage_counts=dict(index.coverage_counts),
+            row_offset=query.row_offset,
+            column_offset=query.column_offset,
+            rows=tile.rows,
+            columns=tile.columns,
+            cells=tile.cells,
+        )
+
+    async def _build_index(self, query: RequirementTraceabilityMatrixTile) -> TraceabilityMatrixIndex:
+        ctx = await _prepare_matrix_context(
+            project_repo=self._project_repo,
+            artifact_repo=self._artifact_repo,
+            process_template_repo=self._process_template_repo,
+            query=query,
+        )
+        _, _, leaf_artifacts = _requirement_tree(ctx)
+        links = await _load_requirement_test_links(
+            relationship_repo=self._relationship_repo,
+            artifact_repo=self._artifact_repo,
+            project_id=query.project_id,
+            requirement_ids=[a.id for a in leaf_artifacts],
+            relationship_types=ctx.relationship_types,
+            include_reverse_verifies=query.include_reverse_verifies,
+        )
+        all_test_ids = list({t for tests in links.values() for t in tests})
+        test_artifact_by_id: dict[uuid.UUID, Any] = {}
+        if all_test_ids:
+            test_artifacts = await self._artifact_repo.list_by_ids_in_project(query.project_id, all_test_ids)
+            test_artifact_by_id = {a.id: a for a in test_artifacts if a.artifact_type == "test-case"}
+
+        search = query.search.strip() if query.search else ""
+        filtered_leafs = _filter_rows_by_search(search, leaf_artifacts, links, test_artifact_by_id)
+        visible_test_ids = list({tid for _, tids in filtered_leafs for tid in tids})
+
+        batch_handler = BatchLastTestExecutionStatusHandler(
+            project_repo=self._project_repo,
+            artifact_repo=self._artifact_repo,
+            relationship_repo=self._relationship_repo,
+            execution_result_repo=self._execution_result_repo,
+        )
+        status_by_test = await _last_status_by_test(batch_handler, query, visible_test_ids)
+
+        columns: list[MatrixColumnRef] = []
+        for tid in visible_test_ids:
+            test = test_artifact_by_id.get(tid)
+            dto = status_by_test.get(tid)
+            columns.append(
+                MatrixColumnRef(
+                    test_id=tid,
+                    artifact_key=test.artifact_key if test else None,
+                    title=test.title if test else str(tid),
+                    status=dto.status if dto else None,
+                    run_id=dto.run_id if dto else None,
+                    run_title=dto.run_title if dto else None,
+                )
+            )
+        columns.sort(key=lambda x: ((x.artifact_key or "").lower(), x.title.lower(), str(x.test_id)))
+        return build_traceability_matrix_index(
+            computed_at=datetime.now(UTC),
+            rows=[
+                MatrixRowRef(
+                    requirement_id=art.id,
+                    parent_id=art.parent_id,
+                    artifact_key=art.artifact_key,
+                    title=art.title,
+                )
+                for art, _ in filtered_leafs
+            ],
+            columns=columns,
+            links={art.id: {tid: links[art.id][tid] for tid in tids} for art, tids in filtered_leafs},
+        )
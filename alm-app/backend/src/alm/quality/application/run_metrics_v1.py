@@ -6,6 +6,8 @@ import json
 import uuid
 from typing import Any
 
+from alm.quality.domain.entities import ExecutionResult, ExecutionStepResult
+
 RUN_METRICS_VERSION = 2
 LEGACY_RUN_METRICS_VERSION = 1
 
@@ -133,3 +135,37 @@ def configuration_name_from_metrics_row(row: dict[str, Any]) -> str | None:
             if isinstance(value, str) and value.strip():
                 return value.strip()
     return None
+
+
+def execution_results_from_custom_fields(run_id: uuid.UUID, custom_fields: dict[str, Any] | None) -> list[ExecutionResult]:
+    """Normalized rows for the ``test_execution_results`` index; rows without a valid ``testId`` are skipped."""
+    out: list[ExecutionResult] = []
+    for index, row in enumerate(parse_run_metrics_v1_results(custom_fields)):
+        try:
+            test_id = uuid.UUID(str(row.get("testId") or ""))
+        except ValueError:
+            continue
+        step_defects = step_defect_ids_from_metrics_row(row)
+        step_attachments = step_attachment_ids_from_metrics_row(row)
+        param_row_index = row.get("paramRowIndex")
+        out.append(
+            ExecutionResult(
+                run_id=run_id,
+                test_id=test_id,
+                result_index=index,
+                status=normalize_execution_status(row.get("status")) or "not-executed",
+                configuration_id=configuration_id_from_metrics_row(row),
+                configuration_name=configuration_name_from_metrics_row(row),
+                param_row_index=param_row_index if isinstance(param_row_index, int) else None,
+                step_results=[
+                    ExecutionStepResult(
+                        step_id=step_id,
+                        status=status,
+                        linked_defect_ids=step_defects.get(step_id, []),
+                        attachment_ids=step_attachments.get(step_id, []),
+                    )
+                    for step_id, status in step_statuses_from_metrics_row(row)
+                ],
+            )
+        )
+    return out
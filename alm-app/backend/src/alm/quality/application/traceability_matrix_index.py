@@ -0,0 +1,189 @@
+"""Sparse requirement x test adjacency index for tiled traceability matrices (pure, unit-tested).
+
+Rows (requirement leaves) and columns (tests) are ordered once; links are stored CSR-style (``row_ptr`` /
+``col_idx``, column indices sorted per row), so a tile costs O(rows in window x log(links per row) + cells in
+window) however large the matrix is. Coverage rollups use one bitset (a Python int over column indices) per
+status bucket: a row's linked tests per bucket is ``(row_mask & bucket_mask).bit_count()``.
+"""
+
+from __future__ import annotations
+
+import uuid
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from alm.quality.application.requirement_coverage_rollups import CoverageBucket, empty_subtree_counts
+
+# Worst-first, as in ``worst_status_among_tests``.
+_WORST_FIRST: tuple[CoverageBucket, ...] = ("failed", "blocked", "not-executed", "no_run", "passed")
+
+
+def status_bucket(status: str | None) -> CoverageBucket:
+    """Coverage bucket of one test's last execution status."""
+    if status in ("passed", "failed", "blocked", "not-executed"):
+        return status  # type: ignore[return-value]
+    return "no_run"
+
+
+@dataclass(frozen=True)
+class MatrixRowRef:
+    requirement_id: uuid.UUID
+    parent_id: uuid.UUID | None
+    artifact_key: str | None
+    title: str
+
+
+@dataclass(frozen=True)
+class MatrixColumnRef:
+    test_id: uuid.UUID
+    artifact_key: str | None
+    title: str
+    status: str | None
+    run_id: uuid.UUID | None
+    run_title: str | None
+
+
+@dataclass(frozen=True)
+class MatrixTileRow:
+    row_index: int
+    ref: MatrixRowRef
+    leaf_status: CoverageBucket
+    linked_test_count: int
+    status_counts: dict[str, int]
+
+
+@dataclass(frozen=True)
+class MatrixTileColumn:
+    column_index: int
+    ref: MatrixColumnRef
+    linked_requirement_count: int
+
+
+@dataclass(frozen=True)
+class MatrixTileCell:
+    row_index: int
+    column_index: int
+    relationship_type: str
+
+
+@dataclass(frozen=True)
+class MatrixTile:
+    rows: list[MatrixTileRow]
+    columns: list[MatrixTileColumn]
+    cells: list[MatrixTileCell]
+
+
+@dataclass
+class TraceabilityMatrixIndex:
+    computed_at: datetime
+    rows: list[MatrixRowRef]
+    columns: list[MatrixColumnRef]
+    row_ptr: array
+    col_idx: array
+    edge_type: array
+    relationship_types: list[str]
+    status_masks: dict[str, int]
+    column_row_counts: array
+    coverage_counts: dict[str, int] = field(default_factory=empty_subtree_counts)
+
+    @property
+    def relationship_count(self) -> int:
+        return len(self.col_idx)
+
+    def row_mask(self, row: int, col_start: int = 0, col_stop: int | None = None) -> int:
+        """Bitset of the row's linked columns in ``[col_start, col_stop)``."""
+        lo, hi = self._row_span(row, col_start, col_stop)
+        mask = 0
+        for i in range(lo, hi):
+            mask |= 1 << self.col_idx[i]
+        return mask
+
+    def row_status_counts(self, mask: int) -> dict[str, int]:
+        return {bucket: (mask & self.status_masks[bucket]).bit_count() for bucket in _WORST_FIRST}
+
+    def leaf_status(self, mask: int) -> CoverageBucket:
+        for bucket in _WORST_FIRST:
+            if mask & self.status_masks[bucket]:
+                return bucket
+        return "not_covered"
+
+    def tile(self, row_offset: int, row_limit: int, column_offset: int, column_limit: int) -> MatrixTile:
+        """Rows ``[row_offset, +row_limit)`` x columns ``[column_offset, +column_limit)``; row rollups span all columns."""
+        row_stop = min(len(self.rows), row_offset + row_limit)
+        col_stop = min(len(self.columns), column_offset + column_limit)
+        rows: list[MatrixTileRow] = []
+        cells: list[MatrixTileCell] = []
+        for r in range(row_offset, row_stop):
+            mask = self.row_mask(r)
+            rows.append(
+                MatrixTileRow(
+                    row_index=r,
+                    ref=self.rows[r],
+                    leaf_status=self.leaf_status(mask),
+                    linked_test_count=self.row_ptr[r + 1] - self.row_ptr[r],
+                    status_counts=self.row_status_counts(mask),
+                )
+            )
+            lo, hi = self._row_span(r, column_offset, col_stop)
+            cells.extend(
+                MatrixTileCell(r, self.col_idx[i], self.relationship_types[self.edge_type[i]]) for i in range(lo, hi)
+            )
+        columns = [
+            MatrixTileColumn(column_index=c, ref=self.columns[c], linked_requirement_count=self.column_row_counts[c])
+            for c in range(column_offset, col_stop)
+        ]
+        return MatrixTile(rows=rows, columns=columns, cells=cells)
+
+    def _row_span(self, row: int, col_start: int, col_stop: int | None) -> tuple[int, int]:
+        start, stop = self.row_ptr[row], self.row_ptr[row + 1]
+        lo = bisect_left(self.col_idx, col_start, start, stop) if col_start > 0 else start
+        hi = bisect_left(self.col_idx, col_stop, lo, stop) if col_stop is not None else stop
+        return lo, hi
+
+
+def build_traceability_matrix_index(
+    *,
+    computed_at: datetime,
+    rows: list[MatrixRowRef],
+    columns: list[MatrixColumnRef],
+    links: dict[uuid.UUID, dict[uuid.UUID, str]],
+) -> TraceabilityMatrixIndex:
+    """``links``: requirement id -> {test id: relationship type}; pairs whose row or column is absent are dropped."""
+    column_index = {c.test_id: i for i, c in enumerate(columns)}
+    type_codes: dict[str, int] = {}
+    row_ptr = array("I", [0])
+    col_idx = array("I")
+    edge_type = array("H")
+    column_row_counts = array("I", [0] * len(columns))
+    for row in rows:
+        linked = sorted(
+            (column_index[tid], rel_type)
+            for tid, rel_type in links.get(row.requirement_id, {}).items()
+            if tid in column_index
+        )
+        for c, rel_type in linked:
+            col_idx.append(c)
+            edge_type.append(type_codes.setdefault(rel_type, len(type_codes)))
+            column_row_counts[c] += 1
+        row_ptr.append(len(col_idx))
+
+    status_masks = dict.fromkeys(_WORST_FIRST, 0)
+    for c, col in enumerate(columns):
+        status_masks[status_bucket(col.status)] |= 1 << c
+
+    index = TraceabilityMatrixIndex(
+        computed_at=computed_at,
+        rows=rows,
+        columns=columns,
+        row_ptr=row_ptr,
+        col_idx=col_idx,
+        edge_type=edge_type,
+        relationship_types=list(type_codes),
+        status_masks=status_masks,
+        column_row_counts=column_row_counts,
+    )
+    for r in range(len(rows)):
+        index.coverage_counts[index.leaf_status(index.row_mask(r))] += 1
+    return index
@@ -0,0 +1,24 @@
+"""Route traceability matrix / coverage computations through the optional ``TraceabilityResultCache``."""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import replace
+
+from alm.quality.domain.ports import TraceabilityResultCache
+
+
+async def cached_result[R](
+    cache: TraceabilityResultCache | None,
+    project_id: uuid.UUID,
+    key: str,
+    compute: Callable[[], Awaitable[R]],
+    *,
+    refresh: bool = False,
+) -> R:
+    """``compute()`` through ``cache`` (None computes every time); hits are returned with ``cache_hit=True``."""
+    if cache is None:
+        return await compute()
+    result, hit = await cache.get_or_compute(project_id, key, compute, refresh=refresh)
+    return replace(result, cache_hit=True) if hit else result
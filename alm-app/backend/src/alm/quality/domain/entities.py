@@ -0,0 +1,36 @@
+"""Normalized test execution results (one row per result of a saved test-run)."""
+
+from __future__ import annotations
+
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+
+TEST_RUN_ARTIFACT_TYPE = "test-run"
+
+
+@dataclass(frozen=True)
+class ExecutionStepResult:
+    step_id: str
+    status: str
+    linked_defect_ids: list[str] = field(default_factory=list)
+    attachment_ids: list[str] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class ExecutionResult:
+    """Result of one test in one run. ``result_index`` is the position in the run's results (first match wins).
+
+    ``run_title`` and ``executed_at`` (the run's ``updated_at``) are filled when read back from the index.
+    """
+
+    run_id: uuid.UUID
+    test_id: uuid.UUID
+    result_index: int
+    status: str
+    configuration_id: str | None = None
+    configuration_name: str | None = None
+    param_row_index: int | None = None
+    step_results: list[ExecutionStepResult] = field(default_factory=list)
+    run_title: str | None = None
+    executed_at: datetime | None = None
@@ -0,0 +1,16 @@
+"""Quality domain events."""
+
+from __future__ import annotations
+
+import uuid
+from dataclasses import dataclass
+
+from alm.shared.domain.events import DomainEvent
+
+
+@dataclass(frozen=True, kw_only=True)
+class RunMetricsRecorded(DomainEvent):
+    """Test-runs of a project were saved and their ``run_metrics_json`` re-indexed (one event per save)."""
+
+    project_id: uuid.UUID
+    run_ids: list[uuid.UUID]
@@ -0,0 +1,58 @@
+"""Quality ports: test execution result index and traceability result cache."""
+
+from __future__ import annotations
+
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+from alm.artifact.domain.entities import Artifact
+from alm.quality.domain.entities import ExecutionResult
+
+T = TypeVar("T")
+
+
+class ExecutionResultRepository(ABC):
+    """``test_execution_results``: per-test rows derived from test-run ``run_metrics_json``."""
+
+    @abstractmethod
+    async def replace_for_runs(self, runs: list[Artifact]) -> None:
+        """Rewrite the rows of ``runs`` from their current metrics (deleted runs keep none)."""
+        ...
+
+    @abstractmethod
+    async def latest_for_tests(
+        self,
+        project_id: uuid.UUID,
+        run_test_pairs: list[tuple[uuid.UUID, uuid.UUID]],
+        configuration_id: str | None = None,
+    ) -> dict[uuid.UUID, ExecutionResult]:
+        """Most recently saved result per test among the allowed (run_id, test_id) pairs."""
+        ...
+
+
+class TraceabilityResultCache(ABC):
+    """Computed traceability matrix / coverage results, keyed by project and a per-project generation.
+
+    Anything that changes a project's links, artifacts or test-run results bumps the generation, which makes
+    every result cached for that project unreachable. Implemented in infrastructure.
+    """
+
+    @abstractmethod
+    async def get_or_compute(
+        self,
+        project_id: uuid.UUID,
+        key: str,
+        compute: Callable[[], Awaitable[T]],
+        *,
+        refresh: bool = False,
+    ) -> tuple[T, bool]:
+        """Cached value for ``key`` at the current generation, else ``compute()`` stored under the generation read
+        before computing. Returns (value, cache_hit); ``refresh`` skips the read but still stores."""
+        ...
+
+    @abstractmethod
+    async def bump_generation(self, project_id: uuid.UUID) -> None:
+        """Invalidate every cached result of the project (on all workers)."""
+        ...
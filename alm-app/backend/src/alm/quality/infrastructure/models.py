@@ -0,0 +1,39 @@
+"""Test execution result index SQLAlchemy model."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, Uuid, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from alm.shared.infrastructure.db.base_model import Base
+
+
+class TestExecutionResultModel(Base):
+    """One row per result of a saved test-run, derived from ``custom_fields.run_metrics_json``."""
+
+    __tablename__ = "test_execution_results"
+    __table_args__ = (
+        # "Last execution status" per test: DISTINCT ON (test_id) ... ORDER BY executed_at DESC.
+        Index(
+            "ix_test_execution_results_project_test_executed",
+            "project_id",
+            "test_id",
+            text("executed_at DESC"),
+        ),
+    )
+
+    run_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("artifacts.id", ondelete="CASCADE"), primary_key=True)
+    result_index: Mapped[int] = mapped_column(Integer, primary_key=True)
+    project_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
+    test_id: Mapped[uuid.UUID] = mapped_column(Uuid, nullable=False)
+    status: Mapped[str] = mapped_column(String(20), nullable=False)
+    configuration_id: Mapped[str | None] = mapped_column(Text, nullable=True)
+    configuration_name: Mapped[str | None] = mapped_column(Text, nullable=True)
+    param_row_index: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    step_results: Mapped[list[dict[str, Any]]] = mapped_column(JSONB, nullable=False, default=list)
+    executed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
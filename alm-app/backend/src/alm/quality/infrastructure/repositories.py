@@ -0,0 +1,122 @@
+"""Test execution result index SQLAlchemy repository."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import Uuid, and_, cast, column, delete, insert, select, values
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from alm.artifact.domain.entities import Artifact
+from alm.artifact.infrastructure.models import ArtifactModel
+from alm.quality.application.run_metrics_v1 import execution_results_from_custom_fields
+from alm.quality.domain.entities import ExecutionResult, ExecutionStepResult
+from alm.quality.domain.ports import ExecutionResultRepository
+from alm.quality.infrastructure.models import TestExecutionResultModel
+
+
+class SqlAlchemyExecutionResultRepository(ExecutionResultRepository):
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def replace_for_runs(self, runs: list[Artifact]) -> None:
+        """Delete and re-insert the rows of ``runs``; ``executed_at`` is the run's ``updated_at``.
+
+        Bulk inserts that did not refresh ``updated_at`` (import) fall back to the current time.
+        """
+        if not runs:
+            return
+        await self._session.execute(
+            delete(TestExecutionResultModel).where(TestExecutionResultModel.run_id.in_([r.id for r in runs]))
+        )
+        rows: list[dict[str, Any]] = []
+        for run in runs:
+            if run.deleted_at is not None:
+                continue
+            executed_at = run.updated_at or datetime.now(UTC)
+            rows.extend(
+                _to_row(result, run.project_id, executed_at)
+                for result in execution_results_from_custom_fields(run.id, run.custom_fields)
+            )
+        if rows:
+            await self._session.execute(insert(TestExecutionResultModel), rows)
+
+    async def latest_for_tests(
+        self,
+        project_id: uuid.UUID,
+        run_test_pairs: list[tuple[uuid.UUID, uuid.UUID]],
+        configuration_id: str | None = None,
+    ) -> dict[uuid.UUID, ExecutionResult]:
+        """One ``DISTINCT ON (test_id)`` over the index; ties on ``executed_at`` go to the higher run id, then
+        the first result in the run (same order as scanning runs newest first)."""
+        if not run_test_pairs:
+            return {}
+        allowed = values(column("run_id", Uuid), column("test_id", Uuid), name="allowed").data(run_test_pairs)
+        r = TestExecutionResultModel
+        stmt = (
+            select(r, ArtifactModel.title)
+            .distinct(r.test_id)
+            .join(
+                allowed,
+                and_(r.run_id == cast(allowed.c.run_id, Uuid), r.test_id == cast(allowed.c.test_id, Uuid)),
+            )
+            .join(ArtifactModel, and_(ArtifactModel.id == r.run_id, ArtifactModel.deleted_at.is_(None)))
+            .where(
+                r.project_id == project_id,
+                r.test_id.in_({test_id for _, test_id in run_test_pairs}),
+            )
+            .order_by(r.test_id, r.executed_at.desc(), r.run_id.desc(), r.result_index)
+        )
+        if configuration_id is not None:
+            stmt = stmt.where(r.configuration_id == configuration_id)
+        result = await self._session.execute(stmt)
+        return {model.test_id: _to_entity(model, title) for model, title in result.all()}
+
+
+def _to_row(result: ExecutionResult, project_id: uuid.UUID, executed_at: datetime) -> dict[str, Any]:
+    return {
+        "run_id": result.run_id,
+        "result_index": result.result_index,
+        "project_id": project_id,
+        "test_id": result.test_id,
+        "status": result.status,
+        "configuration_id": result.configuration_id,
+        "configuration_name": result.configuration_name,
+        "param_row_index": result.param_row_index,
+        "step_results": [
+            {
+                "step_id": step.step_id,
+                "status": step.status,
+                "linked_defect_ids": step.linked_defect_ids,
+                "attachment_ids": step.attachment_ids,
+            }
+            for step in result.step_results
+        ],
+        "executed_at": executed_at,
+    }
+
+
+def _to_entity(m: TestExecutionResultModel, run_title: str | None) -> ExecutionResult:
+    return ExecutionResult(
+        run_id=m.run_id,
+        test_id=m.test_id,
+        result_index=m.result_index,
+        status=m.status,
+        configuration_id=m.configuration_id,
+        configuration_name=m.configuration_name,
+        param_row_index=m.param_row_index,
+        step_results=[
+            ExecutionStepResult(
+                step_id=str(step.get("step_id") or ""),
+                status=str(step.get("status") or "not-executed"),
+                linked_defect_ids=list(step.get("linked_defect_ids") or []),
+                attachment_ids=list(step.get("attachment_ids") or []),
+            )
+            for step in m.step_results or []
+            if isinstance(step, dict)
+        ],
+        run_title=run_title,
+        executed_at=m.executed_at,
+    )
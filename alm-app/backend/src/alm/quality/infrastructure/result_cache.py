@@ -0,0 +1,301 @@
+"""Traceability matrix / coverage result cache: bounded in-process L1 over a Redis L2.
+
+Redis keys:
+    trace:gen:{project_id}                                   per-project generation counter
+    trace:{payload_version}:{project_id}:{generation}:{key}  HMAC-SHA256 tag + zlib-compressed pickle, with a TTL
+
+Every lookup reads the project's generation from Redis, so a bump by any worker makes the results cached by all
+workers unreachable at once; entries of old generations age out of Redis by TTL and out of L1 by LRU. The same TTL
+applies in L1 and bounds staleness after writes that emit no event. Payloads are pickled application DTOs, signed
+with a key derived from ``ALM_JWT_SECRET_KEY`` over the Redis key and the payload: an entry is unpickled only when
+its tag verifies, so write access to Redis alone cannot run code in the workers or move an entry to another key.
+``payload_version`` is the release (``ALM_APP_VERSION``, else the package version) plus ``_PAYLOAD_SCHEMA``, so
+during a rolling deploy workers never unpickle entries written by another release.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import pickle
+import time
+import uuid
+import zlib
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+import redis.asyncio as redis
+import structlog
+
+from alm import __version__
+from alm.config.settings import settings
+from alm.quality.domain.ports import TraceabilityResultCache
+from alm.quality.infrastructure.result_cache_metrics import (
+    alm_traceability_cache_generation_bumps_total,
+    alm_traceability_cache_l1_entries,
+    alm_traceability_cache_payload_bytes,
+    record_lookup,
+)
+from alm.shared.infrastructure.cache import get_binary_redis
+from alm.shared.infrastructure.event_lookups import current_event_lookup_scope
+
+logger = structlog.get_logger()
+
+T = TypeVar("T")
+
+# Bump when a cached DTO changes shape without a release version change.
+_PAYLOAD_SCHEMA = 1
+_TAG_BYTES = hashlib.sha256().digest_size
+
+
+class LocalTraceabilityResultCache:
+    """In-process TTL + LRU of results per (project, generation, key) (L1). One per worker; asyncio-only, no locking.
+
+    Seeing a newer generation for a project drops that project's older entries.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self._max_entries = max(0, max_entries)
+        self._ttl = ttl_seconds
+        self._data: OrderedDict[tuple[uuid.UUID, int, str], tuple[float, Any]] = OrderedDict()
+        self._generations: dict[uuid.UUID, int] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_entries > 0 and self._ttl > 0
+
+    def get(self, project_id: uuid.UUID, generation: int, key: str) -> Any | None:
+        if not self.enabled:
+            return None
+        self._observe(project_id, generation)
+        entry_key = (project_id, generation, key)
+        entry = self._data.get(entry_key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[entry_key]
+            self._report_size()
+            return None
+        self._data.move_to_end(entry_key)
+        return value
+
+    def set(self, project_id: uuid.UUID, generation: int, key: str, value: Any) -> None:
+        if not self.enabled:
+            return
+        self._observe(project_id, generation)
+        if generation < self._generations[project_id]:
+            return
+        entry_key = (project_id, generation, key)
+        self._data[entry_key] = (time.monotonic() + self._ttl, value)
+        self._data.move_to_end(entry_key)
+        while len(self._data) > self._max_entries:
+            self._data.popitem(last=False)
+        self._report_size()
+
+    def evict_project(self, project_id: uuid.UUID) -> None:
+        self._generations.pop(project_id, None)
+        for entry_key in [k for k in self._data if k[0] == project_id]:
+            del self._data[entry_key]
+        self._report_size()
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._generations.clear()
+        self._report_size()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _observe(self, project_id: uuid.UUID, generation: int) -> None:
+        known = self._generations.get(project_id)
+        if known is None or generation > known:
+            if known is not None:
+                for entry_key in [k for k in self._data if k[0] == project_id and k[1] < generation]:
+                    del self._data[entry_key]
+                self._report_size()
+            self._generations[project_id] = generation
+
+    def _report_size(self) -> None:
+        alm_traceability_cache_l1_entries.set(len(self._data))
+
+
+_local_traceability_cache: LocalTraceabilityResultCache | None = None
+
+
+def get_local_traceability_cache() -> LocalTraceabilityResultCache:
+    """Process-wide L1 (sized from settings on first use)."""
+    global _local_traceability_cache
+    if _local_traceability_cache is None:
+        _local_traceability_cache = LocalTraceabilityResultCache(
+            settings.traceability_cache_l1_max_entries,
+            settings.traceability_cache_l2_ttl_seconds,
+        )
+    return _local_traceability_cache
+
+
+def _payload_version() -> str:
+    return f"{settings.app_version or __version__}.{_PAYLOAD_SCHEMA}"
+
+
+def _payload_tag(entry_key: str, data: bytes) -> bytes:
+    """HMAC-SHA256 of the Redis key and the compressed payload, keyed by a derivative of the JWT secret."""
+    signing_key = hmac.digest(settings.jwt_secret_key.encode(), b"alm.traceability-result-cache", "sha256")
+    return hmac.digest(signing_key, entry_key.encode() + b"\0" + data, "sha256")
+
+
+def _sign_payload(entry_key: str, value: Any) -> bytes:
+    data = zlib.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    return _payload_tag(entry_key, data) + data
+
+
+def _load_signed_payload(entry_key: str, signed: bytes) -> Any:
+    """Unpickle ``signed`` only after its tag verifies; raises ``ValueError`` for unsigned or tampered entries."""
+    tag, data = signed[:_TAG_BYTES], signed[_TAG_BYTES:]
+    if len(tag) != _TAG_BYTES or not hmac.compare_digest(tag, _payload_tag(entry_key, data)):
+        raise ValueError("traceability cache entry signature mismatch")
+    return pickle.loads(zlib.decompress(data))
+
+
+class LocalTraceabilityIndexCache(TraceabilityResultCache):
+    """Worker-local fallback for tile indexes when the shared cache is disabled: TTL-bounded LRU, no Redis.
+
+    Only events dispatched on this worker evict a project, so ``ttl_seconds`` bounds staleness from the others.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self._max_entries = max(0, max_entries)
+        self._ttl = ttl_seconds
+        self._data: OrderedDict[tuple[uuid.UUID, str], tuple[float, Any]] = OrderedDict()
+
+    async def get_or_compute(
+        self,
+        project_id: uuid.UUID,
+        key: str,
+        compute: Callable[[], Awaitable[T]],
+        *,
+        refresh: bool = False,
+    ) -> tuple[T, bool]:
+        entry_key = (project_id, key)
+        entry = self._data.get(entry_key)
+        if entry is not None and not refresh and entry[0] > time.monotonic():
+            self._data.move_to_end(entry_key)
+            record_lookup("l1", "hit")
+            return entry[1], True
+        record_lookup("l1", "miss")
+        value = await compute()
+        if self._max_entries > 0 and self._ttl > 0:
+            self._data[entry_key] = (time.monotonic() + self._ttl, value)
+            self._data.move_to_end(entry_key)
+            while len(self._data) > self._max_entries:
+                self._data.popitem(last=False)
+        return value, False
+
+    async def bump_generation(self, project_id: uuid.UUID) -> None:
+        for entry_key in [k for k in self._data if k[0] == project_id]:
+            del self._data[entry_key]
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class RedisTraceabilityResultCache(TraceabilityResultCache):
+    """Two-tier result cache shared by all workers. When Redis is unreachable results are computed uncached."""
+
+    def __init__(
+        self,
+        r: redis.Redis | None = None,
+        l1: LocalTraceabilityResultCache | None = None,
+        ttl_seconds: int | None = None,
+    ) -> None:
+        self._redis = r or get_binary_redis()
+        self._l1 = l1 if l1 is not None else get_local_traceability_cache()
+        self._ttl = ttl_seconds if ttl_seconds is not None else settings.traceability_cache_l2_ttl_seconds
+
+    @staticmethod
+    def _generation_key(project_id: uuid.UUID) -> str:
+        return f"trace:gen:{project_id}"
+
+    @staticmethod
+    def _entry_key(project_id: uuid.UUID, generation: int, key: str) -> str:
+        digest = hashlib.sha256(key.encode()).hexdigest()[:32]
+        return f"trace:{_payload_version()}:{project_id}:{generation}:{digest}"
+
+    async def _generation(self, project_id: uuid.UUID) -> int:
+        """Current generation; a missing counter (first use, eviction) starts at the clock so it never repeats."""
+        gen_key = self._generation_key(project_id)
+        raw = await self._redis.get(gen_key)
+        if raw is None:
+            await self._redis.set(gen_key, time.time_ns(), nx=True)
+            raw = await self._redis.get(gen_key)
+        return int(raw)
+
+    async def get_or_compute(
+        self,
+        project_id: uuid.UUID,
+        key: str,
+        compute: Callable[[], Awaitable[T]],
+        *,
+        refresh: bool = False,
+    ) -> tuple[T, bool]:
+        try:
+            generation = await self._generation(project_id)
+        except Exception as e:  # noqa: BLE001
+            record_lookup("l2", "error")
+            logger.warning("traceability_cache_unavailable", project_id=str(project_id), error=str(e))
+            return await compute(), False
+        if not refresh:
+            cached = await self._read(project_id, generation, key)
+            if cached is not None:
+                return cached, True
+        value = await compute()
+        await self._write(project_id, generation, key, value)
+        return value, False
+
+    async def _read(self, project_id: uuid.UUID, generation: int, key: str) -> Any | None:
+        if self._l1.enabled:
+            value = self._l1.get(project_id, generation, key)
+            record_lookup("l1", "hit" if value is not None else "miss")
+            if value is not None:
+                return value
+        entry_key = self._entry_key(project_id, generation, key)
+        try:
+            data = await self._redis.get(entry_key)
+            value = _load_signed_payload(entry_key, data) if data is not None else None
+        except Exception as e:  # noqa: BLE001
+            record_lookup("l2", "error")
+            logger.warning("traceability_cache_read_failed", project_id=str(project_id), error=str(e))
+            return None
+        record_lookup("l2", "hit" if value is not None else "miss")
+        if value is not None:
+            self._l1.set(project_id, generation, key, value)
+        return value
+
+    async def _write(self, project_id: uuid.UUID, generation: int, key: str, value: Any) -> None:
+        self._l1.set(project_id, generation, key, value)
+        entry_key = self._entry_key(project_id, generation, key)
+        try:
+            data = _sign_payload(entry_key, value)
+            alm_traceability_cache_payload_bytes.observe(len(data))
+            await self._redis.set(entry_key, data, ex=max(1, self._ttl))
+        except Exception as e:  # noqa: BLE001
+            logger.warning("traceability_cache_write_failed", project_id=str(project_id), error=str(e))
+
+    async def bump_generation(self, project_id: uuid.UUID) -> None:
+        """Bump once per project per dispatched batch: its events were all committed before dispatch."""
+        scope = current_event_lookup_scope()
+        if scope is not None and not scope.once(("traceability_generation", project_id)):
+            return
+        self._l1.evict_project(project_id)
+        gen_key = self._generation_key(project_id)
+        try:
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.set(gen_key, time.time_ns(), nx=True)
+                pipe.incr(gen_key)
+                await pipe.execute()
+        except Exception as e:  # noqa: BLE001
+            alm_traceability_cache_generation_bumps_total.labels(result="error").inc()
+            logger.warning("traceability_cache_bump_failed", project_id=str(project_id), error=str(e))
+            return
+        alm_traceability_cache_generation_bumps_total.labels(result="ok").inc()
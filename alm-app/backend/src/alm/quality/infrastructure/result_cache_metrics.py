@@ -0,0 +1,36 @@
+"""Prometheus metrics for the traceability matrix / coverage result cache (in-process L1, Redis L2).
+
+Hit ratio per tier: ``rate(alm_traceability_cache_lookups_total{tier="l1",result="hit"}[5m])`` divided by
+``rate(alm_traceability_cache_lookups_total{tier="l1"}[5m])``.
+"""
+
+from __future__ import annotations
+
+from prometheus_client import Counter, Gauge, Histogram
+
+alm_traceability_cache_lookups_total = Counter(
+    "alm_traceability_cache_lookups_total",
+    "Traceability result cache lookups by tier (l1, l2) and result (hit, miss, error)",
+    ["tier", "result"],
+)
+
+alm_traceability_cache_generation_bumps_total = Counter(
+    "alm_traceability_cache_generation_bumps_total",
+    "Per-project traceability generation bumps (result: ok, error)",
+    ["result"],
+)
+
+alm_traceability_cache_l1_entries = Gauge(
+    "alm_traceability_cache_l1_entries",
+    "Results currently held in this worker's in-process traceability cache",
+)
+
+alm_traceability_cache_payload_bytes = Histogram(
+    "alm_traceability_cache_payload_bytes",
+    "Compressed size of results written to the Redis L2",
+    buckets=(1_000, 10_000, 50_000, 100_000, 250_000, 500_000, 1_000_000, 5_000_000),
+)
+
+
+def record_lookup(tier: str, result: str) -> None:
+    alm_traceability_cache_lookups_total.labels(tier=tier, result=result).inc()
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import json
 import uuid
 
 import structlog
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
-from alm.realtime.connection_manager import connection_manager
+from alm.realtime.connection_manager import RealtimeConnection, connection_manager, parse_subscription
 from alm.shared.infrastructure.security.jwt import InvalidTokenError, decode_token
 
 logger = structlog.get_logger()
@@ -17,7 +18,12 @@ router = APIRouter()
 
 @router.websocket("/ws")
 async def websocket_realtime(websocket: WebSocket) -> None:
-    """Connect with ?token=ACCESS_TOKEN. Receives tenant-scoped events (e.g. artifact_state_changed)."""
+    """Connect with ?token=ACCESS_TOKEN. Receives tenant-scoped events (e.g. artifact_state_changed).
+
+    Optionally narrow delivery by sending ``{"type": "subscribe", "project_ids": [...], "event_types": [...]}``
+    (omitted or null = all); the server answers ``{"type": "subscribed", ...}`` and each new message replaces
+    the previous filter.
+    """
     await websocket.accept()
     token = websocket.query_params.get("token")
     if not token or not token.strip():
@@ -33,13 +39,37 @@ async def websocket_realtime(websocket: WebSocket) -> None:
         await websocket.close(code=4001, reason="Access token with tenant required")
         return
     tenant_id: uuid.UUID = payload.tid
-    await connection_manager.add(tenant_id, websocket)
+    conn = await connection_manager.add(tenant_id, websocket)
     try:
         while True:
-            await websocket.receive_text()
+            _handle_client_message(conn, await websocket.receive_text())
     except WebSocketDisconnect:
         pass
     except Exception:  # noqa: BLE001
         pass
     finally:
-        await connection_manager.remove(tenant_id, websocket)
+        await connection_manager.remove(conn)
+
+
+def _handle_client_message(conn: RealtimeConnection, text: str) -> None:
+    try:
+        data = json.loads(text)
+    except ValueError:
+        return
+    if not isinstance(data, dict) or data.get("type") != "subscribe":
+        return
+    try:
+        conn.subscription = parse_subscription(data)
+    except ValueError as e:
+        conn.offer(json.dumps({"type": "error", "detail": str(e)}))
+        return
+    sub = conn.subscription
+    conn.offer(
+        json.dumps(
+            {
+                "type": "subscribed",
+                "project_ids": sorted(sub.project_ids) if sub.project_ids is not None else None,
+                "event_types": sorted(sub.event_types) if sub.event_types is not None else None,
+            }
+        )
+    )
@@ -1,51 +1,202 @@
-"""In-memory connection manager for WebSocket clients per tenant."""
+"""In-memory connection manager for WebSocket clients per tenant.
+
+Each connection has a bounded outbound queue drained by its own writer task, so a slow client only delays
+itself, and an optional subscription (project ids, event types) that narrows what it receives.
+"""
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import json
 import uuid
+from dataclasses import dataclass
+from typing import Any, Literal
 
 import structlog
 from starlette.websockets import WebSocket
 
+from alm.config.settings import settings
+from alm.realtime.metrics import (
+    alm_realtime_connections,
+    alm_realtime_messages_dropped_total,
+    alm_realtime_send_queue_depth,
+    alm_realtime_slow_consumer_disconnects_total,
+)
+
 logger = structlog.get_logger()
 
 CHANNEL_PREFIX = "alm:events:"
 
+# Close code for slow consumers (RFC 6455 1013 "Try Again Later").
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+
+@dataclass(frozen=True)
+class RealtimeSubscription:
+    """What a connection wants to receive; ``None`` means no filter. Events without a project pass project filters."""
+
+    project_ids: frozenset[str] | None = None
+    event_types: frozenset[str] | None = None
+
+    def matches(self, event_types: frozenset[str], project_id: str | None) -> bool:
+        """``event_types`` are the types carried by the frame (several for a ``batch`` frame)."""
+        if self.event_types is not None and not (event_types & self.event_types):
+            return False
+        return self.project_ids is None or project_id is None or project_id in self.project_ids
+
+
+def parse_subscription(data: dict[str, Any]) -> RealtimeSubscription:
+    """Build a subscription from a client ``{"type": "subscribe", "project_ids": [...], "event_types": [...]}``.
+
+    Raises ValueError for malformed filters.
+    """
+
+    def _ids(key: str, *, as_uuid: bool) -> frozenset[str] | None:
+        raw = data.get(key)
+        if raw is None:
+            return None
+        if not isinstance(raw, list) or not all(isinstance(v, str) for v in raw):
+            raise ValueError(f"{key} must be a list of strings")
+        return frozenset(str(uuid.UUID(v)) for v in raw) if as_uuid else frozenset(raw)
+
+    return RealtimeSubscription(
+        project_ids=_ids("project_ids", as_uuid=True),
+        event_types=_ids("event_types", as_uuid=False),
+    )
+
+
+class RealtimeConnection:
+    """One WebSocket with its subscription, bounded outbound queue and writer task."""
+
+    def __init__(
+        self,
+        tenant_id: uuid.UUID,
+        ws: WebSocket,
+        *,
+        max_queue: int,
+        policy: Literal["drop_oldest", "disconnect"],
+    ) -> None:
+        self.tenant_id = tenant_id
+        self.ws = ws
+        self.subscription = RealtimeSubscription()
+        self.dropped = 0
+        self._policy = policy
+        self._queue: asyncio.Queue[str] = asyncio.Queue(maxsize=max(1, max_queue))
+        self._writer: asyncio.Task[None] | None = None
+        self._close_task: asyncio.Task[None] | None = None
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def start(self) -> None:
+        self._writer = asyncio.create_task(self._write_loop())
+
+    def offer(self, message: str) -> bool:
+        """Queue ``message`` without waiting; applies the slow-consumer policy when the queue is full."""
+        if self._closed or self._close_task is not None:
+            return False
+        if self._queue.full():
+            if self._policy == "disconnect":
+                alm_realtime_slow_consumer_disconnects_total.inc()
+                alm_realtime_messages_dropped_total.labels(reason="disconnected").inc()
+                logger.warning("realtime_slow_consumer_disconnected", tenant_id=str(self.tenant_id))
+                # Scheduled once; later offers are refused until it runs.
+                self._close_task = asyncio.create_task(self.close(code=SLOW_CONSUMER_CLOSE_CODE))
+                return False
+            self._queue.get_nowait()
+            alm_realtime_send_queue_depth.dec()
+            self.dropped += 1
+            alm_realtime_messages_dropped_total.labels(reason="queue_full").inc()
+        self._queue.put_nowait(message)
+        alm_realtime_send_queue_depth.inc()
+        return True
+
+    async def close(self, code: int | None = None) -> None:
+        """Stop the writer and release queued messages; closes the socket when ``code`` is given."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._writer is not None and self._writer is not asyncio.current_task():
+            self._writer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._writer
+        alm_realtime_send_queue_depth.dec(self._queue.qsize())
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        if code is not None:
+            with contextlib.suppress(Exception):
+                await self.ws.close(code=code)
+
+    async def _write_loop(self) -> None:
+        while True:
+            message = await self._queue.get()
+            alm_realtime_send_queue_depth.dec()
+            try:
+                await self.ws.send_text(message)
+            except Exception as e:  # noqa: BLE001
+                logger.warning("realtime_send_failed", tenant_id=str(self.tenant_id), error=str(e))
+                await self.close()
+                return
+
 
 class ConnectionManager:
-    """Maps tenant_id to set of WebSocket connections; broadcasts messages to tenant subscribers."""
+    """Maps tenant_id to its connections; broadcasts messages to matching subscribers without waiting on sends."""
 
     def __init__(self) -> None:
-        self._connections: dict[uuid.UUID, set[WebSocket]] = {}
-        self._lock = asyncio.Lock()
-
-    async def add(self, tenant_id: uuid.UUID, ws: WebSocket) -> None:
-        async with self._lock:
-            if tenant_id not in self._connections:
-                self._connections[tenant_id] = set()
-            self._connections[tenant_id].add(ws)
+        self._connections: dict[uuid.UUID, set[RealtimeConnection]] = {}
+
+    async def add(self, tenant_id: uuid.UUID, ws: WebSocket) -> RealtimeConnection:
+        conn = RealtimeConnection(
+            tenant_id,
+            ws,
+            max_queue=settings.realtime_send_queue_size,
+            policy=settings.realtime_slow_consumer_policy,
+        )
+        conn.start()
+        self._connections.setdefault(tenant_id, set()).add(conn)
+        alm_realtime_connections.inc()
         logger.debug("realtime_connection_added", tenant_id=str(tenant_id))
+        return conn
 
-    async def remove(self, tenant_id: uuid.UUID, ws: WebSocket) -> None:
-        async with self._lock:
-            if tenant_id in self._connections:
-                self._connections[tenant_id].discard(ws)
-                if not self._connections[tenant_id]:
-                    del self._connections[tenant_id]
-        logger.debug("realtime_connection_removed", tenant_id=str(tenant_id))
+    async def remove(self, conn: RealtimeConnection) -> None:
+        conns = self._connections.get(conn.tenant_id)
+        if conns is not None and conn in conns:
+            conns.discard(conn)
+            if not conns:
+                del self._connections[conn.tenant_id]
+            alm_realtime_connections.dec()
+        await conn.close()
+        logger.debug("realtime_connection_removed", tenant_id=str(conn.tenant_id))
 
     async def broadcast(self, tenant_id: uuid.UUID, message: str) -> None:
-        async with self._lock:
-            conns = set(self._connections.get(tenant_id, ()))
-        for ws in conns:
-            try:
-                await ws.send_text(message)
-            except Exception as e:  # noqa: BLE001
-                logger.warning("realtime_send_failed", tenant_id=str(tenant_id), error=str(e))
-                async with self._lock:
-                    if tenant_id in self._connections:
-                        self._connections[tenant_id].discard(ws)
+        conns = self._connections.get(tenant_id)
+        if not conns:
+            return
+        event_types, project_id = _routing_fields(message)
+        for conn in list(conns):
+            if conn.closed:
+                await self.remove(conn)
+            elif conn.subscription.matches(event_types, project_id):
+                conn.offer(message)
+
+
+def _routing_fields(message: str) -> tuple[frozenset[str], str | None]:
+    """Event types and project of a frame; a ``batch`` frame reports the types of the events it carries."""
+    try:
+        data = json.loads(message)
+    except ValueError:
+        return frozenset(), None
+    if not isinstance(data, dict):
+        return frozenset(), None
+    items = data.get("events") if data.get("type") == "batch" else [data]
+    event_types = frozenset(
+        item["type"] for item in items or () if isinstance(item, dict) and isinstance(item.get("type"), str)
+    )
+    project_id = data.get("project_id")
+    return event_types, project_id if isinstance(project_id, str) else None
 
 
 # Singleton used by WebSocket route and Redis subscriber
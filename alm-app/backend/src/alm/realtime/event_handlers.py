@@ -2,25 +2,26 @@
 
 from __future__ import annotations
 
-import uuid
-
 from alm.artifact.domain.events import ArtifactStateChanged
-from alm.project.infrastructure.repositories import SqlAlchemyProjectRepository
 from alm.realtime.pubsub import publish_event
 from alm.shared.domain.events import DomainEvent
-from alm.shared.infrastructure.db.session import async_session_factory
+from alm.shared.infrastructure.event_lookups import event_lookup_scope
 
 
 async def on_artifact_state_changed_realtime(event: DomainEvent) -> None:
-    """Publish ArtifactStateChanged to Redis so WebSocket clients can refresh."""
+    """Publish ArtifactStateChanged to Redis so WebSocket clients can refresh.
+
+    The tenant comes from the event; only events persisted before it carried ``tenant_id`` need the
+    dispatch's batched project lookup.
+    """
     if not isinstance(event, ArtifactStateChanged):
         return
-    async with async_session_factory() as session:
-        project_repo = SqlAlchemyProjectRepository(session)
-        project = await project_repo.find_by_id(event.project_id)
-        if project is None:
+    tenant_id = event.tenant_id
+    if tenant_id is None:
+        async with event_lookup_scope([event]) as lookups:
+            tenant_id = await lookups.tenant_id_for(event)
+        if tenant_id is None:
             return
-        tenant_id: uuid.UUID = project.tenant_id
     await publish_event(
         tenant_id,
         {
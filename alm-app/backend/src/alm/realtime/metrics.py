@@ -0,0 +1,26 @@
+"""Prometheus metrics for WebSocket realtime delivery."""
+
+from __future__ import annotations
+
+from prometheus_client import Counter, Gauge
+
+alm_realtime_connections = Gauge(
+    "alm_realtime_connections",
+    "Open realtime WebSocket connections on this worker",
+)
+
+alm_realtime_send_queue_depth = Gauge(
+    "alm_realtime_send_queue_depth",
+    "Messages waiting in the per-connection outbound queues on this worker (sum over connections)",
+)
+
+alm_realtime_messages_dropped_total = Counter(
+    "alm_realtime_messages_dropped_total",
+    "Realtime messages not delivered to a connection by reason (queue_full, disconnected)",
+    ["reason"],
+)
+
+alm_realtime_slow_consumer_disconnects_total = Counter(
+    "alm_realtime_slow_consumer_disconnects_total",
+    "WebSocket connections closed because their outbound queue was full",
+)
@@ -1,14 +1,17 @@
-"""Redis PubSub: publish tenant-scoped events and run subscriber that forwards to WebSocket manager."""
+"""Redis PubSub: publish tenant-scoped events (coalesced into batch frames) and run subscriber that forwards to WebSocket manager."""
 
 from __future__ import annotations
 
 import asyncio
+import itertools
 import json
 import uuid
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 import structlog
 
+from alm.config.settings import settings
 from alm.realtime.connection_manager import CHANNEL_PREFIX, connection_manager
 from alm.shared.infrastructure.cache import get_redis
 
@@ -19,8 +22,7 @@ def event_channel(tenant_id: uuid.UUID) -> str:
     return f"{CHANNEL_PREFIX}{tenant_id}"
 
 
-async def publish_event(tenant_id: uuid.UUID, payload: dict[str, Any]) -> None:
-    """Publish a JSON payload to the tenant's event channel (for WebSocket delivery)."""
+async def _publish_now(tenant_id: uuid.UUID, payload: dict[str, Any]) -> None:
     try:
         r = get_redis()
         channel = event_channel(tenant_id)
@@ -30,6 +32,92 @@ async def publish_event(tenant_id: uuid.UUID, payload: dict[str, Any]) -> None:
         logger.warning("realtime_publish_failed", tenant_id=str(tenant_id), error=str(e))
 
 
+class RealtimeEventCoalescer:
+    """Buffers events per (tenant, project) for ``window_seconds`` and publishes them as one frame.
+
+    Within a buffer only the latest event per (type, artifact_id) is kept; a state change keeps the
+    ``from_state`` of the first one it replaced. A buffer holding a single event is published unchanged,
+    larger ones as ``{"type": "batch", "project_id": ..., "events": [...]}``. A buffer reaching
+    ``max_events`` is flushed at once.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float,
+        max_events: int,
+        publish: Callable[[uuid.UUID, dict[str, Any]], Awaitable[None]] = _publish_now,
+    ) -> None:
+        self._window = window_seconds
+        self._max_events = max(1, max_events)
+        self._publish = publish
+        self._buffers: dict[tuple[uuid.UUID, str | None], dict[str, dict[str, Any]]] = {}
+        self._timers: dict[tuple[uuid.UUID, str | None], asyncio.Task[None]] = {}
+        self._seq = itertools.count()
+
+    async def add(self, tenant_id: uuid.UUID, payload: dict[str, Any]) -> None:
+        key = (tenant_id, payload.get("project_id"))
+        buffer = self._buffers.setdefault(key, {})
+        artifact_id = payload.get("artifact_id")
+        dedupe_key = f"{payload.get('type')}:{artifact_id}" if artifact_id else f"_:{next(self._seq)}"
+        previous = buffer.pop(dedupe_key, None)
+        if previous is not None and "from_state" in previous:
+            payload = {**payload, "from_state": previous["from_state"]}
+        buffer[dedupe_key] = payload
+        if len(buffer) >= self._max_events:
+            await self._flush(key)
+        elif key not in self._timers:
+            self._timers[key] = asyncio.create_task(self._flush_later(key))
+
+    async def flush_all(self) -> None:
+        for key in list(self._buffers):
+            await self._flush(key)
+
+    async def _flush_later(self, key: tuple[uuid.UUID, str | None]) -> None:
+        await asyncio.sleep(self._window)
+        self._timers.pop(key, None)
+        await self._flush(key)
+
+    async def _flush(self, key: tuple[uuid.UUID, str | None]) -> None:
+        timer = self._timers.pop(key, None)
+        if timer is not None and timer is not asyncio.current_task():
+            timer.cancel()
+        events = list(self._buffers.pop(key, {}).values())
+        if not events:
+            return
+        tenant_id, project_id = key
+        if len(events) == 1:
+            await self._publish(tenant_id, events[0])
+        else:
+            await self._publish(tenant_id, {"type": "batch", "project_id": project_id, "events": events})
+
+
+_coalescer: RealtimeEventCoalescer | None = None
+
+
+def _get_coalescer() -> RealtimeEventCoalescer:
+    global _coalescer
+    if _coalescer is None:
+        _coalescer = RealtimeEventCoalescer(
+            settings.realtime_coalesce_window_ms / 1000,
+            settings.realtime_coalesce_max_events,
+        )
+    return _coalescer
+
+
+async def publish_event(tenant_id: uuid.UUID, payload: dict[str, Any]) -> None:
+    """Publish a JSON payload to the tenant's event channel (for WebSocket delivery), coalesced per project."""
+    if settings.realtime_coalesce_window_ms <= 0:
+        await _publish_now(tenant_id, payload)
+        return
+    await _get_coalescer().add(tenant_id, payload)
+
+
+async def flush_realtime_events() -> None:
+    """Publish anything still buffered (shutdown)."""
+    if _coalescer is not None:
+        await _coalescer.flush_all()
+
+
 async def run_subscriber() -> None:
     """Subscribe to alm:events:* and broadcast each message to the connection manager."""
     r = get_redis()
@@ -0,0 +1,23 @@
+"""Keep the in-memory relationship graphs in step with committed relationship changes."""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+
+from alm.relationship.domain.events import RelationshipCreated, RelationshipDeleted
+from alm.relationship.domain.ports import RelationshipGraphIndex
+from alm.shared.domain.events import DomainEvent
+
+RELATIONSHIP_GRAPH_EVENTS: tuple[type[DomainEvent], ...] = (RelationshipCreated, RelationshipDeleted)
+
+
+def create_relationship_graph_handler(
+    index: RelationshipGraphIndex,
+) -> Callable[[DomainEvent], Awaitable[None]]:
+    """Returns a handler (register it for ``RELATIONSHIP_GRAPH_EVENTS``) that applies the change to the index."""
+
+    async def on_relationship_changed(event: DomainEvent) -> None:
+        if isinstance(event, RELATIONSHIP_GRAPH_EVENTS):
+            await index.apply_event(event)
+
+    return on_relationship_changed
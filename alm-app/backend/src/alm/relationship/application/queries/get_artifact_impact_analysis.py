@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import uuid
 from dataclasses import dataclass
+from typing import Literal
 
 from alm.artifact.application.dtos import ArtifactDTO
 from alm.artifact.domain.entities import Artifact
@@ -15,7 +16,7 @@ from alm.relationship.application.dtos import (
     ImpactHierarchyRefDTO,
 )
 from alm.relationship.domain.entities import Relationship
-from alm.relationship.domain.ports import RelationshipRepository
+from alm.relationship.domain.ports import RelationshipRepository, TracedArtifact, TracedRelationship
 from alm.relationship.domain.types import BLOCKS, IMPACTS, get_relationship_type
 from alm.shared.application.query import Query, QueryHandler
 from alm.shared.domain.exceptions import ValidationError
@@ -23,6 +24,8 @@ from alm.shared.domain.exceptions import ValidationError
 DEFAULT_IMPACT_RELATIONSHIP_TYPES: tuple[str, ...] = (IMPACTS, BLOCKS)
 MAX_IMPACT_DEPTH = 5
 
+_TraceDirection = Literal["incoming", "outgoing"]
+
 
 @dataclass(frozen=True)
 class GetArtifactImpactAnalysis(Query):
@@ -37,6 +40,8 @@ class GetArtifactImpactAnalysis(Query):
 
 
 class GetArtifactImpactAnalysisHandler(QueryHandler[ArtifactImpactAnalysisResultDTO]):
+    """Each direction is traced by one recursive query; hierarchy paths come from one batched ancestor query."""
+
     def __init__(
         self,
         project_repo: ProjectRepository,
@@ -46,10 +51,6 @@ class GetArtifactImpactAnalysisHandler(QueryHandler[ArtifactImpactAnalysisResult
         self._project_repo = project_repo
         self._artifact_repo = artifact_repo
         self._relationship_repo = relationship_repo
-        self._artifact_cache: dict[uuid.UUID, Artifact] = {}
-        self._outgoing_cache: dict[uuid.UUID, list[Relationship]] = {}
-        self._incoming_cache: dict[tuple[uuid.UUID, tuple[str, ...]], list[Relationship]] = {}
-        self._hierarchy_cache: dict[uuid.UUID, tuple[ImpactHierarchyRefDTO, ...]] = {}
 
     async def handle(self, query: Query) -> ArtifactImpactAnalysisResultDTO:
         assert isinstance(query, GetArtifactImpactAnalysis)
@@ -68,29 +69,43 @@ class GetArtifactImpactAnalysisHandler(QueryHandler[ArtifactImpactAnalysisResult
         focus_artifact = await self._artifact_repo.find_by_id(query.artifact_id)
         if focus_artifact is None or focus_artifact.project_id != query.project_id:
             raise ValidationError("Artifact not found")
-        self._artifact_cache[focus_artifact.id] = focus_artifact
+
+        edges: dict[_TraceDirection, dict[uuid.UUID, list[TracedRelationship]]] = {}
+        if direction in {"both", "from"}:
+            edges["incoming"] = await self._load_edges(
+                query.project_id, focus_artifact.id, relationship_types, depth, "incoming"
+            )
+        if direction in {"both", "to"}:
+            edges["outgoing"] = await self._load_edges(
+                query.project_id, focus_artifact.id, relationship_types, depth, "outgoing"
+            )
+
+        hierarchy_paths: dict[uuid.UUID, tuple[ImpactHierarchyRefDTO, ...]] = {}
+        if query.include_hierarchy:
+            nodes: dict[uuid.UUID, TracedArtifact] = {}
+            for trace_direction, by_artifact in edges.items():
+                nodes.update(_reachable_artifacts(by_artifact, focus_artifact.id, trace_direction, max(depth, 1)))
+            hierarchy_paths = await self._load_hierarchy_paths(query.project_id, nodes)
 
         trace_from: list[ArtifactImpactAnalysisNodeDTO] = []
         trace_to: list[ArtifactImpactAnalysisNodeDTO] = []
-        if direction in {"both", "from"}:
-            trace_from = await self._build_trace(
+        if "incoming" in edges:
+            trace_from = self._build_trace(
+                edges["incoming"],
                 focus_artifact.id,
-                query.project_id,
-                relationship_types,
                 depth,
                 direction="incoming",
-                include_hierarchy=query.include_hierarchy,
+                hierarchy_paths=hierarchy_paths,
                 manifest_bundle=query.manifest_bundle,
                 path={focus_artifact.id},
             )
-        if direction in {"both", "to"}:
-            trace_to = await self._build_trace(
+        if "outgoing" in edges:
+            trace_to = self._build_trace(
+                edges["outgoing"],
                 focus_artifact.id,
-                query.project_id,
-                relationship_types,
                 depth,
                 direction="outgoing",
-                include_hierarchy=query.include_hierarchy,
+                hierarchy_paths=hierarchy_paths,
                 manifest_bundle=query.manifest_bundle,
                 path={focus_artifact.id},
             )
@@ -112,59 +127,68 @@ class GetArtifactImpactAnalysisHandler(QueryHandler[ArtifactImpactAnalysisResult
                 normalized.append(item)
         return tuple(normalized or DEFAULT_IMPACT_RELATIONSHIP_TYPES)
 
-    async def _build_trace(
+    async def _load_edges(
         self,
-        artifact_id: uuid.UUID,
         project_id: uuid.UUID,
+        artifact_id: uuid.UUID,
         relationship_types: tuple[str, ...],
-        remaining_depth: int,
-        *,
-        direction: str,
-        include_hierarchy: bool,
-        manifest_bundle: dict | None,
-        path: set[uuid.UUID],
-    ) -> list[ArtifactImpactAnalysisNodeDTO]:
-        relationships = await self._load_relationships(
+        depth: int,
+        direction: _TraceDirection,
+    ) -> dict[uuid.UUID, list[TracedRelationship]]:
+        """Traced relationships grouped by their near-end artifact.
+
+        Edges leaving the last level are included so ``has_more`` needs no further queries.
+        """
+        traced = await self._relationship_repo.trace_relationships(
             project_id,
             artifact_id,
-            relationship_types,
+            list(relationship_types),
             direction=direction,
+            max_hops=depth,
         )
-        nodes: list[ArtifactImpactAnalysisNodeDTO] = []
-        for relationship in relationships:
-            next_id = (
-                relationship.source_artifact_id
+        by_artifact: dict[uuid.UUID, list[TracedRelationship]] = {}
+        for edge in traced:
+            near_id = (
+                edge.relationship.target_artifact_id
                 if direction == "incoming"
-                else relationship.target_artifact_id
+                else edge.relationship.source_artifact_id
             )
-            if next_id in path:
-                continue
-            next_artifact = await self._get_artifact(project_id, next_id)
-            if next_artifact is None:
+            by_artifact.setdefault(near_id, []).append(edge)
+        return by_artifact
+
+    def _build_trace(
+        self,
+        edges: dict[uuid.UUID, list[TracedRelationship]],
+        artifact_id: uuid.UUID,
+        remaining_depth: int,
+        *,
+        direction: _TraceDirection,
+        hierarchy_paths: dict[uuid.UUID, tuple[ImpactHierarchyRefDTO, ...]],
+        manifest_bundle: dict | None,
+        path: set[uuid.UUID],
+    ) -> list[ArtifactImpactAnalysisNodeDTO]:
+        nodes: list[ArtifactImpactAnalysisNodeDTO] = []
+        for edge in edges.get(artifact_id, ()):
+            relationship, next_artifact = edge.relationship, edge.artifact
+            next_id = _far_end(relationship, direction)
+            if next_id in path or next_artifact is None:
                 continue
             child_path = set(path)
             child_path.add(next_id)
             children: list[ArtifactImpactAnalysisNodeDTO] = []
             if remaining_depth > 1:
-                children = await self._build_trace(
+                children = self._build_trace(
+                    edges,
                     next_id,
-                    project_id,
-                    relationship_types,
                     remaining_depth - 1,
                     direction=direction,
-                    include_hierarchy=include_hierarchy,
+                    hierarchy_paths=hierarchy_paths,
                     manifest_bundle=manifest_bundle,
                     path=child_path,
                 )
-            has_more = False
-            if remaining_depth == 1:
-                has_more = await self._has_more_relationships(
-                    project_id,
-                    next_id,
-                    relationship_types,
-                    direction=direction,
-                    exclude_ids=child_path,
-                )
+            has_more = remaining_depth == 1 and any(
+                _far_end(e.relationship, direction) not in child_path for e in edges.get(next_id, ())
+            )
             rel_type = get_relationship_type(manifest_bundle, relationship.relationship_type)
             nodes.append(
                 ArtifactImpactAnalysisNodeDTO(
@@ -176,115 +200,46 @@ class GetArtifactImpactAnalysisHandler(QueryHandler[ArtifactImpactAnalysisResult
                     parent_id=next_artifact.parent_id,
                     relationship_id=relationship.id,
                     relationship_type=relationship.relationship_type,
-                    relationship_label=(
-                        rel_type.reverse_label if direction == "incoming" else rel_type.forward_label
-                    ),
+                    relationship_label=(rel_type.reverse_label if direction == "incoming" else rel_type.forward_label),
                     direction=direction,
                     depth=len(path),
                     has_more=has_more,
-                    hierarchy_path=(
-                        await self._get_hierarchy_path(project_id, next_artifact.id)
-                        if include_hierarchy
-                        else ()
-                    ),
+                    hierarchy_path=hierarchy_paths.get(next_id, ()),
                     children=children,
                 )
             )
         return nodes
 
-    async def _load_relationships(
-        self,
-        project_id: uuid.UUID,
-        artifact_id: uuid.UUID,
-        relationship_types: tuple[str, ...],
-        *,
-        direction: str,
-    ) -> list[Relationship]:
-        if direction == "outgoing":
-            cached = self._outgoing_cache.get(artifact_id)
-            if cached is None:
-                cached = await self._relationship_repo.list_outgoing_relationships_from_artifacts(
-                    project_id,
-                    [artifact_id],
-                )
-                self._outgoing_cache[artifact_id] = cached
-            return [rel for rel in cached if rel.relationship_type in relationship_types]
-
-        key = (artifact_id, relationship_types)
-        cached = self._incoming_cache.get(key)
-        if cached is None:
-            cached = await self._relationship_repo.list_relationships_to_artifacts(
-                project_id,
-                [artifact_id],
-                list(relationship_types),
-            )
-            self._incoming_cache[key] = cached
-        return cached
-
-    async def _has_more_relationships(
-        self,
-        project_id: uuid.UUID,
-        artifact_id: uuid.UUID,
-        relationship_types: tuple[str, ...],
-        *,
-        direction: str,
-        exclude_ids: set[uuid.UUID],
-    ) -> bool:
-        relationships = await self._load_relationships(
-            project_id,
-            artifact_id,
-            relationship_types,
-            direction=direction,
-        )
-        for relationship in relationships:
-            next_id = (
-                relationship.source_artifact_id
-                if direction == "incoming"
-                else relationship.target_artifact_id
-            )
-            if next_id not in exclude_ids:
-                return True
-        return False
-
-    async def _get_artifact(self, project_id: uuid.UUID, artifact_id: uuid.UUID) -> Artifact | None:
-        cached = self._artifact_cache.get(artifact_id)
-        if cached is not None:
-            return cached
-        loaded = await self._artifact_repo.list_by_ids_in_project(project_id, [artifact_id])
-        if not loaded:
-            return None
-        self._artifact_cache[artifact_id] = loaded[0]
-        return loaded[0]
-
-    async def _get_hierarchy_path(
+    async def _load_hierarchy_paths(
         self,
         project_id: uuid.UUID,
-        artifact_id: uuid.UUID,
-    ) -> tuple[ImpactHierarchyRefDTO, ...]:
-        cached = self._hierarchy_cache.get(artifact_id)
-        if cached is not None:
-            return cached
-        current = await self._get_artifact(project_id, artifact_id)
-        refs: list[ImpactHierarchyRefDTO] = []
-        seen: set[uuid.UUID] = set()
-        while current is not None and current.parent_id is not None and current.parent_id not in seen:
-            seen.add(current.parent_id)
-            parent = await self._get_artifact(project_id, current.parent_id)
-            if parent is None:
-                break
-            refs.append(
-                ImpactHierarchyRefDTO(
-                    id=parent.id,
-                    artifact_key=parent.artifact_key,
-                    title=parent.title,
-                    artifact_type=parent.artifact_type,
+        nodes: dict[uuid.UUID, TracedArtifact],
+    ) -> dict[uuid.UUID, tuple[ImpactHierarchyRefDTO, ...]]:
+        if not nodes:
+            return {}
+        ancestors = {a.id: a for a in await self._artifact_repo.list_ancestors_in_project(project_id, list(nodes))}
+        paths: dict[uuid.UUID, tuple[ImpactHierarchyRefDTO, ...]] = {}
+        for node in nodes.values():
+            refs: list[ImpactHierarchyRefDTO] = []
+            seen: set[uuid.UUID] = set()
+            parent_id = node.parent_id
+            while parent_id is not None and parent_id not in seen:
+                seen.add(parent_id)
+                parent = ancestors.get(parent_id)
+                if parent is None:
+                    break
+                refs.append(
+                    ImpactHierarchyRefDTO(
+                        id=parent.id,
+                        artifact_key=parent.artifact_key,
+                        title=parent.title,
+                        artifact_type=parent.artifact_type,
+                    )
                 )
-            )
-            current = parent
-        refs.reverse()
-        result = tuple(refs)
-        self._hierarchy_cache[artifact_id] = result
-        return result
+                parent_id = parent.parent_id
+            refs.reverse()
+            paths[node.id] = tuple(refs)
+        return paths
 
     @staticmethod
     def _to_artifact_dto(artifact: Artifact) -> ArtifactDTO:
@@ -313,3 +268,31 @@ class GetArtifactImpactAnalysisHandler(QueryHandler[ArtifactImpactAnalysisResult
             stale_traceability_at=getattr(artifact, "stale_traceability_at", None),
             tags=(),
         )
+
+
+def _far_end(relationship: Relationship, direction: _TraceDirection) -> uuid.UUID:
+    return relationship.source_artifact_id if direction == "incoming" else relationship.target_artifact_id
+
+
+def _reachable_artifacts(
+    edges: dict[uuid.UUID, list[TracedRelationship]],
+    start_id: uuid.UUID,
+    direction: _TraceDirection,
+    hops: int,
+) -> dict[uuid.UUID, TracedArtifact]:
+    """Artifacts within ``hops`` of ``start_id`` (every node the trace can show)."""
+    found: dict[uuid.UUID, TracedArtifact] = {}
+    frontier = [start_id]
+    visited = {start_id}
+    for _ in range(hops):
+        next_frontier: list[uuid.UUID] = []
+        for artifact_id in frontier:
+            for edge in edges.get(artifact_id, ()):
+                next_id = _far_end(edge.relationship, direction)
+                if edge.artifact is None or next_id in visited:
+                    continue
+                visited.add(next_id)
+                found[next_id] = edge.artifact
+                next_frontier.append(next_id)
+        frontier = next_frontier
+    return found
@@ -0,0 +1,260 @@
+"""Compact in-memory relationship graph of one project (pure, unit-tested).
+
+Artifacts get dense ordinals. Edges live in parallel arrays indexed by slot (source and target ordinal, type code,
+16-byte relationship id); outgoing and incoming adjacency are CSR slices of edge slots (``out_ptr`` / ``out_slots``,
+``in_ptr`` / ``in_slots``). Edges created after the build go to small per-node overlays and deleted slots to a
+tombstone set; ``compact`` folds both back into CSR once they grow past a fraction of the graph.
+
+Served relationships carry ids, endpoints and type only (no ``created_at`` / ``sort_order``).
+"""
+
+from __future__ import annotations
+
+import sys
+import uuid
+from array import array
+from collections.abc import Collection, Iterable, Iterator
+from typing import Literal
+
+from alm.relationship.domain.entities import Relationship
+
+# (relationship id, source artifact id, target artifact id, relationship type)
+EdgeRow = tuple[uuid.UUID, uuid.UUID, uuid.UUID, str]
+
+GraphDirection = Literal["outgoing", "incoming"]
+
+# Rough per-artifact cost of the ordinal map: the UUID object, its int and the dict / list slots.
+_NODE_OVERHEAD_BYTES = sys.getsizeof(uuid.UUID(int=0)) + sys.getsizeof(2**127) + 48
+
+_COMPACT_MIN_PENDING = 256
+_COMPACT_FRACTION = 0.1
+
+
+class ProjectRelationshipGraph:
+    """Typed directed adjacency of one project's relationships; asyncio-only, mutations never await."""
+
+    def __init__(self, project_id: uuid.UUID) -> None:
+        self.project_id = project_id
+        self._ordinal: dict[uuid.UUID, int] = {}
+        self._node_ids: list[uuid.UUID] = []
+        self._types: list[str] = []
+        self._type_codes: dict[str, int] = {}
+        self._src = array("I")
+        self._dst = array("I")
+        self._type = array("H")
+        self._ids = bytearray()
+        self._out_ptr = array("I", [0])
+        self._out_slots = array("I")
+        self._in_ptr = array("I", [0])
+        self._in_slots = array("I")
+        self._out_extra: dict[int, list[int]] = {}
+        self._in_extra: dict[int, list[int]] = {}
+        self._removed: set[int] = set()
+
+    @classmethod
+    def build(cls, project_id: uuid.UUID, rows: Iterable[EdgeRow]) -> ProjectRelationshipGraph:
+        graph = cls(project_id)
+        graph.load_rows(rows)
+        graph.finish_load()
+        return graph
+
+    def load_rows(self, rows: Iterable[EdgeRow]) -> None:
+        """Bulk-append rows (page by page while streaming); call ``finish_load`` before querying."""
+        for rel_id, source_id, target_id, rel_type in rows:
+            self._append_edge(rel_id, source_id, target_id, rel_type)
+
+    def finish_load(self) -> None:
+        self._rebuild_csr()
+
+    @property
+    def edge_count(self) -> int:
+        return len(self._src) - len(self._removed)
+
+    @property
+    def node_count(self) -> int:
+        return len(self._node_ids)
+
+    @property
+    def nbytes(self) -> int:
+        """Estimated memory held by the graph."""
+        arrays = (self._src, self._dst, self._type, self._out_ptr, self._out_slots, self._in_ptr, self._in_slots)
+        pending = sum(len(v) for v in self._out_extra.values()) + sum(len(v) for v in self._in_extra.values())
+        return (
+            sum(a.itemsize * len(a) for a in arrays)
+            + len(self._ids)
+            + len(self._node_ids) * _NODE_OVERHEAD_BYTES
+            + (pending + len(self._removed)) * 64
+        )
+
+    def outgoing(
+        self, source_ids: Iterable[uuid.UUID], relationship_types: Iterable[str] | None = None
+    ) -> list[Relationship]:
+        codes = self._codes(relationship_types)
+        return [self._relationship(s) for s in self._adjacent_slots(source_ids, "outgoing", codes)]
+
+    def incoming(
+        self, target_ids: Iterable[uuid.UUID], relationship_types: Iterable[str] | None = None
+    ) -> list[Relationship]:
+        codes = self._codes(relationship_types)
+        return [self._relationship(s) for s in self._adjacent_slots(target_ids, "incoming", codes)]
+
+    def within_hops(
+        self,
+        artifact_id: uuid.UUID,
+        relationship_types: Iterable[str],
+        *,
+        direction: GraphDirection,
+        max_hops: int,
+        stop_at: Collection[uuid.UUID] = (),
+    ) -> list[Relationship]:
+        """Edges of ``relationship_types`` leaving (along ``direction``) every artifact within ``max_hops``.
+
+        Artifacts in ``stop_at`` (e.g. deleted ones) are reached but their own edges are not followed.
+        """
+        codes = self._codes(relationship_types)
+        start = self._ordinal.get(artifact_id)
+        if start is None or not codes:
+            return []
+        far = self._dst if direction == "outgoing" else self._src
+        seen = {start}
+        seen.update(self._ordinal[a] for a in stop_at if a in self._ordinal and a != artifact_id)
+        frontier = [start]
+        slots: list[int] = []
+        for hop in range(max_hops + 1):
+            next_frontier: list[int] = []
+            for node in frontier:
+                for slot in self._node_slots(node, direction):
+                    if self._type[slot] not in codes:
+                        continue
+                    slots.append(slot)
+                    nxt = far[slot]
+                    if hop < max_hops and nxt not in seen:
+                        seen.add(nxt)
+                        next_frontier.append(nxt)
+            frontier = next_frontier
+        slots.sort()
+        return [self._relationship(s) for s in slots]
+
+    def add_edge(self, rel_id: uuid.UUID, source_id: uuid.UUID, target_id: uuid.UUID, rel_type: str) -> bool:
+        """Add a created relationship; False when it is already present (idempotent)."""
+        if self._find_slot(rel_id, source_id) is not None:
+            return False
+        slot = self._append_edge(rel_id, source_id, target_id, rel_type)
+        self._out_extra.setdefault(self._src[slot], []).append(slot)
+        self._in_extra.setdefault(self._dst[slot], []).append(slot)
+        self._maybe_compact()
+        return True
+
+    def remove_edge(self, rel_id: uuid.UUID, source_id: uuid.UUID) -> bool:
+        """Drop a deleted relationship; False when it is not present (idempotent)."""
+        slot = self._find_slot(rel_id, source_id)
+        if slot is None:
+            return False
+        self._removed.add(slot)
+        self._maybe_compact()
+        return True
+
+    def compact(self) -> None:
+        """Rebuild CSR without tombstones or overlays (slots are renumbered in their original order)."""
+        if not self._removed and not self._out_extra:
+            return
+        keep = [s for s in range(len(self._src)) if s not in self._removed]
+        self._src = array("I", (self._src[s] for s in keep))
+        self._dst = array("I", (self._dst[s] for s in keep))
+        self._type = array("H", (self._type[s] for s in keep))
+        self._ids = bytearray(b"".join(bytes(self._ids[s * 16 : s * 16 + 16]) for s in keep))
+        self._removed.clear()
+        self._rebuild_csr()
+
+    def _append_edge(self, rel_id: uuid.UUID, source_id: uuid.UUID, target_id: uuid.UUID, rel_type: str) -> int:
+        slot = len(self._src)
+        self._src.append(self._node(source_id))
+        self._dst.append(self._node(target_id))
+        code = self._type_codes.get(rel_type)
+        if code is None:
+            code = self._type_codes[rel_type] = len(self._types)
+            self._types.append(rel_type)
+        self._type.append(code)
+        self._ids += rel_id.bytes
+        return slot
+
+    def _node(self, artifact_id: uuid.UUID) -> int:
+        ordinal = self._ordinal.get(artifact_id)
+        if ordinal is None:
+            ordinal = self._ordinal[artifact_id] = len(self._node_ids)
+            self._node_ids.append(artifact_id)
+        return ordinal
+
+    def _rebuild_csr(self) -> None:
+        self._out_ptr, self._out_slots = _csr(self._src, len(self._node_ids))
+        self._in_ptr, self._in_slots = _csr(self._dst, len(self._node_ids))
+        self._out_extra.clear()
+        self._in_extra.clear()
+
+    def _maybe_compact(self) -> None:
+        pending = len(self._removed) + sum(len(v) for v in self._out_extra.values())
+        if pending >= max(_COMPACT_MIN_PENDING, int(len(self._src) * _COMPACT_FRACTION)):
+            self.compact()
+
+    def _node_slots(self, node: int, direction: GraphDirection) -> Iterator[int]:
+        if direction == "outgoing":
+            ptr, slots, extra = self._out_ptr, self._out_slots, self._out_extra
+        else:
+            ptr, slots, extra = self._in_ptr, self._in_slots, self._in_extra
+        if node + 1 < len(ptr):
+            for i in range(ptr[node], ptr[node + 1]):
+                if slots[i] not in self._removed:
+                    yield slots[i]
+        for slot in extra.get(node, ()):
+            if slot not in self._removed:
+                yield slot
+
+    def _adjacent_slots(
+        self, artifact_ids: Iterable[uuid.UUID], direction: GraphDirection, codes: set[int] | None
+    ) -> list[int]:
+        out: list[int] = []
+        for artifact_id in dict.fromkeys(artifact_ids):
+            node = self._ordinal.get(artifact_id)
+            if node is None:
+                continue
+            out.extend(s for s in self._node_slots(node, direction) if codes is None or self._type[s] in codes)
+        return out
+
+    def _codes(self, relationship_types: Iterable[str] | None) -> set[int] | None:
+        if relationship_types is None:
+            return None
+        return {self._type_codes[t] for t in relationship_types if t in self._type_codes}
+
+    def _find_slot(self, rel_id: uuid.UUID, source_id: uuid.UUID) -> int | None:
+        node = self._ordinal.get(source_id)
+        if node is None:
+            return None
+        wanted = rel_id.bytes
+        for slot in self._node_slots(node, "outgoing"):
+            if self._ids[slot * 16 : slot * 16 + 16] == wanted:
+                return slot
+        return None
+
+    def _relationship(self, slot: int) -> Relationship:
+        return Relationship(
+            project_id=self.project_id,
+            source_artifact_id=self._node_ids[self._src[slot]],
+            target_artifact_id=self._node_ids[self._dst[slot]],
+            relationship_type=self._types[self._type[slot]],
+            id=uuid.UUID(bytes=bytes(self._ids[slot * 16 : slot * 16 + 16])),
+        )
+
+
+def _csr(keys: array, node_count: int) -> tuple[array, array]:
+    """Counting sort of edge slots by ``keys[slot]``; slots stay in ascending order within a node."""
+    ptr = array("I", [0] * (node_count + 1))
+    for k in keys:
+        ptr[k + 1] += 1
+    for i in range(node_count):
+        ptr[i + 1] += ptr[i]
+    fill = array("I", ptr[:-1])
+    slots = array("I", [0] * len(keys))
+    for slot, k in enumerate(keys):
+        slots[fill[k]] = slot
+        fill[k] += 1
+    return ptr, slots
@@ -6,6 +6,7 @@ import uuid
 from datetime import datetime
 from typing import Any
 
+from alm.relationship.domain.events import RelationshipCreated, RelationshipDeleted
 from alm.shared.domain.aggregate import AggregateRoot
 
 
@@ -42,7 +43,7 @@ class Relationship(AggregateRoot):
         id: uuid.UUID | None = None,
         sort_order: int | None = None,
     ) -> Relationship:
-        return cls(
+        relationship = cls(
             project_id=project_id,
             source_artifact_id=source_artifact_id,
             target_artifact_id=target_artifact_id,
@@ -50,6 +51,21 @@ class Relationship(AggregateRoot):
             id=id,
             sort_order=sort_order,
         )
+        relationship._register_event(RelationshipCreated(**relationship._event_fields()))
+        return relationship
+
+    def mark_deleted(self) -> None:
+        """Register the deletion event; the repository removes the row."""
+        self._register_event(RelationshipDeleted(**self._event_fields()))
+
+    def _event_fields(self) -> dict[str, Any]:
+        return {
+            "project_id": self.project_id,
+            "relationship_id": self.id,
+            "source_artifact_id": self.source_artifact_id,
+            "target_artifact_id": self.target_artifact_id,
+            "relationship_type": self.relationship_type,
+        }
 
     def to_snapshot_dict(self) -> dict[str, Any]:
         return {
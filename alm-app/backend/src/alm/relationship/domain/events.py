@@ -0,0 +1,26 @@
+"""Relationship domain events."""
+
+from __future__ import annotations
+
+import uuid
+from dataclasses import dataclass
+
+from alm.shared.domain.events import DomainEvent
+
+
+@dataclass(frozen=True, kw_only=True)
+class RelationshipCreated(DomainEvent):
+    project_id: uuid.UUID
+    relationship_id: uuid.UUID
+    source_artifact_id: uuid.UUID
+    target_artifact_id: uuid.UUID
+    relationship_type: str
+
+
+@dataclass(frozen=True, kw_only=True)
+class RelationshipDeleted(DomainEvent):
+    project_id: uuid.UUID
+    relationship_id: uuid.UUID
+    source_artifact_id: uuid.UUID
+    target_artifact_id: uuid.UUID
+    relationship_type: str
@@ -3,9 +3,32 @@
 from __future__ import annotations
 
 import uuid
-from abc import abstractmethod
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Literal
 
 from alm.relationship.domain.entities import Relationship
+from alm.relationship.domain.events import RelationshipCreated, RelationshipDeleted
+
+
+@dataclass(frozen=True)
+class TracedArtifact:
+    """Read-only view of the artifact at the far end of a traced relationship."""
+
+    id: uuid.UUID
+    artifact_key: str | None
+    artifact_type: str
+    title: str
+    state: str
+    parent_id: uuid.UUID | None
+
+
+@dataclass(frozen=True)
+class TracedRelationship:
+    """A relationship reached by ``trace_relationships``; ``artifact`` is None when the far end is deleted."""
+
+    relationship: Relationship
+    artifact: TracedArtifact | None
 
 
 class RelationshipRepository:
@@ -94,3 +117,28 @@ class RelationshipRepository:
         project_id: uuid.UUID,
         suite_ids: list[uuid.UUID],
     ) -> list[uuid.UUID]: ...
+
+    @abstractmethod
+    async def trace_relationships(
+        self,
+        project_id: uuid.UUID,
+        artifact_id: uuid.UUID,
+        relationship_types: list[str],
+        *,
+        direction: Literal["outgoing", "incoming"],
+        max_hops: int,
+    ) -> list[TracedRelationship]:
+        """Relationships of ``relationship_types`` leaving (``outgoing``) or entering (``incoming``) every artifact
+        within ``max_hops`` of ``artifact_id`` along that direction, with their far-end artifacts, in one query.
+        Deleted far-end artifacts are returned as ends but not walked past.
+        """
+        ...
+
+
+class RelationshipGraphIndex(ABC):
+    """Per-project in-memory relationship graphs shared by traversal-heavy queries. Implemented in infrastructure."""
+
+    @abstractmethod
+    async def apply_event(self, event: RelationshipCreated | RelationshipDeleted) -> None:
+        """Apply a committed relationship change to the cached graph of its project (and signal other workers)."""
+        ...
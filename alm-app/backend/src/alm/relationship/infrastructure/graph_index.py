@@ -0,0 +1,341 @@
+"""Per-worker relationship graph index with cross-worker invalidation.
+
+Redis key:
+    relgraph:gen:{project_id}   per-project generation counter, bumped by every relationship event
+
+Each worker keeps the graphs of recently used projects, bounded by estimated bytes
+(``relationship_graph_max_bytes``, least recently used first) and dropped after
+``relationship_graph_idle_seconds`` without use. A graph is stamped with the generation read before loading it
+and reloaded when Redis reports another one. The worker that dispatches a relationship event applies it in place
+when its graph is exactly one generation behind, so a project's own worker rarely reloads. Graphs are never reused
+past ``relationship_graph_max_age_seconds``, which bounds staleness when a bump is lost (Redis unreachable).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Literal
+
+import redis.asyncio as redis
+import structlog
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from alm.config.settings import settings
+from alm.relationship.application.relationship_graph import ProjectRelationshipGraph
+from alm.relationship.domain.entities import Relationship
+from alm.relationship.domain.events import RelationshipCreated, RelationshipDeleted
+from alm.relationship.domain.ports import RelationshipGraphIndex, TracedRelationship
+from alm.relationship.infrastructure.graph_index_metrics import (
+    alm_relationship_graph_bytes,
+    alm_relationship_graph_deltas_total,
+    alm_relationship_graph_evictions_total,
+    alm_relationship_graph_load_seconds,
+    alm_relationship_graph_lookups_total,
+    alm_relationship_graph_projects,
+)
+from alm.relationship.infrastructure.models import RelationshipModel
+from alm.relationship.infrastructure.repositories import SqlAlchemyRelationshipRepository
+from alm.shared.infrastructure.cache import get_redis
+
+logger = structlog.get_logger()
+
+_LOAD_PAGE_SIZE = 5000
+
+
+@dataclass
+class _GraphEntry:
+    graph: ProjectRelationshipGraph
+    generation: int | None
+    loaded_at: float
+    last_used: float
+
+
+class LocalRelationshipGraphs:
+    """Project graphs held by one worker, LRU-bounded by estimated bytes; asyncio-only, no locking."""
+
+    def __init__(self, max_bytes: int, idle_seconds: float) -> None:
+        self._max_bytes = max(0, max_bytes)
+        self._idle_seconds = idle_seconds
+        self._data: OrderedDict[uuid.UUID, _GraphEntry] = OrderedDict()
+
+    def get(self, project_id: uuid.UUID) -> _GraphEntry | None:
+        """The project's entry, marked as used (idle entries of other projects are evicted first)."""
+        now = time.monotonic()
+        self._evict_idle(now)
+        entry = self._data.get(project_id)
+        if entry is not None:
+            entry.last_used = now
+            self._data.move_to_end(project_id)
+        return entry
+
+    def peek(self, project_id: uuid.UUID) -> _GraphEntry | None:
+        return self._data.get(project_id)
+
+    def put(self, project_id: uuid.UUID, entry: _GraphEntry) -> None:
+        self._data.pop(project_id, None)
+        if entry.graph.nbytes > self._max_bytes:
+            alm_relationship_graph_evictions_total.labels(reason="oversize").inc()
+            self.report()
+            return
+        self._data[project_id] = entry
+        self.report()
+
+    def discard(self, project_id: uuid.UUID) -> None:
+        if self._data.pop(project_id, None) is not None:
+            self.report()
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.report()
+
+    @property
+    def nbytes(self) -> int:
+        return sum(e.graph.nbytes for e in self._data.values())
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def report(self) -> None:
+        """Enforce the byte budget (after loads and in-place growth) and publish the gauges."""
+        total = self.nbytes
+        while total > self._max_bytes and self._data:
+            _, evicted = self._data.popitem(last=False)
+            total -= evicted.graph.nbytes
+            alm_relationship_graph_evictions_total.labels(reason="memory").inc()
+        alm_relationship_graph_projects.set(len(self._data))
+        alm_relationship_graph_bytes.set(total)
+
+    def _evict_idle(self, now: float) -> None:
+        idle = [pid for pid, e in self._data.items() if now - e.last_used >= self._idle_seconds]
+        for pid in idle:
+            del self._data[pid]
+            alm_relationship_graph_evictions_total.labels(reason="idle").inc()
+        if idle:
+            self.report()
+
+
+_local_relationship_graphs: LocalRelationshipGraphs | None = None
+
+
+def get_local_relationship_graphs() -> LocalRelationshipGraphs:
+    """Process-wide graph store (sized from settings on first use)."""
+    global _local_relationship_graphs
+    if _local_relationship_graphs is None:
+        _local_relationship_graphs = LocalRelationshipGraphs(
+            settings.relationship_graph_max_bytes,
+            settings.relationship_graph_idle_seconds,
+        )
+    return _local_relationship_graphs
+
+
+class RedisRelationshipGraphIndex(RelationshipGraphIndex):
+    """Worker-local graphs kept coherent across workers through a Redis generation per project."""
+
+    def __init__(
+        self,
+        r: redis.Redis | None = None,
+        local: LocalRelationshipGraphs | None = None,
+        max_age_seconds: float | None = None,
+    ) -> None:
+        self._redis = r or get_redis()
+        self._local = local if local is not None else get_local_relationship_graphs()
+        self._max_age = max_age_seconds if max_age_seconds is not None else settings.relationship_graph_max_age_seconds
+        self._load_locks: dict[uuid.UUID, asyncio.Lock] = {}
+
+    @staticmethod
+    def _generation_key(project_id: uuid.UUID) -> str:
+        return f"relgraph:gen:{project_id}"
+
+    async def _generation(self, project_id: uuid.UUID) -> int | None:
+        """Current generation (a missing counter starts at the clock so it never repeats); None if unreachable."""
+        gen_key = self._generation_key(project_id)
+        try:
+            raw = await self._redis.get(gen_key)
+            if raw is None:
+                await self._redis.set(gen_key, time.time_ns(), nx=True)
+                raw = await self._redis.get(gen_key)
+        except Exception as e:  # noqa: BLE001
+            logger.warning("relationship_graph_generation_unavailable", project_id=str(project_id), error=str(e))
+            return None
+        return int(raw)
+
+    def _fresh(self, entry: _GraphEntry, generation: int | None) -> bool:
+        if time.monotonic() - entry.loaded_at >= self._max_age:
+            return False
+        return generation is None or entry.generation == generation
+
+    async def graph_for(
+        self,
+        project_id: uuid.UUID,
+        load: Callable[[], Awaitable[ProjectRelationshipGraph]],
+    ) -> ProjectRelationshipGraph:
+        """The project's graph at the current generation; concurrent misses share one ``load``."""
+        generation = await self._generation(project_id)
+        entry = self._local.get(project_id)
+        if entry is not None and self._fresh(entry, generation):
+            alm_relationship_graph_lookups_total.labels(result="hit").inc()
+            return entry.graph
+        lock = self._load_locks.setdefault(project_id, asyncio.Lock())
+        async with lock:
+            entry = self._local.get(project_id)
+            if entry is not None and self._fresh(entry, generation):
+                alm_relationship_graph_lookups_total.labels(result="hit").inc()
+                return entry.graph
+            started = time.monotonic()
+            graph = await load()
+            now = time.monotonic()
+            alm_relationship_graph_load_seconds.observe(now - started)
+            alm_relationship_graph_lookups_total.labels(result="load").inc()
+            self._local.put(project_id, _GraphEntry(graph, generation, loaded_at=now, last_used=now))
+        if not lock.locked():
+            self._load_locks.pop(project_id, None)
+        return graph
+
+    async def apply_event(self, event: RelationshipCreated | RelationshipDeleted) -> None:
+        generation: int | None = None
+        gen_key = self._generation_key(event.project_id)
+        try:
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.set(gen_key, time.time_ns(), nx=True)
+                pipe.incr(gen_key)
+                _, generation = await pipe.execute()
+        except Exception as e:  # noqa: BLE001
+            alm_relationship_graph_deltas_total.labels(result="error").inc()
+            logger.warning("relationship_graph_bump_failed", project_id=str(event.project_id), error=str(e))
+        entry = self._local.peek(event.project_id)
+        if entry is None:
+            return
+        if generation is not None and entry.generation != generation - 1:
+            # Another worker changed the project since this graph was loaded: reload on next use.
+            self._local.discard(event.project_id)
+            alm_relationship_graph_deltas_total.labels(result="dropped").inc()
+            return
+        if isinstance(event, RelationshipCreated):
+            entry.graph.add_edge(
+                event.relationship_id,
+                event.source_artifact_id,
+                event.target_artifact_id,
+                event.relationship_type,
+            )
+        else:
+            entry.graph.remove_edge(event.relationship_id, event.source_artifact_id)
+        if generation is not None:
+            entry.generation = generation
+        alm_relationship_graph_deltas_total.labels(result="applied").inc()
+        self._local.report()
+
+
+class GraphIndexedRelationshipRepository(SqlAlchemyRelationshipRepository):
+    """Answers adjacency reads from the project's in-memory graph; everything else goes to the database.
+
+    The graph is resolved once per project per repository instance (one Redis round trip per query handler).
+    Relationships served from the graph carry no ``created_at`` / ``sort_order``.
+    """
+
+    def __init__(self, session: AsyncSession, index: RedisRelationshipGraphIndex) -> None:
+        super().__init__(session)
+        self._index = index
+        self._graphs: dict[uuid.UUID, ProjectRelationshipGraph] = {}
+
+    async def _graph(self, project_id: uuid.UUID) -> ProjectRelationshipGraph:
+        graph = self._graphs.get(project_id)
+        if graph is None:
+            graph = await self._index.graph_for(project_id, lambda: self._load_graph(project_id))
+            self._graphs[project_id] = graph
+        return graph
+
+    async def _load_graph(self, project_id: uuid.UUID) -> ProjectRelationshipGraph:
+        graph = ProjectRelationshipGraph(project_id)
+        q = (
+            select(
+                RelationshipModel.id,
+                RelationshipModel.source_artifact_id,
+                RelationshipModel.target_artifact_id,
+                RelationshipModel.relationship_type,
+            )
+            .where(RelationshipModel.project_id == project_id)
+            .order_by(RelationshipModel.created_at, RelationshipModel.id)
+        )
+        result = await self._session.stream(q.execution_options(yield_per=_LOAD_PAGE_SIZE))
+        try:
+            async for page in result.partitions(_LOAD_PAGE_SIZE):
+                graph.load_rows(tuple(row) for row in page)
+        finally:
+            await result.close()
+        graph.finish_load()
+        return graph
+
+    async def list_outgoing_relationships_from_artifacts(
+        self,
+        project_id: uuid.UUID,
+        source_artifact_ids: list[uuid.UUID],
+    ) -> list[Relationship]:
+        if not source_artifact_ids:
+            return []
+        return (await self._graph(project_id)).outgoing(source_artifact_ids)
+
+    async def list_suite_includes_tests_for_suites(
+        self,
+        project_id: uuid.UUID,
+        suite_ids: list[uuid.UUID],
+    ) -> list[Relationship]:
+        if not suite_ids:
+            return []
+        return (await self._graph(project_id)).outgoing(suite_ids, ("suite_includes_test",))
+
+    async def list_relationships_to_artifacts(
+        self,
+        project_id: uuid.UUID,
+        target_artifact_ids: list[uuid.UUID],
+        relationship_types: list[str],
+    ) -> list[Relationship]:
+        if not target_artifact_ids or not relationship_types:
+            return []
+        return (await self._graph(project_id)).incoming(target_artifact_ids, relationship_types)
+
+    async def list_run_ids_for_suite_targets(
+        self,
+        project_id: uuid.UUID,
+        suite_ids: list[uuid.UUID],
+    ) -> list[uuid.UUID]:
+        if not suite_ids:
+            return []
+        links = (await self._graph(project_id)).incoming(suite_ids, ("run_for_suite",))
+        return list(dict.fromkeys(rel.source_artifact_id for rel in links))
+
+    async def trace_relationships(
+        self,
+        project_id: uuid.UUID,
+        artifact_id: uuid.UUID,
+        relationship_types: list[str],
+        *,
+        direction: Literal["outgoing", "incoming"],
+        max_hops: int,
+    ) -> list[TracedRelationship]:
+        if not relationship_types:
+            return []
+        graph = await self._graph(project_id)
+        relationships = graph.within_hops(artifact_id, relationship_types, direction=direction, max_hops=max_hops)
+        far_ids = {
+            rel.target_artifact_id if direction == "outgoing" else rel.source_artifact_id for rel in relationships
+        }
+        artifacts = await self._traced_artifacts(project_id, list(far_ids))
+        # Like the SQL reach, do not walk past deleted artifacts; the pruned walk only reaches ids loaded above.
+        deleted = far_ids - artifacts.keys()
+        if deleted:
+            relationships = graph.within_hops(
+                artifact_id, relationship_types, direction=direction, max_hops=max_hops, stop_at=deleted
+            )
+        return [
+            TracedRelationship(
+                relationship=rel,
+                artifact=artifacts.get(rel.target_artifact_id if direction == "outgoing" else rel.source_artifact_id),
+            )
+            for rel in relationships
+        ]
@@ -0,0 +1,43 @@
+"""Prometheus metrics for the per-worker relationship graph index.
+
+Reload ratio: ``rate(alm_relationship_graph_lookups_total{result="load"}[5m])`` divided by
+``rate(alm_relationship_graph_lookups_total[5m])``.
+"""
+
+from __future__ import annotations
+
+from prometheus_client import Counter, Gauge, Histogram
+
+alm_relationship_graph_lookups_total = Counter(
+    "alm_relationship_graph_lookups_total",
+    "Project graph lookups by result (hit, load)",
+    ["result"],
+)
+
+alm_relationship_graph_deltas_total = Counter(
+    "alm_relationship_graph_deltas_total",
+    "Relationship events seen by the graph index (applied, dropped: graph discarded for reload, error)",
+    ["result"],
+)
+
+alm_relationship_graph_evictions_total = Counter(
+    "alm_relationship_graph_evictions_total",
+    "Project graphs evicted from this worker (reason: idle, memory, oversize)",
+    ["reason"],
+)
+
+alm_relationship_graph_projects = Gauge(
+    "alm_relationship_graph_projects",
+    "Project graphs currently held by this worker",
+)
+
+alm_relationship_graph_bytes = Gauge(
+    "alm_relationship_graph_bytes",
+    "Estimated memory held by this worker's project graphs",
+)
+
+alm_relationship_graph_load_seconds = Histogram(
+    "alm_relationship_graph_load_seconds",
+    "Time to load one project graph from the database",
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
@@ -3,15 +3,22 @@
 from __future__ import annotations
 
 import uuid
+from typing import Any, Literal
 
-from sqlalchemy import and_, func, or_, select, union_all, update
+from sqlalchemy import Uuid, and_, func, literal, or_, select, union_all, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import aliased
 
 from alm.artifact.infrastructure.models import ArtifactModel
 from alm.relationship.domain.entities import Relationship
-from alm.relationship.domain.ports import RelationshipRepository
+from alm.relationship.domain.ports import RelationshipRepository, TracedArtifact, TracedRelationship
 from alm.relationship.infrastructure.models import RelationshipModel
+from alm.shared.application.mediator import buffer_events
+
+
+def _traced_artifact_columns(art: Any) -> tuple[Any, ...]:
+    """Artifact columns in ``TracedArtifact`` field order."""
+    return (art.id, art.artifact_key, art.artifact_type, art.title, art.state, art.parent_id)
 
 
 class SqlAlchemyRelationshipRepository(RelationshipRepository):
@@ -60,6 +67,7 @@ class SqlAlchemyRelationshipRepository(RelationshipRepository):
         )
         self._session.add(model)
         await self._session.flush()
+        buffer_events(self._session, relationship.collect_events())
         return relationship
 
     async def delete(self, relationship_id: uuid.UUID) -> bool:
@@ -67,8 +75,11 @@ class SqlAlchemyRelationshipRepository(RelationshipRepository):
         model = result.scalar_one_or_none()
         if model is None:
             return False
+        relationship = self._to_entity(model)
+        relationship.mark_deleted()
         await self._session.delete(model)
         await self._session.flush()
+        buffer_events(self._session, relationship.collect_events())
         return True
 
     async def max_sort_order_for_outgoing(
@@ -269,6 +280,88 @@ class SqlAlchemyRelationshipRepository(RelationshipRepository):
         )
         return [row[0] for row in result.all()]
 
+    async def trace_relationships(
+        self,
+        project_id: uuid.UUID,
+        artifact_id: uuid.UUID,
+        relationship_types: list[str],
+        *,
+        direction: Literal["outgoing", "incoming"],
+        max_hops: int,
+    ) -> list[TracedRelationship]:
+        if not relationship_types:
+            return []
+        if direction == "outgoing":
+            near, far = RelationshipModel.source_artifact_id, RelationshipModel.target_artifact_id
+        else:
+            near, far = RelationshipModel.target_artifact_id, RelationshipModel.source_artifact_id
+        # UNION (not UNION ALL) keeps one row per (artifact, hops), so cycles cannot grow the CTE past the hop cap.
+        # Only live artifacts of the project join the reach: a deleted far end is listed but not walked past.
+        reach = select(
+            literal(artifact_id, Uuid).label("artifact_id"),
+            literal(0).label("hops"),
+        ).cte("impact_reach", recursive=True)
+        reach = reach.union(
+            select(far, reach.c.hops + 1)
+            .select_from(RelationshipModel)
+            .join(reach, near == reach.c.artifact_id)
+            .join(
+                ArtifactModel,
+                and_(
+                    ArtifactModel.id == far,
+                    ArtifactModel.project_id == project_id,
+                    ArtifactModel.deleted_at.is_(None),
+                ),
+            )
+            .where(
+                RelationshipModel.project_id == project_id,
+                RelationshipModel.relationship_type.in_(relationship_types),
+                reach.c.hops < max_hops,
+            )
+        )
+        far_art = aliased(ArtifactModel)
+        result = await self._session.execute(
+            select(RelationshipModel, *_traced_artifact_columns(far_art))
+            .outerjoin(
+                far_art,
+                and_(
+                    far_art.id == far,
+                    far_art.project_id == project_id,
+                    far_art.deleted_at.is_(None),
+                ),
+            )
+            .where(
+                RelationshipModel.project_id == project_id,
+                RelationshipModel.relationship_type.in_(relationship_types),
+                near.in_(select(reach.c.artifact_id)),
+            )
+            .order_by(RelationshipModel.created_at, RelationshipModel.id)
+        )
+        return [
+            TracedRelationship(
+                relationship=self._to_entity(row[0]),
+                artifact=TracedArtifact(*row[1:]) if row[1] is not None else None,
+            )
+            for row in result.all()
+        ]
+
+    async def _traced_artifacts(
+        self,
+        project_id: uuid.UUID,
+        artifact_ids: list[uuid.UUID],
+    ) -> dict[uuid.UUID, TracedArtifact]:
+        """Non-deleted artifacts of the project by id, as ``TracedArtifact`` views."""
+        if not artifact_ids:
+            return {}
+        result = await self._session.execute(
+            select(*_traced_artifact_columns(ArtifactModel)).where(
+                ArtifactModel.project_id == project_id,
+                ArtifactModel.id.in_(artifact_ids),
+                ArtifactModel.deleted_at.is_(None),
+            )
+        )
+        return {row[0]: TracedArtifact(*row) for row in result.all()}
+
     @staticmethod
     def _to_entity(model: RelationshipModel) -> Relationship:
         return Relationship(
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import time
 import uuid
 from collections.abc import Callable
 from typing import Any
@@ -15,7 +16,7 @@ from alm.shared.domain.events import DomainEvent
 logger = structlog.get_logger()
 
 # Domain events dispatch after DB commit. Buffered events are serialized into ``domain_event_outbox`` in the same
-# transaction as aggregates; rows are deleted after successful dispatch. Failures leave rows for the background worker.
+# transaction as aggregates; rows are deleted after successful dispatch. Failures hand rows to the background worker.
 
 HandlerFactory = Callable[[AsyncSession], CommandHandler[Any] | QueryHandler[Any]]
 
@@ -81,13 +82,15 @@ class Mediator:
         factory = _command_factories.get(type(command))
         if factory is None:
             raise ValueError(f"No handler registered for command {type(command).__name__}")
+        started = time.perf_counter()
         handler = factory(self._session)
         result = await handler.handle(command)
         await self._process_audit()
         if commit:
             await self._persist_outbox_if_buffered()
             await self._session.commit()
-            await self._dispatch_collected_events()
+            mode = await self._dispatch_collected_events()
+            _observe_command_duration(mode, time.perf_counter() - started)
         else:
             await self._session.flush()
         return result
@@ -116,12 +119,17 @@ class Mediator:
 
         await persist_buffered_domain_events(self._session)
 
-    async def _dispatch_collected_events(self) -> None:
+    async def _dispatch_collected_events(self) -> str:
+        """Dispatch committed events inline, or hand them to the background queue when it runs. Returns the mode."""
+        from alm.shared.infrastructure.async_event_dispatch import get_async_event_dispatch_queue
         from alm.shared.infrastructure.domain_event_outbox import (
             OUTBOX_ROW_IDS_SESSION_KEY,
             delete_synced_outbox_rows,
         )
+        from alm.shared.infrastructure.event_dispatch_metrics import alm_domain_event_dispatch_lag_seconds
 
+        queue = get_async_event_dispatch_queue()
+        mode = "async" if queue is not None else "inline"
         row_ids: list[uuid.UUID] = self._session.info.pop(OUTBOX_ROW_IDS_SESSION_KEY, [])
         events: list[DomainEvent] = self._session.info.pop(SESSION_EVENTS_KEY, [])
         self._session.info[SESSION_EVENTS_KEY] = []
@@ -132,6 +140,11 @@ class Mediator:
                 types=[type(e).__name__ for e in events],
             )
             if _domain_event_dispatcher is not None:
+                if queue is not None:
+                    if not queue.submit(events, row_ids):
+                        await self._release_outbox_rows(row_ids)
+                    return mode
+                dispatch_started = time.perf_counter()
                 try:
                     await _domain_event_dispatcher.dispatch(events)
                 except Exception:
@@ -140,8 +153,32 @@ class Mediator:
                         count=len(events),
                         types=[type(e).__name__ for e in events],
                     )
+                    await self._release_outbox_rows(row_ids)
                     raise
+                alm_domain_event_dispatch_lag_seconds.labels(mode="inline").observe(
+                    time.perf_counter() - dispatch_started
+                )
                 await delete_synced_outbox_rows(self._session, row_ids)
                 if row_ids:
                     # Mediator uses a request-scoped session that does not auto-commit after the handler; persist deletes.
                     await self._session.commit()
+        return mode
+
+    async def _release_outbox_rows(self, row_ids: list[uuid.UUID]) -> None:
+        """Best effort: let the outbox worker retry now; if this fails too the sync lease expires on its own."""
+        from alm.shared.infrastructure.domain_event_outbox import release_synced_outbox_rows
+
+        if not row_ids:
+            return
+        try:
+            await self._session.rollback()
+            await release_synced_outbox_rows(self._session, row_ids)
+            await self._session.commit()
+        except Exception:
+            logger.exception("domain_event_outbox_release_failed", count=len(row_ids))
+
+
+def _observe_command_duration(mode: str, seconds: float) -> None:
+    from alm.shared.infrastructure.event_dispatch_metrics import alm_command_duration_seconds
+
+    alm_command_duration_seconds.labels(mode=mode).observe(seconds)
@@ -12,9 +12,8 @@ from alm.shared.audit.api.schemas import (
     PropertyChangeSchema,
     SnapshotSchema,
 )
-from alm.shared.audit.dtos import EntityHistoryDTO
-from alm.shared.audit.queries import GetEntityHistory
-from alm.shared.domain.exceptions import EntityNotFound
+from alm.shared.audit.dtos import EntityHistoryDTO, SnapshotDTO
+from alm.shared.audit.queries import GetEntityHistory, GetSnapshotVersion
 
 router = APIRouter(prefix="/audit", tags=["audit"])
 
@@ -24,6 +23,7 @@ def _history_to_schema(history: EntityHistoryDTO) -> EntityHistorySchema:
         entity_type=history.entity_type,
         entity_id=history.entity_id,
         total_versions=history.total_versions,
+        next_before_version=history.next_before_version,
         entries=[
             ChangeSchema(
                 snapshot=SnapshotSchema(**e.snapshot.__dict__),
@@ -47,6 +47,8 @@ async def get_entity_history(
     entity_id: uuid.UUID,
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
+    before_version: int | None = Query(default=None, ge=1),
+    changes_only: bool = Query(default=False),
     mediator: Mediator = Depends(get_mediator),
 ) -> EntityHistorySchema:
     history: EntityHistoryDTO = await mediator.query(
@@ -55,6 +57,8 @@ async def get_entity_history(
             entity_id=entity_id,
             limit=limit,
             offset=offset,
+            before_version=before_version,
+            changes_only=changes_only,
         )
     )
     return _history_to_schema(history)
@@ -70,15 +74,7 @@ async def get_snapshot_version(
     version: int,
     mediator: Mediator = Depends(get_mediator),
 ) -> SnapshotSchema:
-    history: EntityHistoryDTO = await mediator.query(
-        GetEntityHistory(
-            entity_type=entity_type,
-            entity_id=entity_id,
-            limit=1,
-            offset=version - 1,
-        )
+    snapshot: SnapshotDTO = await mediator.query(
+        GetSnapshotVersion(entity_type=entity_type, entity_id=entity_id, version=version)
     )
-    if not history.entries:
-        raise EntityNotFound("AuditSnapshot", entity_id)
-
-    return SnapshotSchema(**history.entries[0].snapshot.__dict__)
+    return SnapshotSchema(**snapshot.__dict__)
@@ -37,3 +37,4 @@ class EntityHistorySchema(BaseModel):
     entity_id: uuid.UUID
     total_versions: int
     entries: list[ChangeSchema]
+    next_before_version: int | None = None
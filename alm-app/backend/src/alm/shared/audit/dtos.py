@@ -42,3 +42,4 @@ class EntityHistoryDTO:
     entity_id: uuid.UUID
     total_versions: int
     entries: list[ChangeDTO] = field(default_factory=list)
+    next_before_version: int | None = None
@@ -38,4 +38,7 @@ class AuditSnapshotModel(Base):
 
     commit: Mapped[AuditCommitModel] = relationship(AuditCommitModel, lazy="joined")
 
-    __table_args__ = (Index("ix_snapshot_entity_version", "entity_type", "entity_id", "version"),)
+    __table_args__ = (
+        Index("ix_snapshot_entity_version", "entity_type", "entity_id", "version"),
+        Index("ix_snapshot_global_id_version", "global_id", "version"),
+    )
@@ -34,6 +34,21 @@ class AuditReader(ABC):
         offset: int = 0,
     ) -> list[AuditSnapshot]: ...
 
+    @abstractmethod
+    async def get_history_page(
+        self,
+        entity_type: str,
+        entity_id: uuid.UUID,
+        *,
+        limit: int = 50,
+        before_version: int | None = None,
+        offset: int = 0,
+    ) -> list[tuple[AuditSnapshot, AuditCommit | None]]:
+        """Snapshots newest first with their commits in one query; ``before_version`` is an exclusive keyset cursor."""
+
+    @abstractmethod
+    async def count_versions(self, entity_type: str, entity_id: uuid.UUID) -> int: ...
+
     @abstractmethod
     async def get_snapshot_by_version(
         self,
@@ -7,14 +7,20 @@ from alm.shared.application.query import Query, QueryHandler
 from alm.shared.audit.core import DiffEngine
 from alm.shared.audit.dtos import ChangeDTO, EntityHistoryDTO, PropertyChangeDTO, SnapshotDTO
 from alm.shared.audit.ports import AuditReader
+from alm.shared.domain.exceptions import EntityNotFound
 
 
 @dataclass(frozen=True)
 class GetEntityHistory(Query):
+    """Versions newest first. ``before_version`` pages by keyset (pass the previous page's ``next_before_version``);
+    ``changes_only`` returns each version's stored ``changed_properties`` instead of full states and diffs."""
+
     entity_type: str
     entity_id: uuid.UUID
     limit: int = 50
     offset: int = 0
+    before_version: int | None = None
+    changes_only: bool = False
 
 
 class GetEntityHistoryHandler(QueryHandler[EntityHistoryDTO]):
@@ -23,16 +29,20 @@ class GetEntityHistoryHandler(QueryHandler[EntityHistoryDTO]):
 
     async def handle(self, query: Query) -> EntityHistoryDTO:
         assert isinstance(query, GetEntityHistory)
-        snapshots = await self._reader.get_snapshots(
+        # One extra (older) row: the baseline for the last entry's changes and the sign of a next page.
+        rows = await self._reader.get_history_page(
             query.entity_type,
             query.entity_id,
-            limit=query.limit,
+            limit=query.limit + 1,
+            before_version=query.before_version,
             offset=query.offset,
         )
+        page = rows[: query.limit]
+        total_versions = await self._reader.count_versions(query.entity_type, query.entity_id)
 
         entries: list[ChangeDTO] = []
-        for i, snap in enumerate(snapshots):
-            commit = await self._reader.get_commit(snap.commit_id)
+        for i, (snap, commit) in enumerate(page):
+            prev_state = rows[i + 1][0].state if i + 1 < len(rows) else None
             snap_dto = SnapshotDTO(
                 id=snap.id,
                 commit_id=snap.commit_id,
@@ -40,21 +50,58 @@ class GetEntityHistoryHandler(QueryHandler[EntityHistoryDTO]):
                 entity_type=snap.entity_type,
                 entity_id=snap.entity_id,
                 change_type=snap.change_type.value,
-                state=snap.state,
+                state={} if query.changes_only else snap.state,
                 changed_properties=snap.changed_properties,
                 version=snap.version,
                 committed_at=commit.committed_at if commit else None,
                 author_id=commit.author_id if commit else None,
             )
-
-            prev_state = snapshots[i + 1].state if i + 1 < len(snapshots) else None
-            prop_changes = DiffEngine.diff(prev_state, snap.state)
-            change_dtos = [PropertyChangeDTO(p.property_name, p.left, p.right) for p in prop_changes]
+            if query.changes_only:
+                change_dtos = [
+                    PropertyChangeDTO(name, prev_state.get(name) if prev_state else None, snap.state.get(name))
+                    for name in snap.changed_properties
+                ]
+            else:
+                prop_changes = DiffEngine.diff(prev_state, snap.state)
+                change_dtos = [PropertyChangeDTO(p.property_name, p.left, p.right) for p in prop_changes]
             entries.append(ChangeDTO(snapshot=snap_dto, changes=change_dtos))
 
         return EntityHistoryDTO(
             entity_type=query.entity_type,
             entity_id=query.entity_id,
-            total_versions=len(snapshots),
+            total_versions=total_versions,
             entries=entries,
+            next_before_version=page[-1][0].version if len(rows) > query.limit else None,
+        )
+
+
+@dataclass(frozen=True)
+class GetSnapshotVersion(Query):
+    entity_type: str
+    entity_id: uuid.UUID
+    version: int
+
+
+class GetSnapshotVersionHandler(QueryHandler[SnapshotDTO]):
+    def __init__(self, audit_reader: AuditReader) -> None:
+        self._reader = audit_reader
+
+    async def handle(self, query: Query) -> SnapshotDTO:
+        assert isinstance(query, GetSnapshotVersion)
+        snap = await self._reader.get_snapshot_by_version(query.entity_type, query.entity_id, query.version)
+        if snap is None:
+            raise EntityNotFound("AuditSnapshot", query.entity_id)
+        commit = await self._reader.get_commit(snap.commit_id)
+        return SnapshotDTO(
+            id=snap.id,
+            commit_id=snap.commit_id,
+            global_id=snap.global_id,
+            entity_type=snap.entity_type,
+            entity_id=snap.entity_id,
+            change_type=snap.change_type.value,
+            state=snap.state,
+            changed_properties=snap.changed_properties,
+            version=snap.version,
+            committed_at=commit.committed_at if commit else None,
+            author_id=commit.author_id if commit else None,
         )
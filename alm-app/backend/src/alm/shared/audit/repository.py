@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import uuid
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
 from alm.shared.audit.core import AuditCommit, AuditSnapshot, ChangeType
 from alm.shared.audit.models import AuditCommitModel, AuditSnapshotModel
@@ -77,6 +78,40 @@ class SqlAlchemyAuditReader(AuditReader):
         )
         return [_to_snapshot_domain(m) for m in result.scalars().all()]
 
+    async def get_history_page(
+        self,
+        entity_type: str,
+        entity_id: uuid.UUID,
+        *,
+        limit: int = 50,
+        before_version: int | None = None,
+        offset: int = 0,
+    ) -> list[tuple[AuditSnapshot, AuditCommit | None]]:
+        q = (
+            select(AuditSnapshotModel)
+            .options(joinedload(AuditSnapshotModel.commit, innerjoin=True))
+            .where(
+                AuditSnapshotModel.entity_type == entity_type,
+                AuditSnapshotModel.entity_id == entity_id,
+            )
+            .order_by(AuditSnapshotModel.version.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+        if before_version is not None:
+            q = q.where(AuditSnapshotModel.version < before_version)
+        result = await self._session.execute(q)
+        return [(_to_snapshot_domain(m), _to_commit_domain(m.commit)) for m in result.scalars().all()]
+
+    async def count_versions(self, entity_type: str, entity_id: uuid.UUID) -> int:
+        result = await self._session.execute(
+            select(func.count(AuditSnapshotModel.id)).where(
+                AuditSnapshotModel.entity_type == entity_type,
+                AuditSnapshotModel.entity_id == entity_id,
+            )
+        )
+        return int(result.scalar_one())
+
     async def get_snapshot_by_version(
         self,
         entity_type: str,
@@ -52,6 +52,13 @@ class IPermissionCache(ABC):
     async def invalidate_tenant(self, tenant_id: uuid.UUID) -> None: ...
 
 
+class ITenantLookupCache(ABC):
+    """Port for the org slug -> tenant lookup cache. Implemented in infrastructure."""
+
+    @abstractmethod
+    async def invalidate_tenant(self, tenant_id: uuid.UUID) -> None: ...
+
+
 class IManifestDefsFlattener(ABC):
     """Convert manifest defs to flat workflows, artifact_types, and relationship_types.
 
@@ -0,0 +1,164 @@
+"""Opt-in background dispatch of committed domain events (``domain_event_async_dispatch_enabled``).
+
+The mediator hands committed events and their outbox row ids to a bounded in-process queue and returns; worker
+tasks run the handlers and delete the rows. The outbox rows stay the source of truth: on overflow or handler
+failure they are released to the outbox worker at once, and if the process dies their sync lease lapses.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+import structlog
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from alm.config.settings import settings
+from alm.shared.domain.event_dispatcher import IDomainEventDispatcher
+from alm.shared.domain.events import DomainEvent
+from alm.shared.infrastructure.domain_event_outbox import delete_synced_outbox_rows, release_synced_outbox_rows
+from alm.shared.infrastructure.event_dispatch_metrics import (
+    alm_domain_event_dispatch_handoffs_total,
+    alm_domain_event_dispatch_lag_seconds,
+    alm_domain_event_dispatch_queue_depth,
+)
+
+logger = structlog.get_logger()
+
+_RowAction = Callable[[AsyncSession, list[uuid.UUID]], Awaitable[None]]
+
+
+@dataclass(frozen=True, slots=True)
+class _CommittedEvents:
+    events: list[DomainEvent]
+    row_ids: list[uuid.UUID]
+    committed_at: float
+
+
+class AsyncEventDispatchQueue:
+    """Bounded queue of committed event batches drained by ``workers`` tasks.
+
+    Each batch is dispatched as a unit, like the inline path. A batch older than the outbox sync lease is skipped:
+    the outbox worker may already have claimed its rows.
+    """
+
+    def __init__(
+        self,
+        dispatcher: IDomainEventDispatcher,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        maxsize: int,
+        workers: int,
+        lease_seconds: float,
+    ) -> None:
+        self._dispatcher = dispatcher
+        self._session_factory = session_factory
+        self._queue: asyncio.Queue[_CommittedEvents] = asyncio.Queue(maxsize=max(1, maxsize))
+        self._workers = max(1, workers)
+        self._lease_seconds = lease_seconds
+
+    def submit(self, events: list[DomainEvent], row_ids: list[uuid.UUID]) -> bool:
+        """Enqueue without waiting. False when the queue is full (the caller hands the rows to the outbox)."""
+        try:
+            self._queue.put_nowait(_CommittedEvents(events, row_ids, time.monotonic()))
+        except asyncio.QueueFull:
+            alm_domain_event_dispatch_handoffs_total.labels(result="overflow").inc()
+            return False
+        alm_domain_event_dispatch_handoffs_total.labels(result="accepted").inc()
+        alm_domain_event_dispatch_queue_depth.set(self._queue.qsize())
+        return True
+
+    async def run(self) -> None:
+        await asyncio.gather(*(self._worker() for _ in range(self._workers)))
+
+    async def drain(self, timeout_seconds: float) -> None:
+        """Wait (bounded) for queued batches to finish; anything left is recovered by the outbox worker."""
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=timeout_seconds)
+        except TimeoutError:
+            logger.warning("domain_event_async_dispatch_drain_timeout", pending=self._queue.qsize())
+
+    async def _worker(self) -> None:
+        while True:
+            item = await self._queue.get()
+            alm_domain_event_dispatch_queue_depth.set(self._queue.qsize())
+            try:
+                await self._process(item)
+            except Exception:
+                logger.exception("domain_event_async_dispatch_worker_error", count=len(item.events))
+            finally:
+                self._queue.task_done()
+
+    async def _process(self, item: _CommittedEvents) -> None:
+        if time.monotonic() - item.committed_at >= self._lease_seconds:
+            alm_domain_event_dispatch_handoffs_total.labels(result="expired").inc()
+            logger.warning("domain_event_async_dispatch_expired", count=len(item.events))
+            return
+        try:
+            await self._dispatcher.dispatch(item.events)
+        except Exception:
+            logger.exception(
+                "domain_events_async_dispatch_failed",
+                count=len(item.events),
+                types=[type(e).__name__ for e in item.events],
+            )
+            alm_domain_event_dispatch_handoffs_total.labels(result="failed").inc()
+            await self._finish(item.row_ids, release_synced_outbox_rows)
+            return
+        alm_domain_event_dispatch_lag_seconds.labels(mode="async").observe(time.monotonic() - item.committed_at)
+        alm_domain_event_dispatch_handoffs_total.labels(result="dispatched").inc()
+        await self._finish(item.row_ids, delete_synced_outbox_rows)
+
+    async def _finish(self, row_ids: list[uuid.UUID], apply: _RowAction) -> None:
+        if not row_ids:
+            return
+        async with self._session_factory() as session:
+            await apply(session, row_ids)
+            await session.commit()
+
+
+_queue: AsyncEventDispatchQueue | None = None
+
+
+def get_async_event_dispatch_queue() -> AsyncEventDispatchQueue | None:
+    """The running queue, or None when async dispatch is disabled or not started (dispatch inline)."""
+    return _queue
+
+
+def start_async_event_dispatch(
+    dispatcher: IDomainEventDispatcher | None,
+    session_factory: async_sessionmaker[AsyncSession],
+) -> asyncio.Task[None] | None:
+    """Create the process-wide queue and its workers when ``domain_event_async_dispatch_enabled`` is set."""
+    global _queue
+    if not settings.domain_event_async_dispatch_enabled or dispatcher is None:
+        return None
+    _queue = AsyncEventDispatchQueue(
+        dispatcher,
+        session_factory,
+        maxsize=settings.domain_event_async_dispatch_queue_size,
+        workers=settings.domain_event_async_dispatch_workers,
+        lease_seconds=settings.domain_event_outbox_sync_lease_seconds,
+    )
+    logger.info(
+        "domain_event_async_dispatch_started",
+        queue_size=settings.domain_event_async_dispatch_queue_size,
+        workers=settings.domain_event_async_dispatch_workers,
+    )
+    return asyncio.create_task(_queue.run())
+
+
+async def stop_async_event_dispatch(task: asyncio.Task[None] | None, timeout_seconds: float = 10.0) -> None:
+    """Stop accepting batches, let queued ones finish (bounded), then cancel the workers."""
+    global _queue
+    queue, _queue = _queue, None
+    if queue is not None:
+        await queue.drain(timeout_seconds)
+    if task is not None:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
@@ -1,15 +1,30 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import time
 import uuid
-from typing import cast
+from collections import OrderedDict
+from typing import Any, cast
 
 import redis.asyncio as redis
+import structlog
 
 from alm.config.settings import settings
-from alm.shared.domain.ports import IPermissionCache
+from alm.shared.domain.ports import IPermissionCache, ITenantLookupCache
+from alm.shared.infrastructure.permission_cache_metrics import (
+    alm_permission_cache_invalidations_total,
+    alm_permission_cache_l1_entries,
+    record_lookup,
+)
+from alm.tenant.application.dtos import TenantDTO
+
+logger = structlog.get_logger()
+
+PERMISSION_INVALIDATION_CHANNEL = "alm:perm:invalidate"
 
 _pool: redis.ConnectionPool | None = None
+_binary_pool: redis.ConnectionPool | None = None
 
 
 def _get_pool() -> redis.ConnectionPool:
@@ -23,6 +38,14 @@ def get_redis() -> redis.Redis:
     return redis.Redis(connection_pool=_get_pool())
 
 
+def get_binary_redis() -> redis.Redis:
+    """Client whose replies are raw bytes (for compressed payloads)."""
+    global _binary_pool
+    if _binary_pool is None:
+        _binary_pool = redis.ConnectionPool.from_url(settings.redis_url)
+    return redis.Redis(connection_pool=_binary_pool)
+
+
 class PermissionCache(IPermissionCache):
     """Redis-backed cache for user permission resolution.
 
@@ -67,3 +90,249 @@ class PermissionCache(IPermissionCache):
                 await self._redis.delete(*keys)
             if cursor == 0:
                 break
+
+
+class LocalPermissionCache:
+    """In-process TTL + LRU cache of privilege codes (L1). One per worker; asyncio-only, no locking.
+
+    The short TTL bounds staleness if an invalidation broadcast is missed (e.g. during a Redis reconnect).
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self._max_entries = max(1, max_entries)
+        self._ttl = ttl_seconds
+        self._data: OrderedDict[tuple[uuid.UUID, uuid.UUID], tuple[float, tuple[str, ...]]] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl > 0
+
+    def get(self, tenant_id: uuid.UUID, user_id: uuid.UUID) -> list[str] | None:
+        if not self.enabled:
+            return None
+        key = (tenant_id, user_id)
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, codes = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self._report_size()
+            return None
+        self._data.move_to_end(key)
+        return list(codes)
+
+    def set(self, tenant_id: uuid.UUID, user_id: uuid.UUID, codes: list[str]) -> None:
+        if not self.enabled:
+            return
+        key = (tenant_id, user_id)
+        self._data[key] = (time.monotonic() + self._ttl, tuple(codes))
+        self._data.move_to_end(key)
+        while len(self._data) > self._max_entries:
+            self._data.popitem(last=False)
+        self._report_size()
+
+    def evict_user(self, tenant_id: uuid.UUID, user_id: uuid.UUID) -> None:
+        self._data.pop((tenant_id, user_id), None)
+        self._report_size()
+
+    def evict_tenant(self, tenant_id: uuid.UUID) -> None:
+        for key in [k for k in self._data if k[0] == tenant_id]:
+            del self._data[key]
+        self._report_size()
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._report_size()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _report_size(self) -> None:
+        alm_permission_cache_l1_entries.set(len(self._data))
+
+
+_local_permission_cache: LocalPermissionCache | None = None
+
+
+def get_local_permission_cache() -> LocalPermissionCache:
+    """Process-wide L1 (sized from settings on first use)."""
+    global _local_permission_cache
+    if _local_permission_cache is None:
+        _local_permission_cache = LocalPermissionCache(
+            settings.permission_cache_l1_max_entries,
+            settings.permission_cache_l1_ttl_seconds,
+        )
+    return _local_permission_cache
+
+
+class LocalTenantSlugCache:
+    """In-process TTL + LRU cache of org slug -> ``TenantDTO`` for ``resolve_org``. One per worker.
+
+    Only successful lookups are cached. Tenant update/archive evict by tenant id through ``TenantLookupCache``.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self._max_entries = max(1, max_entries)
+        self._ttl = ttl_seconds
+        self._data: OrderedDict[str, tuple[float, TenantDTO]] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl > 0
+
+    def get(self, slug: str) -> TenantDTO | None:
+        if not self.enabled:
+            return None
+        entry = self._data.get(slug)
+        if entry is None:
+            return None
+        expires_at, dto = entry
+        if expires_at <= time.monotonic():
+            del self._data[slug]
+            return None
+        self._data.move_to_end(slug)
+        return dto
+
+    def set(self, slug: str, dto: TenantDTO) -> None:
+        if not self.enabled:
+            return
+        self._data[slug] = (time.monotonic() + self._ttl, dto)
+        self._data.move_to_end(slug)
+        while len(self._data) > self._max_entries:
+            self._data.popitem(last=False)
+
+    def evict_tenant(self, tenant_id: uuid.UUID) -> None:
+        for slug in [k for k, (_, dto) in self._data.items() if dto.id == tenant_id]:
+            del self._data[slug]
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+_tenant_slug_cache: LocalTenantSlugCache | None = None
+
+
+def get_tenant_slug_cache() -> LocalTenantSlugCache:
+    """Process-wide slug -> tenant cache (sized from settings on first use)."""
+    global _tenant_slug_cache
+    if _tenant_slug_cache is None:
+        _tenant_slug_cache = LocalTenantSlugCache(
+            settings.tenant_slug_cache_max_entries,
+            settings.tenant_slug_cache_ttl_seconds,
+        )
+    return _tenant_slug_cache
+
+
+def _apply_invalidation(payload: dict[str, Any], *, source: str, local: LocalPermissionCache | None = None) -> None:
+    tenant_id = uuid.UUID(str(payload["tenant_id"]))
+    if payload.get("scope") == "org":
+        get_tenant_slug_cache().evict_tenant(tenant_id)
+        alm_permission_cache_invalidations_total.labels(scope="org", source=source).inc()
+        return
+    if local is None:
+        local = get_local_permission_cache()
+    user_id = payload.get("user_id")
+    if user_id:
+        local.evict_user(tenant_id, uuid.UUID(str(user_id)))
+        alm_permission_cache_invalidations_total.labels(scope="user", source=source).inc()
+    else:
+        local.evict_tenant(tenant_id)
+        alm_permission_cache_invalidations_total.labels(scope="tenant", source=source).inc()
+
+
+class TwoTierPermissionCache(IPermissionCache):
+    """Permission cache used by request paths and role commands: in-process L1 over the Redis ``PermissionCache``.
+
+    Invalidations drop the local L1 entry, delete the Redis key(s) and publish on
+    ``PERMISSION_INVALIDATION_CHANNEL`` so every other worker evicts its L1 as well
+    (see ``run_permission_invalidation_subscriber``).
+    """
+
+    def __init__(self, l2: IPermissionCache | None = None, l1: LocalPermissionCache | None = None) -> None:
+        self._l1 = l1 if l1 is not None else get_local_permission_cache()
+        self._l2 = l2 or PermissionCache()
+
+    async def get(self, tenant_id: uuid.UUID, user_id: uuid.UUID) -> list[str] | None:
+        if self._l1.enabled:
+            codes = self._l1.get(tenant_id, user_id)
+            record_lookup("l1", codes is not None)
+            if codes is not None:
+                return codes
+        codes = await self._l2.get(tenant_id, user_id)
+        record_lookup("l2", codes is not None)
+        if codes is not None:
+            self._l1.set(tenant_id, user_id, codes)
+        return codes
+
+    async def set(self, tenant_id: uuid.UUID, user_id: uuid.UUID, codes: list[str]) -> None:
+        self._l1.set(tenant_id, user_id, codes)
+        await self._l2.set(tenant_id, user_id, codes)
+
+    async def invalidate_user(self, tenant_id: uuid.UUID, user_id: uuid.UUID) -> None:
+        payload = {"tenant_id": str(tenant_id), "user_id": str(user_id)}
+        _apply_invalidation(payload, source="local", local=self._l1)
+        await self._l2.invalidate_user(tenant_id, user_id)
+        await self._broadcast(payload)
+
+    async def invalidate_tenant(self, tenant_id: uuid.UUID) -> None:
+        payload = {"tenant_id": str(tenant_id), "user_id": None}
+        _apply_invalidation(payload, source="local", local=self._l1)
+        await self._l2.invalidate_tenant(tenant_id)
+        await self._broadcast(payload)
+
+    async def _broadcast(self, payload: dict[str, Any]) -> None:
+        try:
+            await get_redis().publish(PERMISSION_INVALIDATION_CHANNEL, json.dumps(payload))
+        except Exception as e:  # noqa: BLE001
+            logger.warning("permission_invalidation_publish_failed", error=str(e), **payload)
+
+
+class TenantLookupCache(ITenantLookupCache):
+    """Evicts a tenant from the slug cache on this worker and, via ``PERMISSION_INVALIDATION_CHANNEL``, on all others."""
+
+    async def invalidate_tenant(self, tenant_id: uuid.UUID) -> None:
+        payload = {"tenant_id": str(tenant_id), "scope": "org"}
+        _apply_invalidation(payload, source="local")
+        try:
+            await get_redis().publish(PERMISSION_INVALIDATION_CHANNEL, json.dumps(payload))
+        except Exception as e:  # noqa: BLE001
+            logger.warning("tenant_lookup_invalidation_publish_failed", error=str(e), **payload)
+
+
+async def run_permission_invalidation_subscriber(reconnect_delay_seconds: float = 1.0) -> None:
+    """Evict this worker's L1 (and slug cache) entries on invalidations published by any worker.
+
+    Both are cleared whenever the subscription (re)starts, because broadcasts may have been missed
+    while it was down.
+    """
+    while True:
+        pubsub = get_redis().pubsub()
+        try:
+            await pubsub.subscribe(PERMISSION_INVALIDATION_CHANNEL)
+            get_local_permission_cache().clear()
+            get_tenant_slug_cache().clear()
+            alm_permission_cache_invalidations_total.labels(scope="all", source="resubscribe").inc()
+            logger.info("permission_invalidation_subscriber_started", channel=PERMISSION_INVALIDATION_CHANNEL)
+            while True:
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                if message is None or message.get("type") != "message":
+                    continue
+                try:
+                    _apply_invalidation(json.loads(message["data"]), source="broadcast")
+                except (KeyError, TypeError, ValueError):
+                    logger.warning("permission_invalidation_message_invalid", data=str(message.get("data"))[:200])
+        except asyncio.CancelledError:
+            logger.info("permission_invalidation_subscriber_stopped")
+            raise
+        except Exception as e:  # noqa: BLE001
+            logger.warning("permission_invalidation_subscriber_error", error=str(e))
+            await asyncio.sleep(reconnect_delay_seconds)
+        finally:
+            try:
+                await pubsub.aclose()
+            except Exception:  # noqa: BLE001
+                logger.debug("permission_invalidation_pubsub_close_failed")
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import importlib
 import uuid
 from dataclasses import asdict, fields, is_dataclass
@@ -11,7 +12,7 @@ from types import UnionType
 from typing import Any, Union, get_args, get_origin, get_type_hints
 
 import structlog
-from sqlalchemy import DateTime, Integer, String, Text, Uuid, delete, func, text, update
+from sqlalchemy import DateTime, Integer, String, Text, Uuid, delete, func, insert, text, update
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import Mapped, mapped_column
@@ -24,6 +25,7 @@ from alm.shared.infrastructure.outbox_metrics import (
     alm_domain_event_outbox_dispatched_total,
     alm_domain_event_outbox_exhausted_rows,
     alm_domain_event_outbox_pending_rows,
+    alm_domain_event_outbox_released_total,
     alm_domain_event_outbox_retry_scheduled_total,
     alm_domain_event_outbox_sync_cleared_total,
 )
@@ -38,7 +40,10 @@ OUTBOX_ROW_IDS_SESSION_KEY = "_domain_event_outbox_row_ids"
 
 _ALLOWED_EVENT_TYPE_PREFIX = "alm."
 
-_CLAIM_NEXT_SQL = """
+# Workers LISTEN here; NOTIFY is sent whenever rows become claimable right away (see ``notify_outbox_worker``).
+OUTBOX_NOTIFY_CHANNEL = "alm_domain_event_outbox"
+
+_CLAIM_BATCH_SQL = """
 WITH cte AS (
   SELECT id FROM domain_event_outbox
   WHERE attempts < :max_attempts
@@ -46,7 +51,7 @@ WITH cte AS (
     AND (locked_until IS NULL OR locked_until < NOW())
   ORDER BY created_at ASC
   FOR UPDATE SKIP LOCKED
-  LIMIT 1
+  LIMIT :batch_size
 )
 UPDATE domain_event_outbox AS o
 SET locked_until = :lease_until
@@ -63,6 +68,9 @@ RETURNING
   o.locked_until
 """
 
+# Payload fields identifying the aggregate whose events must be dispatched in order (first match wins).
+_AGGREGATE_KEY_FIELDS = ("artifact_id", "project_id", "tenant_id")
+
 
 class DomainEventOutboxModel(Base):
     """Stores serialized domain events until handlers succeed (same transaction as aggregates on insert)."""
@@ -165,28 +173,48 @@ def import_event_class(fqcn: str) -> type[DomainEvent]:
     return cls
 
 
+async def notify_outbox_worker(session: AsyncSession) -> None:
+    """Queue a NOTIFY on ``OUTBOX_NOTIFY_CHANNEL``; PostgreSQL delivers it to listening workers on commit."""
+    await session.execute(text("SELECT pg_notify(:channel, '')"), {"channel": OUTBOX_NOTIFY_CHANNEL})
+
+
 async def persist_buffered_domain_events(session: AsyncSession) -> None:
-    """Insert one outbox row per buffered session event (same transaction as upcoming commit)."""
-    from alm.shared.application.mediator import SESSION_EVENTS_KEY
+    """Insert one outbox row per buffered session event (same transaction as upcoming commit).
+
+    All rows go out as a single executemany so batch commands do not pay one INSERT per event.
+    When the request path will dispatch them after commit, the rows carry a short lease so the worker does
+    not dispatch them concurrently; otherwise the worker is notified straight away.
+    """
+    from alm.shared.application.mediator import SESSION_EVENTS_KEY, get_domain_event_dispatcher
 
     events: list[DomainEvent] = session.info.get(SESSION_EVENTS_KEY) or []
     if not events:
         session.info.pop(OUTBOX_ROW_IDS_SESSION_KEY, None)
         return
 
-    row_ids: list[uuid.UUID] = []
+    dispatch_in_request = get_domain_event_dispatcher() is not None
+    locked_until = (
+        datetime.now(UTC) + timedelta(seconds=settings.domain_event_outbox_sync_lease_seconds)
+        if dispatch_in_request
+        else None
+    )
+    rows: list[dict[str, Any]] = []
     for event in events:
         packed = domain_event_to_payload(event)
-        row = DomainEventOutboxModel(
-            id=uuid.uuid4(),
-            event_type=packed["event_type"],
-            payload=packed,
+        rows.append(
+            {
+                "id": uuid.uuid4(),
+                "event_type": packed["event_type"],
+                "payload": packed,
+                "locked_until": locked_until,
+            }
         )
-        session.add(row)
-        row_ids.append(row.id)
 
-    session.info[OUTBOX_ROW_IDS_SESSION_KEY] = row_ids
     await session.flush()
+    await session.execute(insert(DomainEventOutboxModel), rows)
+    if not dispatch_in_request:
+        await notify_outbox_worker(session)
+    session.info[OUTBOX_ROW_IDS_SESSION_KEY] = [r["id"] for r in rows]
 
 
 async def delete_synced_outbox_rows(session: AsyncSession, row_ids: list[uuid.UUID]) -> None:
@@ -196,53 +224,82 @@ async def delete_synced_outbox_rows(session: AsyncSession, row_ids: list[uuid.UU
     alm_domain_event_outbox_sync_cleared_total.inc(len(row_ids))
 
 
+async def release_synced_outbox_rows(session: AsyncSession, row_ids: list[uuid.UUID]) -> None:
+    """Hand rows whose post-commit dispatch failed to the worker now instead of after the sync lease."""
+    if not row_ids:
+        return
+    await session.execute(
+        update(DomainEventOutboxModel).where(DomainEventOutboxModel.id.in_(row_ids)).values(locked_until=None)
+    )
+    await notify_outbox_worker(session)
+
+
 def _retry_delay_seconds(attempts: int) -> float:
     capped = min(attempts, 12)
     return min(3600.0, 5.0 * (2**capped))
 
 
-async def claim_next_outbox_row(
+async def claim_outbox_rows(
     session_factory: async_sessionmaker[AsyncSession],
-) -> dict[str, Any] | None:
-    """Atomically lock one eligible row for dispatch (PostgreSQL FOR UPDATE SKIP LOCKED)."""
+    limit: int,
+) -> list[dict[str, Any]]:
+    """Atomically lease up to ``limit`` eligible rows in one statement (FOR UPDATE SKIP LOCKED), oldest first."""
     lease_until = datetime.now(UTC) + timedelta(seconds=settings.domain_event_outbox_lease_seconds)
     max_attempts = settings.domain_event_outbox_max_attempts
     async with session_factory() as session, session.begin():
         result = await session.execute(
-            text(_CLAIM_NEXT_SQL),
-            {"lease_until": lease_until, "max_attempts": max_attempts},
+            text(_CLAIM_BATCH_SQL),
+            {"lease_until": lease_until, "max_attempts": max_attempts, "batch_size": max(1, limit)},
         )
-        row = result.mappings().first()
-    return dict(row) if row else None
+        rows = [dict(row) for row in result.mappings().all()]
+    # UPDATE ... RETURNING does not keep the CTE order.
+    rows.sort(key=lambda row: row["created_at"])
+    return rows
 
 
-async def _delete_outbox_row(session_factory: async_sessionmaker[AsyncSession], row_id: uuid.UUID) -> None:
-    async with session_factory() as session:
-        await session.execute(delete(DomainEventOutboxModel).where(DomainEventOutboxModel.id == row_id))
-        await session.commit()
+def _aggregate_key(row: dict[str, Any]) -> str:
+    raw_fields = (row.get("payload") or {}).get("fields") or {}
+    for name in _AGGREGATE_KEY_FIELDS:
+        value = raw_fields.get(name)
+        if value:
+            return f"{name}:{value}"
+    return f"row:{row['id']}"
 
 
-async def _mark_outbox_dispatch_failed(
+async def _complete_outbox_batch(
     session_factory: async_sessionmaker[AsyncSession],
-    row: dict[str, Any],
-    exc: Exception,
+    succeeded: list[uuid.UUID],
+    failed: list[tuple[dict[str, Any], Exception, list[uuid.UUID]]],
 ) -> None:
-    attempts_before = int(row["attempts"])
-    new_attempts = attempts_before + 1
-    delay = _retry_delay_seconds(new_attempts)
-    next_at = datetime.now(UTC) + timedelta(seconds=delay)
-    async with session_factory() as session:
-        await session.execute(
-            update(DomainEventOutboxModel)
-            .where(DomainEventOutboxModel.id == row["id"])
-            .values(
-                locked_until=None,
-                attempts=new_attempts,
-                last_error=repr(exc)[:4000],
-                next_attempt_at=next_at,
-            )
-        )
-        await session.commit()
+    """Delete successes in one statement, schedule retries and release skipped rows, all in one transaction.
+
+    Each failure carries the later rows of its aggregate that were skipped; they are released with the failed
+    row's ``next_attempt_at`` so the claim (oldest first) cannot hand them out before the failed row.
+    """
+    now = datetime.now(UTC)
+    async with session_factory() as session, session.begin():
+        if succeeded:
+            await session.execute(delete(DomainEventOutboxModel).where(DomainEventOutboxModel.id.in_(succeeded)))
+        if failed:
+            retries: list[dict[str, Any]] = []
+            held_back: list[dict[str, Any]] = []
+            for row, exc, skipped in failed:
+                next_attempt_at = now + timedelta(seconds=_retry_delay_seconds(int(row["attempts"]) + 1))
+                retries.append(
+                    {
+                        "id": row["id"],
+                        "locked_until": None,
+                        "attempts": int(row["attempts"]) + 1,
+                        "last_error": repr(exc)[:4000],
+                        "next_attempt_at": next_attempt_at,
+                    }
+                )
+                held_back.extend(
+                    {"id": row_id, "locked_until": None, "next_attempt_at": next_attempt_at} for row_id in skipped
+                )
+            await session.execute(update(DomainEventOutboxModel), retries)
+            if held_back:
+                await session.execute(update(DomainEventOutboxModel), held_back)
 
 
 async def refresh_outbox_prometheus_gauges(session_factory: async_sessionmaker[AsyncSession]) -> None:
@@ -295,65 +352,136 @@ async def requeue_exhausted_outbox_rows(
 
 
 async def process_pending_outbox_batch(session_factory: async_sessionmaker[AsyncSession]) -> int:
-    """Dispatch up to batch_size pending rows using one row claim per iteration. Returns rows attempted."""
+    """Claim up to batch_size rows in one statement and dispatch them. Returns rows claimed.
+
+    Rows are grouped by aggregate (``_AGGREGATE_KEY_FIELDS``). Groups run concurrently, at most
+    ``domain_event_outbox_dispatch_concurrency`` at a time; within a group events go out in ``created_at`` order
+    and the first failure stops the group, holding its remaining rows back until the failed row's retry.
+    """
     from alm.shared.application.mediator import get_domain_event_dispatcher
 
-    processed = 0
-    try:
-        dispatcher = get_domain_event_dispatcher()
-        if dispatcher is None:
-            return 0
+    dispatcher = get_domain_event_dispatcher()
+    if dispatcher is None:
+        return 0
 
-        batch_size = settings.domain_event_outbox_batch_size
+    rows = await claim_outbox_rows(session_factory, settings.domain_event_outbox_batch_size)
+    if not rows:
+        return 0
 
-        for _ in range(batch_size):
-            row = await claim_next_outbox_row(session_factory)
-            if row is None:
-                break
+    groups: dict[str, list[dict[str, Any]]] = {}
+    for row in rows:
+        groups.setdefault(_aggregate_key(row), []).append(row)
+
+    semaphore = asyncio.Semaphore(max(1, settings.domain_event_outbox_dispatch_concurrency))
+    succeeded: list[uuid.UUID] = []
+    failed: list[tuple[dict[str, Any], Exception, list[uuid.UUID]]] = []
+
+    async def dispatch_group(group: list[dict[str, Any]]) -> None:
+        async with semaphore:
+            for index, row in enumerate(group):
+                try:
+                    event = payload_to_domain_event(row["payload"])
+                    await dispatcher.dispatch([event])
+                except Exception as exc:
+                    logger.exception(
+                        "domain_event_outbox_dispatch_failed",
+                        outbox_id=str(row["id"]),
+                        event_type=str(row["event_type"]),
+                        attempts_before=row["attempts"],
+                    )
+                    failed.append((row, exc, [uuid.UUID(str(r["id"])) for r in group[index + 1 :]]))
+                    return
+                succeeded.append(uuid.UUID(str(row["id"])))
+
+    await asyncio.gather(*(dispatch_group(group) for group in groups.values()))
+    await _complete_outbox_batch(session_factory, succeeded, failed)
+    released = sum(len(skipped) for _, _, skipped in failed)
+
+    alm_domain_event_outbox_dispatched_total.inc(len(succeeded))
+    alm_domain_event_outbox_retry_scheduled_total.inc(len(failed))
+    alm_domain_event_outbox_released_total.inc(released)
+    logger.info(
+        "domain_event_outbox_batch_dispatched",
+        claimed=len(rows),
+        dispatched=len(succeeded),
+        failed=len(failed),
+        released=released,
+    )
+    return len(rows)
+
+
+async def _refresh_outbox_gauges_periodically(session_factory: async_sessionmaker[AsyncSession]) -> None:
+    interval = max(1.0, settings.domain_event_outbox_gauge_refresh_seconds)
+    while True:
+        try:
+            await refresh_outbox_prometheus_gauges(session_factory)
+        except Exception:
+            logger.exception("domain_event_outbox_gauge_refresh_failed")
+        await asyncio.sleep(interval)
 
-            processed += 1
-            oid = uuid.UUID(str(row["id"]))
-            et = str(row["event_type"])
 
-            try:
-                event = payload_to_domain_event(row["payload"])
-                await dispatcher.dispatch([event])
-            except Exception as exc:
-                logger.exception(
-                    "domain_event_outbox_dispatch_failed",
-                    outbox_id=str(oid),
-                    event_type=et,
-                    attempts_before=row["attempts"],
-                )
-                await _mark_outbox_dispatch_failed(session_factory, row, exc)
-                alm_domain_event_outbox_retry_scheduled_total.inc()
-                continue
+async def _listen_for_outbox_notifications(
+    session_factory: async_sessionmaker[AsyncSession],
+    wakeup: asyncio.Event,
+    reconnect_delay_seconds: float = 5.0,
+) -> None:
+    """LISTEN on ``OUTBOX_NOTIFY_CHANNEL`` over a dedicated autocommit connection; each NOTIFY sets ``wakeup``."""
+    engine = session_factory.kw["bind"]
 
-            await _delete_outbox_row(session_factory, oid)
-            alm_domain_event_outbox_dispatched_total.inc()
-            logger.info(
-                "domain_event_outbox_dispatched",
-                outbox_id=str(oid),
-                event_type=et,
-            )
+    def on_notify(*_args: object) -> None:
+        wakeup.set()
 
-        return processed
-    finally:
+    while True:
         try:
-            await refresh_outbox_prometheus_gauges(session_factory)
-        except Exception:
-            logger.exception("domain_event_outbox_gauge_refresh_failed")
+            async with engine.connect() as conn:
+                conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+                driver = (await conn.get_raw_connection()).driver_connection
+                await driver.add_listener(OUTBOX_NOTIFY_CHANNEL, on_notify)
+                logger.info("domain_event_outbox_listener_started", channel=OUTBOX_NOTIFY_CHANNEL)
+                # Catch up on anything committed while we were not listening.
+                wakeup.set()
+                try:
+                    while not driver.is_closed():
+                        await asyncio.sleep(reconnect_delay_seconds)
+                finally:
+                    if not driver.is_closed():
+                        await driver.remove_listener(OUTBOX_NOTIFY_CHANNEL, on_notify)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:  # noqa: BLE001
+            logger.warning("domain_event_outbox_listener_error", error=str(e))
+        await asyncio.sleep(reconnect_delay_seconds)
 
 
 async def run_domain_event_outbox_worker(session_factory: async_sessionmaker[AsyncSession]) -> None:
+    """Drain the outbox: full batches run back to back; otherwise wait for a NOTIFY or the poll interval.
+
+    Prometheus gauges are refreshed by a separate task every ``domain_event_outbox_gauge_refresh_seconds``.
+    """
     interval = settings.domain_event_outbox_poll_interval_seconds
     if interval <= 0:
         logger.info("domain_event_outbox_worker_disabled", reason="poll_interval_seconds<=0")
         return
 
-    while True:
-        try:
-            await process_pending_outbox_batch(session_factory)
-        except Exception:
-            logger.exception("domain_event_outbox_batch_failed")
-        await asyncio.sleep(interval)
+    wakeup = asyncio.Event()
+    helpers = [asyncio.create_task(_refresh_outbox_gauges_periodically(session_factory))]
+    if settings.domain_event_outbox_listen_enabled:
+        helpers.append(asyncio.create_task(_listen_for_outbox_notifications(session_factory, wakeup)))
+
+    batch_size = settings.domain_event_outbox_batch_size
+    try:
+        while True:
+            wakeup.clear()
+            processed = 0
+            try:
+                processed = await process_pending_outbox_batch(session_factory)
+            except Exception:
+                logger.exception("domain_event_outbox_batch_failed")
+            if processed >= batch_size:
+                continue
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(wakeup.wait(), timeout=interval)
+    finally:
+        for task in helpers:
+            task.cancel()
+        await asyncio.gather(*helpers, return_exceptions=True)
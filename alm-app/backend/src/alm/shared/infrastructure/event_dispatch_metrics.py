@@ -0,0 +1,36 @@
+"""Prometheus metrics for post-commit domain event dispatch (inline vs. background queue).
+
+p50 / p99: ``histogram_quantile(0.99, sum by (le, mode) (rate(alm_command_duration_seconds_bucket[5m])))``, and the
+same over ``alm_domain_event_dispatch_lag_seconds_bucket`` for commit-to-handlers-finished lag.
+"""
+
+from __future__ import annotations
+
+from prometheus_client import Counter, Gauge, Histogram
+
+_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+alm_command_duration_seconds = Histogram(
+    "alm_command_duration_seconds",
+    "Mediator command time on the request path (handler, commit and any inline event dispatch) by dispatch mode",
+    ["mode"],
+    buckets=_LATENCY_BUCKETS,
+)
+
+alm_domain_event_dispatch_lag_seconds = Histogram(
+    "alm_domain_event_dispatch_lag_seconds",
+    "Time from DB commit until all handlers for the committed events finished, by dispatch mode",
+    ["mode"],
+    buckets=_LATENCY_BUCKETS,
+)
+
+alm_domain_event_dispatch_queue_depth = Gauge(
+    "alm_domain_event_dispatch_queue_depth",
+    "Committed event batches waiting in this worker's background dispatch queue",
+)
+
+alm_domain_event_dispatch_handoffs_total = Counter(
+    "alm_domain_event_dispatch_handoffs_total",
+    "Background dispatch outcomes (accepted, overflow, dispatched, failed, expired); non-dispatched go to the outbox",
+    ["result"],
+)
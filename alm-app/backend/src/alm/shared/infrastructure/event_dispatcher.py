@@ -9,6 +9,7 @@ from alm.shared.domain.event_dispatcher import (
     IDomainEventDispatcher,
 )
 from alm.shared.domain.events import DomainEvent
+from alm.shared.infrastructure.event_lookups import event_lookup_scope
 
 logger = structlog.get_logger()
 
@@ -30,19 +31,23 @@ def _get_handler_types(event: DomainEvent) -> list[type[DomainEvent]]:
 
 
 class DomainEventDispatcher(IDomainEventDispatcher):
-    """Dispatches domain events to registered handlers. Handlers run in registration order."""
+    """Dispatches domain events to registered handlers. Handlers run in registration order.
+
+    Handlers of one ``dispatch`` call share an ``EventLookupScope`` (one read session, memoized lookups).
+    """
 
     async def dispatch(self, events: list[DomainEvent]) -> None:
-        for event in events:
-            for handler_type in _get_handler_types(event):
-                handlers = _event_handlers.get(handler_type, [])
-                for handler in handlers:
-                    try:
-                        await handler(event)
-                    except Exception:
-                        logger.exception(
-                            "event_handler_failed",
-                            event_type=type(event).__name__,
-                            handler=handler.__qualname__,
-                        )
-                        raise
+        async with event_lookup_scope(events):
+            for event in events:
+                for handler_type in _get_handler_types(event):
+                    handlers = _event_handlers.get(handler_type, [])
+                    for handler in handlers:
+                        try:
+                            await handler(event)
+                        except Exception:
+                            logger.exception(
+                                "event_handler_failed",
+                                event_type=type(event).__name__,
+                                handler=handler.__qualname__,
+                            )
+                            raise
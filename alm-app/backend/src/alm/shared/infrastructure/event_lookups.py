@@ -0,0 +1,111 @@
+"""Reads shared by the handlers of one domain event dispatch.
+
+``DomainEventDispatcher.dispatch`` opens an ``EventLookupScope`` around its batch. Handlers that need data the
+event does not carry (workflow rules, the tenant of an event persisted before it carried ``tenant_id``) read
+through the scope instead of opening their own session, so dispatching N events costs at most one session and
+one query per distinct lookup.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable
+from contextvars import ContextVar
+from typing import Any, TypeVar
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from alm.project.infrastructure.models import ProjectModel
+from alm.shared.domain.events import DomainEvent
+from alm.shared.infrastructure.db.session import async_session_factory
+
+T = TypeVar("T")
+
+_current_scope: ContextVar[EventLookupScope | None] = ContextVar("alm_event_lookup_scope", default=None)
+
+
+class EventLookupScope:
+    """One lazily opened read session plus memoized lookups for a batch of events."""
+
+    def __init__(self, events: list[DomainEvent], session_factory: async_sessionmaker[AsyncSession]) -> None:
+        self._events = events
+        self._session_factory = session_factory
+        self._session: AsyncSession | None = None
+        self._memo: dict[Hashable, Any] = {}
+        self._project_tenants: dict[uuid.UUID, uuid.UUID | None] = {}
+
+    async def session(self) -> AsyncSession:
+        if self._session is None:
+            self._session = self._session_factory()
+        return self._session
+
+    async def memoized(self, key: Hashable, load: Callable[[AsyncSession], Awaitable[T]]) -> T:
+        """Run ``load`` once per ``key`` for the whole batch (callers must not mutate the result)."""
+        if key not in self._memo:
+            self._memo[key] = await load(await self.session())
+        return self._memo[key]
+
+    def once(self, key: Hashable) -> bool:
+        """True only on the first call per ``key`` for the batch (side effects the whole batch needs once)."""
+        marker = ("once", key)
+        if marker in self._memo:
+            return False
+        self._memo[marker] = True
+        return True
+
+    async def tenant_id_for(self, event: DomainEvent) -> uuid.UUID | None:
+        """The event's ``tenant_id``, else its project's tenant (one query for every project in the batch)."""
+        tenant_id = getattr(event, "tenant_id", None)
+        if isinstance(tenant_id, uuid.UUID):
+            return tenant_id
+        project_id = getattr(event, "project_id", None)
+        if not isinstance(project_id, uuid.UUID):
+            return None
+        if project_id not in self._project_tenants:
+            await self._load_project_tenants(project_id)
+        return self._project_tenants[project_id]
+
+    async def _load_project_tenants(self, project_id: uuid.UUID) -> None:
+        wanted = {project_id}
+        for event in self._events:
+            pid = getattr(event, "project_id", None)
+            if isinstance(pid, uuid.UUID) and getattr(event, "tenant_id", None) is None:
+                wanted.add(pid)
+        wanted.difference_update(self._project_tenants)
+        session = await self.session()
+        result = await session.execute(
+            select(ProjectModel.id, ProjectModel.tenant_id).where(ProjectModel.id.in_(wanted))
+        )
+        self._project_tenants.update(dict.fromkeys(wanted))
+        self._project_tenants.update({row.id: row.tenant_id for row in result})
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+def current_event_lookup_scope() -> EventLookupScope | None:
+    """The scope of the dispatch in progress, if any."""
+    return _current_scope.get()
+
+
+@contextlib.asynccontextmanager
+async def event_lookup_scope(
+    events: list[DomainEvent],
+    session_factory: async_sessionmaker[AsyncSession] | None = None,
+) -> AsyncIterator[EventLookupScope]:
+    """Enter a scope for ``events``; reuses the enclosing dispatch's scope when there is one."""
+    current = _current_scope.get()
+    if current is not None:
+        yield current
+        return
+    scope = EventLookupScope(events, session_factory or async_session_factory)
+    token = _current_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _current_scope.reset(token)
+        await scope.close()
@@ -10,6 +10,8 @@ from fastapi import Depends
 from alm.config.dependencies import get_mediator
 from alm.shared.application.mediator import Mediator
 from alm.shared.domain.exceptions import AccessDenied
+from alm.shared.infrastructure.cache import get_tenant_slug_cache
+from alm.shared.infrastructure.security.auth_context import request_memo
 from alm.shared.infrastructure.security.dependencies import (
     CurrentUser,
     get_current_user,
@@ -34,11 +36,28 @@ async def resolve_org(
 ) -> ResolvedOrg:
     """Resolve org_slug to tenant and ensure current user has access.
 
-    User must have switched to this tenant (JWT tid matches).
+    User must have switched to this tenant (JWT tid matches). The tenant comes from the request memo, then
+    the process-wide slug cache, and only then from ``GetTenantBySlug``, so every dependency of a request
+    shares one lookup and warm slugs skip the database.
     """
-    dto: TenantDTO = await mediator.query(GetTenantBySlug(slug=org_slug))
+    dto = await _tenant_for_slug(org_slug, mediator)
     if user.tenant_id != dto.id:
         raise AccessDenied(
             f"Cannot access org '{org_slug}'; switch to this organization first",
         )
     return ResolvedOrg(tenant_id=dto.id, slug=org_slug, dto=dto)
+
+
+async def _tenant_for_slug(org_slug: str, mediator: Mediator) -> TenantDTO:
+    memo = request_memo()
+    memo_key = ("org", org_slug)
+    if memo is not None and memo_key in memo:
+        return memo[memo_key]
+    cache = get_tenant_slug_cache()
+    dto = cache.get(org_slug)
+    if dto is None:
+        dto = await mediator.query(GetTenantBySlug(slug=org_slug))
+        cache.set(org_slug, dto)
+    if memo is not None:
+        memo[memo_key] = dto
+    return dto
@@ -24,9 +24,14 @@ alm_domain_event_outbox_dead_letter_requeued_total = Counter(
     "Exhausted outbox rows reset for retry (admin requeue)",
 )
 
+alm_domain_event_outbox_released_total = Counter(
+    "alm_domain_event_outbox_released_total",
+    "Claimed rows returned unattempted because an earlier event of the same aggregate failed in the batch",
+)
+
 alm_domain_event_outbox_pending_rows = Gauge(
     "alm_domain_event_outbox_pending_rows",
-    "Rows currently stored in domain_event_outbox (updated after each worker batch)",
+    "Rows currently stored in domain_event_outbox (refreshed every domain_event_outbox_gauge_refresh_seconds)",
 )
 
 alm_domain_event_outbox_exhausted_rows = Gauge(
@@ -0,0 +1,30 @@
+"""Prometheus metrics for privilege resolution caching (request memo, in-process L1, Redis L2).
+
+Hit ratio per tier: ``rate(alm_permission_cache_lookups_total{tier="l1",result="hit"}[5m])`` divided by
+``rate(alm_permission_cache_lookups_total{tier="l1"}[5m])``.
+"""
+
+from __future__ import annotations
+
+from prometheus_client import Counter, Gauge
+
+alm_permission_cache_lookups_total = Counter(
+    "alm_permission_cache_lookups_total",
+    "Privilege cache lookups by tier (request, l1, l2) and result (hit, miss)",
+    ["tier", "result"],
+)
+
+alm_permission_cache_invalidations_total = Counter(
+    "alm_permission_cache_invalidations_total",
+    "L1 invalidations applied by scope (user, tenant, org, all) and source (local, broadcast, resubscribe)",
+    ["scope", "source"],
+)
+
+alm_permission_cache_l1_entries = Gauge(
+    "alm_permission_cache_l1_entries",
+    "Entries currently held in this worker's in-process permission cache",
+)
+
+
+def record_lookup(tier: str, hit: bool) -> None:
+    alm_permission_cache_lookups_total.labels(tier=tier, result="hit" if hit else "miss").inc()
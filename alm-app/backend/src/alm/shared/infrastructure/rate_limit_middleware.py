@@ -2,15 +2,12 @@
 
 from __future__ import annotations
 
-import uuid
-
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from alm.config.settings import settings
-from alm.shared.infrastructure.rate_limiter import check_sliding_window
-from alm.shared.infrastructure.security.jwt import InvalidTokenError, decode_token
+from alm.shared.infrastructure.rate_limiter import check_rate_limit
+from alm.shared.infrastructure.security.auth_context import auth_context_from_scope
 
 API_PREFIX = "/api/v1"
 
@@ -26,35 +23,34 @@ def is_scm_provider_webhook_path(path: str) -> bool:
     )
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Apply sliding-window rate limit per tenant for /api/v1 requests. No limit when tenant cannot be determined."""
+class RateLimitMiddleware:
+    """Apply sliding-window rate limit per tenant for /api/v1 requests. No limit when tenant cannot be determined.
 
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        if not request.url.path.startswith(API_PREFIX):
-            return await call_next(request)
+    Pure ASGI; the tenant comes from the request's shared auth context instead of decoding the JWT again.
+    Requests are weighted by ``rate_limit_route_costs`` and pre-checked against a per-worker token bucket.
+    """
 
-        if is_scm_provider_webhook_path(request.url.path):
-            return await call_next(request)
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-        tenant_id: uuid.UUID | None = None
-        auth_header = request.headers.get("authorization", "")
-        if auth_header.startswith("Bearer "):
-            try:
-                payload = decode_token(auth_header[7:])
-                if payload.tid is not None:
-                    tenant_id = payload.tid
-            except InvalidTokenError:
-                pass
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        if tenant_id is None:
-            return await call_next(request)
+        path: str = scope["path"]
+        if not path.startswith(API_PREFIX) or is_scm_provider_webhook_path(path):
+            await self.app(scope, receive, send)
+            return
 
-        if settings.debug:
-            return await call_next(request)
+        payload = auth_context_from_scope(scope).payload
+        if payload is None or payload.tid is None or settings.debug:
+            await self.app(scope, receive, send)
+            return
 
-        allowed, retry_after = await check_sliding_window(tenant_id)
+        allowed, retry_after = await check_rate_limit(payload.tid, path)
         if not allowed:
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=429,
                 headers={"Retry-After": str(retry_after)},
                 content={
@@ -66,5 +62,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 },
                 media_type="application/problem+json",
             )
+            await response(scope, receive, send)
+            return
 
-        return await call_next(request)
+        await self.app(scope, receive, send)
@@ -1,11 +1,13 @@
-"""Tenant-scoped rate limiter using Redis sliding window (Faz D2)."""
+"""Tenant-scoped rate limiter: Redis sliding window in one atomic Lua call, behind a per-worker token bucket (Faz D2)."""
 
 from __future__ import annotations
 
+import math
 import time
 import uuid
 
 import structlog
+from redis.commands.core import AsyncScript
 
 from alm.config.settings import settings
 from alm.shared.infrastructure.cache import get_redis
@@ -14,40 +16,182 @@ logger = structlog.get_logger()
 
 KEY_PREFIX = "ratelimit:tenant:"
 
+# Sliding-window log. KEYS[1]=zset; ARGV: limit, window seconds, cost, request token.
+# Trims, counts, and either records ``cost`` members or returns the seconds until enough entries expire,
+# all in one round trip (EVALSHA) and atomically, so concurrent requests cannot overshoot the limit.
+# Time comes from the Redis server so workers with skewed clocks share one timeline.
+_SLIDING_WINDOW_LUA = """
+local key = KEYS[1]
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window)
+local count = redis.call('ZCARD', key)
+if count + cost > limit then
+  local idx = count + cost - limit - 1
+  local entry = redis.call('ZRANGE', key, idx, idx, 'WITHSCORES')
+  local retry = 1
+  if entry[2] then
+    retry = math.max(1, math.ceil(tonumber(entry[2]) + window - now))
+  end
+  return {0, retry}
+end
+local args = {}
+for i = 1, cost do
+  args[#args + 1] = now
+  args[#args + 1] = ARGV[4] .. ':' .. i
+end
+redis.call('ZADD', key, unpack(args))
+redis.call('EXPIRE', key, math.ceil(window) + 10)
+return {1, 0}
+"""
+
+_script: AsyncScript | None = None
+
+
+def _sliding_window_script() -> AsyncScript:
+    """Registered once per process; redis-py sends EVALSHA and reloads the script on NOSCRIPT."""
+    global _script
+    if _script is None:
+        _script = get_redis().register_script(_SLIDING_WINDOW_LUA)
+    return _script
+
 
 async def check_sliding_window(
     tenant_id: uuid.UUID,
     *,
+    cost: int = 1,
     limit: int | None = None,
     window_seconds: int | None = None,
 ) -> tuple[bool, int]:
-    """Sliding window: allow request if count in window < limit. Returns (allowed, retry_after_seconds)."""
+    """Sliding window: allow if the weighted count in the window plus ``cost`` stays within ``limit``.
+
+    Returns (allowed, retry_after_seconds). ``cost`` is clamped to ``limit`` so a heavy route is never
+    permanently rejected on a small limit.
+    """
     limit = limit if limit is not None else settings.rate_limit_requests_per_minute
     window_seconds = window_seconds if window_seconds is not None else settings.rate_limit_window_seconds
-    key = f"{KEY_PREFIX}{tenant_id}"
-    now = time.time()
-    window_start = now - window_seconds
-
-    r = get_redis()
-    pipe = r.pipeline()
-    # Remove entries outside the window (score < window_start)
-    pipe.zremrangebyscore(key, "-inf", window_start)
-    pipe.zcard(key)
-    res = await pipe.execute()
-    count = res[1] or 0
-
-    if count >= limit:
-        # Get oldest timestamp in window to compute Retry-After
-        oldest = await r.zrange(key, 0, 0, withscores=True)
-        retry_after = 1
-        if oldest:
-            oldest_ts = oldest[0][1]
-            retry_after = max(1, int(window_seconds - (now - oldest_ts)))
-        logger.debug("rate_limit_exceeded", tenant_id=str(tenant_id), count=count, limit=limit)
-        return False, retry_after
-
-    pipe = r.pipeline()
-    pipe.zadd(key, {str(now): now})
-    pipe.expire(key, window_seconds + 10)
-    await pipe.execute()
+    cost = max(1, min(cost, limit))
+    allowed, retry_after = await _sliding_window_script()(
+        keys=[f"{KEY_PREFIX}{tenant_id}"],
+        args=[limit, window_seconds, cost, uuid.uuid4().hex],
+        client=get_redis(),
+    )
+    if not int(allowed):
+        logger.debug("rate_limit_exceeded", tenant_id=str(tenant_id), cost=cost, limit=limit)
+        return False, int(retry_after)
     return True, 0
+
+
+class LocalTokenBucket:
+    """Per-worker token bucket per tenant, refilled at the global rate (limit / window).
+
+    With the default capacity (the global limit) one worker alone cannot empty it faster than Redis would
+    reject. Granted cost is batched (``charge``) and sent to the Redis window once per ``sync_cost`` units or
+    ``sync_seconds``, so a burst against this worker costs one round trip per batch rather than one per
+    request. After a Redis rejection the tenant's bucket is drained, so the worker backs off locally until it
+    refills instead of asking Redis again for every request.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        refill_per_second: float,
+        max_tenants: int = 10_000,
+        *,
+        sync_cost: int = 1,
+        sync_seconds: float = 0.0,
+    ) -> None:
+        self._capacity = float(max(1, capacity))
+        self._rate = refill_per_second
+        self._max_tenants = max(1, max_tenants)
+        self._sync_cost = max(1, sync_cost)
+        self._sync_seconds = sync_seconds
+        self._buckets: dict[uuid.UUID, tuple[float, float]] = {}
+        # tenant -> (cost granted locally but not yet charged to Redis, monotonic time of the oldest unit)
+        self._unsynced: dict[uuid.UUID, tuple[int, float]] = {}
+
+    def try_acquire(self, tenant_id: uuid.UUID, cost: int = 1) -> tuple[bool, int]:
+        """Take ``cost`` tokens. Returns (allowed, retry_after_seconds)."""
+        now = time.monotonic()
+        tokens, updated = self._buckets.pop(tenant_id, (self._capacity, now))
+        tokens = min(self._capacity, tokens + (now - updated) * self._rate)
+        cost = min(float(cost), self._capacity)
+        allowed = tokens >= cost
+        if allowed:
+            tokens -= cost
+        self._store(tenant_id, tokens, now)
+        if allowed:
+            return True, 0
+        return False, (max(1, math.ceil((cost - tokens) / self._rate)) if self._rate > 0 else 1)
+
+    def charge(self, tenant_id: uuid.UUID, cost: int) -> int:
+        """Record ``cost`` granted locally. Returns the cost to charge to Redis now, or 0 while it can wait."""
+        now = time.monotonic()
+        pending, since = self._unsynced.pop(tenant_id, (0, now))
+        pending += cost
+        if pending >= self._sync_cost or now - since >= self._sync_seconds:
+            return pending
+        self._unsynced[tenant_id] = (pending, since)
+        while len(self._unsynced) > self._max_tenants:
+            self._unsynced.pop(next(iter(self._unsynced)))
+        return 0
+
+    def drain(self, tenant_id: uuid.UUID) -> None:
+        self._unsynced.pop(tenant_id, None)
+        self._store(tenant_id, 0.0, time.monotonic())
+
+    def _store(self, tenant_id: uuid.UUID, tokens: float, updated: float) -> None:
+        # Re-inserting keeps dict order as least-recently-used first; drop the oldest tenants beyond the cap.
+        self._buckets[tenant_id] = (tokens, updated)
+        while len(self._buckets) > self._max_tenants:
+            self._buckets.pop(next(iter(self._buckets)))
+
+
+_local_bucket: LocalTokenBucket | None = None
+
+
+def get_local_token_bucket() -> LocalTokenBucket | None:
+    """Process-wide local pre-check, or None when ``rate_limit_local_bucket_enabled`` is off."""
+    global _local_bucket
+    if not settings.rate_limit_local_bucket_enabled:
+        return None
+    if _local_bucket is None:
+        limit = settings.rate_limit_requests_per_minute
+        _local_bucket = LocalTokenBucket(
+            capacity=settings.rate_limit_local_burst or limit,
+            refill_per_second=limit / max(1, settings.rate_limit_window_seconds),
+            sync_cost=settings.rate_limit_local_sync_cost,
+            sync_seconds=settings.rate_limit_local_sync_seconds,
+        )
+    return _local_bucket
+
+
+def route_cost(path: str) -> int:
+    """Weight of a request from ``rate_limit_route_costs`` (path suffix match, trailing slash ignored); default 1."""
+    p = path.rstrip("/") or path
+    for suffix, cost in settings.rate_limit_route_costs.items():
+        if p.endswith(suffix.rstrip("/")):
+            return max(1, int(cost))
+    return 1
+
+
+async def check_rate_limit(tenant_id: uuid.UUID, path: str) -> tuple[bool, int]:
+    """Local token bucket first; its granted cost reaches the atomic Redis window in batches."""
+    cost = route_cost(path)
+    bucket = get_local_token_bucket()
+    if bucket is None:
+        return await check_sliding_window(tenant_id, cost=cost)
+    allowed, retry_after = bucket.try_acquire(tenant_id, cost)
+    if not allowed:
+        logger.debug("rate_limit_local_rejected", tenant_id=str(tenant_id), cost=cost)
+        return False, retry_after
+    due = bucket.charge(tenant_id, cost)
+    if not due:
+        return True, 0
+    allowed, retry_after = await check_sliding_window(tenant_id, cost=due)
+    if not allowed:
+        bucket.drain(tenant_id)
+    return allowed, retry_after
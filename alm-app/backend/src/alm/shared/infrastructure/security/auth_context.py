@@ -0,0 +1,99 @@
+"""Per-request auth context: the bearer token is verified once and the parsed principal is kept on the ASGI scope.
+
+``AuthContextMiddleware`` resolves it up front; tenant context, rate limiting and the auth dependencies read it
+through ``auth_context_from_scope`` (which resolves lazily when the middleware is not installed, e.g. in tests).
+The middleware also installs a request-scoped memo (``request_memo``) for per-request lookups such as privileges.
+"""
+
+from __future__ import annotations
+
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from alm.shared.infrastructure.security.jwt import InvalidTokenError, TokenPayload, decode_token
+
+AUTH_CONTEXT_SCOPE_KEY = "alm.auth_context"
+
+_request_memo: ContextVar[dict[Any, Any] | None] = ContextVar("alm_request_memo", default=None)
+
+
+@dataclass(frozen=True, slots=True)
+class AuthContext:
+    """Outcome of verifying the request's bearer token. ``payload`` is None when absent or invalid."""
+
+    token: str | None = None
+    payload: TokenPayload | None = None
+    error: str | None = None
+
+
+_ANONYMOUS = AuthContext()
+
+
+def _bearer_token(scope: Scope) -> str | None:
+    """Credentials of a ``Bearer`` Authorization header, split the same way as FastAPI's ``HTTPBearer``."""
+    for name, value in scope.get("headers") or ():
+        if name == b"authorization":
+            scheme, _, credentials = value.decode("latin-1").partition(" ")
+            return (credentials or None) if scheme.lower() == "bearer" else None
+    return None
+
+
+def _resolve(token: str | None) -> AuthContext:
+    if token is None:
+        return _ANONYMOUS
+    try:
+        return AuthContext(token=token, payload=decode_token(token))
+    except InvalidTokenError as exc:
+        return AuthContext(token=token, error=str(exc))
+
+
+def auth_context_from_scope(scope: Scope) -> AuthContext:
+    """Auth context for this request; decodes the Authorization header at most once per scope."""
+    ctx = scope.get(AUTH_CONTEXT_SCOPE_KEY)
+    if ctx is None:
+        ctx = _resolve(_bearer_token(scope))
+        scope[AUTH_CONTEXT_SCOPE_KEY] = ctx
+    return ctx
+
+
+def token_payload_for(scope: Scope, token: str) -> TokenPayload:
+    """Verified payload for ``token``, reusing the scope's auth context when it was built from the same token.
+
+    Raises ``InvalidTokenError`` like ``decode_token``.
+    """
+    ctx = auth_context_from_scope(scope)
+    if ctx.token != token:
+        return decode_token(token)
+    if ctx.payload is None:
+        raise InvalidTokenError(ctx.error or "Invalid token")
+    return ctx.payload
+
+
+def request_memo() -> dict[Any, Any] | None:
+    """Dict shared by everything running for the current request; None outside ``AuthContextMiddleware``."""
+    return _request_memo.get()
+
+
+class AuthContextMiddleware:
+    """Pure ASGI middleware that verifies the bearer token once and stores the ``AuthContext`` on the scope.
+
+    Also installs a fresh ``request_memo`` for the duration of the request.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        auth_context_from_scope(scope)
+        memo_token = _request_memo.set({})
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _request_memo.reset(memo_token)
@@ -3,12 +3,16 @@ from __future__ import annotations
 import logging
 import uuid
 from dataclasses import dataclass, field
+from typing import cast
 
 from fastapi import Depends, Query
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from starlette.requests import HTTPConnection
 
 from alm.shared.domain.exceptions import AccessDenied
-from alm.shared.infrastructure.security.jwt import InvalidTokenError, TokenPayload, decode_token
+from alm.shared.infrastructure.permission_cache_metrics import record_lookup
+from alm.shared.infrastructure.security.auth_context import request_memo, token_payload_for
+from alm.shared.infrastructure.security.jwt import InvalidTokenError, TokenPayload
 
 logger = logging.getLogger(__name__)
 
@@ -23,11 +27,12 @@ class CurrentUser:
 
 
 async def get_authenticated_user_id(
+    connection: HTTPConnection,
     credentials: HTTPAuthorizationCredentials = Depends(_bearer_scheme),
 ) -> uuid.UUID:
     """Accepts access or tenant_select (temp) token. Returns user id. For create-tenant etc."""
     try:
-        payload: TokenPayload = decode_token(credentials.credentials)
+        payload: TokenPayload = token_payload_for(connection.scope, credentials.credentials)
     except InvalidTokenError as exc:
         raise AccessDenied(f"Invalid token: {exc}") from exc
 
@@ -37,10 +42,12 @@ async def get_authenticated_user_id(
 
 
 async def get_current_user(
+    connection: HTTPConnection,
     credentials: HTTPAuthorizationCredentials = Depends(_bearer_scheme),
 ) -> CurrentUser:
+    """Access-token user; the token is verified once per request by ``AuthContextMiddleware``."""
     try:
-        payload: TokenPayload = decode_token(credentials.credentials)
+        payload: TokenPayload = token_payload_for(connection.scope, credentials.credentials)
     except InvalidTokenError as exc:
         raise AccessDenied(f"Invalid token: {exc}") from exc
 
@@ -66,8 +73,25 @@ def _matches_permission(codes: list[str], required_code: str) -> bool:
 
 
 async def get_user_privileges(tenant_id: uuid.UUID, user_id: uuid.UUID) -> list[str]:
-    """Resolve effective privilege codes for a user in a tenant (for MPC AuthPort/GuardPort)."""
-    from alm.shared.infrastructure.cache import PermissionCache
+    """Resolve effective privilege codes for a user in a tenant (for MPC AuthPort/GuardPort).
+
+    Lookup order: request memo (at most one resolution per request), in-process L1, Redis, then the DB.
+    """
+    memo = request_memo()
+    memo_key = ("privileges", tenant_id, user_id)
+    if memo is not None:
+        memoized = memo.get(memo_key)
+        record_lookup("request", memoized is not None)
+        if memoized is not None:
+            return cast("list[str]", memoized)
+    codes = await _resolve_user_privileges(tenant_id, user_id)
+    if memo is not None:
+        memo[memo_key] = codes
+    return codes
+
+
+async def _resolve_user_privileges(tenant_id: uuid.UUID, user_id: uuid.UUID) -> list[str]:
+    from alm.shared.infrastructure.cache import TwoTierPermissionCache
     from alm.shared.infrastructure.db.session import async_session_factory
     from alm.tenant.domain.services import PermissionResolver
     from alm.tenant.infrastructure.repositories import (
@@ -75,7 +99,7 @@ async def get_user_privileges(tenant_id: uuid.UUID, user_id: uuid.UUID) -> list[
         SqlAlchemyRoleRepository,
     )
 
-    cache = PermissionCache()
+    cache = TwoTierPermissionCache()
     try:
         cached = await cache.get(tenant_id, user_id)
         if cached is not None:
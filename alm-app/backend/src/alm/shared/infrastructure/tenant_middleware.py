@@ -1,29 +1,25 @@
 from __future__ import annotations
 
-import uuid
-
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from alm.shared.infrastructure.db.tenant_context import set_current_tenant_id
-from alm.shared.infrastructure.security.jwt import InvalidTokenError, decode_token
+from alm.shared.infrastructure.security.auth_context import auth_context_from_scope
+
+
+class TenantContextMiddleware:
+    """Pure ASGI: expose the token's tenant to RLS for the duration of the request (no second JWT decode)."""
 
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-class TenantContextMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-        tenant_id: uuid.UUID | None = None
-        auth_header = request.headers.get("authorization", "")
-        if auth_header.startswith("Bearer "):
-            try:
-                payload = decode_token(auth_header[7:])
-                if payload.tid is not None:
-                    tenant_id = payload.tid
-            except InvalidTokenError:
-                pass
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
 
-        set_current_tenant_id(tenant_id)
+        payload = auth_context_from_scope(scope).payload
+        set_current_tenant_id(payload.tid if payload is not None else None)
         try:
-            return await call_next(request)
+            await self.app(scope, receive, send)
         finally:
             set_current_tenant_id(None)
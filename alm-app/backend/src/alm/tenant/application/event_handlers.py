@@ -0,0 +1,26 @@
+"""Evict the org slug lookup cache once tenant changes have committed."""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+
+from alm.shared.domain.events import DomainEvent
+from alm.shared.domain.ports import ITenantLookupCache
+from alm.tenant.domain.events import TenantArchived, TenantUpdated
+
+TENANT_LOOKUP_EVENTS: tuple[type[DomainEvent], ...] = (TenantUpdated, TenantArchived)
+
+
+def create_tenant_lookup_cache_handler(
+    cache: ITenantLookupCache,
+) -> Callable[[DomainEvent], Awaitable[None]]:
+    """Returns a handler (register it for ``TENANT_LOOKUP_EVENTS``) that drops the tenant's cached slug lookups.
+
+    Runs after commit, so a concurrent lookup can no longer re-cache the row being replaced.
+    """
+
+    async def on_tenant_changed(event: DomainEvent) -> None:
+        if isinstance(event, TENANT_LOOKUP_EVENTS):
+            await cache.invalidate_tenant(event.tenant_id)
+
+    return on_tenant_changed
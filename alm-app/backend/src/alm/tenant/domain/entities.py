@@ -12,6 +12,7 @@ from alm.tenant.domain.events import (
     RolePrivilegesChanged,
     RoleUpdated,
     TenantCreated,
+    TenantUpdated,
 )
 
 
@@ -43,6 +44,7 @@ class Tenant(AggregateRoot):
         if settings is not None:
             self.settings = settings
         self.touch()
+        self._register_event(TenantUpdated(tenant_id=self.id))
 
 
 class TenantMembership(BaseEntity):
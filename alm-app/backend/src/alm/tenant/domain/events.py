@@ -13,6 +13,17 @@ class TenantCreated(DomainEvent):
     slug: str
 
 
+@dataclass(frozen=True, kw_only=True)
+class TenantUpdated(DomainEvent):
+    tenant_id: uuid.UUID
+
+
+@dataclass(frozen=True, kw_only=True)
+class TenantArchived(DomainEvent):
+    tenant_id: uuid.UUID
+    archived_by: uuid.UUID
+
+
 @dataclass(frozen=True, kw_only=True)
 class MemberInvited(DomainEvent):
     tenant_id: uuid.UUID
@@ -10,6 +10,7 @@ from alm.shared.application.mediator import buffer_events
 from alm.shared.audit.core import ChangeType
 from alm.shared.audit.interceptor import buffer_audit
 from alm.tenant.domain.entities import Invitation, Privilege, Role, Tenant, TenantMembership
+from alm.tenant.domain.events import TenantArchived
 from alm.tenant.domain.ports import (
     InvitationRepository,
     MembershipRepository,
@@ -77,6 +78,7 @@ class SqlAlchemyTenantRepository(TenantRepository):
             .values(deleted_at=datetime.now(UTC), deleted_by=deleted_by)
         )
         await self._session.flush()
+        buffer_events(self._session, [TenantArchived(tenant_id=tenant_id, archived_by=deleted_by)])
 
     @staticmethod
     def _to_entity(m: TenantModel) -> Tenant:
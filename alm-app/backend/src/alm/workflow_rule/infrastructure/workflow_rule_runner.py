@@ -6,10 +6,11 @@ import uuid
 from typing import Any
 
 import structlog
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from alm.artifact.domain.events import ArtifactCreated, ArtifactStateChanged
 from alm.shared.domain.events import DomainEvent
-from alm.shared.infrastructure.db.session import async_session_factory
+from alm.shared.infrastructure.event_lookups import event_lookup_scope
 from alm.workflow_rule.domain.ports import IWorkflowRuleRunner
 from alm.workflow_rule.infrastructure.repositories import SqlAlchemyWorkflowRuleRepository
 
@@ -19,6 +20,7 @@ logger = structlog.get_logger()
 def _event_context(event: DomainEvent) -> dict[str, Any]:
     if isinstance(event, ArtifactCreated):
         return {
+            "tenant_id": str(event.tenant_id) if event.tenant_id else None,
             "artifact_id": str(event.artifact_id),
             "project_id": str(event.project_id),
             "artifact_type": event.artifact_type,
@@ -27,8 +29,10 @@ def _event_context(event: DomainEvent) -> dict[str, Any]:
         }
     if isinstance(event, ArtifactStateChanged):
         return {
+            "tenant_id": str(event.tenant_id) if event.tenant_id else None,
             "artifact_id": str(event.artifact_id),
             "project_id": str(event.project_id),
+            "artifact_type": event.artifact_type,
             "from_state": event.from_state,
             "to_state": event.to_state,
         }
@@ -65,8 +69,19 @@ def _execute_actions(rule_id: str, rule_name: str, actions: list[dict[str, Any]]
             )
 
 
+_RuleData = tuple[str, str, str | None, list[dict[str, Any]]]
+
+
+async def _load_active_rules(session: AsyncSession, project_id: uuid.UUID, trigger_event_type: str) -> list[_RuleData]:
+    rules = await SqlAlchemyWorkflowRuleRepository(session).list_active_by_trigger(project_id, trigger_event_type)
+    return [(str(r.id), r.name, r.condition_expression, list(r.actions)) for r in rules]
+
+
 class WorkflowRuleRunner(IWorkflowRuleRunner):
-    """Runs workflow rules for a project/trigger; uses its own session (infrastructure)."""
+    """Runs workflow rules for a project/trigger (infrastructure).
+
+    Active rules are read through the dispatch's ``EventLookupScope``, once per (project, trigger) per batch.
+    """
 
     async def run(
         self,
@@ -74,12 +89,11 @@ class WorkflowRuleRunner(IWorkflowRuleRunner):
         trigger_event_type: str,
         event: DomainEvent,
     ) -> None:
-        rules_data: list[tuple[str, str, str | None, list[dict[str, Any]]]] = []
-        async with async_session_factory() as session:
-            repo = SqlAlchemyWorkflowRuleRepository(session)
-            rules = await repo.list_active_by_trigger(project_id, trigger_event_type)
-            for r in rules:
-                rules_data.append((str(r.id), r.name, r.condition_expression, list(r.actions)))
+        async with event_lookup_scope([event]) as lookups:
+            rules_data = await lookups.memoized(
+                ("workflow_rules", project_id, trigger_event_type),
+                lambda session: _load_active_rules(session, project_id, trigger_event_type),
+            )
         context = _event_context(event)
         for rule_id, rule_name, condition_expression, actions in rules_data:
             if not _evaluate_condition(condition_expression, context):
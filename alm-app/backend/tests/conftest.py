@@ -245,7 +245,7 @@ async def client(test_engine, test_session_factory) -> AsyncGenerator[AsyncClien
         # Rate limit middleware uses Redis; integration tests run without Redis by default.
         stack.enter_context(
             patch(
-                "alm.shared.infrastructure.rate_limit_middleware.check_sliding_window",
+                "alm.shared.infrastructure.rate_limit_middleware.check_rate_limit",
                 new_callable=AsyncMock,
                 return_value=(True, 0),
             )
@@ -259,3 +259,23 @@ async def client(test_engine, test_session_factory) -> AsyncGenerator[AsyncClien
         transport = ASGITransport(app=app)
         async with AsyncClient(transport=transport, base_url="http://test") as ac:
             yield ac
+
+
+@pytest.fixture(autouse=True)
+def _clear_process_manifest_caches() -> Generator[None, None, None]:
+    """Process-wide manifest caches are keyed by version id; tests reuse ids with different bundles."""
+    from alm.artifact.domain.manifest_cache import clear_manifest_ast_cache_for_tests
+
+    clear_manifest_ast_cache_for_tests()
+    yield
+    clear_manifest_ast_cache_for_tests()
+
+
+@pytest.fixture(autouse=True)
+def _clear_tenant_slug_cache() -> Generator[None, None, None]:
+    """resolve_org caches slug -> tenant per process; tests recreate tenants under the same slugs."""
+    from alm.shared.infrastructure.cache import get_tenant_slug_cache
+
+    get_tenant_slug_cache().clear()
+    yield
+    get_tenant_slug_cache().clear()
@@ -0,0 +1,69 @@
+"""PostgreSQL integration tests: default artifact list pages are served by the keyset indexes (requires test_engine)."""
+
+from __future__ import annotations
+
+import uuid
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+
+from alm.artifact.infrastructure.models import ArtifactModel
+from alm.artifact.infrastructure.repositories import SqlAlchemyArtifactRepository
+from alm.project.infrastructure.models import ProjectModel
+from alm.tenant.infrastructure.models import TenantModel
+
+
+async def _project(session) -> uuid.UUID:
+    tenant = TenantModel(id=uuid.uuid4(), name="Keyset", slug=f"keyset-{uuid.uuid4().hex[:8]}")
+    project = ProjectModel(id=uuid.uuid4(), tenant_id=tenant.id, code="KEY", name="Keyset", slug="keyset")
+    session.add(tenant)
+    await session.flush()
+    session.add(project)
+    await session.flush()
+    return project.id
+
+
+async def _explain_list_page(session, monkeypatch, project_id: uuid.UUID, **kwargs) -> str:
+    """Run ``list_by_project`` and return EXPLAIN of the exact statement it executed."""
+    statements = []
+    execute = session.execute
+
+    async def spy(statement, *args, **kw):
+        statements.append(statement)
+        return await execute(statement, *args, **kw)
+
+    monkeypatch.setattr(session, "execute", spy)
+    await SqlAlchemyArtifactRepository(session).list_by_project(project_id, limit=50, **kwargs)
+    monkeypatch.undo()
+    sql = statements[-1].compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    # A handful of rows would otherwise make a sequential scan plus sort the cheaper plan.
+    await session.execute(text("SET LOCAL enable_seqscan = off"))
+    result = await session.execute(text(f"EXPLAIN {sql}"))
+    return "\n".join(row[0] for row in result)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("sort_by", "sort_order", "index_name"),
+    [
+        (None, None, "ix_artifacts_project_created_id"),
+        ("created_at", "asc", "ix_artifacts_project_created_id"),
+        ("updated_at", "desc", "ix_artifacts_project_updated_id"),
+    ],
+)
+async def test_default_sorts_use_keyset_index_without_a_sort_node(
+    db_session, monkeypatch, sort_by, sort_order, index_name
+) -> None:
+    project_id = await _project(db_session)
+    db_session.add_all(
+        ArtifactModel(id=uuid.uuid4(), project_id=project_id, artifact_type="requirement", title=f"r{i}", state="new")
+        for i in range(20)
+    )
+    await db_session.flush()
+    await db_session.execute(text("ANALYZE artifacts"))
+
+    plan = await _explain_list_page(db_session, monkeypatch, project_id, sort_by=sort_by, sort_order=sort_order)
+
+    assert index_name in plan, plan
+    assert not any(line.strip().startswith(("Sort", "->  Sort")) for line in plan.splitlines()), plan
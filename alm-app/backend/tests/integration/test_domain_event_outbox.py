@@ -3,16 +3,18 @@
 from __future__ import annotations
 
 import uuid
+from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, patch
 
 import pytest
 from httpx import AsyncClient
 from sqlalchemy import func, select
 
-from alm.artifact.domain.events import ArtifactCreated
+from alm.artifact.domain.events import ArtifactCreated, ArtifactStateChanged
 from alm.config.settings import settings
 from alm.shared.infrastructure.domain_event_outbox import (
     DomainEventOutboxModel,
+    claim_outbox_rows,
     domain_event_to_payload,
     process_pending_outbox_batch,
     requeue_exhausted_outbox_rows,
@@ -116,6 +118,49 @@ async def test_worker_dispatch_failure_keeps_row_and_clears_lease(test_session_f
     assert row.last_error is not None
 
 
+@pytest.mark.asyncio
+async def test_rows_behind_a_failed_event_are_not_claimed_before_it(test_session_factory):
+    pid = uuid.uuid4()
+    aid = uuid.uuid4()
+    base = datetime.now(UTC) - timedelta(minutes=1)
+    row_ids = [uuid.uuid4(), uuid.uuid4()]
+    async with test_session_factory() as session:
+        for offset, (row_id, state) in enumerate(zip(row_ids, ("draft", "active"), strict=True)):
+            packed = domain_event_to_payload(
+                ArtifactStateChanged(artifact_id=aid, project_id=pid, from_state="new", to_state=state)
+            )
+            session.add(
+                DomainEventOutboxModel(
+                    id=row_id,
+                    event_type=packed["event_type"],
+                    payload=packed,
+                    created_at=base + timedelta(seconds=offset),
+                )
+            )
+        await session.commit()
+
+    dispatcher = AsyncMock()
+    dispatcher.dispatch.side_effect = RuntimeError("handler_failed")
+    with patch(
+        "alm.shared.application.mediator.get_domain_event_dispatcher",
+        return_value=dispatcher,
+    ):
+        await process_pending_outbox_batch(test_session_factory)
+    assert dispatcher.dispatch.await_count == 1
+
+    async with test_session_factory() as session:
+        rows = {
+            r.id: r
+            for r in await session.scalars(select(DomainEventOutboxModel).where(DomainEventOutboxModel.id.in_(row_ids)))
+        }
+        await session.commit()
+    failed, held = rows[row_ids[0]], rows[row_ids[1]]
+    assert (failed.attempts, held.attempts) == (1, 0)
+    assert held.locked_until is None
+    assert held.next_attempt_at == failed.next_attempt_at
+    assert await claim_outbox_rows(test_session_factory, 10) == []
+
+
 @pytest.mark.asyncio
 async def test_requeue_exhausted_resets_row_for_retry(test_session_factory):
     pid = uuid.uuid4()
@@ -0,0 +1,48 @@
+"""PostgreSQL integration tests for the test execution result index (requires test_engine)."""
+
+from __future__ import annotations
+
+import uuid
+
+import pytest
+
+from alm.artifact.domain.entities import Artifact
+from alm.artifact.infrastructure.models import ArtifactModel
+from alm.project.infrastructure.models import ProjectModel
+from alm.quality.infrastructure.repositories import SqlAlchemyExecutionResultRepository
+from alm.tenant.infrastructure.models import TenantModel
+
+
+@pytest.mark.asyncio
+async def test_run_with_oversized_configuration_id_is_saved_and_found(db_session) -> None:
+    tenant = TenantModel(id=uuid.uuid4(), name="Results", slug=f"results-{uuid.uuid4().hex[:8]}")
+    project = ProjectModel(id=uuid.uuid4(), tenant_id=tenant.id, code="RES", name="Results", slug="results")
+    db_session.add(tenant)
+    await db_session.flush()
+    db_session.add(project)
+    await db_session.flush()
+    test_id = uuid.uuid4()
+    long_id = "cfg-" + "x" * 1000
+    run = Artifact(
+        project_id=project.id,
+        artifact_type="test-run",
+        title="Run",
+        state="new",
+        id=uuid.uuid4(),
+        custom_fields={
+            "run_metrics_json": {
+                "v": 2,
+                "results": [{"testId": str(test_id), "status": "passed", "configurationId": long_id}],
+            }
+        },
+    )
+    db_session.add(ArtifactModel(id=run.id, project_id=project.id, artifact_type="test-run", title="Run", state="new"))
+    await db_session.flush()
+    repo = SqlAlchemyExecutionResultRepository(db_session)
+
+    await repo.replace_for_runs([run])
+    await db_session.flush()
+
+    latest = await repo.latest_for_tests(project.id, [(run.id, test_id)], configuration_id=long_id)
+    assert latest[test_id].configuration_id == long_id
+    assert latest[test_id].status == "passed"
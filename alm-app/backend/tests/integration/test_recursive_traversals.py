@@ -0,0 +1,100 @@
+"""PostgreSQL integration tests for the recursive relationship reach and ancestor CTEs (requires test_engine)."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+
+from alm.artifact.infrastructure.models import ArtifactModel
+from alm.artifact.infrastructure.repositories import SqlAlchemyArtifactRepository
+from alm.project.infrastructure.models import ProjectModel
+from alm.relationship.infrastructure.models import RelationshipModel
+from alm.relationship.infrastructure.repositories import SqlAlchemyRelationshipRepository
+from alm.tenant.infrastructure.models import TenantModel
+
+
+async def _project(session) -> uuid.UUID:
+    tenant = TenantModel(id=uuid.uuid4(), name="Traversal", slug=f"traversal-{uuid.uuid4().hex[:8]}")
+    project = ProjectModel(id=uuid.uuid4(), tenant_id=tenant.id, code="TRV", name="Traversal", slug="traversal")
+    session.add(tenant)
+    await session.flush()
+    session.add(project)
+    await session.flush()
+    return project.id
+
+
+def _artifact(project_id: uuid.UUID, title: str, **kwargs) -> ArtifactModel:
+    return ArtifactModel(
+        id=uuid.uuid4(), project_id=project_id, artifact_type="requirement", title=title, state="new", **kwargs
+    )
+
+
+def _link(project_id: uuid.UUID, source: ArtifactModel, target: ArtifactModel, rel_type: str) -> RelationshipModel:
+    return RelationshipModel(
+        id=uuid.uuid4(),
+        project_id=project_id,
+        source_artifact_id=source.id,
+        target_artifact_id=target.id,
+        relationship_type=rel_type,
+    )
+
+
+@pytest.mark.asyncio
+async def test_trace_relationships_caps_hops_survives_cycles_and_stops_at_deleted_artifacts(db_session) -> None:
+    project_id = await _project(db_session)
+    a, b, c, d = (_artifact(project_id, t) for t in "abcd")
+    gone = _artifact(project_id, "gone", deleted_at=datetime.now(UTC))
+    behind_gone = _artifact(project_id, "behind gone")
+    db_session.add_all([a, b, c, d, gone, behind_gone])
+    await db_session.flush()
+    ab, bc, ca, cd = (
+        _link(project_id, a, b, "depends_on"),
+        _link(project_id, b, c, "depends_on"),
+        _link(project_id, c, a, "depends_on"),
+        _link(project_id, c, d, "depends_on"),
+    )
+    ad = _link(project_id, a, d, "relates_to")
+    a_gone = _link(project_id, a, gone, "blocks")
+    gone_behind = _link(project_id, gone, behind_gone, "blocks")
+    db_session.add_all([ab, bc, ca, cd, ad, a_gone, gone_behind])
+    await db_session.flush()
+    repo = SqlAlchemyRelationshipRepository(db_session)
+
+    async def trace(types: list[str], max_hops: int, direction: str = "outgoing") -> set[uuid.UUID]:
+        traced = await repo.trace_relationships(project_id, a.id, types, direction=direction, max_hops=max_hops)
+        return {t.relationship.id for t in traced}
+
+    assert await trace(["depends_on"], 0) == {ab.id}
+    assert await trace(["depends_on"], 1) == {ab.id, bc.id}
+    # The a -> b -> c -> a cycle ends at the hop cap instead of looping.
+    assert await trace(["depends_on"], 10) == {ab.id, bc.id, ca.id, cd.id}
+    assert await trace(["depends_on"], 10, "incoming") == {ca.id, bc.id, ab.id}
+    # A deleted far end is listed (without its artifact) but its own edges are not fetched.
+    traced = await repo.trace_relationships(project_id, a.id, ["blocks"], direction="outgoing", max_hops=5)
+    assert [(t.relationship.id, t.artifact) for t in traced] == [(a_gone.id, None)]
+
+
+@pytest.mark.asyncio
+async def test_list_ancestors_in_project_stops_at_deleted_parent_and_survives_cycles(db_session) -> None:
+    project_id = await _project(db_session)
+    root = _artifact(project_id, "root")
+    archived = _artifact(project_id, "archived", deleted_at=datetime.now(UTC))
+    folder = _artifact(project_id, "folder")
+    leaf = _artifact(project_id, "leaf")
+    loop_a, loop_b = _artifact(project_id, "loop a"), _artifact(project_id, "loop b")
+    db_session.add_all([root, archived, folder, leaf, loop_a, loop_b])
+    await db_session.flush()
+    archived.parent_id = root.id
+    folder.parent_id = archived.id
+    leaf.parent_id = folder.id
+    loop_a.parent_id, loop_b.parent_id = loop_b.id, loop_a.id
+    await db_session.flush()
+    repo = SqlAlchemyArtifactRepository(db_session)
+
+    ancestors = await repo.list_ancestors_in_project(project_id, [leaf.id])
+    assert {x.id for x in ancestors} == {folder.id}
+
+    looped = await repo.list_ancestors_in_project(project_id, [loop_a.id])
+    assert {x.id for x in looped} == {loop_a.id, loop_b.id}
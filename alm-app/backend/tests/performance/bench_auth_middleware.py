@@ -0,0 +1,148 @@
+#!/usr/bin/env -S uv run python
+"""Micro-benchmark: authenticated request throughput, legacy vs. pure ASGI auth middleware stack.
+
+``legacy`` rebuilds the previous stack: ``TenantContextMiddleware`` and ``RateLimitMiddleware`` as
+``BaseHTTPMiddleware`` subclasses, each decoding the bearer token, plus a ``get_current_user`` that
+decodes it a third time. ``asgi`` is the current stack: ``AuthContextMiddleware`` verifies the token once
+and the tenant context, rate limiter and ``get_current_user`` read the principal from the scope.
+
+The route is a trivial ``GET`` depending on ``get_current_user``. The rate-limit check (local token bucket
+and Redis sliding window) is replaced by an always-allow coroutine in both stacks so only middleware / JWT
+overhead is measured.
+Requests go through ``httpx.ASGITransport`` (no sockets).
+
+Usage:
+  cd alm-app/backend
+  uv run python tests/performance/bench_auth_middleware.py [--requests 5000] [--concurrency 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+import uuid
+from unittest.mock import patch
+
+
+def _legacy_app():  # type: ignore[no-untyped-def]
+    from fastapi import Depends, FastAPI
+    from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+    from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+    from starlette.requests import Request
+    from starlette.responses import Response
+
+    from alm.shared.infrastructure.db.tenant_context import set_current_tenant_id
+    from alm.shared.infrastructure.rate_limiter import check_sliding_window
+    from alm.shared.infrastructure.security.jwt import InvalidTokenError, decode_token
+
+    def _tenant(request: Request) -> uuid.UUID | None:
+        auth_header = request.headers.get("authorization", "")
+        if auth_header.startswith("Bearer "):
+            try:
+                return decode_token(auth_header[7:]).tid
+            except InvalidTokenError:
+                return None
+        return None
+
+    class LegacyTenantContextMiddleware(BaseHTTPMiddleware):
+        async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+            set_current_tenant_id(_tenant(request))
+            try:
+                return await call_next(request)
+            finally:
+                set_current_tenant_id(None)
+
+    class LegacyRateLimitMiddleware(BaseHTTPMiddleware):
+        async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+            tenant_id = _tenant(request)
+            if tenant_id is not None:
+                await check_sliding_window(tenant_id)
+            return await call_next(request)
+
+    bearer = HTTPBearer()
+
+    async def legacy_current_user(credentials: HTTPAuthorizationCredentials = Depends(bearer)) -> uuid.UUID:
+        return decode_token(credentials.credentials).sub
+
+    app = FastAPI()
+    app.add_middleware(LegacyTenantContextMiddleware)
+    app.add_middleware(LegacyRateLimitMiddleware)
+
+    @app.get("/api/v1/ping")
+    async def ping(user_id: uuid.UUID = Depends(legacy_current_user)) -> dict[str, str]:
+        return {"user": str(user_id)}
+
+    return app
+
+
+def _asgi_app():  # type: ignore[no-untyped-def]
+    from fastapi import Depends, FastAPI
+
+    from alm.shared.infrastructure.rate_limit_middleware import RateLimitMiddleware
+    from alm.shared.infrastructure.security.auth_context import AuthContextMiddleware
+    from alm.shared.infrastructure.security.dependencies import CurrentUser, get_current_user
+    from alm.shared.infrastructure.tenant_middleware import TenantContextMiddleware
+
+    app = FastAPI()
+    app.add_middleware(TenantContextMiddleware)
+    app.add_middleware(RateLimitMiddleware)
+    app.add_middleware(AuthContextMiddleware)
+
+    @app.get("/api/v1/ping")
+    async def ping(user: CurrentUser = Depends(get_current_user)) -> dict[str, str]:
+        return {"user": str(user.id)}
+
+    return app
+
+
+async def _measure(app, token: str, requests: int, concurrency: int) -> float:  # type: ignore[no-untyped-def]
+    import httpx
+
+    headers = {"Authorization": f"Bearer {token}"}
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        for _ in range(50):
+            (await client.get("/api/v1/ping", headers=headers)).raise_for_status()
+
+        remaining = requests
+
+        async def worker() -> None:
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                (await client.get("/api/v1/ping", headers=headers)).raise_for_status()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return time.perf_counter() - start
+
+
+async def _run(requests: int, concurrency: int) -> None:
+    from alm.shared.infrastructure.security.jwt import create_access_token
+
+    token = create_access_token(uuid.uuid4(), uuid.uuid4(), ["admin"])
+
+    async def _allow(_tenant_id: uuid.UUID, *_args: object, **_kwargs: object) -> tuple[bool, int]:
+        return True, 0
+
+    with (
+        patch("alm.shared.infrastructure.rate_limiter.check_sliding_window", _allow),
+        patch("alm.shared.infrastructure.rate_limit_middleware.check_rate_limit", _allow),
+        patch("alm.shared.infrastructure.rate_limit_middleware.settings.debug", False),
+    ):
+        print(f"requests={requests} concurrency={concurrency}")
+        for name, factory in (("legacy", _legacy_app), ("asgi", _asgi_app)):
+            elapsed = await _measure(factory(), token, requests, concurrency)
+            print(f"  {name:<7} {requests / elapsed:8.0f} req/s ({elapsed / requests * 1e6:.0f} us/request)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(_run(max(1, args.requests), max(1, args.concurrency)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env -S uv run python
+"""Micro-benchmark: in-memory planning phase of the bulk artifact import.
+
+Builds a synthetic quality tree (folders referenced by ``path``, test cases by ``parent_key``) and times
+``_ImportPlanner.plan``. The rows are listed children-first so every row initially waits on its parent,
+which is the worst case for dependency resolution. Database writes are not included.
+
+Usage:
+  cd alm-app/backend
+  uv run python tests/performance/bench_import_planner.py [--rows 50000] [--folders 500]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import uuid
+from unittest.mock import patch
+
+
+def _run(rows: int, folders: int) -> None:
+    from alm.artifact.application import import_export_service as svc
+    from alm.artifact.domain.entities import Artifact
+    from alm.artifact.domain.manifest_cache import compile_manifest
+    from alm.config.seed import iter_builtin_merged_manifest_bundles_for_tests
+
+    bundle = dict(iter_builtin_merged_manifest_bundles_for_tests())["basic"]
+    compiled = compile_manifest(uuid.uuid4(), bundle, fulltext_default="english")
+    project_id = uuid.uuid4()
+    root = Artifact(project_id=project_id, artifact_type="root-quality", title="Quality", state="active")
+
+    import_rows: list[svc._ImportArtifactRow] = []
+    for i in range(rows - folders):
+        import_rows.append(
+            svc._ImportArtifactRow(
+                row_number=len(import_rows) + 2,
+                sheet="artifacts",
+                artifact_key=f"TC-{i}",
+                artifact_type="test-case",
+                title=f"Case {i}",
+                description="",
+                parent_key=f"QF-{i % folders}",
+            )
+        )
+    for f in range(folders):
+        import_rows.append(
+            svc._ImportArtifactRow(
+                row_number=len(import_rows) + 2,
+                sheet="artifacts",
+                artifact_key=f"QF-{f}",
+                artifact_type="quality-folder",
+                title=f"Folder {f}",
+                description="",
+                path=f"Quality/Folder {f}",
+            )
+        )
+
+    planner = svc._ImportPlanner(
+        compiled=compiled,
+        tenant_id=uuid.uuid4(),
+        project_id=project_id,
+        actor_id=None,
+        scope="generic",
+        mode="create",
+        existing=[root],
+        step_rows_by_key={},
+        known_keys=set(),
+        root_defect_id=None,
+        area_paths={},
+    )
+    result = svc.ArtifactImportResult()
+    with patch.object(svc, "workflow_get_initial_state", return_value="new"):
+        start = time.perf_counter()
+        planned = planner.plan(import_rows, result)
+        elapsed = time.perf_counter() - start
+
+    print(f"rows={rows} folders={folders} planned={len(planned)} failed={result.failed_count}")
+    print(f"  plan: {elapsed:.2f}s ({elapsed / max(1, rows) * 1e6:.1f} us/row)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--folders", type=int, default=500)
+    args = parser.parse_args()
+    _run(max(2, args.rows), max(1, min(args.folders, args.rows - 1)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env -S uv run python
+"""Micro-benchmark: per-request CPU overhead of the ``require_manifest_acl`` dependency.
+
+Compares the previous path (``GetProjectManifest`` merge + uncached ``_to_ast`` + ``acl_check`` on every
+request) with the current one (process-wide compiled manifest + memoized ACL decision). Repositories are
+in-memory stubs so the numbers isolate manifest/ACL work from database latency.
+
+Usage:
+  cd alm-app/backend
+  uv run python tests/performance/bench_manifest_acl.py [--iterations 2000] [--template scrum]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+import uuid
+from types import SimpleNamespace
+from typing import Any
+
+
+class _ProjectRepo:
+    def __init__(self, project: Any) -> None:
+        self._project = project
+
+    async def find_by_id(self, _project_id: uuid.UUID) -> Any:
+        return self._project
+
+
+class _ProcessTemplateRepo:
+    def __init__(self, version: Any) -> None:
+        self._version = version
+
+    async def find_version_by_id(self, _version_id: uuid.UUID) -> Any:
+        return self._version
+
+    async def find_default_version(self) -> Any:
+        return self._version
+
+    async def find_by_id(self, _template_id: uuid.UUID) -> Any:
+        return SimpleNamespace(name="Bench", slug="bench")
+
+
+async def _legacy_check(handler: Any, query: Any, roles: list[str]) -> None:
+    from alm.artifact.domain.mpc_resolver import _to_ast, acl_check
+
+    manifest = await handler.handle(query)
+    ast = _to_ast(manifest.manifest_bundle or {})
+    acl_check(ast, "read", "artifact", roles)
+
+
+async def _run(iterations: int, template: str) -> None:
+    from alm.artifact.domain.manifest_cache import clear_manifest_ast_cache_for_tests
+    from alm.config.seed import iter_builtin_merged_manifest_bundles_for_tests
+    from alm.project.application.queries.get_project_manifest import (
+        GetProjectCompiledManifest,
+        GetProjectCompiledManifestHandler,
+        GetProjectManifest,
+        GetProjectManifestHandler,
+    )
+    from alm.shared.infrastructure.security.dependencies import CurrentUser
+    from alm.shared.infrastructure.security.manifest_acl import require_manifest_acl
+
+    bundles = dict(iter_builtin_merged_manifest_bundles_for_tests())
+    bundle = bundles.get(template) or bundles["basic"]
+    tenant_id = uuid.uuid4()
+    project_id = uuid.uuid4()
+    version = SimpleNamespace(id=uuid.uuid4(), template_id=uuid.uuid4(), version="1.0.0", manifest_bundle=bundle)
+    project = SimpleNamespace(tenant_id=tenant_id, process_template_version_id=version.id)
+    project_repo = _ProjectRepo(project)
+    process_repo = _ProcessTemplateRepo(version)
+    roles = ["member", "viewer"]
+
+    legacy_handler = GetProjectManifestHandler(project_repo, process_repo)  # type: ignore[arg-type]
+    legacy_query = GetProjectManifest(tenant_id=tenant_id, project_id=project_id)
+
+    compiled_handler = GetProjectCompiledManifestHandler(project_repo, process_repo)  # type: ignore[arg-type]
+
+    class _Mediator:
+        async def query(self, q: Any) -> Any:
+            assert isinstance(q, GetProjectCompiledManifest)
+            return await compiled_handler.handle(q)
+
+    check = require_manifest_acl("artifact", "read").dependency
+    org = SimpleNamespace(tenant_id=tenant_id)
+    user = CurrentUser(id=uuid.uuid4(), tenant_id=tenant_id, roles=roles)
+    mediator = _Mediator()
+
+    clear_manifest_ast_cache_for_tests()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await _legacy_check(legacy_handler, legacy_query, roles)
+    legacy = (time.perf_counter() - start) / iterations
+
+    clear_manifest_ast_cache_for_tests()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await check(project_id=project_id, org=org, user=user, mediator=mediator)
+    cached = (time.perf_counter() - start) / iterations
+
+    print(f"template={template} defs={len(bundle.get('defs') or [])} iterations={iterations}")
+    print(f"  before (merge + normalize + acl per request): {legacy * 1e6:10.1f} us/request")
+    print(f"  after  (compiled manifest + memoized acl):    {cached * 1e6:10.1f} us/request")
+    if cached > 0:
+        print(f"  speedup: {legacy / cached:.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--template", default="scrum", help="Built-in template slug (basic, scrum, kanban, ...)")
+    args = parser.parse_args()
+    asyncio.run(_run(max(1, args.iterations), args.template))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
+import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import replace
+from typing import Any
 from unittest.mock import AsyncMock
 
+from alm.artifact.domain.entities import Artifact
 from alm.artifact.domain.manifest_ast import SimpleAST
+from alm.quality.application.run_metrics_v1 import execution_results_from_custom_fields
+from alm.quality.domain.entities import ExecutionResult
+from alm.quality.domain.ports import ExecutionResultRepository, TraceabilityResultCache
 
 
 def simple_manifest_ast() -> SimpleAST:
-    """AST with empty defs — use when patching ``get_manifest_ast`` in command tests."""
+    """AST with empty defs — use when patching ``get_manifest_ast`` / ``manifest_cache._parse_ast`` in command tests."""
     return SimpleAST({})
 
 
@@ -21,3 +29,115 @@ def empty_project_tag_repo() -> AsyncMock:
     tr.set_artifact_tags = AsyncMock()
     tr.set_task_tags = AsyncMock()
     return tr
+
+
+class InMemoryExecutionResultRepository(ExecutionResultRepository):
+    """``test_execution_results`` over in-memory runs, ordered like the SQL ``DISTINCT ON`` query."""
+
+    def __init__(self, runs: list[Artifact] | None = None) -> None:
+        self._rows: list[ExecutionResult] = []
+        for run in runs or []:
+            self._index(run)
+
+    def _index(self, run: Artifact) -> None:
+        self._rows = [r for r in self._rows if r.run_id != run.id]
+        if run.deleted_at is None:
+            self._rows.extend(
+                replace(r, run_title=run.title, executed_at=run.updated_at)
+                for r in execution_results_from_custom_fields(run.id, run.custom_fields)
+            )
+
+    async def replace_for_runs(self, runs: list[Artifact]) -> None:
+        for run in runs:
+            self._index(run)
+
+    async def latest_for_tests(
+        self,
+        project_id: uuid.UUID,
+        run_test_pairs: list[tuple[uuid.UUID, uuid.UUID]],
+        configuration_id: str | None = None,
+    ) -> dict[uuid.UUID, ExecutionResult]:
+        allowed = set(run_test_pairs)
+        candidates = [
+            r
+            for r in self._rows
+            if (r.run_id, r.test_id) in allowed and (configuration_id is None or r.configuration_id == configuration_id)
+        ]
+        candidates.sort(key=lambda r: r.result_index)
+        candidates.sort(key=lambda r: (r.executed_at.timestamp() if r.executed_at else 0.0, r.run_id), reverse=True)
+        latest: dict[uuid.UUID, ExecutionResult] = {}
+        for r in candidates:
+            latest.setdefault(r.test_id, r)
+        return latest
+
+
+class InMemoryTraceabilityResultCache(TraceabilityResultCache):
+    """Results per (project, generation, key) in a dict; no serialization or eviction."""
+
+    def __init__(self) -> None:
+        self.generations: dict[uuid.UUID, int] = {}
+        self._data: dict[tuple[uuid.UUID, int, str], Any] = {}
+
+    async def get_or_compute(
+        self,
+        project_id: uuid.UUID,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        *,
+        refresh: bool = False,
+    ) -> tuple[Any, bool]:
+        entry_key = (project_id, self.generations.get(project_id, 0), key)
+        if not refresh and entry_key in self._data:
+            return self._data[entry_key], True
+        value = await compute()
+        self._data[entry_key] = value
+        return value, False
+
+    async def bump_generation(self, project_id: uuid.UUID) -> None:
+        self.generations[project_id] = self.generations.get(project_id, 0) + 1
+
+
+class FakeRedis:
+    """The subset of the async Redis client used by the generation-keyed caches (get, set NX, incr, pipeline)."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, Any] = {}
+        self.incr_calls = 0
+
+    async def get(self, key: str) -> Any:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: Any, *, nx: bool = False, ex: int | None = None) -> bool:
+        if nx and key in self.data:
+            return False
+        self.data[key] = str(value).encode() if isinstance(value, int) else value
+        return True
+
+    async def incr(self, key: str) -> int:
+        self.incr_calls += 1
+        self.data[key] = str(int(self.data.get(key, b"0")) + 1).encode()
+        return int(self.data[key])
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis: FakeRedis) -> None:
+        self._redis = redis
+        self._ops: list[tuple[str, tuple[Any, ...], dict[str, Any]]] = []
+
+    async def __aenter__(self) -> FakePipeline:
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        return None
+
+    def set(self, *args: Any, **kwargs: Any) -> None:
+        self._ops.append(("set", args, kwargs))
+
+    def incr(self, *args: Any) -> None:
+        self._ops.append(("incr", args, {}))
+
+    async def execute(self) -> list[Any]:
+        return [await getattr(self._redis, op)(*args, **kwargs) for op, args, kwargs in self._ops]
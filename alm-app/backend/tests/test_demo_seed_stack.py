@@ -180,10 +180,11 @@ async def test_run_startup_seeds_demo_backlog_end_to_end(postgres_url: str, monk
                 )
             )
             stack.enter_context(patch("alm.main.run_subscriber", _noop_subscriber))
+            stack.enter_context(patch("alm.main.run_permission_invalidation_subscriber", _noop_subscriber))
             stack.enter_context(patch("alm.main.run_domain_event_outbox_worker", _noop_domain_event_outbox_worker))
             stack.enter_context(
                 patch(
-                    "alm.shared.infrastructure.rate_limit_middleware.check_sliding_window",
+                    "alm.shared.infrastructure.rate_limit_middleware.check_rate_limit",
                     new_callable=AsyncMock,
                     return_value=(True, 0),
                 )
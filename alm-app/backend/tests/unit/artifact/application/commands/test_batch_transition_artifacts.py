@@ -0,0 +1,154 @@
+"""BatchTransitionArtifacts: one load, one shared manifest, one bulk write, per-item results."""
+
+from __future__ import annotations
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from alm.artifact.application.commands.batch_transition_artifacts import (
+    BatchTransitionArtifacts,
+    BatchTransitionArtifactsHandler,
+)
+from alm.artifact.application.commands.transition_artifact import TransitionPlan
+from alm.artifact.domain.entities import Artifact
+from alm.artifact.domain.ports import TransitionWrite
+from alm.shared.domain.exceptions import GuardDeniedError, PolicyDeniedError
+
+_PLAN = "alm.artifact.application.commands.batch_transition_artifacts.plan_transition"
+
+
+def _setup(artifacts: list[Artifact]):
+    tenant_id = uuid.uuid4()
+    project_repo = AsyncMock()
+    project_repo.find_by_id.return_value = MagicMock(tenant_id=tenant_id, process_template_version_id=uuid.uuid4())
+    process_template_repo = AsyncMock()
+    process_template_repo.find_version_by_id.return_value = MagicMock(id=uuid.uuid4(), manifest_bundle={})
+    artifact_repo = AsyncMock()
+    artifact_repo.list_by_ids_in_project.return_value = artifacts
+    artifact_repo.apply_transitions.side_effect = lambda arts, expected, all_or_nothing: TransitionWrite(
+        written=frozenset(a.id for a in arts)
+    )
+    handler = BatchTransitionArtifactsHandler(artifact_repo, project_repo, process_template_repo, MagicMock())
+    return tenant_id, artifact_repo, handler
+
+
+def _artifact(project_id: uuid.UUID) -> Artifact:
+    return Artifact(project_id=project_id, artifact_type="task", title="t", state="new", id=uuid.uuid4())
+
+
+def _plan_for(outcomes: dict[uuid.UUID, Exception]):
+    def plan(compiled, artifact, **_kwargs):
+        if artifact.id in outcomes:
+            raise outcomes[artifact.id]
+        return TransitionPlan(to_state="active", resolution=None, actions={"on_leave": [], "on_enter": []})
+
+    return plan
+
+
+@pytest.mark.asyncio
+async def test_batch_transition_applies_valid_items_in_one_write():
+    project_id = uuid.uuid4()
+    ok, guarded, policy, stale = (_artifact(project_id) for _ in range(4))
+    tenant_id, artifact_repo, handler = _setup([ok, guarded, policy, stale])
+    artifact_repo.apply_transitions.side_effect = lambda arts, expected, all_or_nothing: TransitionWrite(
+        written=frozenset({ok.id}), conflicted=frozenset({stale.id})
+    )
+    missing = uuid.uuid4()
+
+    with patch(_PLAN, side_effect=_plan_for({guarded.id: GuardDeniedError("g"), policy.id: PolicyDeniedError("p")})):
+        result = await handler.handle(
+            BatchTransitionArtifacts(
+                tenant_id=tenant_id,
+                project_id=project_id,
+                artifact_ids=(ok.id, guarded.id, policy.id, stale.id, missing),
+                new_state="active",
+            )
+        )
+
+    artifact_repo.list_by_ids_in_project.assert_awaited_once()
+    artifact_repo.apply_transitions.assert_awaited_once()
+    written, expected = artifact_repo.apply_transitions.await_args.args
+    assert [a.id for a in written] == [ok.id, stale.id]
+    assert set(expected) == {ok.id, stale.id}
+    assert result.results == {
+        ok.id: "ok",
+        guarded.id: "guard_denied",
+        policy.id: "policy_denied",
+        stale.id: "conflict_error",
+        missing: "validation_error",
+    }
+    assert result.success_count == 1
+    assert ok.state == "active"
+
+
+@pytest.mark.asyncio
+async def test_batch_transition_all_or_nothing_skips_write_when_any_item_fails():
+    project_id = uuid.uuid4()
+    ok, guarded = _artifact(project_id), _artifact(project_id)
+    tenant_id, artifact_repo, handler = _setup([ok, guarded])
+
+    with patch(_PLAN, side_effect=_plan_for({guarded.id: GuardDeniedError("g")})):
+        result = await handler.handle(
+            BatchTransitionArtifacts(
+                tenant_id=tenant_id,
+                project_id=project_id,
+                artifact_ids=(ok.id, guarded.id),
+                new_state="active",
+                all_or_nothing=True,
+            )
+        )
+
+    artifact_repo.apply_transitions.assert_not_awaited()
+    assert result.results == {guarded.id: "guard_denied", ok.id: "aborted"}
+    assert result.success_count == 0
+
+
+@pytest.mark.asyncio
+async def test_batch_transition_all_or_nothing_reports_conflict_and_aborts_the_rest_when_write_rolled_back():
+    project_id = uuid.uuid4()
+    a, stale, c = _artifact(project_id), _artifact(project_id), _artifact(project_id)
+    tenant_id, artifact_repo, handler = _setup([a, stale, c])
+    artifact_repo.apply_transitions.side_effect = lambda arts, expected, all_or_nothing: TransitionWrite(
+        conflicted=frozenset({stale.id})
+    )
+
+    with patch(_PLAN, side_effect=_plan_for({})):
+        result = await handler.handle(
+            BatchTransitionArtifacts(
+                tenant_id=tenant_id,
+                project_id=project_id,
+                artifact_ids=(a.id, stale.id, c.id),
+                new_state="active",
+                all_or_nothing=True,
+            )
+        )
+
+    assert artifact_repo.apply_transitions.await_args.kwargs == {"all_or_nothing": True}
+    assert result.results == {a.id: "aborted", stale.id: "conflict_error", c.id: "aborted"}
+    assert result.success_count == 0
+
+
+@pytest.mark.asyncio
+async def test_batch_transition_reports_rejected_rows_apart_from_version_conflicts():
+    project_id = uuid.uuid4()
+    ok, stale, rejected = _artifact(project_id), _artifact(project_id), _artifact(project_id)
+    tenant_id, artifact_repo, handler = _setup([ok, stale, rejected])
+    artifact_repo.apply_transitions.side_effect = lambda arts, expected, all_or_nothing: TransitionWrite(
+        written=frozenset({ok.id}), conflicted=frozenset({stale.id}), failed=frozenset({rejected.id})
+    )
+
+    with patch(_PLAN, side_effect=_plan_for({})):
+        result = await handler.handle(
+            BatchTransitionArtifacts(
+                tenant_id=tenant_id,
+                project_id=project_id,
+                artifact_ids=(ok.id, stale.id, rejected.id),
+                new_state="active",
+            )
+        )
+
+    assert result.results == {ok.id: "ok", stale.id: "conflict_error", rejected.id: "write_error"}
+    assert "modified by someone else" in result.errors[stale.id]
+    assert "modified by someone else" not in result.errors[rejected.id]
@@ -71,7 +71,7 @@ async def test_transition_artifact_optimistic_locking_conflict():
 
     # Act & Assert
     with (
-        patch("alm.artifact.application.commands.transition_artifact.get_manifest_ast", return_value=simple_manifest_ast()),
+        patch("alm.artifact.domain.manifest_cache._parse_ast", return_value=simple_manifest_ast()),
         pytest.raises(ConflictError, match="modified by someone else"),
     ):
         await handler.handle(command)
@@ -106,7 +106,7 @@ async def test_transition_artifact_invalid_trigger():
 
     # Act & Assert
     with (
-        patch("alm.artifact.application.commands.transition_artifact.get_manifest_ast", return_value=simple_manifest_ast()),
+        patch("alm.artifact.domain.manifest_cache._parse_ast", return_value=simple_manifest_ast()),
         patch("alm.artifact.application.commands.transition_artifact.get_permitted_triggers", return_value=[]),
         pytest.raises(ValidationError, match="is not permitted"),
     ):
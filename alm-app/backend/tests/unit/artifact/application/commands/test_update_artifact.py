@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import uuid
+from unittest.mock import AsyncMock
+
+import pytest
+from tests.support.mocks import empty_project_tag_repo
+
+from alm.artifact.application.commands.update_artifact import UpdateArtifact, UpdateArtifactHandler
+from alm.artifact.domain.entities import Artifact
+from alm.artifact.domain.events import ArtifactDeleted, ArtifactRestored, ArtifactScheduleChanged
+
+
+def _defect(**kwargs: object) -> Artifact:
+    return Artifact(uuid.uuid4(), "defect", "Crash", "new", parent_id=uuid.uuid4(), **kwargs)  # type: ignore[arg-type]
+
+
+async def _update(artifact: Artifact, updates: dict[str, object]) -> None:
+    tenant_id = uuid.uuid4()
+    artifact_repo = AsyncMock()
+    artifact_repo.find_by_id = AsyncMock(return_value=artifact)
+    project_repo = AsyncMock()
+    project_repo.find_by_id = AsyncMock(return_value=AsyncMock(tenant_id=tenant_id, process_template_version_id=None))
+    handler = UpdateArtifactHandler(
+        artifact_repo=artifact_repo,
+        project_repo=project_repo,
+        area_repo=AsyncMock(),
+        process_template_repo=AsyncMock(),
+        tag_repo=empty_project_tag_repo(),
+    )
+    await handler.handle(
+        UpdateArtifact(tenant_id=tenant_id, project_id=artifact.project_id, artifact_id=artifact.id, updates=updates)
+    )
+    artifact_repo.update.assert_awaited_once_with(artifact)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "updates",
+    [{"cycle_id": str(uuid.uuid4())}, {"custom_fields": {"story_points": 5}}],
+)
+async def test_cycle_moves_and_effort_changes_emit_schedule_changed(updates: dict[str, object]) -> None:
+    artifact = _defect(custom_fields={"story_points": 3})
+
+    await _update(artifact, updates)
+
+    assert [type(e) for e in artifact.collect_events()] == [ArtifactScheduleChanged]
+
+
+@pytest.mark.asyncio
+async def test_updates_that_keep_cycle_and_fields_emit_nothing() -> None:
+    artifact = _defect(cycle_id=uuid.uuid4(), custom_fields={"story_points": 3})
+
+    await _update(artifact, {"title": "Crash on save", "custom_fields": {"story_points": 3}})
+
+    assert artifact.collect_events() == []
+
+
+def test_soft_delete_and_restore_emit_events() -> None:
+    artifact = _defect()
+
+    artifact.soft_delete(by=uuid.uuid4())
+    artifact.restore()
+
+    assert [type(e) for e in artifact.collect_events()] == [ArtifactDeleted, ArtifactRestored]
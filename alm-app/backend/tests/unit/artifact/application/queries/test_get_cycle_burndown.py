@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, date, datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from alm.artifact.application.queries.get_cycle_burndown import GetCycleBurndown, GetCycleBurndownHandler
+from alm.cycle.domain.entities import BurndownSnapshot, Cadence
+from alm.project.domain.entities import Project
+
+
+def _handler(project: Project, cycle: Cadence, snapshots: list[BurndownSnapshot]):
+    project_repo = AsyncMock()
+    project_repo.find_by_id = AsyncMock(return_value=project)
+    cycle_repo = AsyncMock()
+    cycle_repo.find_by_id = AsyncMock(return_value=cycle)
+    snapshot_repo = AsyncMock()
+    snapshot_repo.list_by_cycle = AsyncMock(return_value=snapshots)
+    artifact_repo = AsyncMock()
+    artifact_repo.sum_effort_buckets_by_cycles = AsyncMock(return_value=[(cycle.id, 10.0, 4.0)])
+    handler = GetCycleBurndownHandler(
+        artifact_repo=artifact_repo,
+        cycle_repo=cycle_repo,
+        snapshot_repo=snapshot_repo,
+        project_repo=project_repo,
+        process_template_repo=AsyncMock(),
+    )
+    return handler, artifact_repo
+
+
+def _fixture() -> tuple[Project, Cadence, date]:
+    today = datetime.now(UTC).date()
+    project = Project(tenant_id=uuid.uuid4(), id=uuid.uuid4(), name="P", slug="p", code="P")
+    cycle = Cadence(
+        project.id,
+        "Sprint 1",
+        "/sprint-1",
+        start_date=today - timedelta(days=3),
+        end_date=today + timedelta(days=1),
+    )
+    return project, cycle, today
+
+
+@pytest.mark.asyncio
+async def test_daily_points_carry_snapshots_forward_without_scanning_artifacts() -> None:
+    project, cycle, today = _fixture()
+    start = cycle.start_date
+    assert start is not None
+    snapshots = [
+        BurndownSnapshot(snapshot_date=start, total_effort=20.0, completed_effort=0.0),
+        BurndownSnapshot(snapshot_date=start + timedelta(days=2), total_effort=24.0, completed_effort=9.0),
+    ]
+    handler, artifact_repo = _handler(project, cycle, snapshots)
+
+    points = await handler.handle(
+        GetCycleBurndown(tenant_id=project.tenant_id, project_id=project.id, cycle_id=cycle.id)
+    )
+
+    assert [p.remaining_effort for p in points] == [20.0, 20.0, 15.0, 15.0, None]
+    assert [p.total_effort for p in points][:4] == [20.0, 20.0, 24.0, 24.0]
+    assert points[0].ideal_effort == 20.0 and points[-1].ideal_effort == 0.0
+    assert points[-1].date == (today + timedelta(days=1)).isoformat()
+    artifact_repo.sum_effort_buckets_by_cycles.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_cycle_without_snapshots_falls_back_to_live_point_for_today() -> None:
+    project, cycle, _today = _fixture()
+    handler, artifact_repo = _handler(project, cycle, [])
+
+    points = await handler.handle(
+        GetCycleBurndown(tenant_id=project.tenant_id, project_id=project.id, cycle_id=cycle.id)
+    )
+
+    assert [p.remaining_effort for p in points] == [None, None, None, 6.0, None]
+    artifact_repo.sum_effort_buckets_by_cycles.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_other_tenant_gets_empty_burndown() -> None:
+    project, cycle, _today = _fixture()
+    handler, _ = _handler(project, cycle, [])
+
+    points = await handler.handle(GetCycleBurndown(tenant_id=uuid.uuid4(), project_id=project.id, cycle_id=cycle.id))
+
+    assert points == []
@@ -0,0 +1,116 @@
+"""Keyset cursors and optional/estimated totals for ListArtifactsHandler."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from alm.artifact.application.queries import list_artifacts as la
+from alm.artifact.application.queries.list_artifacts import (
+    ListArtifacts,
+    ListArtifactsHandler,
+    decode_artifact_cursor,
+    encode_artifact_cursor,
+)
+from alm.artifact.domain.entities import Artifact
+from alm.shared.domain.exceptions import ValidationError
+
+TENANT = uuid.uuid4()
+
+
+def _artifacts(project_id: uuid.UUID, n: int) -> list[Artifact]:
+    return [
+        Artifact(
+            project_id, "requirement", f"R{i}", "new", id=uuid.uuid4(), created_at=datetime(2026, 1, i + 1, tzinfo=UTC)
+        )
+        for i in range(n)
+    ]
+
+
+def _handler(artifacts: list[Artifact]) -> tuple[ListArtifactsHandler, MagicMock]:
+    artifact_repo = MagicMock()
+    artifact_repo.list_by_project = AsyncMock(return_value=artifacts)
+    artifact_repo.count_by_project = AsyncMock(return_value=500)
+    artifact_repo.estimate_count_by_project = AsyncMock(return_value=480)
+    project_repo = MagicMock()
+    project_repo.find_by_id = AsyncMock(
+        return_value=SimpleNamespace(tenant_id=TENANT, process_template_version_id=None)
+    )
+    tag_repo = MagicMock()
+    tag_repo.get_tags_by_artifact_ids = AsyncMock(return_value={})
+    handler = ListArtifactsHandler(artifact_repo, project_repo, MagicMock(), MagicMock(), tag_repo)
+    return handler, artifact_repo
+
+
+def test_cursor_round_trips_datetime_sort_value_and_id():
+    artifact = _artifacts(uuid.uuid4(), 1)[0]
+
+    cursor = encode_artifact_cursor(artifact, None, None)
+
+    assert decode_artifact_cursor(cursor, "created_at", "desc") == (artifact.created_at, artifact.id)
+
+
+@pytest.mark.parametrize(
+    ("cursor", "sort_by", "sort_order"),
+    [("not-a-cursor", None, None), (None, "title", "desc"), (None, None, "asc")],
+)
+def test_cursor_rejects_garbled_or_foreign_sort(cursor, sort_by, sort_order):
+    cursor = cursor or encode_artifact_cursor(_artifacts(uuid.uuid4(), 1)[0], None, None)
+
+    with pytest.raises(ValidationError):
+        decode_artifact_cursor(cursor, sort_by, sort_order)
+
+
+@pytest.mark.asyncio
+async def test_full_page_returns_next_cursor_and_skips_count_when_total_mode_none():
+    project_id = uuid.uuid4()
+    artifacts = _artifacts(project_id, 3)
+    handler, repo = _handler(artifacts)
+
+    with patch.object(la, "effective_compiled_manifest", AsyncMock(return_value=None)):
+        result = await handler.handle(
+            ListArtifacts(tenant_id=TENANT, project_id=project_id, limit=2, total_mode="none")
+        )
+
+    assert [d.id for d in result.items] == [a.id for a in artifacts[:2]]
+    assert result.total is None
+    assert decode_artifact_cursor(result.next_cursor, None, None) == (artifacts[1].created_at, artifacts[1].id)
+    assert repo.list_by_project.call_args.kwargs["limit"] == 3
+    repo.count_by_project.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_cursor_page_passes_keyset_and_uses_planner_estimate():
+    project_id = uuid.uuid4()
+    artifacts = _artifacts(project_id, 3)
+    handler, repo = _handler(artifacts)
+    cursor = encode_artifact_cursor(artifacts[0], None, None)
+
+    with patch.object(la, "effective_compiled_manifest", AsyncMock(return_value=None)):
+        result = await handler.handle(
+            ListArtifacts(
+                tenant_id=TENANT, project_id=project_id, limit=2, offset=40, cursor=cursor, total_mode="estimate"
+            )
+        )
+
+    kwargs = repo.list_by_project.call_args.kwargs
+    assert kwargs["after"] == (artifacts[0].created_at, artifacts[0].id)
+    assert kwargs["offset"] is None
+    assert (result.total, result.total_is_estimate) == (480, True)
+    repo.count_by_project.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_short_first_page_knows_total_without_counting():
+    project_id = uuid.uuid4()
+    handler, repo = _handler(_artifacts(project_id, 2))
+
+    with patch.object(la, "effective_compiled_manifest", AsyncMock(return_value=None)):
+        result = await handler.handle(ListArtifacts(tenant_id=TENANT, project_id=project_id, limit=20, offset=0))
+
+    assert (result.total, result.next_cursor) == (2, None)
+    repo.count_by_project.assert_not_called()
@@ -0,0 +1,120 @@
+"""Streaming artifact export: paged cursor reads feeding CSV, zip and write-only XLSX writers."""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import uuid
+import zipfile
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from openpyxl import load_workbook
+
+from alm.artifact.application import import_export_service as svc
+from alm.artifact.application.queries.list_artifacts import ArtifactListScope
+from alm.artifact.domain.entities import Artifact
+
+
+def _artifacts(project_id: uuid.UUID) -> list[Artifact]:
+    folder = Artifact(project_id, "quality-folder", "Smoke", "active", id=uuid.uuid4(), artifact_key="QF-1")
+    steps = [{"id": "s1", "name": "Open page", "expectedResult": "Shown"}]
+    cases = [
+        Artifact(
+            project_id,
+            "test-case",
+            f"Case {i}",
+            "new",
+            id=uuid.uuid4(),
+            parent_id=folder.id,
+            artifact_key=f"TC-{i}",
+            custom_fields={"priority": "high", "test_steps_json": json.dumps(steps)},
+        )
+        for i in range(3)
+    ]
+    return [folder, *cases]
+
+
+async def _collect(stream: svc.ArtifactExportStream) -> bytes:
+    return b"".join([chunk async for chunk in stream.chunks])
+
+
+async def _export(artifacts: list[Artifact], **kw) -> tuple[bytes, svc.ArtifactExportStream, MagicMock]:
+    project_id = artifacts[0].project_id
+    artifact_repo = MagicMock()
+
+    async def _pages(*_args, **_kwargs):
+        yield artifacts[:2]
+        yield artifacts[2:]
+
+    artifact_repo.stream_by_project = MagicMock(side_effect=_pages)
+    artifact_repo.list_hierarchy_by_project = AsyncMock(
+        return_value=[(a.id, a.parent_id, a.title, a.artifact_key) for a in artifacts]
+    )
+    artifact_repo.list_custom_field_keys_by_project = AsyncMock(return_value=["priority", "test_steps_json"])
+    project_repo = MagicMock()
+    project_repo.find_by_id = AsyncMock(return_value=SimpleNamespace(tenant_id=uuid.uuid4()))
+    tag_repo = MagicMock()
+    tag_repo.get_tags_by_artifact_ids = AsyncMock(return_value={artifacts[1].id: (SimpleNamespace(name="smoke"),)})
+    scope = ArtifactListScope(compiled=None, filters={"type_filter": None})
+
+    with (
+        patch.object(svc, "SqlAlchemyArtifactRepository", return_value=artifact_repo),
+        patch.object(svc, "SqlAlchemyProjectRepository", return_value=project_repo),
+        patch.object(svc, "SqlAlchemyProjectTagRepository", return_value=tag_repo),
+        patch.object(svc, "SqlAlchemyCycleRepository"),
+        patch.object(svc, "SqlAlchemyProcessTemplateRepository"),
+        patch.object(svc.ListArtifactsHandler, "resolve_scope", AsyncMock(return_value=scope)),
+    ):
+        stream = await svc.export_artifacts(MagicMock(), project_id=project_id, **kw)
+        content = await _collect(stream)
+    return content, stream, artifact_repo
+
+
+@pytest.mark.asyncio
+async def test_csv_export_streams_pages_with_paths_tags_and_custom_fields():
+    artifacts = _artifacts(uuid.uuid4())
+
+    content, stream, artifact_repo = await _export(artifacts, format="csv", scope="generic")
+
+    assert stream.filename == "artifacts-export.csv"
+    rows = list(csv.DictReader(io.StringIO(content.decode("utf-8-sig"))))
+    assert [r["artifact_key"] for r in rows] == ["QF-1", "TC-0", "TC-1", "TC-2"]
+    assert rows[1]["path"] == "Smoke/Case 0"
+    assert rows[1]["parent_key"] == "QF-1"
+    assert rows[1]["tag_names"] == "smoke"
+    assert rows[1]["cf.priority"] == "high"
+    assert artifact_repo.stream_by_project.call_args.kwargs["page_size"] == svc._EXPORT_PAGE_SIZE
+
+
+@pytest.mark.asyncio
+async def test_testcases_csv_export_streams_zip_with_artifact_and_step_members():
+    artifacts = _artifacts(uuid.uuid4())
+
+    content, stream, artifact_repo = await _export(artifacts, format="csv", scope="testcases")
+
+    assert stream.filename == "testcases-export.zip"
+    with zipfile.ZipFile(io.BytesIO(content)) as archive:
+        assert archive.namelist() == ["artifacts.csv", "test_case_steps.csv"]
+        artifact_rows = list(csv.DictReader(io.StringIO(archive.read("artifacts.csv").decode("utf-8-sig"))))
+        step_rows = list(csv.DictReader(io.StringIO(archive.read("test_case_steps.csv").decode("utf-8-sig"))))
+    assert "cf.test_steps_json" not in artifact_rows[0]
+    assert len(artifact_rows) == 4
+    assert [(r["test_case_key"], r["action"]) for r in step_rows] == [(f"TC-{i}", "Open page") for i in range(3)]
+    assert artifact_repo.stream_by_project.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_testcases_xlsx_export_writes_both_sheets_in_one_pass():
+    artifacts = _artifacts(uuid.uuid4())
+
+    content, stream, artifact_repo = await _export(artifacts, format="xlsx", scope="testcases")
+
+    assert stream.filename == "testcases-export.xlsx"
+    workbook = load_workbook(io.BytesIO(content))
+    assert workbook.sheetnames == ["artifacts", "test_case_steps"]
+    assert workbook["artifacts"].max_row == 5
+    assert [c.value for c in workbook["test_case_steps"]["A"]] == ["test_case_key", "TC-0", "TC-1", "TC-2"]
+    assert artifact_repo.stream_by_project.call_count == 1
@@ -0,0 +1,253 @@
+"""Set-based artifact import: dependency-ordered planning and chunked bulk writes."""
+
+from __future__ import annotations
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from alm.artifact.application import import_export_service as svc
+from alm.artifact.domain.entities import Artifact
+from alm.artifact.domain.events import ArtifactCreated
+from alm.artifact.domain.manifest_cache import compile_manifest
+from alm.artifact.infrastructure.repositories import SqlAlchemyArtifactRepository
+from alm.config.seed import iter_builtin_merged_manifest_bundles_for_tests
+from alm.project.application import event_handlers as project_event_handlers
+from alm.shared.application import mediator as mediator_module
+from alm.shared.application.mediator import SESSION_EVENTS_KEY, Mediator
+from alm.shared.infrastructure.event_lookups import event_lookup_scope
+
+_INITIAL_STATE = "alm.artifact.application.import_export_service.workflow_get_initial_state"
+
+
+def _compiled():
+    bundle = dict(iter_builtin_merged_manifest_bundles_for_tests())["basic"]
+    return compile_manifest(uuid.uuid4(), bundle, fulltext_default="english")
+
+
+def _root(project_id: uuid.UUID, artifact_type: str, title: str) -> Artifact:
+    return Artifact(project_id=project_id, artifact_type=artifact_type, title=title, state="active", id=uuid.uuid4())
+
+
+def _row(n: int, key: str, artifact_type: str, title: str, **kw) -> svc._ImportArtifactRow:
+    return svc._ImportArtifactRow(
+        row_number=n,
+        sheet="artifacts",
+        artifact_key=key,
+        artifact_type=artifact_type,
+        title=title,
+        description="",
+        **kw,
+    )
+
+
+def _planner(project_id: uuid.UUID, existing: list[Artifact], mode: svc.ImportMode = "upsert") -> svc._ImportPlanner:
+    return svc._ImportPlanner(
+        compiled=_compiled(),
+        tenant_id=uuid.uuid4(),
+        project_id=project_id,
+        actor_id=None,
+        scope="generic",
+        mode=mode,
+        existing=existing,
+        step_rows_by_key={},
+        known_keys=set(),
+        root_defect_id=None,
+        area_paths={},
+    )
+
+
+def test_planner_orders_parents_before_children_across_key_and_path_references():
+    project_id = uuid.uuid4()
+    root = _root(project_id, "root-quality", "Quality")
+    rows = [
+        _row(2, "TC-1", "test-case", "Login", parent_key="QF-2"),
+        _row(3, "QF-2", "quality-folder", "B", path="Quality/A/B"),
+        _row(4, "QF-1", "quality-folder", "A", path="Quality/A"),
+    ]
+    result = svc.ArtifactImportResult()
+
+    with patch(_INITIAL_STATE, return_value="new"):
+        planned = _planner(project_id, [root]).plan(rows, result)
+
+    assert [p.row.artifact_key for p in planned] == ["QF-1", "QF-2", "TC-1"]
+    by_key = {p.row.artifact_key: p.artifact for p in planned}
+    assert by_key["QF-1"].parent_id == root.id
+    assert by_key["QF-2"].parent_id == by_key["QF-1"].id
+    assert by_key["TC-1"].parent_id == by_key["QF-2"].id
+    assert result.failed_count == 0
+
+
+def test_planner_reports_unresolvable_and_invalid_rows():
+    project_id = uuid.uuid4()
+    root = _root(project_id, "root-quality", "Quality")
+    rows = [
+        _row(2, "TC-1", "test-case", "Orphan", parent_key="NOPE"),
+        _row(3, "TC-2", "test-case", "Under bad folder", parent_key="QF-BAD"),
+        _row(4, "QF-BAD", "quality-folder", "Bad", parent_key="TC-1"),
+        _row(5, "TC-3", "test-case", "Waiting", path="Quality/Missing/Waiting"),
+        _row(6, "TC-4", "test-case", "Directly under root", path="Quality/Directly under root"),
+    ]
+    result = svc.ArtifactImportResult()
+
+    with patch(_INITIAL_STATE, return_value="new"):
+        planned = _planner(project_id, [root]).plan(rows, result)
+
+    assert planned == []
+    messages = {r.artifact_key: r.message for r in result.rows}
+    assert "parent_key 'NOPE' was not found" in messages["TC-1"]
+    assert messages["QF-BAD"] == svc._PARENT_UNRESOLVED_MESSAGE
+    assert messages["TC-2"] == svc._PARENT_UNRESOLVED_MESSAGE
+    assert messages["TC-3"] == svc._PARENT_UNRESOLVED_MESSAGE
+    assert "must be created under a 'quality-folder'" in messages["TC-4"]
+    assert result.failed_count == 5
+
+
+@pytest.mark.asyncio
+async def test_import_allocates_key_block_and_writes_in_bulk():
+    tenant_id, project_id = uuid.uuid4(), uuid.uuid4()
+    compiled = _compiled()
+    root = _root(project_id, "root-quality", "Quality")
+    project = MagicMock(tenant_id=tenant_id, process_template_version_id=compiled.version_id, code="PRJ")
+
+    artifact_repo = AsyncMock()
+    artifact_repo.list_by_project.side_effect = lambda *a, **kw: [] if kw.get("type_filter") else [root]
+    project_repo = AsyncMock()
+    project_repo.find_by_id.return_value = project
+    project_repo.reserve_artifact_seq_block.return_value = 41
+    tag_repo = AsyncMock()
+    tag_repo.list_by_project.return_value = []
+    tag_repo.create.side_effect = lambda pid, name: MagicMock(id=uuid.uuid4())
+    session = MagicMock(info={})
+    session.begin_nested = AsyncMock(return_value=AsyncMock())
+    payload = (
+        b"artifact_key,artifact_type,title,path,tag_names\n"
+        b",test-case,Login,Quality/Smoke/Login,smoke\n"
+        b"QF-1,quality-folder,Smoke,Quality/Smoke,\n"
+        b",test-case,Logout,Quality/Smoke/Logout,smoke;regression\n"
+    )
+
+    with (
+        patch.object(svc, "SqlAlchemyArtifactRepository", return_value=artifact_repo),
+        patch.object(svc, "SqlAlchemyProjectRepository", return_value=project_repo),
+        patch.object(svc, "SqlAlchemyProjectTagRepository", return_value=tag_repo),
+        patch.object(svc, "SqlAlchemyAreaRepository"),
+        patch.object(svc, "SqlAlchemyProcessTemplateRepository"),
+        patch.object(svc, "effective_compiled_manifest", AsyncMock(return_value=compiled)),
+        patch.object(svc, "AuditInterceptor") as interceptor,
+        patch(_INITIAL_STATE, return_value="new"),
+    ):
+        interceptor.return_value.process = AsyncMock()
+        result = await svc.import_artifacts(
+            session,
+            tenant_id=tenant_id,
+            project_id=project_id,
+            actor_id=None,
+            filename="import.csv",
+            payload=payload,
+            scope="generic",
+            mode="create",
+            validate_only=False,
+            progress=lambda p: None,
+        )
+
+    assert result.created_count == 3
+    project_repo.reserve_artifact_seq_block.assert_awaited_once_with(project_id, 2)
+    artifact_repo.add_many.assert_awaited_once()
+    inserted = artifact_repo.add_many.await_args.args[0]
+    assert [a.artifact_key for a in inserted] == ["QF-1", "PRJ-41", "PRJ-42"]
+    tag_repo.replace_artifact_tags_bulk.assert_awaited_once()
+    assert len(tag_repo.replace_artifact_tags_bulk.await_args.args[0]) == 2
+    interceptor.return_value.process.assert_awaited_once()
+    assert [r.row_number for r in result.rows] == [2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_import_update_dispatches_buffered_events_to_burndown_refresh_after_commit():
+    tenant_id, project_id = uuid.uuid4(), uuid.uuid4()
+    compiled = _compiled()
+    root = _root(project_id, "root-quality", "Quality")
+    folder = Artifact(
+        project_id=project_id,
+        artifact_type="quality-folder",
+        title="Smoke",
+        state="active",
+        id=uuid.uuid4(),
+        artifact_key="QF-1",
+        parent_id=root.id,
+    )
+    project = MagicMock(tenant_id=tenant_id, process_template_version_id=compiled.version_id, code="PRJ")
+    session = MagicMock(info={})
+    session.begin_nested = AsyncMock(return_value=AsyncMock())
+    session.execute = AsyncMock()
+    session.commit = AsyncMock()
+
+    artifact_repo = AsyncMock()
+    artifact_repo.list_by_project.side_effect = lambda *a, **kw: [] if kw.get("type_filter") else [root, folder]
+    # The real bulk writer: it buffers the entities' domain events on the session after the write.
+    artifact_repo.update_many.side_effect = SqlAlchemyArtifactRepository(session).update_many
+    project_repo = AsyncMock()
+    project_repo.find_by_id.return_value = project
+    tag_repo = AsyncMock()
+    tag_repo.list_by_project.return_value = []
+    refresh = AsyncMock(return_value=1)
+
+    class _InlineDispatcher:
+        async def dispatch(self, events):
+            async with event_lookup_scope(events, session_factory=MagicMock()):
+                for event in events:
+                    await project_event_handlers.on_artifact_changed_refresh_burndown_snapshots(event)
+
+    cycle_id = uuid.uuid4()
+    payload = f"artifact_key,artifact_type,title,cycle_id\nQF-1,quality-folder,Smoke,{cycle_id}\n".encode()
+
+    with (
+        patch.object(svc, "SqlAlchemyArtifactRepository", return_value=artifact_repo),
+        patch.object(svc, "SqlAlchemyProjectRepository", return_value=project_repo),
+        patch.object(svc, "SqlAlchemyProjectTagRepository", return_value=tag_repo),
+        patch.object(svc, "SqlAlchemyAreaRepository"),
+        patch.object(svc, "SqlAlchemyProcessTemplateRepository"),
+        patch.object(svc, "effective_compiled_manifest", AsyncMock(return_value=compiled)),
+        patch.object(svc, "AuditInterceptor") as interceptor,
+        patch.object(mediator_module, "_domain_event_dispatcher", _InlineDispatcher()),
+        patch("alm.shared.infrastructure.domain_event_outbox.persist_buffered_domain_events", AsyncMock()),
+        patch("alm.shared.infrastructure.async_event_dispatch.get_async_event_dispatch_queue", return_value=None),
+        patch.object(project_event_handlers, "refresh_burndown_snapshots", refresh),
+        patch.object(project_event_handlers, "async_session_factory", MagicMock(return_value=AsyncMock())),
+    ):
+        interceptor.return_value.process = AsyncMock()
+        result = await svc.import_artifacts(
+            session,
+            tenant_id=tenant_id,
+            project_id=project_id,
+            actor_id=None,
+            filename="import.csv",
+            payload=payload,
+            scope="generic",
+            mode="upsert",
+            validate_only=False,
+        )
+        refresh.assert_not_awaited()
+        await Mediator(session).finalize_transaction()
+
+    assert result.updated_count == 1
+    assert folder.cycle_id == cycle_id
+    session.commit.assert_awaited()
+    assert [c.args[0] for c in refresh.await_args_list] == [project_id]
+
+
+@pytest.mark.asyncio
+async def test_add_many_buffers_created_events_after_the_insert():
+    project_id = uuid.uuid4()
+    artifact = Artifact.create(project_id=project_id, artifact_type="quality-folder", title="Smoke", state="active")
+    session = MagicMock(info={})
+    session.execute = AsyncMock()
+
+    await SqlAlchemyArtifactRepository(session).add_many([artifact])
+
+    session.execute.assert_awaited_once()
+    events = session.info[SESSION_EVENTS_KEY]
+    assert [type(e) for e in events] == [ArtifactCreated]
+    assert events[0].project_id == project_id
+    assert artifact.collect_events() == []
@@ -0,0 +1,92 @@
+"""Process-wide compiled manifest cache (keyed by immutable process template version id)."""
+
+from __future__ import annotations
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from tests.support.manifests import MPC_RESOLVER_SAMPLE_MANIFEST
+
+from alm.artifact.domain import manifest_cache
+from alm.artifact.domain.manifest_cache import (
+    BoundedLRUCache,
+    compile_manifest,
+    get_manifest_ast,
+    set_manifest_cache_metrics,
+)
+from alm.project.application.services.effective_process_template_version import (
+    compiled_manifest_by_version_id,
+    effective_compiled_manifest,
+)
+
+
+@pytest.fixture
+def metrics():
+    m = MagicMock()
+    set_manifest_cache_metrics(m)
+    yield m
+    set_manifest_cache_metrics(None)
+
+
+def _version(bundle: dict) -> MagicMock:
+    return MagicMock(id=uuid.uuid4(), manifest_bundle=bundle)
+
+
+def test_compile_manifest_precomputes_derived_lookups():
+    bundle = {**MPC_RESOLVER_SAMPLE_MANIFEST, "search_locale": "german", "burndown_done_states": ["closed"]}
+    compiled = compile_manifest(uuid.uuid4(), bundle, fulltext_default="english")
+
+    assert compiled.fulltext_regconfig == "german"
+    assert compiled.burndown_done_states == ("closed",)
+    assert compiled.tree_root_type("Requirement") == "root-requirement"
+    assert "root-requirement" in compiled.system_root_types
+    assert compiled.manifest_bundle["task_workflow_id"] == "task_basic"
+    wf = compiled.workflow_def_for("requirement")
+    assert wf is not None
+    assert wf["initial"] == "new"
+
+
+def test_bounded_lru_evicts_least_recently_used(metrics):
+    cache = BoundedLRUCache("t", max_size=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert cache.peek("b") is None
+    assert cache.peek("a") == 1
+    assert cache.get("missing") is None
+    metrics.record_hit.assert_called_once_with("t")
+    metrics.record_miss.assert_called_once_with("t")
+    metrics.record_eviction.assert_called_once_with("t")
+
+
+@pytest.mark.asyncio
+async def test_compiled_manifest_loaded_once_per_version(metrics):
+    version = _version(MPC_RESOLVER_SAMPLE_MANIFEST)
+    repo = AsyncMock()
+    repo.find_version_by_id.return_value = version
+
+    first = await compiled_manifest_by_version_id(repo, version.id)
+    second = await compiled_manifest_by_version_id(repo, version.id)
+
+    assert first is second
+    repo.find_version_by_id.assert_awaited_once_with(version.id)
+    metrics.record_miss.assert_any_call("compiled_manifest")
+    metrics.record_hit.assert_any_call("compiled_manifest")
+    assert get_manifest_ast(version.id, {}) is first.ast
+
+
+@pytest.mark.asyncio
+async def test_effective_compiled_manifest_falls_back_to_default_version():
+    default = _version({})
+    repo = AsyncMock()
+    repo.find_version_by_id.return_value = None
+    repo.find_default_version.return_value = default
+
+    compiled = await effective_compiled_manifest(repo, uuid.uuid4())
+
+    assert compiled is not None
+    assert compiled.version_id == default.id
+    assert manifest_cache.get_cached_compiled_manifest(default.id) is compiled
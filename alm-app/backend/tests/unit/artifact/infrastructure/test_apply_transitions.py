@@ -0,0 +1,68 @@
+"""SqlAlchemyArtifactRepository.apply_transitions: per-item fallback after a rejected bulk write."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.exc import DataError, IntegrityError, OperationalError
+
+from alm.artifact.domain.entities import Artifact
+from alm.artifact.infrastructure.repositories import SqlAlchemyArtifactRepository
+
+
+def _session() -> MagicMock:
+    session = MagicMock(info={})
+    session.begin_nested = AsyncMock(side_effect=lambda: AsyncMock())
+    return session
+
+
+def _artifacts(n: int) -> list[Artifact]:
+    project_id = uuid.uuid4()
+    return [
+        Artifact(project_id=project_id, artifact_type="task", title="t", state="active", id=uuid.uuid4())
+        for _ in range(n)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_rejected_rows_are_failed_and_guard_skips_are_conflicted():
+    ok, stale, bad_data, bad_fk = _artifacts(4)
+    now = datetime.now(UTC)
+
+    async def update(rows):
+        if len(rows) > 1:
+            raise IntegrityError("UPDATE", {}, Exception("fk"))
+        row_id = rows[0]["id"]
+        if row_id == bad_data.id:
+            raise DataError("UPDATE", {}, Exception("too long"))
+        if row_id == bad_fk.id:
+            raise IntegrityError("UPDATE", {}, Exception("fk"))
+        return {} if row_id == stale.id else {row_id: now}
+
+    repo = SqlAlchemyArtifactRepository(_session())
+    with (
+        patch.object(repo, "_update_transitions", side_effect=update),
+        patch.object(repo, "_sync_execution_results", AsyncMock()),
+    ):
+        write = await repo.apply_transitions([ok, stale, bad_data, bad_fk], {})
+
+    assert write.written == {ok.id}
+    assert write.conflicted == {stale.id}
+    assert write.failed == {bad_data.id, bad_fk.id}
+
+
+@pytest.mark.asyncio
+async def test_other_database_errors_propagate_instead_of_reading_as_conflicts():
+    (artifact,) = _artifacts(1)
+    repo = SqlAlchemyArtifactRepository(_session())
+
+    with (
+        patch.object(
+            repo, "_update_transitions", AsyncMock(side_effect=OperationalError("UPDATE", {}, Exception("gone")))
+        ),
+        pytest.raises(OperationalError),
+    ):
+        await repo.apply_transitions([artifact], {})
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from alm.project.application.queries.get_burndown import GetBurndown, GetBurndownHandler
+from alm.project.domain.entities import Project
+
+
+@pytest.mark.asyncio
+async def test_burndown_reads_total_and_done_effort_in_one_grouped_call() -> None:
+    tenant_id = uuid.uuid4()
+    project_id = uuid.uuid4()
+    c1, c2 = uuid.uuid4(), uuid.uuid4()
+
+    project_repo = AsyncMock()
+    project_repo.find_by_id = AsyncMock(
+        return_value=Project(tenant_id=tenant_id, id=project_id, name="P", slug="p", code="P")
+    )
+    cycle_repo = AsyncMock()
+    cycle_repo.list_by_project = AsyncMock(
+        return_value=[SimpleNamespace(id=c1, name="Sprint 1"), SimpleNamespace(id=c2, name="Sprint 2")]
+    )
+    artifact_repo = AsyncMock()
+    artifact_repo.sum_effort_buckets_by_cycles = AsyncMock(return_value=[(c1, 13.0, 8.0), (c2, 5.0, 0.0)])
+
+    handler = GetBurndownHandler(
+        project_repo=project_repo,
+        cycle_repo=cycle_repo,
+        artifact_repo=artifact_repo,
+        process_template_repo=AsyncMock(),
+    )
+    result = await handler.handle(GetBurndown(tenant_id=tenant_id, project_id=project_id, effort_field="points"))
+
+    assert [(p.cycle_name, p.total_effort, p.completed_effort, p.remaining_effort) for p in result] == [
+        ("Sprint 1", 13.0, 8.0, 5.0),
+        ("Sprint 2", 5.0, 0.0, 5.0),
+    ]
+    artifact_repo.sum_effort_buckets_by_cycles.assert_awaited_once()
+    repo_project_id, repo_cycle_ids, _done_states, repo_field = (
+        artifact_repo.sum_effort_buckets_by_cycles.await_args.args
+    )
+    assert (repo_project_id, repo_cycle_ids, repo_field) == (project_id, [c1, c2], "points")
+    artifact_repo.sum_total_effort_by_cycles.assert_not_called()
+    artifact_repo.sum_effort_by_cycles.assert_not_called()
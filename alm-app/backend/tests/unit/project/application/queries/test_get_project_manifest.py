@@ -7,7 +7,12 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from alm.project.application.queries.get_project_manifest import GetProjectManifest, GetProjectManifestHandler
+from alm.project.application.queries.get_project_manifest import (
+    GetProjectCompiledManifest,
+    GetProjectCompiledManifestHandler,
+    GetProjectManifest,
+    GetProjectManifestHandler,
+)
 
 
 @pytest.mark.asyncio
@@ -47,3 +52,33 @@ async def test_get_project_manifest_falls_back_when_stored_version_id_orphaned()
     assert result is not None
     assert result.template_slug == "basic"
     process_repo.find_default_version.assert_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_project_compiled_manifest_reuses_cached_version() -> None:
+    tenant_id = uuid.uuid4()
+    version = MagicMock(id=uuid.uuid4(), manifest_bundle={"defs": []})
+    project = MagicMock(tenant_id=tenant_id, process_template_version_id=version.id)
+    project_repo = AsyncMock()
+    project_repo.find_by_id = AsyncMock(return_value=project)
+    process_repo = AsyncMock()
+    process_repo.find_version_by_id = AsyncMock(return_value=version)
+
+    handler = GetProjectCompiledManifestHandler(project_repo, process_repo)
+    query = GetProjectCompiledManifest(tenant_id=tenant_id, project_id=uuid.uuid4())
+    first = await handler.handle(query)
+    second = await handler.handle(query)
+
+    assert first is not None
+    assert first is second
+    assert first.version_id == version.id
+    process_repo.find_version_by_id.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_project_compiled_manifest_other_tenant_returns_none() -> None:
+    project_repo = AsyncMock()
+    project_repo.find_by_id = AsyncMock(return_value=MagicMock(tenant_id=uuid.uuid4()))
+    handler = GetProjectCompiledManifestHandler(project_repo, AsyncMock())
+
+    assert await handler.handle(GetProjectCompiledManifest(tenant_id=uuid.uuid4(), project_id=uuid.uuid4())) is None
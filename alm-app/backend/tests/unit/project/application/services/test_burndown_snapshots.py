@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import uuid
+from datetime import date, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from alm.cycle.domain.entities import Cadence
+from alm.project.application.services.burndown_snapshots import SNAPSHOT_EFFORT_FIELD, refresh_burndown_snapshots
+from alm.project.domain.entities import Project
+
+
+@pytest.mark.asyncio
+async def test_refresh_upserts_today_for_in_progress_cycles_only() -> None:
+    today = date(2026, 10, 17)
+    project = Project(tenant_id=uuid.uuid4(), id=uuid.uuid4(), name="P", slug="p", code="P")
+    running = Cadence(project.id, "S2", "/s2", start_date=today - timedelta(days=2), end_date=today + timedelta(days=5))
+    finished = Cadence(
+        project.id, "S1", "/s1", start_date=today - timedelta(days=20), end_date=today - timedelta(days=3)
+    )
+    undated = Cadence(project.id, "Backlog", "/backlog")
+
+    project_repo = AsyncMock()
+    project_repo.find_by_id = AsyncMock(return_value=project)
+    cycle_repo = AsyncMock()
+    cycle_repo.list_by_project = AsyncMock(return_value=[finished, running, undated])
+    artifact_repo = AsyncMock()
+    artifact_repo.sum_effort_buckets_by_cycles = AsyncMock(return_value=[(running.id, 8.0, 3.0)])
+    snapshot_repo = AsyncMock()
+
+    written = await refresh_burndown_snapshots(
+        project.id,
+        today=today,
+        project_repo=project_repo,
+        cycle_repo=cycle_repo,
+        artifact_repo=artifact_repo,
+        process_template_repo=AsyncMock(),
+        snapshot_repo=snapshot_repo,
+    )
+
+    assert written == 1
+    assert artifact_repo.sum_effort_buckets_by_cycles.await_args.args[1] == [running.id]
+    snapshot_repo.upsert_many.assert_awaited_once_with(
+        project.id, today, SNAPSHOT_EFFORT_FIELD, [(running.id, 8.0, 3.0)]
+    )
+
+
+@pytest.mark.asyncio
+async def test_refresh_skips_projects_without_running_cycles() -> None:
+    project = Project(tenant_id=uuid.uuid4(), id=uuid.uuid4(), name="P", slug="p", code="P")
+    project_repo = AsyncMock()
+    project_repo.find_by_id = AsyncMock(return_value=project)
+    cycle_repo = AsyncMock()
+    cycle_repo.list_by_project = AsyncMock(return_value=[])
+    artifact_repo = AsyncMock()
+    snapshot_repo = AsyncMock()
+
+    written = await refresh_burndown_snapshots(
+        project.id,
+        today=date(2026, 10, 17),
+        project_repo=project_repo,
+        cycle_repo=cycle_repo,
+        artifact_repo=artifact_repo,
+        process_template_repo=AsyncMock(),
+        snapshot_repo=snapshot_repo,
+    )
+
+    assert written == 0
+    artifact_repo.sum_effort_buckets_by_cycles.assert_not_called()
+    snapshot_repo.upsert_many.assert_not_called()
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from alm.artifact.domain.events import ArtifactDeleted, ArtifactStateChanged, ArtifactUpdated
+from alm.project.application import event_handlers
+from alm.shared.infrastructure.event_lookups import event_lookup_scope
+
+
+@pytest.mark.asyncio
+async def test_refresh_runs_once_per_project_per_dispatched_batch() -> None:
+    project_a, project_b = uuid.uuid4(), uuid.uuid4()
+    events = [
+        *(
+            ArtifactStateChanged(artifact_id=uuid.uuid4(), project_id=project_a, from_state="new", to_state="done")
+            for _ in range(3)
+        ),
+        ArtifactDeleted(artifact_id=uuid.uuid4(), project_id=project_b),
+        ArtifactUpdated(artifact_id=uuid.uuid4(), project_id=project_b),
+    ]
+    refresh = AsyncMock(return_value=1)
+
+    with (
+        patch.object(event_handlers, "refresh_burndown_snapshots", refresh),
+        patch.object(event_handlers, "async_session_factory", MagicMock(return_value=AsyncMock())),
+    ):
+        async with event_lookup_scope(events, session_factory=MagicMock()):
+            for event in events:
+                await event_handlers.on_artifact_changed_refresh_burndown_snapshots(event)
+        # Outside a dispatch (no scope) every event refreshes.
+        await event_handlers.on_artifact_changed_refresh_burndown_snapshots(events[0])
+
+    assert [c.args[0] for c in refresh.await_args_list] == [project_a, project_b, project_a]
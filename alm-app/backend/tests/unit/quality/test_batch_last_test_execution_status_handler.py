@@ -4,6 +4,7 @@ from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from tests.support.mocks import InMemoryExecutionResultRepository
 
 from alm.artifact.domain.entities import Artifact
 from alm.quality.application.queries.batch_last_test_execution_status import (
@@ -21,6 +22,7 @@ async def test_handler_empty_test_ids():
         project_repo=AsyncMock(),
         artifact_repo=AsyncMock(),
         relationship_repo=AsyncMock(),
+        execution_result_repo=InMemoryExecutionResultRepository(),
     )
     out = await h.handle(
         BatchLastTestExecutionStatus(
@@ -38,6 +40,7 @@ async def test_handler_too_many_ids():
         project_repo=AsyncMock(),
         artifact_repo=AsyncMock(),
         relationship_repo=AsyncMock(),
+        execution_result_repo=InMemoryExecutionResultRepository(),
     )
     ids = [uuid.uuid4() for _ in range(MAX_TEST_IDS + 1)]
     with pytest.raises(ValidationError):
@@ -69,6 +72,7 @@ async def test_handler_no_candidates_returns_nulls():
         project_repo=project_repo,
         artifact_repo=AsyncMock(),
         relationship_repo=relationship_repo,
+        execution_result_repo=InMemoryExecutionResultRepository(),
     )
     out = await h.handle(
         BatchLastTestExecutionStatus(tenant_id=tenant, project_id=proj, test_ids=[test_id])
@@ -135,6 +139,7 @@ async def test_handler_returns_status_and_step_results_from_run_metrics():
         project_repo=project_repo,
         artifact_repo=artifact_repo,
         relationship_repo=relationship_repo,
+        execution_result_repo=InMemoryExecutionResultRepository([run_art]),
     )
     out = await h.handle(
         BatchLastTestExecutionStatus(tenant_id=tenant, project_id=proj, test_ids=[test_id])
@@ -183,6 +188,7 @@ async def test_scope_run_id_wrong_artifact_raises():
         project_repo=project_repo,
         artifact_repo=artifact_repo,
         relationship_repo=AsyncMock(),
+        execution_result_repo=InMemoryExecutionResultRepository(),
     )
     with pytest.raises(ValidationError, match="scope_run_id"):
         await h.handle(
@@ -238,6 +244,7 @@ async def test_scope_run_id_skips_candidate_query_uses_only_that_run():
         project_repo=project_repo,
         artifact_repo=artifact_repo,
         relationship_repo=relationship_repo,
+        execution_result_repo=InMemoryExecutionResultRepository([run_art]),
     )
     out = await h.handle(
         BatchLastTestExecutionStatus(
@@ -317,6 +324,7 @@ async def test_scope_suite_id_filters_candidates():
         project_repo=project_repo,
         artifact_repo=artifact_repo,
         relationship_repo=relationship_repo,
+        execution_result_repo=InMemoryExecutionResultRepository([kept_art, dropped_art]),
     )
     out = await h.handle(
         BatchLastTestExecutionStatus(
@@ -355,6 +363,7 @@ async def test_scope_campaign_id_no_suites_yields_nulls():
         project_repo=project_repo,
         artifact_repo=AsyncMock(),
         relationship_repo=relationship_repo,
+        execution_result_repo=InMemoryExecutionResultRepository(),
     )
     out = await h.handle(
         BatchLastTestExecutionStatus(
@@ -427,6 +436,7 @@ async def test_scope_campaign_id_filters_via_campaign_suites():
         project_repo=project_repo,
         artifact_repo=artifact_repo,
         relationship_repo=relationship_repo,
+        execution_result_repo=InMemoryExecutionResultRepository([run_art]),
     )
     out = await h.handle(
         BatchLastTestExecutionStatus(
@@ -492,6 +502,7 @@ async def test_scope_configuration_id_filters_matching_metrics_row():
         project_repo=project_repo,
         artifact_repo=artifact_repo,
         relationship_repo=relationship_repo,
+        execution_result_repo=InMemoryExecutionResultRepository([run_art]),
     )
     out = await h.handle(
         BatchLastTestExecutionStatus(
@@ -504,3 +515,49 @@ async def test_scope_configuration_id_filters_matching_metrics_row():
     assert len(out) == 1
     assert out[0].status == "passed"
     assert out[0].configuration_id == "cfg-b"
+
+
+@pytest.mark.asyncio
+async def test_only_tests_in_the_run_execution_set_are_looked_up():
+    tenant = uuid.uuid4()
+    proj = uuid.uuid4()
+    in_suite = uuid.uuid4()
+    direct_only = uuid.uuid4()
+    run_id = uuid.uuid4()
+    suite_id = uuid.uuid4()
+
+    project = MagicMock()
+    project.tenant_id = tenant
+    project_repo = AsyncMock()
+    project_repo.find_by_id = AsyncMock(return_value=project)
+
+    run_for_suite = Relationship.create(
+        project_id=proj, source_artifact_id=run_id, target_artifact_id=suite_id, relationship_type="run_for_suite"
+    )
+    direct = Relationship.create(
+        project_id=proj, source_artifact_id=run_id, target_artifact_id=direct_only, relationship_type="includes_test"
+    )
+    suite_includes = Relationship.create(
+        project_id=proj, source_artifact_id=suite_id, target_artifact_id=in_suite, relationship_type="suite_includes_test"
+    )
+
+    relationship_repo = AsyncMock()
+    relationship_repo.list_candidate_run_test_pairs = AsyncMock(return_value=[(run_id, in_suite), (run_id, direct_only)])
+    relationship_repo.list_outgoing_relationships_from_artifacts = AsyncMock(return_value=[run_for_suite, direct])
+    relationship_repo.list_suite_includes_tests_for_suites = AsyncMock(return_value=[suite_includes])
+
+    execution_result_repo = AsyncMock()
+    execution_result_repo.latest_for_tests = AsyncMock(return_value={})
+
+    h = BatchLastTestExecutionStatusHandler(
+        project_repo=project_repo,
+        artifact_repo=AsyncMock(),
+        relationship_repo=relationship_repo,
+        execution_result_repo=execution_result_repo,
+    )
+    out = await h.handle(
+        BatchLastTestExecutionStatus(tenant_id=tenant, project_id=proj, test_ids=[in_suite, direct_only])
+    )
+
+    execution_result_repo.latest_for_tests.assert_awaited_once_with(proj, [(run_id, in_suite)], None)
+    assert [dto.status for dto in out] == [None, None]
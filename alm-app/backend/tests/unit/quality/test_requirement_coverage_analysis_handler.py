@@ -4,13 +4,14 @@ from __future__ import annotations
 
 import json
 import uuid
+from dataclasses import replace
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from tests.support.mocks import InMemoryExecutionResultRepository, InMemoryTraceabilityResultCache
 
 from alm.artifact.domain.entities import Artifact
-from alm.quality.application.queries import requirement_coverage_analysis as rca_mod
 from alm.quality.application.queries.requirement_coverage_analysis import (
     MAX_COVERAGE_ARTIFACTS_WITHOUT_UNDER,
     RequirementCoverageAnalysis,
@@ -20,13 +21,6 @@ from alm.relationship.domain.entities import Relationship
 from alm.shared.domain.exceptions import ValidationError
 
 
-@pytest.fixture(autouse=True)
-def _clear_coverage_cache() -> None:
-    rca_mod._coverage_cache.clear()
-    yield
-    rca_mod._coverage_cache.clear()
-
-
 @pytest.mark.asyncio
 async def test_rejects_multiple_execution_scopes() -> None:
     h = RequirementCoverageAnalysisHandler(
@@ -34,6 +28,7 @@ async def test_rejects_multiple_execution_scopes() -> None:
         artifact_repo=AsyncMock(),
         relationship_repo=AsyncMock(),
         process_template_repo=AsyncMock(),
+        execution_result_repo=InMemoryExecutionResultRepository(),
     )
     with pytest.raises(ValidationError, match="At most one"):
         await h.handle(
@@ -55,6 +50,7 @@ async def test_project_not_found() -> None:
         artifact_repo=AsyncMock(),
         relationship_repo=AsyncMock(),
         process_template_repo=AsyncMock(),
+        execution_result_repo=InMemoryExecutionResultRepository(),
     )
     with pytest.raises(ValidationError, match="Project not found"):
         await h.handle(
@@ -101,6 +97,7 @@ async def test_tree_too_large_without_under_raises() -> None:
         artifact_repo=artifact_repo,
         relationship_repo=AsyncMock(),
         process_template_repo=AsyncMock(),
+        execution_result_repo=InMemoryExecutionResultRepository(),
     )
     with pytest.raises(ValidationError, match="too large"):
         await h.handle(RequirementCoverageAnalysis(tenant_id=tenant, project_id=proj))
@@ -144,6 +141,7 @@ async def test_under_not_in_project_raises() -> None:
         artifact_repo=artifact_repo,
         relationship_repo=AsyncMock(),
         process_template_repo=AsyncMock(),
+        execution_result_repo=InMemoryExecutionResultRepository(),
     )
     with pytest.raises(ValidationError, match="under_artifact_id"):
         await h.handle(
@@ -176,6 +174,7 @@ async def test_no_roots_returns_empty_nodes() -> None:
         artifact_repo=artifact_repo,
         relationship_repo=AsyncMock(),
         process_template_repo=AsyncMock(),
+        execution_result_repo=InMemoryExecutionResultRepository(),
     )
     out = await h.handle(RequirementCoverageAnalysis(tenant_id=tenant, project_id=proj))
     assert out.nodes == []
@@ -274,6 +273,7 @@ async def test_single_requirement_with_verifies_and_passed_run() -> None:
         artifact_repo=artifact_repo,
         relationship_repo=relationship_repo,
         process_template_repo=AsyncMock(),
+        execution_result_repo=InMemoryExecutionResultRepository([run_art]),
     )
     out = await h.handle(
         RequirementCoverageAnalysis(
@@ -293,7 +293,7 @@ async def test_single_requirement_with_verifies_and_passed_run() -> None:
 
 
 @pytest.mark.asyncio
-async def test_cache_hit_on_second_identical_query() -> None:
+async def test_cached_until_refresh_or_generation_bump() -> None:
     tenant = uuid.uuid4()
     proj = uuid.uuid4()
     root_id = uuid.uuid4()
@@ -323,11 +323,14 @@ async def test_cache_hit_on_second_identical_query() -> None:
     artifact_repo.list_by_project = AsyncMock(side_effect=_list_bp)
     artifact_repo.count_by_project = AsyncMock(return_value=0)
 
+    cache = InMemoryTraceabilityResultCache()
     h = RequirementCoverageAnalysisHandler(
         project_repo=project_repo,
         artifact_repo=artifact_repo,
         relationship_repo=AsyncMock(),
         process_template_repo=AsyncMock(),
+        execution_result_repo=InMemoryExecutionResultRepository(),
+        result_cache=cache,
     )
     q = RequirementCoverageAnalysis(tenant_id=tenant, project_id=proj)
     first = await h.handle(q)
@@ -335,3 +338,10 @@ async def test_cache_hit_on_second_identical_query() -> None:
     assert first.cache_hit is False
     assert second.cache_hit is True
     assert second.nodes == first.nodes
+    assert second.computed_at == first.computed_at
+
+    assert (await h.handle(replace(q, refresh=True))).cache_hit is False
+    await cache.bump_generation(proj)
+    after_bump = await h.handle(q)
+    assert after_bump.cache_hit is False
+    assert (await h.handle(q)).cache_hit is True
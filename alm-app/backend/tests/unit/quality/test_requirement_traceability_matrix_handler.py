@@ -8,6 +8,7 @@ from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from tests.support.mocks import InMemoryExecutionResultRepository, InMemoryTraceabilityResultCache
 
 from alm.artifact.domain.entities import Artifact
 from alm.quality.application.queries import requirement_traceability_matrix as rtm_mod
@@ -16,18 +17,13 @@ from alm.quality.application.queries.requirement_traceability_matrix import (
     RequirementTraceabilityMatrixHandler,
     RequirementTraceabilityMatrixSummary,
     RequirementTraceabilityMatrixSummaryHandler,
+    RequirementTraceabilityMatrixTile,
+    RequirementTraceabilityMatrixTileHandler,
 )
 from alm.relationship.domain.entities import Relationship
 from alm.shared.domain.exceptions import ValidationError
 
 
-@pytest.fixture(autouse=True)
-def _clear_matrix_cache() -> None:
-    rtm_mod._matrix_cache.clear()
-    yield
-    rtm_mod._matrix_cache.clear()
-
-
 @pytest.mark.asyncio
 async def test_single_requirement_and_test_builds_matrix() -> None:
     tenant = uuid.uuid4()
@@ -131,6 +127,7 @@ async def test_single_requirement_and_test_builds_matrix() -> None:
         artifact_repo=artifact_repo,
         relationship_repo=relationship_repo,
         process_template_repo=AsyncMock(),
+        execution_result_repo=InMemoryExecutionResultRepository([run_art]),
     )
     out = await h.handle(
         RequirementTraceabilityMatrix(
@@ -253,6 +250,7 @@ async def test_search_filters_rows_and_columns() -> None:
         artifact_repo=artifact_repo,
         relationship_repo=relationship_repo,
         process_template_repo=AsyncMock(),
+        execution_result_repo=InMemoryExecutionResultRepository(),
     )
     out = await h.handle(
         RequirementTraceabilityMatrix(
@@ -275,6 +273,7 @@ async def test_rejects_multiple_execution_scopes() -> None:
         artifact_repo=AsyncMock(),
         relationship_repo=AsyncMock(),
         process_template_repo=AsyncMock(),
+        execution_result_repo=InMemoryExecutionResultRepository(),
     )
     with pytest.raises(ValidationError, match="At most one"):
         await h.handle(
@@ -423,3 +422,106 @@ async def test_summary_flags_project_wide_scope_that_requires_under() -> None:
 
     assert out.can_render_matrix is False
     assert out.exceeds_project_without_under_limit is True
+
+
+@pytest.mark.asyncio
+async def test_tile_serves_windows_past_dense_limits_from_cached_index() -> None:
+    tenant = uuid.uuid4()
+    proj = uuid.uuid4()
+    root_id = uuid.uuid4()
+    n_rows = rtm_mod.MAX_MATRIX_ROWS + 50
+
+    project = MagicMock()
+    project.tenant_id = tenant
+    project.process_template_version_id = None
+
+    root = Artifact.create(
+        project_id=proj,
+        artifact_type="root-requirement",
+        title="Root",
+        state="active",
+        id=root_id,
+    )
+    reqs = [
+        Artifact.create(
+            project_id=proj,
+            artifact_type="requirement",
+            title=f"Req {i:04d}",
+            state="new",
+            parent_id=root_id,
+            artifact_key=f"REQ-{i}",
+        )
+        for i in range(n_rows)
+    ]
+    tests = [
+        Artifact.create(
+            project_id=proj,
+            artifact_type="test-case",
+            title=f"Test {i:04d}",
+            state="ready",
+            artifact_key=f"TC-{i:04d}",
+        )
+        for i in range(n_rows)
+    ]
+    links = [
+        Relationship.create(
+            project_id=proj,
+            source_artifact_id=t.id,
+            target_artifact_id=r.id,
+            relationship_type="verifies",
+        )
+        for r, t in zip(reqs, tests, strict=True)
+    ]
+
+    project_repo = AsyncMock()
+    project_repo.find_by_id = AsyncMock(return_value=project)
+
+    async def _list_bp(*_a: object, **kw: object) -> list[Artifact]:
+        if kw.get("type_filter") == "root-requirement":
+            return [root]
+        return reqs
+
+    artifact_repo = AsyncMock()
+    artifact_repo.list_by_project = AsyncMock(side_effect=_list_bp)
+    artifact_repo.count_by_project = AsyncMock(return_value=rtm_mod.MAX_MATRIX_ARTIFACTS_WITHOUT_UNDER + 10)
+    artifact_repo.list_by_ids_in_project = AsyncMock(side_effect=lambda _p, ids: [t for t in tests if t.id in ids])
+
+    relationship_repo = AsyncMock()
+    relationship_repo.list_relationships_to_artifacts = AsyncMock(
+        side_effect=lambda _p, ids, _types: [rel for rel in links if rel.target_artifact_id in ids]
+    )
+    relationship_repo.list_outgoing_relationships_from_artifacts = AsyncMock(return_value=[])
+    relationship_repo.list_candidate_run_test_pairs = AsyncMock(return_value=[])
+    relationship_repo.list_suite_includes_tests_for_suites = AsyncMock(return_value=[])
+
+    h = RequirementTraceabilityMatrixTileHandler(
+        project_repo=project_repo,
+        artifact_repo=artifact_repo,
+        relationship_repo=relationship_repo,
+        process_template_repo=AsyncMock(),
+        execution_result_repo=InMemoryExecutionResultRepository(),
+        result_cache=InMemoryTraceabilityResultCache(),
+    )
+    query = RequirementTraceabilityMatrixTile(
+        tenant_id=tenant,
+        project_id=proj,
+        include_reverse_verifies=False,
+        row_offset=n_rows - 10,
+        row_limit=20,
+        column_offset=n_rows - 10,
+        column_limit=5,
+    )
+    out = await h.handle(query)
+
+    assert out.cache_hit is False
+    assert out.total_rows == n_rows
+    assert out.total_columns == n_rows
+    assert out.relationship_count == n_rows
+    assert out.coverage_counts["no_run"] == n_rows
+    assert len(out.rows) == 10
+    assert [c.column_index for c in out.columns] == list(range(n_rows - 10, n_rows - 5))
+    assert [(c.row_index, c.column_index) for c in out.cells] == [(i, i) for i in range(n_rows - 10, n_rows - 5)]
+
+    again = await h.handle(query)
+    assert again.cache_hit is True
+    assert relationship_repo.list_relationships_to_artifacts.await_count == 1
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import pickle
+import uuid
+import zlib
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from tests.support.mocks import FakeRedis
+
+from alm.artifact.domain.events import ArtifactCreated, ArtifactStateChanged
+from alm.quality.application.event_handlers import create_traceability_cache_handler
+from alm.quality.domain.events import RunMetricsRecorded
+from alm.quality.infrastructure.result_cache import (
+    LocalTraceabilityIndexCache,
+    LocalTraceabilityResultCache,
+    RedisTraceabilityResultCache,
+)
+from alm.shared.infrastructure.event_lookups import event_lookup_scope
+
+
+def _worker(redis: FakeRedis) -> RedisTraceabilityResultCache:
+    return RedisTraceabilityResultCache(
+        redis, LocalTraceabilityResultCache(max_entries=8, ttl_seconds=60), ttl_seconds=60
+    )  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_result_is_shared_across_workers_until_generation_bump() -> None:
+    redis = FakeRedis()
+    a, b = _worker(redis), _worker(redis)
+    project_id = uuid.uuid4()
+    compute = AsyncMock(side_effect=[{"rows": [1]}, {"rows": [2]}])
+
+    assert await a.get_or_compute(project_id, "k", compute) == ({"rows": [1]}, False)
+    assert await b.get_or_compute(project_id, "k", compute) == ({"rows": [1]}, True)
+    assert await a.get_or_compute(project_id, "k", compute) == ({"rows": [1]}, True)
+
+    await b.bump_generation(project_id)
+
+    assert await a.get_or_compute(project_id, "k", compute) == ({"rows": [2]}, False)
+    assert compute.await_count == 2
+    assert len(a._l1) == 1
+
+
+@pytest.mark.asyncio
+async def test_refresh_recomputes_and_replaces_the_cached_result() -> None:
+    cache = _worker(FakeRedis())
+    project_id = uuid.uuid4()
+    compute = AsyncMock(side_effect=["old", "new"])
+
+    await cache.get_or_compute(project_id, "k", compute)
+    assert await cache.get_or_compute(project_id, "k", compute, refresh=True) == ("new", False)
+    assert await cache.get_or_compute(project_id, "k", compute) == ("new", True)
+
+
+@pytest.mark.asyncio
+async def test_redis_outage_computes_uncached() -> None:
+    redis = MagicMock()
+    redis.get = AsyncMock(side_effect=ConnectionError("down"))
+    cache = RedisTraceabilityResultCache(
+        redis, LocalTraceabilityResultCache(max_entries=8, ttl_seconds=60), ttl_seconds=60
+    )
+    compute = AsyncMock(return_value="value")
+
+    assert await cache.get_or_compute(uuid.uuid4(), "k", compute) == ("value", False)
+    assert await cache.get_or_compute(uuid.uuid4(), "k", compute) == ("value", False)
+    assert compute.await_count == 2
+
+
+def test_local_cache_is_bounded_and_drops_older_generations() -> None:
+    local = LocalTraceabilityResultCache(max_entries=2, ttl_seconds=60)
+    p1, p2 = uuid.uuid4(), uuid.uuid4()
+    local.set(p1, 1, "a", "a1")
+    local.set(p2, 1, "a", "b1")
+    local.set(p2, 1, "b", "b2")
+
+    assert local.get(p1, 1, "a") is None
+    assert len(local) == 2
+
+    assert local.get(p2, 2, "a") is None
+    assert len(local) == 0
+
+    local.set(p1, 1, "a", "a1")
+    with patch("alm.quality.infrastructure.result_cache.time.monotonic", return_value=1e12):
+        assert local.get(p1, 1, "a") is None
+
+
+@pytest.mark.asyncio
+async def test_entries_of_another_release_are_not_read() -> None:
+    redis = FakeRedis()
+    project_id = uuid.uuid4()
+    compute = AsyncMock(side_effect=["old", "new"])
+
+    with patch("alm.quality.infrastructure.result_cache.settings.app_version", "1.0"):
+        assert await _worker(redis).get_or_compute(project_id, "k", compute) == ("old", False)
+    with patch("alm.quality.infrastructure.result_cache.settings.app_version", "1.1"):
+        assert await _worker(redis).get_or_compute(project_id, "k", compute) == ("new", False)
+
+
+@pytest.mark.asyncio
+async def test_unsigned_or_tampered_entries_are_recomputed_without_unpickling() -> None:
+    redis = FakeRedis()
+    project_id = uuid.uuid4()
+    await _worker(redis).get_or_compute(project_id, "k", AsyncMock(return_value="cached"))
+    (entry_key,) = [k for k in redis.data if not k.startswith("trace:gen:")]
+    signed = redis.data[entry_key]
+    forged = zlib.compress(pickle.dumps("forged"))
+    compute = AsyncMock(return_value="fresh")
+
+    for payload in (forged, signed[:32] + forged, signed[:-1] + bytes([signed[-1] ^ 1])):
+        redis.data[entry_key] = payload
+        with patch("alm.quality.infrastructure.result_cache.pickle.loads") as loads:
+            assert await _worker(redis).get_or_compute(project_id, "k", compute) == ("fresh", False)
+        loads.assert_not_called()
+    assert compute.await_count == 3
+
+    # A valid entry copied under another project's key does not verify either.
+    other = uuid.uuid4()
+    await _worker(redis).get_or_compute(other, "k", AsyncMock(return_value="other"))
+    (other_key,) = [k for k in redis.data if str(other) in k and not k.startswith("trace:gen:")]
+    redis.data[other_key] = signed
+    assert await _worker(redis).get_or_compute(other, "k", AsyncMock(return_value="recomputed")) == (
+        "recomputed",
+        False,
+    )
+
+
+@pytest.mark.asyncio
+async def test_local_index_fallback_reuses_until_ttl_or_local_event() -> None:
+    cache = LocalTraceabilityIndexCache(max_entries=2, ttl_seconds=60)
+    project_id = uuid.uuid4()
+    compute = AsyncMock(side_effect=["v1", "v2", "v3"])
+
+    assert await cache.get_or_compute(project_id, "k", compute) == ("v1", False)
+    assert await cache.get_or_compute(project_id, "k", compute) == ("v1", True)
+
+    await create_traceability_cache_handler(cache)(
+        ArtifactCreated(
+            project_id=project_id, artifact_id=uuid.uuid4(), artifact_type="requirement", title="r", state="new"
+        )
+    )
+    assert await cache.get_or_compute(project_id, "k", compute) == ("v2", False)
+
+    with patch("alm.quality.infrastructure.result_cache.time.monotonic", return_value=1e12):
+        assert await cache.get_or_compute(project_id, "k", compute) == ("v3", False)
+    assert len(cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_handler_bumps_each_project_once_per_dispatched_batch() -> None:
+    redis = FakeRedis()
+    handler = create_traceability_cache_handler(_worker(redis))
+    p1, p2 = uuid.uuid4(), uuid.uuid4()
+    events = [
+        ArtifactCreated(project_id=p1, artifact_id=uuid.uuid4(), artifact_type="requirement", title="R", state="new"),
+        RunMetricsRecorded(project_id=p1, run_ids=[uuid.uuid4()]),
+        RunMetricsRecorded(project_id=p2, run_ids=[uuid.uuid4()]),
+        ArtifactStateChanged(artifact_id=uuid.uuid4(), project_id=p2, from_state="a", to_state="b"),
+    ]
+
+    async with event_lookup_scope(events, session_factory=MagicMock()):
+        for event in events:
+            await handler(event)
+
+    assert redis.incr_calls == 2
@@ -2,11 +2,13 @@ import json
 import uuid
 
 from alm.quality.application.run_metrics_v1 import (
+    execution_results_from_custom_fields,
     metrics_row_for_test_id,
     normalize_execution_status,
     parse_run_metrics_v1_results,
     step_statuses_from_metrics_row,
 )
+from alm.quality.infrastructure import models
 
 
 def test_parse_v1_results():
@@ -66,3 +68,43 @@ def test_step_statuses_from_metrics_row():
     pairs = step_statuses_from_metrics_row(row)
     assert pairs == [("s1", "passed"), ("s2", "not-executed")]
 
+
+def test_execution_results_from_custom_fields_normalizes_rows():
+    run_id = uuid.uuid4()
+    tid = uuid.uuid4()
+    cf = {
+        "run_metrics_json": {
+            "v": 2,
+            "results": [
+                {"testId": "not-a-uuid", "status": "passed"},
+                {
+                    "testId": str(tid),
+                    "status": "bogus",
+                    "configurationId": " cfg-a ",
+                    "paramRowIndex": 2,
+                    "stepResults": [{"stepId": "s1", "status": "failed", "linkedDefectIds": ["d1"]}],
+                },
+            ],
+        }
+    }
+    rows = execution_results_from_custom_fields(run_id, cf)
+    assert len(rows) == 1
+    row = rows[0]
+    assert (row.run_id, row.test_id, row.result_index) == (run_id, tid, 1)
+    assert row.status == "not-executed"
+    assert row.configuration_id == "cfg-a"
+    assert row.param_row_index == 2
+    assert row.step_results[0].step_id == "s1"
+    assert row.step_results[0].linked_defect_ids == ["d1"]
+
+
+def test_oversized_configuration_id_is_indexed_unchanged():
+    tid = uuid.uuid4()
+    long_id = "cfg-" + "x" * 1000
+    cf = {"run_metrics_json": {"v": 2, "results": [{"testId": str(tid), "configurationId": long_id}]}}
+
+    (row,) = execution_results_from_custom_fields(uuid.uuid4(), cf)
+
+    assert row.configuration_id == long_id
+    # Client-defined ids are unbounded: a length cap would fail the whole test-run save on flush.
+    assert models.TestExecutionResultModel.__table__.c.configuration_id.type.length is None
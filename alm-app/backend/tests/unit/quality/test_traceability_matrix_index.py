@@ -0,0 +1,75 @@
+"""Unit tests for the sparse traceability matrix index and its tiles."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime
+
+from alm.quality.application.traceability_matrix_index import (
+    MatrixColumnRef,
+    MatrixRowRef,
+    build_traceability_matrix_index,
+)
+
+
+def _rows(n: int) -> list[MatrixRowRef]:
+    return [MatrixRowRef(uuid.uuid4(), None, f"REQ-{i}", f"Req {i}") for i in range(n)]
+
+
+def _columns(statuses: list[str | None]) -> list[MatrixColumnRef]:
+    return [MatrixColumnRef(uuid.uuid4(), f"TC-{i}", f"Test {i}", s, None, None) for i, s in enumerate(statuses)]
+
+
+def test_tile_returns_only_cells_inside_the_window() -> None:
+    rows = _rows(4)
+    columns = _columns(["passed"] * 6)
+    links = {
+        rows[0].requirement_id: {columns[0].test_id: "verifies", columns[5].test_id: "verifies"},
+        rows[2].requirement_id: {columns[2].test_id: "tests", columns[3].test_id: "verifies"},
+        rows[3].requirement_id: {columns[4].test_id: "verifies"},
+    }
+    index = build_traceability_matrix_index(computed_at=datetime.now(UTC), rows=rows, columns=columns, links=links)
+
+    tile = index.tile(row_offset=1, row_limit=2, column_offset=2, column_limit=2)
+
+    assert [r.row_index for r in tile.rows] == [1, 2]
+    assert [c.column_index for c in tile.columns] == [2, 3]
+    assert [(c.row_index, c.column_index, c.relationship_type) for c in tile.cells] == [
+        (2, 2, "tests"),
+        (2, 3, "verifies"),
+    ]
+    assert index.relationship_count == 5
+
+
+def test_row_rollups_span_all_columns_and_use_worst_status() -> None:
+    rows = _rows(3)
+    columns = _columns(["passed", "failed", None, "blocked"])
+    links = {
+        rows[0].requirement_id: {columns[0].test_id: "verifies", columns[1].test_id: "verifies"},
+        rows[1].requirement_id: {columns[0].test_id: "verifies", columns[2].test_id: "verifies"},
+    }
+    index = build_traceability_matrix_index(computed_at=datetime.now(UTC), rows=rows, columns=columns, links=links)
+
+    tile = index.tile(row_offset=0, row_limit=10, column_offset=0, column_limit=1)
+
+    assert [r.leaf_status for r in tile.rows] == ["failed", "no_run", "not_covered"]
+    assert tile.rows[0].linked_test_count == 2
+    assert tile.rows[0].status_counts["failed"] == 1
+    assert tile.rows[0].status_counts["passed"] == 1
+    assert tile.columns[0].linked_requirement_count == 2
+    assert index.coverage_counts["failed"] == 1
+    assert index.coverage_counts["no_run"] == 1
+    assert index.coverage_counts["not_covered"] == 1
+
+
+def test_links_outside_rows_or_columns_are_dropped() -> None:
+    rows = _rows(1)
+    columns = _columns(["passed"])
+    links = {
+        rows[0].requirement_id: {columns[0].test_id: "verifies", uuid.uuid4(): "verifies"},
+        uuid.uuid4(): {columns[0].test_id: "verifies"},
+    }
+    index = build_traceability_matrix_index(computed_at=datetime.now(UTC), rows=rows, columns=columns, links=links)
+
+    assert index.relationship_count == 1
+    assert index.tile(0, 5, 3, 5).cells == []
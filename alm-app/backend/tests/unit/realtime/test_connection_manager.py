@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from alm.realtime.connection_manager import (
+    SLOW_CONSUMER_CLOSE_CODE,
+    ConnectionManager,
+    RealtimeConnection,
+    RealtimeSubscription,
+    parse_subscription,
+)
+
+
+def _message(event_type: str, project_id: uuid.UUID | None = None) -> str:
+    payload: dict[str, str] = {"type": event_type}
+    if project_id is not None:
+        payload["project_id"] = str(project_id)
+    return json.dumps(payload)
+
+
+def test_subscription_filters_by_project_and_event_type() -> None:
+    project = str(uuid.uuid4())
+    sub = RealtimeSubscription(project_ids=frozenset({project}), event_types=frozenset({"artifact_state_changed"}))
+
+    assert sub.matches(frozenset({"artifact_state_changed"}), project)
+    assert sub.matches(frozenset({"artifact_state_changed"}), None)
+    assert sub.matches(frozenset({"artifact_presence", "artifact_state_changed"}), project)
+    assert not sub.matches(frozenset({"artifact_state_changed"}), str(uuid.uuid4()))
+    assert not sub.matches(frozenset({"artifact_presence"}), project)
+
+
+def test_parse_subscription_normalizes_ids_and_rejects_bad_input() -> None:
+    project = uuid.uuid4()
+
+    sub = parse_subscription({"type": "subscribe", "project_ids": [str(project).upper()]})
+
+    assert sub.project_ids == frozenset({str(project)})
+    assert sub.event_types is None
+    with pytest.raises(ValueError):
+        parse_subscription({"type": "subscribe", "project_ids": "not-a-list"})
+    with pytest.raises(ValueError):
+        parse_subscription({"type": "subscribe", "project_ids": ["nope"]})
+
+
+@pytest.mark.asyncio
+async def test_broadcast_delivers_only_to_matching_subscribers() -> None:
+    manager = ConnectionManager()
+    tenant_id, project_a, project_b = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    ws_a, ws_all = AsyncMock(), AsyncMock()
+    conn_a = await manager.add(tenant_id, ws_a)
+    conn_a.subscription = RealtimeSubscription(project_ids=frozenset({str(project_a)}))
+    conn_all = await manager.add(tenant_id, ws_all)
+
+    await manager.broadcast(tenant_id, _message("artifact_state_changed", project_b))
+    await asyncio.sleep(0)
+
+    ws_a.send_text.assert_not_awaited()
+    ws_all.send_text.assert_awaited_once()
+    await manager.remove(conn_a)
+    await manager.remove(conn_all)
+
+
+@pytest.mark.asyncio
+async def test_slow_consumer_does_not_block_other_connections() -> None:
+    manager = ConnectionManager()
+    tenant_id = uuid.uuid4()
+    blocked = asyncio.Event()
+
+    async def stuck_send(_message: str) -> None:
+        await blocked.wait()
+
+    slow_ws = MagicMock()
+    slow_ws.send_text = AsyncMock(side_effect=stuck_send)
+    fast_ws = AsyncMock()
+    slow = await manager.add(tenant_id, slow_ws)
+    fast = await manager.add(tenant_id, fast_ws)
+
+    for _ in range(3):
+        await manager.broadcast(tenant_id, _message("artifact_state_changed"))
+    await asyncio.sleep(0)
+
+    assert fast_ws.send_text.await_count == 3
+    slow_ws.send_text.assert_awaited_once()
+    blocked.set()
+    await manager.remove(slow)
+    await manager.remove(fast)
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_oldest_message() -> None:
+    ws = MagicMock()
+    ws.send_text = AsyncMock()
+    conn = RealtimeConnection(uuid.uuid4(), ws, max_queue=2, policy="drop_oldest")
+
+    for i in range(3):
+        conn.offer(str(i))
+    conn.start()
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    assert conn.dropped == 1
+    assert [c.args[0] for c in ws.send_text.await_args_list] == ["1", "2"]
+    await conn.close()
+
+
+@pytest.mark.asyncio
+async def test_full_queue_disconnects_when_policy_is_disconnect() -> None:
+    ws = AsyncMock()
+    conn = RealtimeConnection(uuid.uuid4(), ws, max_queue=1, policy="disconnect")
+
+    with patch("alm.realtime.connection_manager.alm_realtime_slow_consumer_disconnects_total") as disconnects:
+        assert conn.offer("first") is True
+        assert conn.offer("second") is False
+        assert conn.offer("third") is False
+        await asyncio.sleep(0)
+
+    assert conn.closed
+    ws.close.assert_awaited_once_with(code=SLOW_CONSUMER_CLOSE_CODE)
+    disconnects.inc.assert_called_once_with()
+    assert conn.offer("fourth") is False
+
+
+@pytest.mark.asyncio
+async def test_batch_frame_matches_on_the_types_it_carries() -> None:
+    manager = ConnectionManager()
+    tenant_id, project_id = uuid.uuid4(), uuid.uuid4()
+    ws = AsyncMock()
+    conn = await manager.add(tenant_id, ws)
+    conn.subscription = RealtimeSubscription(event_types=frozenset({"artifact_state_changed"}))
+    frame = json.dumps(
+        {
+            "type": "batch",
+            "project_id": str(project_id),
+            "events": [{"type": "artifact_state_changed", "project_id": str(project_id)}],
+        }
+    )
+
+    await manager.broadcast(tenant_id, frame)
+    await asyncio.sleep(0)
+
+    ws.send_text.assert_awaited_once_with(frame)
+    await manager.remove(conn)
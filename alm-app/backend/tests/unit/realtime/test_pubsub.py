@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import asyncio
+import uuid
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+
+from alm.realtime.pubsub import RealtimeEventCoalescer
+
+
+def _state_changed(project_id: str, artifact_id: str, from_state: str, to_state: str) -> dict[str, Any]:
+    return {
+        "type": "artifact_state_changed",
+        "project_id": project_id,
+        "artifact_id": artifact_id,
+        "from_state": from_state,
+        "to_state": to_state,
+    }
+
+
+@pytest.mark.asyncio
+async def test_events_in_window_become_one_batch_frame_per_project() -> None:
+    publish = AsyncMock()
+    coalescer = RealtimeEventCoalescer(window_seconds=0.01, max_events=1000, publish=publish)
+    tenant_id, project_id = uuid.uuid4(), str(uuid.uuid4())
+
+    for _ in range(500):
+        await coalescer.add(tenant_id, _state_changed(project_id, str(uuid.uuid4()), "new", "done"))
+    await asyncio.sleep(0.05)
+
+    publish.assert_awaited_once()
+    sent_tenant, frame = publish.await_args.args
+    assert sent_tenant == tenant_id
+    assert frame["type"] == "batch"
+    assert frame["project_id"] == project_id
+    assert len(frame["events"]) == 500
+
+
+@pytest.mark.asyncio
+async def test_repeated_artifact_keeps_latest_state_and_first_from_state() -> None:
+    publish = AsyncMock()
+    coalescer = RealtimeEventCoalescer(window_seconds=60, max_events=1000, publish=publish)
+    tenant_id, project_id, artifact_id = uuid.uuid4(), str(uuid.uuid4()), str(uuid.uuid4())
+
+    await coalescer.add(tenant_id, _state_changed(project_id, artifact_id, "new", "active"))
+    await coalescer.add(tenant_id, _state_changed(project_id, artifact_id, "active", "done"))
+    await coalescer.flush_all()
+
+    publish.assert_awaited_once_with(tenant_id, _state_changed(project_id, artifact_id, "new", "done"))
+
+
+@pytest.mark.asyncio
+async def test_full_buffer_flushes_without_waiting_for_the_window() -> None:
+    publish = AsyncMock()
+    coalescer = RealtimeEventCoalescer(window_seconds=60, max_events=2, publish=publish)
+    tenant_id, project_id = uuid.uuid4(), str(uuid.uuid4())
+
+    await coalescer.add(tenant_id, _state_changed(project_id, str(uuid.uuid4()), "a", "b"))
+    await coalescer.add(tenant_id, _state_changed(project_id, str(uuid.uuid4()), "a", "b"))
+
+    publish.assert_awaited_once()
+    assert len(publish.await_args.args[1]["events"]) == 2
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import asyncio
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from tests.support.mocks import FakeRedis
+
+from alm.config.handler_registry import register_all_handlers
+from alm.relationship.application.event_handlers import create_relationship_graph_handler
+from alm.relationship.application.relationship_graph import ProjectRelationshipGraph
+from alm.relationship.domain.events import RelationshipCreated, RelationshipDeleted
+from alm.relationship.infrastructure.graph_index import (
+    LocalRelationshipGraphs,
+    RedisRelationshipGraphIndex,
+    _GraphEntry,
+)
+from alm.shared.infrastructure import event_dispatcher as dispatcher_module
+
+
+def _worker(redis: FakeRedis) -> RedisRelationshipGraphIndex:
+    return RedisRelationshipGraphIndex(redis, LocalRelationshipGraphs(1 << 20, 60), max_age_seconds=600)  # type: ignore[arg-type]
+
+
+def _created(project_id: uuid.UUID, source: uuid.UUID, target: uuid.UUID) -> RelationshipCreated:
+    return RelationshipCreated(
+        project_id=project_id,
+        relationship_id=uuid.uuid4(),
+        source_artifact_id=source,
+        target_artifact_id=target,
+        relationship_type="verifies",
+    )
+
+
+@pytest.mark.asyncio
+async def test_dispatching_worker_applies_events_in_place_and_others_reload() -> None:
+    redis = FakeRedis()
+    a, b = _worker(redis), _worker(redis)
+    project_id, req, test = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    load = AsyncMock(side_effect=lambda: ProjectRelationshipGraph.build(project_id, []))
+    graph_a = await a.graph_for(project_id, load)
+    graph_b = await b.graph_for(project_id, load)
+    assert load.await_count == 2
+
+    created = _created(project_id, req, test)
+    await create_relationship_graph_handler(a)(created)
+
+    assert await a.graph_for(project_id, load) is graph_a
+    assert [r.id for r in graph_a.outgoing([req])] == [created.relationship_id]
+    assert await b.graph_for(project_id, load) is not graph_b
+    assert load.await_count == 3
+
+    # ``a`` missed the bump made by ``b``: its next delta is dropped rather than applied to a stale graph.
+    await b.apply_event(_created(project_id, req, uuid.uuid4()))
+    await a.apply_event(
+        RelationshipDeleted(
+            project_id=project_id,
+            relationship_id=created.relationship_id,
+            source_artifact_id=req,
+            target_artifact_id=test,
+            relationship_type="verifies",
+        )
+    )
+    assert len(a._local) == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_load_and_redis_outage_still_serves() -> None:
+    project_id = uuid.uuid4()
+    index = _worker(FakeRedis())
+    load = AsyncMock(return_value=ProjectRelationshipGraph.build(project_id, []))
+
+    first, second = await asyncio.gather(index.graph_for(project_id, load), index.graph_for(project_id, load))
+    assert first is second
+    assert load.await_count == 1
+
+    down = MagicMock()
+    down.get = AsyncMock(side_effect=ConnectionError("down"))
+    outage = RedisRelationshipGraphIndex(down, LocalRelationshipGraphs(1 << 20, 60), max_age_seconds=600)
+    assert await outage.graph_for(project_id, load) is first
+    assert await outage.graph_for(project_id, load) is first
+    assert load.await_count == 2
+
+
+def test_local_graphs_evict_least_recently_used_past_the_byte_budget_and_idle_entries() -> None:
+    graphs = [
+        ProjectRelationshipGraph.build(pid, [(uuid.uuid4(), uuid.uuid4(), uuid.uuid4(), "verifies")])
+        for pid in (uuid.uuid4(), uuid.uuid4(), uuid.uuid4())
+    ]
+    size = graphs[0].nbytes
+    local = LocalRelationshipGraphs(max_bytes=size * 2, idle_seconds=60)
+    for g in graphs[:2]:
+        local.put(g.project_id, _GraphEntry(g, 1, loaded_at=0.0, last_used=1e12))
+    assert local.get(graphs[0].project_id) is not None
+    local.put(graphs[2].project_id, _GraphEntry(graphs[2], 1, loaded_at=0.0, last_used=1e12))
+
+    assert local.peek(graphs[1].project_id) is None
+    assert local.peek(graphs[0].project_id) is not None
+    assert len(local) == 2
+
+    local.peek(graphs[0].project_id).last_used = 0.0  # type: ignore[union-attr]
+    assert local.get(graphs[2].project_id) is not None
+    assert local.peek(graphs[0].project_id) is None
+
+    local.put(graphs[0].project_id, _GraphEntry(_big_graph(graphs[0].project_id), 1, loaded_at=0.0, last_used=1e12))
+    assert local.peek(graphs[0].project_id) is None
+
+
+def _big_graph(project_id: uuid.UUID) -> ProjectRelationshipGraph:
+    return ProjectRelationshipGraph.build(
+        project_id, [(uuid.uuid4(), uuid.uuid4(), uuid.uuid4(), "verifies") for _ in range(64)]
+    )
+
+
+@pytest.mark.parametrize("event_type", [RelationshipCreated, RelationshipDeleted])
+def test_graph_generation_is_bumped_before_the_traceability_cache_generation(event_type: type) -> None:
+    with (
+        patch("alm.config.handler_registry.settings.traceability_cache_enabled", True),
+        patch("alm.config.handler_registry.settings.relationship_graph_enabled", True),
+        patch.dict(dispatcher_module._event_handlers, clear=True),
+    ):
+        register_all_handlers()
+        names = [h.__qualname__.rsplit(".", 1)[-1] for h in dispatcher_module._event_handlers[event_type]]
+
+    assert names.index("on_relationship_changed") < names.index("on_traceability_input_changed")
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import uuid
+
+from alm.relationship.application.relationship_graph import ProjectRelationshipGraph
+
+
+def _ids(n: int) -> list[uuid.UUID]:
+    return [uuid.uuid4() for _ in range(n)]
+
+
+def test_outgoing_and_incoming_filter_by_type_in_load_order() -> None:
+    project_id = uuid.uuid4()
+    req, test_a, test_b, defect = _ids(4)
+    r1, r2, r3 = _ids(3)
+    graph = ProjectRelationshipGraph.build(
+        project_id,
+        [
+            (r1, req, test_a, "verifies"),
+            (r2, req, test_b, "verifies"),
+            (r3, defect, req, "blocks"),
+        ],
+    )
+
+    out = graph.outgoing([req])
+    assert [(r.id, r.target_artifact_id) for r in out] == [(r1, test_a), (r2, test_b)]
+    assert all(r.project_id == project_id for r in out)
+    assert graph.outgoing([req], ["blocks"]) == []
+    assert [r.id for r in graph.incoming([req], ["blocks"])] == [r3]
+    assert [r.id for r in graph.incoming([test_a, test_b, test_a], ["verifies"])] == [r1, r2]
+    assert graph.incoming([uuid.uuid4()]) == []
+    assert graph.edge_count == 3
+    assert graph.node_count == 4
+
+
+def test_within_hops_stops_at_the_hop_limit_and_survives_cycles() -> None:
+    a, b, c, d = _ids(4)
+    ab, bc, ca, cd, ad = _ids(5)
+    graph = ProjectRelationshipGraph.build(
+        uuid.uuid4(),
+        [
+            (ab, a, b, "depends_on"),
+            (bc, b, c, "depends_on"),
+            (ca, c, a, "depends_on"),
+            (cd, c, d, "depends_on"),
+            (ad, a, d, "relates_to"),
+        ],
+    )
+
+    assert [r.id for r in graph.within_hops(a, ["depends_on"], direction="outgoing", max_hops=0)] == [ab]
+    assert [r.id for r in graph.within_hops(a, ["depends_on"], direction="outgoing", max_hops=1)] == [ab, bc]
+    assert [r.id for r in graph.within_hops(a, ["depends_on"], direction="outgoing", max_hops=5)] == [
+        ab,
+        bc,
+        ca,
+        cd,
+    ]
+    assert [r.id for r in graph.within_hops(d, ["depends_on"], direction="incoming", max_hops=0)] == [cd]
+    assert graph.within_hops(a, ["unknown"], direction="outgoing", max_hops=3) == []
+
+
+def test_incremental_edits_are_idempotent_and_survive_compaction() -> None:
+    a, b, c = _ids(3)
+    ab, bc = _ids(2)
+    graph = ProjectRelationshipGraph.build(uuid.uuid4(), [(ab, a, b, "verifies")])
+
+    assert graph.add_edge(bc, b, c, "verifies") is True
+    assert graph.add_edge(bc, b, c, "verifies") is False
+    assert graph.remove_edge(ab, a) is True
+    assert graph.remove_edge(ab, a) is False
+    before = (graph.outgoing([a, b]), graph.incoming([b, c]))
+    assert [r.id for r in before[0]] == [bc]
+
+    graph.compact()
+
+    assert (graph.outgoing([a, b]), graph.incoming([b, c])) == before
+    assert graph.edge_count == 1
+    assert graph.remove_edge(bc, b) is True
+    assert graph.outgoing([b]) == []
+
+
+def test_within_hops_lists_stop_at_artifacts_without_walking_past_them() -> None:
+    a, b, c = _ids(3)
+    ab, bc, ca = _ids(3)
+    graph = ProjectRelationshipGraph.build(
+        uuid.uuid4(),
+        [(ab, a, b, "depends_on"), (bc, b, c, "depends_on"), (ca, c, a, "depends_on")],
+    )
+
+    assert [r.id for r in graph.within_hops(a, ["depends_on"], direction="outgoing", max_hops=5, stop_at={b})] == [ab]
+    # The start artifact is always walked.
+    assert [r.id for r in graph.within_hops(a, ["depends_on"], direction="outgoing", max_hops=0, stop_at={a})] == [ab]
@@ -24,9 +24,48 @@ from alm.relationship.application.queries.list_relationships_for_artifact import
     ListRelationshipsForArtifactHandler,
 )
 from alm.relationship.domain.entities import Relationship
+from alm.relationship.domain.events import RelationshipCreated, RelationshipDeleted
+from alm.relationship.domain.ports import TracedArtifact, TracedRelationship
 from alm.shared.domain.exceptions import ValidationError
 
 
+def _traced(relationships: list[Relationship], artifacts: list[Artifact]) -> AsyncMock:
+    """``trace_relationships`` stand-in returning every matching relationship with its far-end artifact."""
+    by_id = {a.id: a for a in artifacts}
+
+    def _trace(
+        _project_id: uuid.UUID,
+        _artifact_id: uuid.UUID,
+        relationship_types: list[str],
+        *,
+        direction: str,
+        max_hops: int,
+    ) -> list[TracedRelationship]:
+        out: list[TracedRelationship] = []
+        for rel in relationships:
+            if rel.relationship_type not in relationship_types:
+                continue
+            far = by_id.get(rel.source_artifact_id if direction == "incoming" else rel.target_artifact_id)
+            out.append(
+                TracedRelationship(
+                    relationship=rel,
+                    artifact=TracedArtifact(
+                        id=far.id,
+                        artifact_key=far.artifact_key,
+                        artifact_type=far.artifact_type,
+                        title=far.title,
+                        state=far.state,
+                        parent_id=far.parent_id,
+                    )
+                    if far is not None
+                    else None,
+                )
+            )
+        return out
+
+    return AsyncMock(side_effect=_trace)
+
+
 @pytest.mark.asyncio
 async def test_reorder_relationships_rejects_unordered_type() -> None:
     tenant_id = uuid.uuid4()
@@ -327,30 +366,12 @@ async def test_get_artifact_impact_analysis_builds_upstream_and_downstream_trees
         downstream_id: downstream,
         deep_id: deep,
     }.get(artifact_id))
-    artifact_repo.list_by_ids_in_project = AsyncMock(
-        side_effect=lambda _project_id, artifact_ids: [
-            artifact
-            for artifact in (focus, upstream, downstream, deep)
-            if artifact.id in artifact_ids
-        ]
-    )
+    artifact_repo.list_ancestors_in_project = AsyncMock(return_value=[downstream])
 
     relationship_repo = AsyncMock()
-    relationship_repo.list_relationships_to_artifacts = AsyncMock(
-        side_effect=lambda _project_id, target_ids, relationship_types: (
-            [incoming]
-            if focus_id in target_ids and "blocks" in relationship_types
-            else []
-        )
-    )
-    relationship_repo.list_outgoing_relationships_from_artifacts = AsyncMock(
-        side_effect=lambda _project_id, source_ids: (
-            [outgoing]
-            if focus_id in source_ids
-            else [deep_outgoing]
-              if downstream_id in source_ids
-              else []
-        )
+    relationship_repo.trace_relationships = _traced(
+        [incoming, outgoing, deep_outgoing],
+        [focus, upstream, downstream, deep],
     )
 
     handler = GetArtifactImpactAnalysisHandler(
@@ -379,6 +400,9 @@ async def test_get_artifact_impact_analysis_builds_upstream_and_downstream_trees
     assert result.trace_to[0].relationship_label == "Impacts"
     assert len(result.trace_to[0].children) == 1
     assert result.trace_to[0].children[0].artifact_id == deep_id
+    assert [ref.id for ref in result.trace_to[0].children[0].hierarchy_path] == [downstream_id]
+    assert relationship_repo.trace_relationships.await_count == 2
+    artifact_repo.list_ancestors_in_project.assert_awaited_once()
 
 
 @pytest.mark.asyncio
@@ -432,19 +456,10 @@ async def test_get_artifact_impact_analysis_prevents_cycles_and_marks_has_more()
         focus_id: focus,
         next_id: next_artifact,
     }.get(artifact_id))
-    artifact_repo.list_by_ids_in_project = AsyncMock(
-        side_effect=lambda _project_id, artifact_ids: [
-            artifact for artifact in (focus, next_artifact) if artifact.id in artifact_ids
-        ]
-    )
+    artifact_repo.list_ancestors_in_project = AsyncMock(return_value=[focus])
 
     relationship_repo = AsyncMock()
-    relationship_repo.list_relationships_to_artifacts = AsyncMock(return_value=[])
-    relationship_repo.list_outgoing_relationships_from_artifacts = AsyncMock(
-        side_effect=lambda _project_id, source_ids: (
-            [focus_to_next] if focus_id in source_ids else [next_to_focus] if next_id in source_ids else []
-        )
-    )
+    relationship_repo.trace_relationships = _traced([focus_to_next, next_to_focus], [focus, next_artifact])
 
     handler = GetArtifactImpactAnalysisHandler(
         project_repo=project_repo,
@@ -467,3 +482,21 @@ async def test_get_artifact_impact_analysis_prevents_cycles_and_marks_has_more()
     assert result.trace_to[0].artifact_id == next_id
     assert result.trace_to[0].children == []
     assert result.trace_to[0].has_more is False
+
+
+def test_relationship_create_and_mark_deleted_register_events() -> None:
+    rel = Relationship.create(
+        project_id=uuid.uuid4(),
+        source_artifact_id=uuid.uuid4(),
+        target_artifact_id=uuid.uuid4(),
+        relationship_type="verifies",
+    )
+    (created,) = rel.collect_events()
+    rel.mark_deleted()
+    (deleted,) = rel.collect_events()
+
+    assert isinstance(created, RelationshipCreated)
+    assert isinstance(deleted, RelationshipDeleted)
+    assert created.relationship_id == deleted.relationship_id == rel.id
+    assert deleted.project_id == rel.project_id
+    assert deleted.relationship_type == "verifies"
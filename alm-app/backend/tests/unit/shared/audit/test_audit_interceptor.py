@@ -0,0 +1,57 @@
+"""AuditInterceptor: one latest-snapshot query and one bulk insert per unit of work."""
+
+from __future__ import annotations
+
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from alm.shared.audit.core import ChangeType
+from alm.shared.audit.interceptor import AUDIT_BUFFER_KEY, AuditInterceptor, buffer_audit
+
+
+def _session(latest_rows: list[SimpleNamespace]) -> MagicMock:
+    session = MagicMock()
+    session.info = {}
+    session.flush = AsyncMock()
+    session.execute = AsyncMock(side_effect=[latest_rows, None])
+    return session
+
+
+@pytest.mark.asyncio
+async def test_process_batches_lookup_and_insert_with_gapless_versions():
+    existing_id = uuid.uuid4()
+    new_id = uuid.uuid4()
+    session = _session(
+        [SimpleNamespace(global_id=f"Artifact/{existing_id}", version=3, state={"title": "a", "state": "new"})]
+    )
+    buffer_audit(session, "Artifact", existing_id, {"title": "a", "state": "active"}, ChangeType.UPDATE)
+    buffer_audit(session, "Artifact", new_id, {"title": "n"}, ChangeType.INITIAL)
+    buffer_audit(session, "Artifact", existing_id, {"title": "b", "state": "active"}, ChangeType.UPDATE)
+
+    await AuditInterceptor(session).process()
+
+    assert session.execute.await_count == 2
+    session.add.assert_called_once()
+    rows = session.execute.await_args_list[1].args[1]
+    assert [(r["global_id"], r["version"]) for r in rows] == [
+        (f"Artifact/{existing_id}", 4),
+        (f"Artifact/{new_id}", 1),
+        (f"Artifact/{existing_id}", 5),
+    ]
+    assert rows[0]["changed_properties"] == ["state"]
+    assert rows[2]["changed_properties"] == ["title"]
+    assert {r["commit_id"] for r in rows} == {session.add.call_args.args[0].id}
+    assert session.info[AUDIT_BUFFER_KEY] == []
+
+
+@pytest.mark.asyncio
+async def test_process_without_entries_is_noop():
+    session = _session([])
+
+    await AuditInterceptor(session).process()
+
+    session.execute.assert_not_awaited()
+    session.add.assert_not_called()
@@ -0,0 +1,121 @@
+"""GetEntityHistory: one joined page query, a true version count and keyset paging; GetSnapshotVersion."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import AsyncMock
+
+import pytest
+
+from alm.shared.audit.core import AuditCommit, AuditSnapshot, ChangeType, DiffEngine
+from alm.shared.audit.queries import (
+    GetEntityHistory,
+    GetEntityHistoryHandler,
+    GetSnapshotVersion,
+    GetSnapshotVersionHandler,
+)
+from alm.shared.domain.exceptions import EntityNotFound
+
+ENTITY_ID = uuid.uuid4()
+AUTHOR_ID = uuid.uuid4()
+
+
+def _version(version: int, state: dict[str, Any], prev: dict[str, Any] | None) -> tuple[AuditSnapshot, AuditCommit]:
+    commit = AuditCommit(id=uuid.uuid4(), author_id=AUTHOR_ID, tenant_id=None, committed_at=datetime.now(UTC))
+    snapshot = AuditSnapshot(
+        id=uuid.uuid4(),
+        commit_id=commit.id,
+        global_id=f"Artifact/{ENTITY_ID}",
+        entity_type="Artifact",
+        entity_id=ENTITY_ID,
+        change_type=ChangeType.INITIAL if prev is None else ChangeType.UPDATE,
+        state=state,
+        changed_properties=DiffEngine.changed_property_names(prev, state),
+        version=version,
+    )
+    return snapshot, commit
+
+
+def _reader(states: list[dict[str, Any]]) -> AsyncMock:
+    """Reader over versions 1..n of ``states``, honouring limit / before_version like the SQL implementation."""
+    history = [_version(i + 1, s, states[i - 1] if i else None) for i, s in enumerate(states)]
+    newest_first = list(reversed(history))
+
+    async def _page(
+        _entity_type: str,
+        _entity_id: uuid.UUID,
+        *,
+        limit: int,
+        before_version: int | None = None,
+        offset: int = 0,
+    ) -> list[tuple[AuditSnapshot, AuditCommit]]:
+        rows = [r for r in newest_first if before_version is None or r[0].version < before_version]
+        return rows[offset : offset + limit]
+
+    reader = AsyncMock()
+    reader.get_history_page = AsyncMock(side_effect=_page)
+    reader.count_versions = AsyncMock(return_value=len(states))
+    return reader
+
+
+STATES = [
+    {"title": "a", "state": "new"},
+    {"title": "b", "state": "new"},
+    {"title": "b", "state": "active"},
+    {"title": "c", "state": "done"},
+]
+
+
+@pytest.mark.asyncio
+async def test_pages_by_version_cursor_with_commits_from_the_page_query() -> None:
+    reader = _reader(STATES)
+    handler = GetEntityHistoryHandler(reader)
+
+    first = await handler.handle(GetEntityHistory(entity_type="Artifact", entity_id=ENTITY_ID, limit=2))
+    assert [e.snapshot.version for e in first.entries] == [4, 3]
+    assert first.total_versions == 4
+    assert first.next_before_version == 3
+    assert all(e.snapshot.author_id == AUTHOR_ID for e in first.entries)
+    # The last entry of a page is diffed against the older row fetched with it, not against nothing.
+    assert [(c.property_name, c.left, c.right) for c in first.entries[1].changes] == [("state", "new", "active")]
+
+    second = await handler.handle(
+        GetEntityHistory(entity_type="Artifact", entity_id=ENTITY_ID, limit=2, before_version=first.next_before_version)
+    )
+    assert [e.snapshot.version for e in second.entries] == [2, 1]
+    assert second.next_before_version is None
+    assert reader.get_history_page.await_count == 2
+    reader.get_commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_changes_only_uses_stored_changed_properties_without_states() -> None:
+    handler = GetEntityHistoryHandler(_reader(STATES))
+
+    full = await handler.handle(GetEntityHistory(entity_type="Artifact", entity_id=ENTITY_ID))
+    compact = await handler.handle(GetEntityHistory(entity_type="Artifact", entity_id=ENTITY_ID, changes_only=True))
+
+    def by_name(entries: list[Any]) -> list[list[Any]]:
+        return [sorted(e.changes, key=lambda c: c.property_name) for e in entries]
+
+    assert by_name(compact.entries) == by_name(full.entries)
+    assert all(e.snapshot.state == {} for e in compact.entries)
+    assert compact.entries[0].snapshot.changed_properties == ["state", "title"]
+
+
+@pytest.mark.asyncio
+async def test_snapshot_version_reads_only_that_version() -> None:
+    snapshot, commit = _version(2, STATES[1], STATES[0])
+    reader = AsyncMock()
+    reader.get_snapshot_by_version = AsyncMock(side_effect=lambda _t, _id, v: snapshot if v == 2 else None)
+    reader.get_commit = AsyncMock(return_value=commit)
+    handler = GetSnapshotVersionHandler(reader)
+
+    dto = await handler.handle(GetSnapshotVersion(entity_type="Artifact", entity_id=ENTITY_ID, version=2))
+    assert (dto.version, dto.state, dto.author_id) == (2, STATES[1], AUTHOR_ID)
+    with pytest.raises(EntityNotFound):
+        await handler.handle(GetSnapshotVersion(entity_type="Artifact", entity_id=ENTITY_ID, version=9))
+    reader.get_history_page.assert_not_awaited()
+    reader.count_versions.assert_not_awaited()
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import asyncio
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from alm.artifact.domain.events import ArtifactStateChanged
+from alm.shared.infrastructure.async_event_dispatch import AsyncEventDispatchQueue
+
+_MODULE = "alm.shared.infrastructure.async_event_dispatch"
+
+
+def _event() -> ArtifactStateChanged:
+    return ArtifactStateChanged(artifact_id=uuid.uuid4(), project_id=uuid.uuid4(), from_state="a", to_state="b")
+
+
+def _session_factory() -> MagicMock:
+    session = AsyncMock()
+    factory = MagicMock()
+    factory.return_value.__aenter__ = AsyncMock(return_value=session)
+    factory.return_value.__aexit__ = AsyncMock(return_value=None)
+    return factory
+
+
+async def _drain(queue: AsyncEventDispatchQueue) -> None:
+    task = asyncio.create_task(queue.run())
+    await queue.drain(1.0)
+    task.cancel()
+
+
+def test_submit_reports_overflow_when_queue_is_full() -> None:
+    queue = AsyncEventDispatchQueue(AsyncMock(), _session_factory(), maxsize=1, workers=1, lease_seconds=15)
+
+    assert queue.submit([_event()], [uuid.uuid4()]) is True
+    assert queue.submit([_event()], [uuid.uuid4()]) is False
+
+
+@pytest.mark.asyncio
+async def test_worker_dispatches_and_deletes_outbox_rows() -> None:
+    dispatcher = AsyncMock()
+    queue = AsyncEventDispatchQueue(dispatcher, _session_factory(), maxsize=10, workers=2, lease_seconds=15)
+    events, row_ids = [_event()], [uuid.uuid4()]
+
+    with (
+        patch(f"{_MODULE}.delete_synced_outbox_rows", AsyncMock()) as delete_rows,
+        patch(f"{_MODULE}.release_synced_outbox_rows", AsyncMock()) as release_rows,
+    ):
+        queue.submit(events, row_ids)
+        await _drain(queue)
+
+    dispatcher.dispatch.assert_awaited_once_with(events)
+    delete_rows.assert_awaited_once()
+    assert delete_rows.await_args.args[1] == row_ids
+    release_rows.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_handler_failure_hands_rows_back_to_outbox_worker() -> None:
+    dispatcher = AsyncMock()
+    dispatcher.dispatch = AsyncMock(side_effect=RuntimeError("handler failed"))
+    queue = AsyncEventDispatchQueue(dispatcher, _session_factory(), maxsize=10, workers=1, lease_seconds=15)
+    row_ids = [uuid.uuid4()]
+
+    with (
+        patch(f"{_MODULE}.delete_synced_outbox_rows", AsyncMock()) as delete_rows,
+        patch(f"{_MODULE}.release_synced_outbox_rows", AsyncMock()) as release_rows,
+    ):
+        queue.submit([_event()], row_ids)
+        await _drain(queue)
+
+    release_rows.assert_awaited_once()
+    assert release_rows.await_args.args[1] == row_ids
+    delete_rows.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_batches_past_the_sync_lease_are_left_to_the_outbox_worker() -> None:
+    dispatcher = AsyncMock()
+    queue = AsyncEventDispatchQueue(dispatcher, _session_factory(), maxsize=10, workers=1, lease_seconds=0)
+
+    with patch(f"{_MODULE}.delete_synced_outbox_rows", AsyncMock()) as delete_rows:
+        queue.submit([_event()], [uuid.uuid4()])
+        await _drain(queue)
+
+    dispatcher.dispatch.assert_not_awaited()
+    delete_rows.assert_not_awaited()
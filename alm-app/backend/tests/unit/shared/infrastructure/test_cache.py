@@ -8,7 +8,17 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 from alm.shared.infrastructure import cache as cache_module
-from alm.shared.infrastructure.cache import PermissionCache, _get_pool, get_redis
+from alm.shared.infrastructure.cache import (
+    PERMISSION_INVALIDATION_CHANNEL,
+    LocalPermissionCache,
+    LocalTenantSlugCache,
+    PermissionCache,
+    TenantLookupCache,
+    TwoTierPermissionCache,
+    _get_pool,
+    get_redis,
+)
+from alm.tenant.application.dtos import TenantDTO
 
 
 class TestConnectionPoolHelpers:
@@ -117,3 +127,170 @@ class TestPermissionCache:
         r.scan.assert_any_await(7, match=pattern, count=100)
         r.delete.assert_any_await("perm:tenant:user1", "perm:tenant:user2")
         r.delete.assert_any_await("perm:tenant:user3")
+
+
+class TestLocalPermissionCache:
+    def test_entries_expire_after_ttl(self) -> None:
+        local = LocalPermissionCache(max_entries=10, ttl_seconds=30)
+        tenant_id, user_id = uuid.uuid4(), uuid.uuid4()
+
+        with patch("alm.shared.infrastructure.cache.time.monotonic", return_value=100.0):
+            local.set(tenant_id, user_id, ["artifact:read"])
+            assert local.get(tenant_id, user_id) == ["artifact:read"]
+        with patch("alm.shared.infrastructure.cache.time.monotonic", return_value=131.0):
+            assert local.get(tenant_id, user_id) is None
+        assert len(local) == 0
+
+    def test_lru_evicts_least_recently_used(self) -> None:
+        local = LocalPermissionCache(max_entries=2, ttl_seconds=30)
+        tenant_id = uuid.uuid4()
+        a, b, c = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+
+        local.set(tenant_id, a, ["a"])
+        local.set(tenant_id, b, ["b"])
+        local.get(tenant_id, a)
+        local.set(tenant_id, c, ["c"])
+
+        assert local.get(tenant_id, b) is None
+        assert local.get(tenant_id, a) == ["a"]
+        assert local.get(tenant_id, c) == ["c"]
+
+    def test_evict_tenant_keeps_other_tenants(self) -> None:
+        local = LocalPermissionCache(max_entries=10, ttl_seconds=30)
+        t1, t2, user_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        local.set(t1, user_id, ["x"])
+        local.set(t2, user_id, ["y"])
+
+        local.evict_tenant(t1)
+
+        assert local.get(t1, user_id) is None
+        assert local.get(t2, user_id) == ["y"]
+
+    def test_zero_ttl_disables_l1(self) -> None:
+        local = LocalPermissionCache(max_entries=10, ttl_seconds=0)
+        tenant_id, user_id = uuid.uuid4(), uuid.uuid4()
+
+        local.set(tenant_id, user_id, ["x"])
+
+        assert local.get(tenant_id, user_id) is None
+
+
+class TestTwoTierPermissionCache:
+    @pytest.mark.asyncio
+    async def test_l2_hit_populates_l1_and_later_reads_skip_redis(self) -> None:
+        tenant_id, user_id = uuid.uuid4(), uuid.uuid4()
+        l2 = AsyncMock()
+        l2.get = AsyncMock(return_value=["artifact:read"])
+        cache = TwoTierPermissionCache(l2=l2, l1=LocalPermissionCache(max_entries=10, ttl_seconds=30))
+
+        assert await cache.get(tenant_id, user_id) == ["artifact:read"]
+        assert await cache.get(tenant_id, user_id) == ["artifact:read"]
+
+        l2.get.assert_awaited_once_with(tenant_id, user_id)
+
+    @pytest.mark.asyncio
+    async def test_invalidate_user_evicts_l1_deletes_l2_and_broadcasts(self) -> None:
+        tenant_id, user_id = uuid.uuid4(), uuid.uuid4()
+        local = LocalPermissionCache(max_entries=10, ttl_seconds=30)
+        local.set(tenant_id, user_id, ["artifact:read"])
+        l2 = AsyncMock()
+        r = AsyncMock()
+
+        with patch("alm.shared.infrastructure.cache.get_redis", return_value=r):
+            await TwoTierPermissionCache(l2=l2, l1=local).invalidate_user(tenant_id, user_id)
+
+        assert local.get(tenant_id, user_id) is None
+        l2.invalidate_user.assert_awaited_once_with(tenant_id, user_id)
+        r.publish.assert_awaited_once_with(
+            PERMISSION_INVALIDATION_CHANNEL,
+            json.dumps({"tenant_id": str(tenant_id), "user_id": str(user_id)}),
+        )
+
+    @pytest.mark.asyncio
+    async def test_injected_empty_l1_is_used_instead_of_the_process_cache(self) -> None:
+        tenant_id, user_id = uuid.uuid4(), uuid.uuid4()
+        local = LocalPermissionCache(max_entries=10, ttl_seconds=30)
+        l2 = AsyncMock()
+        l2.get = AsyncMock(return_value=["artifact:read"])
+        cache = TwoTierPermissionCache(l2=l2, l1=local)
+
+        await cache.get(tenant_id, user_id)
+        assert local.get(tenant_id, user_id) == ["artifact:read"]
+        assert cache_module.get_local_permission_cache().get(tenant_id, user_id) is None
+
+        with patch("alm.shared.infrastructure.cache.get_redis", return_value=AsyncMock()):
+            await cache.invalidate_tenant(tenant_id)
+        assert len(local) == 0
+
+    @pytest.mark.asyncio
+    async def test_broadcast_failure_does_not_fail_invalidation(self) -> None:
+        tenant_id = uuid.uuid4()
+        l2 = AsyncMock()
+        r = AsyncMock()
+        r.publish = AsyncMock(side_effect=ConnectionError("redis down"))
+
+        with patch("alm.shared.infrastructure.cache.get_redis", return_value=r):
+            await TwoTierPermissionCache(l2=l2, l1=LocalPermissionCache(10, 30)).invalidate_tenant(tenant_id)
+
+        l2.invalidate_tenant.assert_awaited_once_with(tenant_id)
+
+    def test_broadcast_message_from_another_worker_evicts_tenant(self) -> None:
+        tenant_id, user_id = uuid.uuid4(), uuid.uuid4()
+        local = LocalPermissionCache(max_entries=10, ttl_seconds=30)
+        local.set(tenant_id, user_id, ["x"])
+
+        with patch("alm.shared.infrastructure.cache.get_local_permission_cache", return_value=local):
+            cache_module._apply_invalidation({"tenant_id": str(tenant_id), "user_id": None}, source="broadcast")
+
+        assert local.get(tenant_id, user_id) is None
+
+
+class TestTenantSlugCache:
+    def test_entries_expire_after_ttl(self) -> None:
+        local = LocalTenantSlugCache(max_entries=10, ttl_seconds=60)
+        dto = TenantDTO(id=uuid.uuid4(), name="Acme", slug="acme", tier="pro")
+
+        with patch("alm.shared.infrastructure.cache.time.monotonic", return_value=100.0):
+            local.set("acme", dto)
+            assert local.get("acme") == dto
+        with patch("alm.shared.infrastructure.cache.time.monotonic", return_value=161.0):
+            assert local.get("acme") is None
+        assert len(local) == 0
+
+    @pytest.mark.asyncio
+    async def test_invalidate_tenant_evicts_its_slug_and_broadcasts(self) -> None:
+        local = LocalTenantSlugCache(max_entries=10, ttl_seconds=60)
+        acme = TenantDTO(id=uuid.uuid4(), name="Acme", slug="acme", tier="pro")
+        other = TenantDTO(id=uuid.uuid4(), name="Other", slug="other", tier="free")
+        local.set("acme", acme)
+        local.set("other", other)
+        r = AsyncMock()
+
+        with (
+            patch("alm.shared.infrastructure.cache.get_tenant_slug_cache", return_value=local),
+            patch("alm.shared.infrastructure.cache.get_redis", return_value=r),
+        ):
+            await TenantLookupCache().invalidate_tenant(acme.id)
+
+        assert local.get("acme") is None
+        assert local.get("other") == other
+        r.publish.assert_awaited_once_with(
+            PERMISSION_INVALIDATION_CHANNEL,
+            json.dumps({"tenant_id": str(acme.id), "scope": "org"}),
+        )
+
+    def test_org_broadcast_leaves_permission_l1_alone(self) -> None:
+        tenant_id, user_id = uuid.uuid4(), uuid.uuid4()
+        perms = LocalPermissionCache(max_entries=10, ttl_seconds=30)
+        perms.set(tenant_id, user_id, ["x"])
+        slugs = LocalTenantSlugCache(max_entries=10, ttl_seconds=60)
+        slugs.set("acme", TenantDTO(id=tenant_id, name="Acme", slug="acme", tier="pro"))
+
+        with (
+            patch("alm.shared.infrastructure.cache.get_local_permission_cache", return_value=perms),
+            patch("alm.shared.infrastructure.cache.get_tenant_slug_cache", return_value=slugs),
+        ):
+            cache_module._apply_invalidation({"tenant_id": str(tenant_id), "scope": "org"}, source="broadcast")
+
+        assert slugs.get("acme") is None
+        assert perms.get(tenant_id, user_id) == ["x"]
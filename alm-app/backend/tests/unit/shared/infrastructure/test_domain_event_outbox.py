@@ -1,19 +1,25 @@
-"""Unit tests for domain event outbox serialization (no database)."""
+"""Unit tests for domain event outbox serialization and batch dispatch (no database)."""
 
 from __future__ import annotations
 
 import uuid
 from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from alm.artifact.domain.events import ArtifactCreated, ArtifactStateChanged
 from alm.shared.infrastructure.domain_event_outbox import (
+    _aggregate_key,
+    _complete_outbox_batch,
     domain_event_to_payload,
     payload_to_domain_event,
+    process_pending_outbox_batch,
 )
 from alm.tenant.domain.events import MemberInvited
 
+_OUTBOX = "alm.shared.infrastructure.domain_event_outbox"
+
 
 def test_roundtrip_artifact_created() -> None:
     pid = uuid.uuid4()
@@ -66,3 +72,90 @@ def test_import_rejects_non_alm_types() -> None:
     }
     with pytest.raises(ValueError, match="disallowed"):
         payload_to_domain_event(packed)
+
+
+def _row(event: ArtifactStateChanged, created_at: datetime) -> dict[str, object]:
+    return {
+        "id": uuid.uuid4(),
+        "event_type": "x",
+        "payload": domain_event_to_payload(event),
+        "created_at": created_at,
+        "attempts": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_batch_keeps_aggregate_order_and_holds_rows_behind_a_failure() -> None:
+    a1, a2 = uuid.uuid4(), uuid.uuid4()
+    pid = uuid.uuid4()
+    first = _row(
+        ArtifactStateChanged(artifact_id=a1, project_id=pid, from_state="a", to_state="b"),
+        datetime(2026, 1, 1, tzinfo=UTC),
+    )
+    failing = _row(
+        ArtifactStateChanged(artifact_id=a1, project_id=pid, from_state="b", to_state="c"),
+        datetime(2026, 1, 2, tzinfo=UTC),
+    )
+    skipped = _row(
+        ArtifactStateChanged(artifact_id=a1, project_id=pid, from_state="c", to_state="d"),
+        datetime(2026, 1, 3, tzinfo=UTC),
+    )
+    other = _row(
+        ArtifactStateChanged(artifact_id=a2, project_id=pid, from_state="a", to_state="b"),
+        datetime(2026, 1, 2, tzinfo=UTC),
+    )
+    seen: list[tuple[uuid.UUID, str]] = []
+
+    async def dispatch(events: list[ArtifactStateChanged]) -> None:
+        event = events[0]
+        seen.append((event.artifact_id, event.to_state))
+        if event.to_state == "c":
+            raise RuntimeError("boom")
+
+    dispatcher = AsyncMock()
+    dispatcher.dispatch = AsyncMock(side_effect=dispatch)
+    complete = AsyncMock()
+
+    with (
+        patch("alm.shared.application.mediator.get_domain_event_dispatcher", return_value=dispatcher),
+        patch(f"{_OUTBOX}.claim_outbox_rows", AsyncMock(return_value=[first, failing, skipped, other])),
+        patch(f"{_OUTBOX}._complete_outbox_batch", complete),
+    ):
+        processed = await process_pending_outbox_batch(AsyncMock())
+
+    assert processed == 4
+    assert [s for s in seen if s[0] == a1] == [(a1, "b"), (a1, "c")]
+    assert (a2, "b") in seen
+    _, succeeded, failed = complete.await_args.args
+    assert set(succeeded) == {first["id"], other["id"]}
+    assert [(row["id"], held) for row, _, held in failed] == [(failing["id"], [skipped["id"]])]
+
+
+@pytest.mark.asyncio
+async def test_rows_held_behind_a_failure_get_its_retry_time() -> None:
+    failing = _row(
+        ArtifactStateChanged(artifact_id=uuid.uuid4(), project_id=uuid.uuid4(), from_state="a", to_state="b"),
+        datetime(2026, 1, 1, tzinfo=UTC),
+    )
+    failing["attempts"] = 2
+    skipped = uuid.uuid4()
+    session = AsyncMock()
+    session.begin = MagicMock(return_value=AsyncMock())
+    session_factory = MagicMock(return_value=AsyncMock(__aenter__=AsyncMock(return_value=session)))
+
+    await _complete_outbox_batch(session_factory, [], [(failing, RuntimeError("boom"), [skipped])])
+
+    (_, retries), (_, held) = (c.args for c in session.execute.await_args_list)
+    assert [(r["id"], r["attempts"]) for r in retries] == [(failing["id"], 3)]
+    assert held == [{"id": skipped, "locked_until": None, "next_attempt_at": retries[0]["next_attempt_at"]}]
+
+
+def test_aggregate_key_prefers_artifact_then_project_then_row() -> None:
+    aid, pid = uuid.uuid4(), uuid.uuid4()
+    row_id = uuid.uuid4()
+
+    assert _aggregate_key({"id": row_id, "payload": {"fields": {"artifact_id": str(aid), "project_id": str(pid)}}}) == (
+        f"artifact_id:{aid}"
+    )
+    assert _aggregate_key({"id": row_id, "payload": {"fields": {"project_id": str(pid)}}}) == f"project_id:{pid}"
+    assert _aggregate_key({"id": row_id, "payload": {"fields": {}}}) == f"row:{row_id}"
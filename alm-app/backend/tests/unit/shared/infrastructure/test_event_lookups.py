@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from alm.artifact.domain.events import ArtifactStateChanged
+from alm.realtime.event_handlers import on_artifact_state_changed_realtime
+from alm.shared.infrastructure.event_lookups import event_lookup_scope
+
+
+def _event(project_id: uuid.UUID, tenant_id: uuid.UUID | None = None) -> ArtifactStateChanged:
+    return ArtifactStateChanged(
+        artifact_id=uuid.uuid4(), project_id=project_id, from_state="a", to_state="b", tenant_id=tenant_id
+    )
+
+
+def _session_factory(rows: list[SimpleNamespace]) -> tuple[MagicMock, AsyncMock]:
+    session = AsyncMock()
+    session.execute = AsyncMock(return_value=rows)
+    return MagicMock(return_value=session), session
+
+
+@pytest.mark.asyncio
+async def test_project_tenants_for_the_whole_batch_load_in_one_query() -> None:
+    tenant_id = uuid.uuid4()
+    projects = [uuid.uuid4() for _ in range(3)]
+    events = [_event(pid) for pid in projects * 2]
+    factory, session = _session_factory([SimpleNamespace(id=pid, tenant_id=tenant_id) for pid in projects])
+
+    async with event_lookup_scope(events, factory) as lookups:
+        resolved = [await lookups.tenant_id_for(e) for e in events]
+
+    assert resolved == [tenant_id] * len(events)
+    factory.assert_called_once()
+    session.execute.assert_awaited_once()
+    session.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_event_tenant_needs_no_session() -> None:
+    tenant_id = uuid.uuid4()
+    factory, _ = _session_factory([])
+
+    async with event_lookup_scope([], factory) as lookups:
+        assert await lookups.tenant_id_for(_event(uuid.uuid4(), tenant_id)) == tenant_id
+
+    factory.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_nested_scope_reuses_the_enclosing_one_and_memoizes() -> None:
+    factory, _ = _session_factory([])
+    load = AsyncMock(return_value=["rule"])
+
+    async with event_lookup_scope([], factory) as outer:
+        async with event_lookup_scope([]) as inner:
+            assert inner is outer
+            assert await inner.memoized("k", load) == ["rule"]
+        assert await outer.memoized("k", load) == ["rule"]
+
+    load.assert_awaited_once()
+    factory.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_realtime_handler_publishes_to_event_tenant_without_a_lookup() -> None:
+    tenant_id = uuid.uuid4()
+    event = _event(uuid.uuid4(), tenant_id)
+
+    with (
+        patch("alm.realtime.event_handlers.publish_event", AsyncMock()) as publish,
+        patch("alm.realtime.event_handlers.event_lookup_scope") as scope,
+    ):
+        await on_artifact_state_changed_realtime(event)
+
+    scope.assert_not_called()
+    publish.assert_awaited_once()
+    assert publish.await_args.args[0] == tenant_id
@@ -1,17 +1,27 @@
 from __future__ import annotations
 
 import uuid
+from collections.abc import Iterator
 from unittest.mock import AsyncMock
 
 import pytest
 
 from alm.shared.domain.exceptions import AccessDenied
+from alm.shared.infrastructure.cache import get_tenant_slug_cache
 from alm.shared.infrastructure.org_resolver import resolve_org
+from alm.shared.infrastructure.security import auth_context
 from alm.shared.infrastructure.security.dependencies import CurrentUser
 from alm.tenant.application.dtos import TenantDTO
 from alm.tenant.application.queries.get_tenant_by_slug import GetTenantBySlug
 
 
+@pytest.fixture(autouse=True)
+def _clear_slug_cache() -> Iterator[None]:
+    get_tenant_slug_cache().clear()
+    yield
+    get_tenant_slug_cache().clear()
+
+
 @pytest.mark.asyncio
 async def test_resolve_org_returns_resolved_org_for_matching_tenant() -> None:
     tenant_id = uuid.uuid4()
@@ -40,3 +50,38 @@ async def test_resolve_org_raises_access_denied_for_mismatched_tenant() -> None:
 
     with pytest.raises(AccessDenied, match="switch to this organization first"):
         await resolve_org("acme", user=user, mediator=mediator)
+
+
+@pytest.mark.asyncio
+async def test_resolve_org_serves_repeat_lookups_from_slug_cache() -> None:
+    tenant_id = uuid.uuid4()
+    dto = TenantDTO(id=tenant_id, name="Acme", slug="acme", tier="pro")
+    mediator = AsyncMock()
+    mediator.query = AsyncMock(return_value=dto)
+    user = CurrentUser(id=uuid.uuid4(), tenant_id=tenant_id, roles=[])
+
+    await resolve_org("acme", user=user, mediator=mediator)
+    resolved = await resolve_org("acme", user=user, mediator=mediator)
+
+    assert resolved.dto == dto
+    mediator.query.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_resolve_org_reuses_request_memo_before_slug_cache() -> None:
+    tenant_id = uuid.uuid4()
+    dto = TenantDTO(id=tenant_id, name="Acme", slug="acme", tier="pro")
+    mediator = AsyncMock()
+    mediator.query = AsyncMock(return_value=dto)
+    user = CurrentUser(id=uuid.uuid4(), tenant_id=tenant_id, roles=[])
+
+    token = auth_context._request_memo.set({})
+    try:
+        await resolve_org("acme", user=user, mediator=mediator)
+        get_tenant_slug_cache().clear()
+        resolved = await resolve_org("acme", user=user, mediator=mediator)
+    finally:
+        auth_context._request_memo.reset(token)
+
+    assert resolved.tenant_id == tenant_id
+    mediator.query.assert_awaited_once()
@@ -1,113 +1,171 @@
 from __future__ import annotations
 
 import uuid
+from collections.abc import Iterator
 from types import SimpleNamespace
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from alm.shared.infrastructure.rate_limiter import check_sliding_window
+from alm.shared.infrastructure import rate_limiter
+from alm.shared.infrastructure.rate_limiter import (
+    LocalTokenBucket,
+    check_rate_limit,
+    check_sliding_window,
+    route_cost,
+)
 
 
-class _Pipe:
-    def __init__(self, execute_result: list[object]) -> None:
-        self.execute_result = execute_result
-        self.calls: list[tuple[str, tuple[object, ...], dict[str, object]]] = []
+@pytest.fixture(autouse=True)
+def _reset_module_state() -> Iterator[None]:
+    rate_limiter._script = None
+    rate_limiter._local_bucket = None
+    yield
+    rate_limiter._script = None
+    rate_limiter._local_bucket = None
 
-    def zremrangebyscore(self, *args: object, **kwargs: object) -> None:
-        self.calls.append(("zremrangebyscore", args, kwargs))
 
-    def zcard(self, *args: object, **kwargs: object) -> None:
-        self.calls.append(("zcard", args, kwargs))
-
-    def zadd(self, *args: object, **kwargs: object) -> None:
-        self.calls.append(("zadd", args, kwargs))
-
-    def expire(self, *args: object, **kwargs: object) -> None:
-        self.calls.append(("expire", args, kwargs))
-
-    async def execute(self) -> list[object]:
-        return self.execute_result
+def _redis_with_script(result: list[int]) -> tuple[SimpleNamespace, AsyncMock]:
+    script = AsyncMock(return_value=result)
+    redis_client = SimpleNamespace(register_script=MagicMock(return_value=script))
+    return redis_client, script
 
 
 @pytest.mark.asyncio
-async def test_check_sliding_window_allows_and_records_request() -> None:
+async def test_check_sliding_window_allows_in_one_script_call() -> None:
     tenant_id = uuid.uuid4()
-    first_pipe = _Pipe([None, 2])
-    second_pipe = _Pipe([None, None])
-    redis_client = SimpleNamespace(
-        pipeline=lambda: [first_pipe, second_pipe].pop(0),
-        zrange=AsyncMock(),
-    )
-    pipes = [first_pipe, second_pipe]
-    redis_client.pipeline = lambda: pipes.pop(0)
+    redis_client, script = _redis_with_script([1, 0])
 
-    with (
-        patch("alm.shared.infrastructure.rate_limiter.get_redis", return_value=redis_client),
-        patch("alm.shared.infrastructure.rate_limiter.time.time", return_value=100.0),
-    ):
+    with patch("alm.shared.infrastructure.rate_limiter.get_redis", return_value=redis_client):
         allowed, retry_after = await check_sliding_window(tenant_id, limit=3, window_seconds=60)
+        await check_sliding_window(tenant_id, limit=3, window_seconds=60)
 
     assert allowed is True
     assert retry_after == 0
-    assert [call[0] for call in first_pipe.calls] == ["zremrangebyscore", "zcard"]
-    assert [call[0] for call in second_pipe.calls] == ["zadd", "expire"]
-    redis_client.zrange.assert_not_awaited()
+    redis_client.register_script.assert_called_once()
+    assert script.await_count == 2
+    kwargs = script.await_args.kwargs
+    assert kwargs["keys"] == [f"ratelimit:tenant:{tenant_id}"]
+    assert kwargs["args"][:3] == [3, 60, 1]
 
 
 @pytest.mark.asyncio
-async def test_check_sliding_window_blocks_and_uses_oldest_score_for_retry_after() -> None:
+async def test_check_sliding_window_blocks_with_script_retry_after() -> None:
+    redis_client, _ = _redis_with_script([0, 42])
+
+    with patch("alm.shared.infrastructure.rate_limiter.get_redis", return_value=redis_client):
+        allowed, retry_after = await check_sliding_window(uuid.uuid4(), limit=3, window_seconds=60)
+
+    assert allowed is False
+    assert retry_after == 42
+
+
+@pytest.mark.asyncio
+async def test_check_sliding_window_clamps_cost_to_limit() -> None:
+    redis_client, script = _redis_with_script([1, 0])
+
+    with patch("alm.shared.infrastructure.rate_limiter.get_redis", return_value=redis_client):
+        await check_sliding_window(uuid.uuid4(), cost=50, limit=5, window_seconds=60)
+
+    assert script.await_args.kwargs["args"][2] == 5
+
+
+def test_local_token_bucket_absorbs_burst_then_refills() -> None:
     tenant_id = uuid.uuid4()
-    first_pipe = _Pipe([None, 3])
-    redis_client = SimpleNamespace(
-        pipeline=lambda: first_pipe,
-        zrange=AsyncMock(return_value=[("90.0", 90.0)]),
-    )
+    bucket = LocalTokenBucket(capacity=2, refill_per_second=1.0)
+
+    with patch("alm.shared.infrastructure.rate_limiter.time.monotonic", return_value=100.0):
+        assert bucket.try_acquire(tenant_id) == (True, 0)
+        assert bucket.try_acquire(tenant_id) == (True, 0)
+        assert bucket.try_acquire(tenant_id) == (False, 1)
+
+    with patch("alm.shared.infrastructure.rate_limiter.time.monotonic", return_value=101.5):
+        assert bucket.try_acquire(tenant_id) == (True, 0)
+
+
+def test_local_token_bucket_drain_and_tenant_cap() -> None:
+    first, second = uuid.uuid4(), uuid.uuid4()
+    bucket = LocalTokenBucket(capacity=3, refill_per_second=0.5, max_tenants=1)
+
+    with patch("alm.shared.infrastructure.rate_limiter.time.monotonic", return_value=10.0):
+        bucket.drain(first)
+        assert bucket.try_acquire(first, cost=2) == (False, 4)
+        bucket.try_acquire(second)
+
+    assert list(bucket._buckets) == [second]
+
+
+def test_route_cost_matches_configured_suffix() -> None:
+    with patch.object(rate_limiter.settings, "rate_limit_route_costs", {"/artifacts/export": 5}):
+        assert route_cost("/api/v1/orgs/acme/projects/p/artifacts/export/") == 5
+        assert route_cost("/api/v1/orgs/acme/projects/p/artifacts") == 1
+
+
+@pytest.mark.asyncio
+async def test_check_rate_limit_skips_redis_when_local_bucket_rejects() -> None:
+    tenant_id = uuid.uuid4()
+    redis_client, script = _redis_with_script([1, 0])
 
     with (
+        patch.object(rate_limiter.settings, "rate_limit_local_bucket_enabled", True),
+        patch.object(rate_limiter.settings, "rate_limit_local_burst", 1),
+        patch.object(rate_limiter.settings, "rate_limit_local_sync_cost", 1),
         patch("alm.shared.infrastructure.rate_limiter.get_redis", return_value=redis_client),
-        patch("alm.shared.infrastructure.rate_limiter.time.time", return_value=100.0),
     ):
-        allowed, retry_after = await check_sliding_window(tenant_id, limit=3, window_seconds=60)
+        assert await check_rate_limit(tenant_id, "/api/v1/projects") == (True, 0)
+        allowed, retry_after = await check_rate_limit(tenant_id, "/api/v1/projects")
 
     assert allowed is False
-    assert retry_after == 50
-    redis_client.zrange.assert_awaited_once()
+    assert retry_after >= 1
+    assert script.await_count == 1
 
 
 @pytest.mark.asyncio
-async def test_check_sliding_window_uses_minimum_retry_after_when_no_oldest() -> None:
+async def test_check_rate_limit_drains_local_bucket_after_redis_rejection() -> None:
     tenant_id = uuid.uuid4()
-    first_pipe = _Pipe([None, 99])
-    redis_client = SimpleNamespace(
-        pipeline=lambda: first_pipe,
-        zrange=AsyncMock(return_value=[]),
-    )
+    redis_client, script = _redis_with_script([0, 30])
 
     with (
+        patch.object(rate_limiter.settings, "rate_limit_local_bucket_enabled", True),
+        patch.object(rate_limiter.settings, "rate_limit_local_burst", None),
+        patch.object(rate_limiter.settings, "rate_limit_local_sync_cost", 1),
         patch("alm.shared.infrastructure.rate_limiter.get_redis", return_value=redis_client),
-        patch("alm.shared.infrastructure.rate_limiter.time.time", return_value=100.0),
     ):
-        allowed, retry_after = await check_sliding_window(tenant_id, limit=1, window_seconds=60)
+        assert await check_rate_limit(tenant_id, "/api/v1/projects") == (False, 30)
+        allowed, _ = await check_rate_limit(tenant_id, "/api/v1/projects")
 
     assert allowed is False
-    assert retry_after == 1
+    assert script.await_count == 1
 
 
 @pytest.mark.asyncio
-async def test_check_sliding_window_clamps_retry_after_to_minimum_one() -> None:
+async def test_check_rate_limit_charges_redis_once_per_batch_of_local_grants() -> None:
     tenant_id = uuid.uuid4()
-    first_pipe = _Pipe([None, 5])
-    redis_client = SimpleNamespace(
-        pipeline=lambda: first_pipe,
-        zrange=AsyncMock(return_value=[("39.9", 39.9)]),
-    )
+    redis_client, script = _redis_with_script([1, 0])
 
     with (
+        patch.object(rate_limiter.settings, "rate_limit_local_bucket_enabled", True),
+        patch.object(rate_limiter.settings, "rate_limit_local_burst", None),
+        patch.object(rate_limiter.settings, "rate_limit_local_sync_cost", 3),
+        patch.object(rate_limiter.settings, "rate_limit_local_sync_seconds", 60.0),
         patch("alm.shared.infrastructure.rate_limiter.get_redis", return_value=redis_client),
-        patch("alm.shared.infrastructure.rate_limiter.time.time", return_value=100.0),
+        patch("alm.shared.infrastructure.rate_limiter.time.monotonic", return_value=100.0),
     ):
-        allowed, retry_after = await check_sliding_window(tenant_id, limit=5, window_seconds=60)
+        results = [await check_rate_limit(tenant_id, "/api/v1/projects") for _ in range(7)]
 
-    assert allowed is False
-    assert retry_after == 1
+    assert results == [(True, 0)] * 7
+    assert [c.kwargs["args"][2] for c in script.await_args_list] == [3, 3]
+
+
+def test_unsynced_local_grants_are_charged_once_they_are_old_enough() -> None:
+    tenant_id = uuid.uuid4()
+    bucket = LocalTokenBucket(capacity=10, refill_per_second=1.0, sync_cost=5, sync_seconds=1.0)
+
+    with patch("alm.shared.infrastructure.rate_limiter.time.monotonic", return_value=10.0):
+        assert bucket.charge(tenant_id, 1) == 0
+        assert bucket.charge(tenant_id, 2) == 0
+    with patch("alm.shared.infrastructure.rate_limiter.time.monotonic", return_value=11.0):
+        assert bucket.charge(tenant_id, 1) == 4
+        assert bucket.charge(tenant_id, 1) == 0
+        bucket.drain(tenant_id)
+        assert bucket._unsynced == {}
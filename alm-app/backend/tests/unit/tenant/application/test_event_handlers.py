@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import uuid
+from unittest.mock import AsyncMock
+
+import pytest
+
+from alm.tenant.application.commands.update_tenant import UpdateTenant, UpdateTenantHandler
+from alm.tenant.application.event_handlers import create_tenant_lookup_cache_handler
+from alm.tenant.domain.entities import Tenant
+from alm.tenant.domain.events import TenantArchived, TenantCreated, TenantUpdated
+
+
+@pytest.mark.asyncio
+async def test_update_records_an_event_instead_of_evicting_before_commit() -> None:
+    tenant = Tenant(name="Acme", slug="acme")
+    repo = AsyncMock()
+    repo.find_by_id.return_value = tenant
+    repo.update.side_effect = lambda t: t
+
+    dto = await UpdateTenantHandler(repo).handle(UpdateTenant(tenant_id=tenant.id, name="Acme Ltd"))
+
+    assert dto.name == "Acme Ltd"
+    events = tenant.collect_events()
+    assert [type(e) for e in events] == [TenantUpdated]
+    assert events[0].tenant_id == tenant.id
+
+
+@pytest.mark.asyncio
+async def test_lookup_cache_handler_evicts_updated_and_archived_tenants_only() -> None:
+    cache = AsyncMock()
+    handler = create_tenant_lookup_cache_handler(cache)
+    tenant_id = uuid.uuid4()
+
+    await handler(TenantUpdated(tenant_id=tenant_id))
+    await handler(TenantArchived(tenant_id=tenant_id, archived_by=uuid.uuid4()))
+    await handler(TenantCreated(tenant_id=uuid.uuid4(), name="Other", slug="other"))
+
+    assert [c.args for c in cache.invalidate_tenant.await_args_list] == [(tenant_id,), (tenant_id,)]
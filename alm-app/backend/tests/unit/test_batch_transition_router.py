@@ -3,19 +3,15 @@
 from __future__ import annotations
 
 import uuid
-from unittest.mock import MagicMock
 
 import pytest
 
 from alm.artifact.api.schemas import BatchTransitionRequest
-from alm.artifact.application.commands.transition_artifact import TransitionArtifact
-from alm.orgs.api.router import batch_transition_artifacts
-from alm.shared.domain.exceptions import (
-    ConflictError,
-    GuardDeniedError,
-    PolicyDeniedError,
-    ValidationError,
+from alm.artifact.application.commands.batch_transition_artifacts import (
+    BatchTransitionArtifacts,
+    BatchTransitionResult,
 )
+from alm.orgs.api.router import batch_transition_artifacts
 from alm.shared.infrastructure.org_resolver import ResolvedOrg
 from alm.shared.infrastructure.security.dependencies import CurrentUser
 from alm.tenant.application.dtos import TenantDTO
@@ -29,9 +25,14 @@ def _org(tenant_id: uuid.UUID) -> ResolvedOrg:
     )
 
 
-class _MediatorOk:
-    async def send(self, cmd: object) -> MagicMock:
-        return MagicMock()
+class _MediatorBatch:
+    def __init__(self, result: BatchTransitionResult) -> None:
+        self.result = result
+        self.commands: list[object] = []
+
+    async def send(self, cmd: object) -> BatchTransitionResult:
+        self.commands.append(cmd)
+        return self.result
 
 
 @pytest.mark.asyncio
@@ -40,7 +41,7 @@ async def test_batch_transition_all_ok() -> None:
     project_id = uuid.uuid4()
     a1, a2 = uuid.uuid4(), uuid.uuid4()
     user = CurrentUser(id=uuid.uuid4(), tenant_id=tenant_id, roles=["member"])
-    mediator = _MediatorOk()
+    mediator = _MediatorBatch(BatchTransitionResult(results={a1: "ok", a2: "ok"}))
 
     resp = await batch_transition_artifacts(
         project_id=project_id,
@@ -51,6 +52,11 @@ async def test_batch_transition_all_ok() -> None:
         mediator=mediator,
     )
 
+    assert len(mediator.commands) == 1
+    cmd = mediator.commands[0]
+    assert isinstance(cmd, BatchTransitionArtifacts)
+    assert cmd.artifact_ids == (a1, a2)
+    assert cmd.all_or_nothing is False
     assert resp.success_count == 2
     assert resp.error_count == 0
     assert resp.results is not None
@@ -58,36 +64,6 @@ async def test_batch_transition_all_ok() -> None:
     assert resp.results[str(a2)] == "ok"
 
 
-class _MediatorMixed:
-    def __init__(
-        self,
-        id_ok: uuid.UUID,
-        id_guard: uuid.UUID,
-        id_policy: uuid.UUID,
-        id_val: uuid.UUID,
-        id_conflict: uuid.UUID,
-    ) -> None:
-        self._id_ok = id_ok
-        self._id_guard = id_guard
-        self._id_policy = id_policy
-        self._id_val = id_val
-        self._id_conflict = id_conflict
-
-    async def send(self, cmd: object) -> MagicMock:
-        assert isinstance(cmd, TransitionArtifact)
-        aid = cmd.artifact_id
-        if aid == self._id_guard:
-            raise GuardDeniedError("assignee required")
-        if aid == self._id_policy:
-            raise PolicyDeniedError("policy")
-        if aid == self._id_val:
-            raise ValidationError("bad state")
-        if aid == self._id_conflict:
-            raise ConflictError("stale")
-        assert aid == self._id_ok
-        return MagicMock()
-
-
 @pytest.mark.asyncio
 async def test_batch_transition_mixed_outcomes() -> None:
     tenant_id = uuid.uuid4()
@@ -99,7 +75,12 @@ async def test_batch_transition_mixed_outcomes() -> None:
     id_conflict = uuid.uuid4()
     user = CurrentUser(id=uuid.uuid4(), tenant_id=tenant_id, roles=["editor"])
 
-    mediator = _MediatorMixed(id_ok, id_guard, id_policy, id_val, id_conflict)
+    result = BatchTransitionResult(results={id_ok: "ok"})
+    result.fail(id_guard, "guard_denied", "assignee required")
+    result.fail(id_policy, "policy_denied", "policy")
+    result.fail(id_val, "validation_error", "bad state")
+    result.fail(id_conflict, "conflict_error", "stale")
+    mediator = _MediatorBatch(result)
 
     resp = await batch_transition_artifacts(
         project_id=project_id,
@@ -123,32 +104,28 @@ async def test_batch_transition_mixed_outcomes() -> None:
     assert r[str(id_val)] == "validation_error"
     assert r[str(id_conflict)] == "conflict_error"
     assert len(resp.errors) == 4
-
-
-class _MediatorRuntimeError:
-    async def send(self, cmd: object) -> MagicMock:
-        raise RuntimeError("boom")
+    assert f"{id_guard}: assignee required" in resp.errors
 
 
 @pytest.mark.asyncio
-async def test_batch_transition_unknown_exception_maps_to_validation_error() -> None:
+async def test_batch_transition_atomic_mode_is_forwarded() -> None:
     tenant_id = uuid.uuid4()
-    project_id = uuid.uuid4()
     aid = uuid.uuid4()
     user = CurrentUser(id=uuid.uuid4(), tenant_id=tenant_id, roles=[])
+    expected = {aid: "2024-01-01T00:00:00Z"}
+    mediator = _MediatorBatch(BatchTransitionResult(results={aid: "ok"}))
 
-    mediator = _MediatorRuntimeError()
-
-    resp = await batch_transition_artifacts(
-        project_id=project_id,
-        body=BatchTransitionRequest(artifact_ids=[aid], new_state="active"),
+    await batch_transition_artifacts(
+        project_id=uuid.uuid4(),
+        body=BatchTransitionRequest(artifact_ids=[aid], trigger="start", mode="atomic", expected_updated_at=expected),
         org=_org(tenant_id),
         user=user,
         _acl=None,
         mediator=mediator,
     )
 
-    assert resp.success_count == 0
-    assert resp.error_count == 1
-    assert resp.results is not None
-    assert resp.results[str(aid)] == "validation_error"
+    cmd = mediator.commands[0]
+    assert isinstance(cmd, BatchTransitionArtifacts)
+    assert cmd.all_or_nothing is True
+    assert cmd.trigger == "start"
+    assert cmd.expected_updated_at == expected
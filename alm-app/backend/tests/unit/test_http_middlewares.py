@@ -5,11 +5,15 @@ from types import SimpleNamespace
 from unittest.mock import AsyncMock, call, patch
 
 import pytest
+from fastapi.security import HTTPAuthorizationCredentials
 from starlette.requests import Request
 from starlette.responses import Response
 
+from alm.shared.domain.exceptions import AccessDenied
 from alm.shared.infrastructure.rate_limit_middleware import RateLimitMiddleware, is_scm_provider_webhook_path
-from alm.shared.infrastructure.security.jwt import InvalidTokenError
+from alm.shared.infrastructure.security.auth_context import AuthContextMiddleware, auth_context_from_scope
+from alm.shared.infrastructure.security.dependencies import get_authenticated_user_id, get_current_user
+from alm.shared.infrastructure.security.jwt import InvalidTokenError, TokenPayload
 from alm.shared.infrastructure.security_headers import SecureHeadersMiddleware
 from alm.shared.infrastructure.tenant_middleware import TenantContextMiddleware
 
@@ -36,6 +40,38 @@ async def _ok_response(_: Request) -> Response:
     return Response(content="ok", status_code=200)
 
 
+_DECODE = "alm.shared.infrastructure.security.auth_context.decode_token"
+
+
+class _RecordingApp:
+    """Inner ASGI app: records calls and answers 200 (or raises ``error``)."""
+
+    def __init__(self, error: Exception | None = None) -> None:
+        self.calls = 0
+        self.error = error
+
+    async def __call__(self, scope, receive, send) -> None:  # type: ignore[no-untyped-def]
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        await Response(content="ok", status_code=200)(scope, receive, send)
+
+
+async def _call_asgi(middleware, request: Request) -> tuple[int, dict[str, str]]:  # type: ignore[no-untyped-def]
+    messages: list[dict] = []
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict) -> None:
+        messages.append(message)
+
+    await middleware(request.scope, receive, send)
+    start = next(m for m in messages if m["type"] == "http.response.start")
+    headers = {k.decode("latin-1"): v.decode("latin-1") for k, v in start["headers"]}
+    return start["status"], headers
+
+
 class TestRateLimitMiddleware:
     def test_is_scm_provider_webhook_path(self) -> None:
         pid = uuid.uuid4()
@@ -48,177 +84,211 @@ class TestRateLimitMiddleware:
     @pytest.mark.asyncio
     async def test_bypasses_scm_provider_webhooks_with_bearer(self) -> None:
         """Proxies that forward Authorization must not burn tenant rate limit on webhooks."""
-        middleware = RateLimitMiddleware(app=AsyncMock())
+        app = _RecordingApp()
+        middleware = RateLimitMiddleware(app=app)
         tenant_id = uuid.uuid4()
         pid = uuid.uuid4()
         request = _request(
             f"/api/v1/orgs/acme/projects/{pid}/webhooks/github",
             authorization="Bearer token",
         )
-        call_next = AsyncMock(side_effect=_ok_response)
 
         with (
+            patch(_DECODE, return_value=SimpleNamespace(tid=tenant_id)) as decode,
             patch(
-                "alm.shared.infrastructure.rate_limit_middleware.decode_token",
-                return_value=SimpleNamespace(tid=tenant_id),
-            ) as decode,
-            patch(
-                "alm.shared.infrastructure.rate_limit_middleware.check_sliding_window",
+                "alm.shared.infrastructure.rate_limit_middleware.check_rate_limit",
                 new=AsyncMock(),
             ) as check,
         ):
-            response = await middleware.dispatch(request, call_next)
+            status, _ = await _call_asgi(middleware, request)
 
-        assert response.status_code == 200
+        assert status == 200
         decode.assert_not_called()
         check.assert_not_awaited()
-        call_next.assert_awaited_once()
+        assert app.calls == 1
 
     @pytest.mark.asyncio
     async def test_bypasses_non_api_paths(self) -> None:
-        middleware = RateLimitMiddleware(app=AsyncMock())
+        app = _RecordingApp()
+        middleware = RateLimitMiddleware(app=app)
         request = _request("/health")
-        call_next = AsyncMock(side_effect=_ok_response)
 
-        with patch("alm.shared.infrastructure.rate_limit_middleware.check_sliding_window", new=AsyncMock()) as check:
-            response = await middleware.dispatch(request, call_next)
+        with patch("alm.shared.infrastructure.rate_limit_middleware.check_rate_limit", new=AsyncMock()) as check:
+            status, _ = await _call_asgi(middleware, request)
 
-        assert response.status_code == 200
+        assert status == 200
         check.assert_not_awaited()
-        call_next.assert_awaited_once()
+        assert app.calls == 1
 
     @pytest.mark.asyncio
     async def test_allows_request_when_no_tenant(self) -> None:
-        middleware = RateLimitMiddleware(app=AsyncMock())
+        middleware = RateLimitMiddleware(app=_RecordingApp())
         request = _request("/api/v1/projects")
-        call_next = AsyncMock(side_effect=_ok_response)
 
-        with patch("alm.shared.infrastructure.rate_limit_middleware.check_sliding_window", new=AsyncMock()) as check:
-            response = await middleware.dispatch(request, call_next)
+        with patch("alm.shared.infrastructure.rate_limit_middleware.check_rate_limit", new=AsyncMock()) as check:
+            status, _ = await _call_asgi(middleware, request)
 
-        assert response.status_code == 200
+        assert status == 200
         check.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_bypasses_rate_limit_when_debug(self) -> None:
         """ALM_DEBUG=true: local dev should not 429 on parallel SPA requests."""
-        middleware = RateLimitMiddleware(app=AsyncMock())
+        app = _RecordingApp()
+        middleware = RateLimitMiddleware(app=app)
         tenant_id = uuid.uuid4()
         request = _request("/api/v1/projects", authorization="Bearer token")
-        call_next = AsyncMock(side_effect=_ok_response)
 
         with (
             patch("alm.shared.infrastructure.rate_limit_middleware.settings") as s,
+            patch(_DECODE, return_value=SimpleNamespace(tid=tenant_id)),
             patch(
-                "alm.shared.infrastructure.rate_limit_middleware.decode_token",
-                return_value=SimpleNamespace(tid=tenant_id),
-            ),
-            patch(
-                "alm.shared.infrastructure.rate_limit_middleware.check_sliding_window",
+                "alm.shared.infrastructure.rate_limit_middleware.check_rate_limit",
                 new=AsyncMock(),
             ) as check,
         ):
             s.debug = True
-            response = await middleware.dispatch(request, call_next)
+            status, _ = await _call_asgi(middleware, request)
 
-        assert response.status_code == 200
+        assert status == 200
         check.assert_not_awaited()
-        call_next.assert_awaited_once()
+        assert app.calls == 1
 
     @pytest.mark.asyncio
     async def test_returns_429_when_limit_exceeded(self) -> None:
-        middleware = RateLimitMiddleware(app=AsyncMock())
+        app = _RecordingApp()
+        middleware = RateLimitMiddleware(app=app)
         tenant_id = uuid.uuid4()
         request = _request("/api/v1/projects", authorization="Bearer token")
 
         with (
             patch("alm.shared.infrastructure.rate_limit_middleware.settings") as s,
+            patch(_DECODE, return_value=SimpleNamespace(tid=tenant_id)),
             patch(
-                "alm.shared.infrastructure.rate_limit_middleware.decode_token",
-                return_value=SimpleNamespace(tid=tenant_id),
-            ),
-            patch(
-                "alm.shared.infrastructure.rate_limit_middleware.check_sliding_window",
+                "alm.shared.infrastructure.rate_limit_middleware.check_rate_limit",
                 new=AsyncMock(return_value=(False, 12)),
             ) as check,
         ):
             s.debug = False
-            response = await middleware.dispatch(request, AsyncMock(side_effect=_ok_response))
+            status, headers = await _call_asgi(middleware, request)
 
-        assert response.status_code == 429
-        assert response.headers["Retry-After"] == "12"
-        check.assert_awaited_once_with(tenant_id)
+        assert status == 429
+        assert headers["retry-after"] == "12"
+        check.assert_awaited_once_with(tenant_id, "/api/v1/projects")
+        assert app.calls == 0
 
     @pytest.mark.asyncio
     async def test_ignores_invalid_token(self) -> None:
-        middleware = RateLimitMiddleware(app=AsyncMock())
+        middleware = RateLimitMiddleware(app=_RecordingApp())
         request = _request("/api/v1/projects", authorization="Bearer bad")
-        call_next = AsyncMock(side_effect=_ok_response)
 
         with (
-            patch("alm.shared.infrastructure.rate_limit_middleware.decode_token", side_effect=InvalidTokenError("bad")),
-            patch("alm.shared.infrastructure.rate_limit_middleware.check_sliding_window", new=AsyncMock()) as check,
+            patch(_DECODE, side_effect=InvalidTokenError("bad")),
+            patch("alm.shared.infrastructure.rate_limit_middleware.check_rate_limit", new=AsyncMock()) as check,
         ):
-            response = await middleware.dispatch(request, call_next)
+            status, _ = await _call_asgi(middleware, request)
 
-        assert response.status_code == 200
+        assert status == 200
         check.assert_not_awaited()
 
 
 class TestTenantContextMiddleware:
     @pytest.mark.asyncio
     async def test_sets_and_resets_tenant_context(self) -> None:
-        middleware = TenantContextMiddleware(app=AsyncMock())
+        middleware = TenantContextMiddleware(app=_RecordingApp())
         tenant_id = uuid.uuid4()
         request = _request("/api/v1/tenant", authorization="Bearer token")
-        call_next = AsyncMock(side_effect=_ok_response)
 
         with (
-            patch(
-                "alm.shared.infrastructure.tenant_middleware.decode_token",
-                return_value=SimpleNamespace(tid=tenant_id),
-            ),
+            patch(_DECODE, return_value=SimpleNamespace(tid=tenant_id)),
             patch("alm.shared.infrastructure.tenant_middleware.set_current_tenant_id") as set_tenant,
         ):
-            response = await middleware.dispatch(request, call_next)
+            status, _ = await _call_asgi(middleware, request)
 
-        assert response.status_code == 200
+        assert status == 200
         assert set_tenant.call_args_list == [call(tenant_id), call(None)]
 
     @pytest.mark.asyncio
     async def test_resets_context_even_when_handler_fails(self) -> None:
-        middleware = TenantContextMiddleware(app=AsyncMock())
+        middleware = TenantContextMiddleware(app=_RecordingApp(error=RuntimeError("boom")))
         tenant_id = uuid.uuid4()
         request = _request("/api/v1/tenant", authorization="Bearer token")
-        call_next = AsyncMock(side_effect=RuntimeError("boom"))
 
         with (
-            patch(
-                "alm.shared.infrastructure.tenant_middleware.decode_token",
-                return_value=SimpleNamespace(tid=tenant_id),
-            ),
+            patch(_DECODE, return_value=SimpleNamespace(tid=tenant_id)),
             patch("alm.shared.infrastructure.tenant_middleware.set_current_tenant_id") as set_tenant,
             pytest.raises(RuntimeError, match="boom"),
         ):
-            await middleware.dispatch(request, call_next)
+            await _call_asgi(middleware, request)
 
         assert set_tenant.call_args_list == [call(tenant_id), call(None)]
 
     @pytest.mark.asyncio
     async def test_ignores_invalid_token(self) -> None:
-        middleware = TenantContextMiddleware(app=AsyncMock())
+        middleware = TenantContextMiddleware(app=_RecordingApp())
         request = _request("/api/v1/tenant", authorization="Bearer bad")
 
         with (
-            patch("alm.shared.infrastructure.tenant_middleware.decode_token", side_effect=InvalidTokenError("bad")),
+            patch(_DECODE, side_effect=InvalidTokenError("bad")),
             patch("alm.shared.infrastructure.tenant_middleware.set_current_tenant_id") as set_tenant,
         ):
-            response = await middleware.dispatch(request, AsyncMock(side_effect=_ok_response))
+            status, _ = await _call_asgi(middleware, request)
 
-        assert response.status_code == 200
+        assert status == 200
         assert set_tenant.call_args_list == [call(None), call(None)]
 
 
+class TestAuthContextMiddleware:
+    @pytest.mark.asyncio
+    async def test_decodes_bearer_once_for_the_whole_stack(self) -> None:
+        tenant_id = uuid.uuid4()
+        user_id = uuid.uuid4()
+        app = _RecordingApp()
+        stack = AuthContextMiddleware(RateLimitMiddleware(TenantContextMiddleware(app)))
+        request = _request("/api/v1/projects", authorization="Bearer token")
+        payload = TokenPayload(sub=user_id, tid=tenant_id, roles=["admin"])
+
+        with (
+            patch(_DECODE, return_value=payload) as decode,
+            patch("alm.shared.infrastructure.rate_limit_middleware.settings") as s,
+            patch(
+                "alm.shared.infrastructure.rate_limit_middleware.check_rate_limit",
+                new=AsyncMock(return_value=(True, 0)),
+            ) as check,
+        ):
+            s.debug = False
+            status, _ = await _call_asgi(stack, request)
+            user = await get_current_user(request, HTTPAuthorizationCredentials(scheme="Bearer", credentials="token"))
+
+        assert status == 200
+        decode.assert_called_once_with("token")
+        check.assert_awaited_once_with(tenant_id, "/api/v1/projects")
+        assert (user.id, user.tenant_id, user.roles) == (user_id, tenant_id, ["admin"])
+        assert auth_context_from_scope(request.scope).payload is payload
+
+    @pytest.mark.asyncio
+    async def test_invalid_token_is_remembered_and_rejected_by_dependencies(self) -> None:
+        request = _request("/api/v1/projects", authorization="Bearer bad")
+
+        with patch(_DECODE, side_effect=InvalidTokenError("expired")) as decode:
+            await _call_asgi(AuthContextMiddleware(_RecordingApp()), request)
+            with pytest.raises(AccessDenied, match="expired"):
+                await get_authenticated_user_id(
+                    request, HTTPAuthorizationCredentials(scheme="Bearer", credentials="bad")
+                )
+
+        decode.assert_called_once_with("bad")
+
+    def test_non_bearer_authorization_is_anonymous(self) -> None:
+        request = _request("/api/v1/projects", authorization="Basic dXNlcjpwdw==")
+
+        with patch(_DECODE) as decode:
+            ctx = auth_context_from_scope(request.scope)
+
+        assert ctx.token is None and ctx.payload is None
+        decode.assert_not_called()
+
+
 class TestSecureHeadersMiddleware:
     @pytest.mark.asyncio
     async def test_adds_base_security_headers(self) -> None:
@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import uuid
+from unittest.mock import patch
 
 from alm.artifact.domain.mpc_resolver import (
     _HAS_MPC,
     _to_ast,
     acl_check,
+    acl_check_memoized,
     build_artifact_transition_policy_event,
     check_transition_policies,
     evaluate_transition_policy,
@@ -275,3 +277,37 @@ class TestMpcResolver:
         allowed, reasons = acl_check(ast, "read", "manifest", ["member"])
         assert isinstance(allowed, bool)
         assert isinstance(reasons, list)
+
+    def test_acl_check_memoized_calls_engine_once_per_role_set(self):
+        version_id = uuid.uuid4()
+        ast = _to_ast(SAMPLE_MANIFEST)
+        with (
+            patch("alm.artifact.domain.mpc_resolver._HAS_MPC", True),
+            patch(
+                "alm.artifact.domain.mpc_resolver.mpc_facade.acl_engine_check",
+                return_value=(False, ["denied"]),
+            ) as engine,
+        ):
+            first = acl_check_memoized(version_id, ast, "read", "artifact", ["viewer", "member"])
+            second = acl_check_memoized(version_id, ast, "read", "artifact", ["member", "viewer"])
+            other = acl_check_memoized(version_id, ast, "update", "artifact", ["member", "viewer"])
+
+        assert first == second == other == (False, ["denied"])
+        assert engine.call_count == 2
+
+    def test_acl_check_memoized_does_not_cache_engine_errors(self):
+        version_id = uuid.uuid4()
+        ast = _to_ast(SAMPLE_MANIFEST)
+        with (
+            patch("alm.artifact.domain.mpc_resolver._HAS_MPC", True),
+            patch(
+                "alm.artifact.domain.mpc_resolver.mpc_facade.acl_engine_check",
+                side_effect=[RuntimeError("boom"), (True, [])],
+            ) as engine,
+        ):
+            failed = acl_check_memoized(version_id, ast, "read", "artifact", ["member"])
+            recovered = acl_check_memoized(version_id, ast, "read", "artifact", ["member"])
+
+        assert failed[0] is False
+        assert recovered == (True, [])
+        assert engine.call_count == 2
@@ -1,8 +1,14 @@
-"""Unit tests for security dependencies (_matches_permission)."""
+"""Unit tests for security dependencies (_matches_permission, per-request privilege memo)."""
 
 from __future__ import annotations
 
-from alm.shared.infrastructure.security.dependencies import _matches_permission
+import uuid
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from alm.shared.infrastructure.security.auth_context import AuthContextMiddleware
+from alm.shared.infrastructure.security.dependencies import _matches_permission, get_user_privileges
 
 
 class TestMatchesPermission:
@@ -33,3 +39,23 @@ class TestMatchesPermission:
     def test_colon_format(self) -> None:
         assert _matches_permission(["resource:action"], "resource:action") is True
         assert _matches_permission(["resource:*"], "resource:other") is True
+
+
+class TestGetUserPrivilegesMemo:
+    @pytest.mark.asyncio
+    async def test_one_resolution_per_request(self) -> None:
+        tenant_id, user_id = uuid.uuid4(), uuid.uuid4()
+        seen: list[list[str]] = []
+
+        async def endpoint(scope, receive, send) -> None:  # type: ignore[no-untyped-def]
+            seen.append(await get_user_privileges(tenant_id, user_id))
+            seen.append(await get_user_privileges(tenant_id, user_id))
+
+        resolve = AsyncMock(return_value=["artifact:read"])
+        with patch("alm.shared.infrastructure.security.dependencies._resolve_user_privileges", resolve):
+            middleware = AuthContextMiddleware(endpoint)
+            await middleware({"type": "http", "headers": []}, AsyncMock(), AsyncMock())
+            await middleware({"type": "http", "headers": []}, AsyncMock(), AsyncMock())
+
+        assert seen == [["artifact:read"]] * 4
+        assert resolve.await_count == 2
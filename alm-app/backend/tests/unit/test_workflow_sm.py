@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import uuid
+from unittest.mock import MagicMock, patch
+
+from alm.artifact.domain.manifest_cache import invalidate_compiled_manifest
 from alm.artifact.domain.workflow_sm import (
     get_initial_state,
     get_permitted_triggers,
     get_transition_actions,
     get_transition_guard,
     get_workflow_def,
+    get_workflow_engine,
     is_valid_transition,
 )
 from tests.support.manifests import (
@@ -77,3 +82,38 @@ class TestWorkflowSm:
         manifest = WORKFLOW_SM_TRANSITION_GUARD_LOOKUP_MANIFEST
         assert get_transition_guard(manifest, "requirement", "new", "active") == "assignee_required"
         assert get_transition_guard(manifest, "requirement", "active", "new") is None
+
+
+class TestWorkflowEngineRegistry:
+    def test_engine_built_once_per_version_and_type(self):
+        version_id = uuid.uuid4()
+        with (
+            patch("alm.artifact.domain.workflow_sm._HAS_MPC", True),
+            patch(
+                "alm.artifact.domain.workflow_sm._build_workflow_engine", side_effect=lambda _d: MagicMock()
+            ) as build,
+        ):
+            first = get_workflow_engine(SAMPLE_MANIFEST, "requirement", version_id=version_id)
+            second = get_workflow_engine(SAMPLE_MANIFEST, "requirement", version_id=version_id)
+            other_version = get_workflow_engine(SAMPLE_MANIFEST, "requirement", version_id=uuid.uuid4())
+            uncached = get_workflow_engine(SAMPLE_MANIFEST, "requirement")
+
+        assert first is second
+        assert other_version is not first
+        assert uncached is not first
+        assert build.call_count == 3
+
+    def test_invalidating_version_drops_its_engines(self):
+        version_id = uuid.uuid4()
+        with (
+            patch("alm.artifact.domain.workflow_sm._HAS_MPC", True),
+            patch(
+                "alm.artifact.domain.workflow_sm._build_workflow_engine", side_effect=lambda _d: MagicMock()
+            ) as build,
+        ):
+            first = get_workflow_engine(SAMPLE_MANIFEST, "requirement", version_id=version_id)
+            invalidate_compiled_manifest(version_id)
+            rebuilt = get_workflow_engine(SAMPLE_MANIFEST, "requirement", version_id=version_id)
+
+        assert rebuilt is not first
+        assert build.call_count == 2
@@ -31,6 +31,9 @@ export type ArtifactSortOrder = "asc" | "desc";
 export interface ArtifactsListResult {
   items: Artifact[];
   total: number;
+  total_is_estimate?: boolean;
+  /** Keyset cursor for the next page (pass as `cursor`); null on the last page. */
+  next_cursor?: string | null;
   /** Permission-aware UI: actions the current user can perform (e.g. create when list is empty). */
   allowed_actions?: string[];
 }
@@ -31,6 +31,8 @@ export interface EntityHistoryResponse {
   entity_id: string;
   total_versions: number;
   entries: AuditChangeEntry[];
+  /** Pass as `before_version` to fetch the next (older) page; null on the last page. */
+  next_before_version?: number | null;
 }
 
 export function useEntityHistory(
@@ -1,6 +1,9 @@
 import { beforeEach, describe, expect, it, vi } from "vitest";
 import { apiClient } from "./client";
-import { fetchRequirementTraceabilityMatrix } from "./requirementTraceabilityApi";
+import {
+  fetchRequirementTraceabilityMatrix,
+  fetchRequirementTraceabilityMatrixTile,
+} from "./requirementTraceabilityApi";
 
 beforeEach(() => {
   vi.restoreAllMocks();
@@ -32,3 +35,34 @@ describe("fetchRequirementTraceabilityMatrix", () => {
     );
   });
 });
+
+describe("fetchRequirementTraceabilityMatrixTile", () => {
+  it("builds the tile endpoint with the window and filters", async () => {
+    const getSpy = vi.spyOn(apiClient, "get").mockResolvedValue({
+      data: {
+        computed_at: "2026-01-01T00:00:00Z",
+        cache_hit: true,
+        total_rows: 0,
+        total_columns: 0,
+        relationship_count: 0,
+        coverage_counts: {},
+        row_offset: 0,
+        column_offset: 0,
+        rows: [],
+        columns: [],
+        cells: [],
+      },
+    } as never);
+
+    await fetchRequirementTraceabilityMatrixTile(
+      "org",
+      "project",
+      { rowOffset: 200, rowLimit: 100, columnOffset: 50, columnLimit: 50 },
+      { under: "under-id", linkTypes: "verifies,tests" },
+    );
+
+    expect(getSpy).toHaveBeenCalledWith(
+      "/orgs/org/projects/project/requirements/traceability-matrix/tiles?under=under-id&relationship_types=verifies%2Ctests&row_offset=200&row_limit=100&column_offset=50&column_limit=50",
+    );
+  });
+});
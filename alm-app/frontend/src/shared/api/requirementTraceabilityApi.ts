@@ -1,4 +1,4 @@
-import { useQuery } from "@tanstack/react-query";
+import { keepPreviousData, useQuery } from "@tanstack/react-query";
 import { apiClient } from "./client";
 
 export type TraceabilityMatrixColumn = {
@@ -74,6 +74,48 @@ export type RequirementTraceabilityMatrixSummaryResponse = {
   child_subtrees: TraceabilityMatrixSummaryChild[];
 };
 
+export type TraceabilityMatrixTileRow = {
+  row_index: number;
+  requirement_id: string;
+  parent_id: string | null;
+  artifact_key: string | null;
+  title: string;
+  leaf_status: string;
+  linked_test_count: number;
+  status_counts: Record<string, number>;
+};
+
+export type TraceabilityMatrixTileColumn = {
+  column_index: number;
+  test_id: string;
+  artifact_key: string | null;
+  title: string;
+  status: string | null;
+  run_id: string | null;
+  run_title: string | null;
+  linked_requirement_count: number;
+};
+
+export type TraceabilityMatrixTileCell = {
+  row_index: number;
+  column_index: number;
+  relationship_type: string;
+};
+
+export type RequirementTraceabilityMatrixTileResponse = {
+  computed_at: string;
+  cache_hit: boolean;
+  total_rows: number;
+  total_columns: number;
+  relationship_count: number;
+  coverage_counts: Record<string, number>;
+  row_offset: number;
+  column_offset: number;
+  rows: TraceabilityMatrixTileRow[];
+  columns: TraceabilityMatrixTileColumn[];
+  cells: TraceabilityMatrixTileCell[];
+};
+
 export type RequirementTraceabilityMatrixParams = {
   under?: string;
   linkTypes?: string;
@@ -125,6 +167,37 @@ export async function fetchRequirementTraceabilityMatrixSummary(
   return data;
 }
 
+export type RequirementTraceabilityMatrixTileWindow = {
+  rowOffset: number;
+  rowLimit: number;
+  columnOffset: number;
+  columnLimit: number;
+};
+
+export async function fetchRequirementTraceabilityMatrixTile(
+  orgSlug: string,
+  projectId: string,
+  window: RequirementTraceabilityMatrixTileWindow,
+  params: RequirementTraceabilityMatrixParams = {},
+): Promise<RequirementTraceabilityMatrixTileResponse> {
+  const search = new URLSearchParams();
+  if (params.under) search.set("under", params.under);
+  if (params.linkTypes) search.set("relationship_types", params.linkTypes);
+  if (params.includeReverseVerifies === false) search.set("include_reverse_verifies", "false");
+  if (params.scopeRunId) search.set("scope_run_id", params.scopeRunId);
+  if (params.scopeSuiteId) search.set("scope_suite_id", params.scopeSuiteId);
+  if (params.scopeCampaignId) search.set("scope_campaign_id", params.scopeCampaignId);
+  if (params.search?.trim()) search.set("search", params.search.trim());
+  search.set("row_offset", String(window.rowOffset));
+  search.set("row_limit", String(window.rowLimit));
+  search.set("column_offset", String(window.columnOffset));
+  search.set("column_limit", String(window.columnLimit));
+  if (params.refresh) search.set("refresh", "true");
+  const url = `/orgs/${orgSlug}/projects/${projectId}/requirements/traceability-matrix/tiles?${search.toString()}`;
+  const { data } = await apiClient.get<RequirementTraceabilityMatrixTileResponse>(url);
+  return data;
+}
+
 export function useRequirementTraceabilityMatrix(
   orgSlug: string | undefined,
   projectId: string | undefined,
@@ -150,3 +223,18 @@ export function useRequirementTraceabilityMatrixSummary(
     enabled: !!orgSlug && !!projectId && enabled,
   });
 }
+
+export function useRequirementTraceabilityMatrixTile(
+  orgSlug: string | undefined,
+  projectId: string | undefined,
+  window: RequirementTraceabilityMatrixTileWindow,
+  params: RequirementTraceabilityMatrixParams,
+  enabled: boolean,
+) {
+  return useQuery({
+    queryKey: ["orgs", orgSlug, "projects", projectId, "requirements", "traceability", "tile", params, window] as const,
+    queryFn: () => fetchRequirementTraceabilityMatrixTile(orgSlug!, projectId!, window, params),
+    enabled: !!orgSlug && !!projectId && enabled,
+    placeholderData: keepPreviousData,
+  });
+}
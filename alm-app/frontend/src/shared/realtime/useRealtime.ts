@@ -1,7 +1,8 @@
 /**
  * WebSocket hook for real-time events (C1–C2).
  * Connects with access token; on artifact_state_changed invalidates that project's artifact queries
- * and shows a toast (C2 real-time feed).
+ * and shows a toast (C2 real-time feed). The server may coalesce events into
+ * { type: "batch", project_id, events: [...] } frames; those invalidate each project once and show one toast.
  */
 import { useEffect, useRef } from "react";
 import { useQueryClient } from "@tanstack/react-query";
@@ -20,6 +21,7 @@ interface RealtimeEvent {
   from_state?: string;
   to_state?: string;
   viewer_user_ids?: string[];
+  events?: RealtimeEvent[];
 }
 
 export function useRealtime(): void {
@@ -45,32 +47,44 @@ export function useRealtime(): void {
       ws.onmessage = (ev) => {
         try {
           const data = JSON.parse(ev.data as string) as RealtimeEvent;
-          // Keep lightweight local map so UI can highlight recently changed items.
-          if (data.artifact_id && data.type === "artifact_state_changed") {
-            useRealtimeStore.getState().markArtifactUpdated(data.artifact_id);
+          const events = data.type === "batch" && Array.isArray(data.events) ? data.events : [data];
+          const changedProjects = new Set<string>();
+          let lastChanged: RealtimeEvent | null = null;
+          for (const event of events) {
+            // Keep lightweight local map so UI can highlight recently changed items.
+            if (event.artifact_id && event.type === "artifact_state_changed") {
+              useRealtimeStore.getState().markArtifactUpdated(event.artifact_id);
+            }
+            // Optional forward-compatible presence contract.
+            // Server may emit: { type: "artifact_presence", artifact_id, viewer_user_ids: [] }.
+            if (
+              event.type === "artifact_presence" &&
+              event.artifact_id &&
+              Array.isArray(event.viewer_user_ids)
+            ) {
+              useRealtimeStore.getState().setArtifactPresence(event.artifact_id, event.viewer_user_ids);
+            }
+            if (event.type === "artifact_state_changed" && event.project_id) {
+              changedProjects.add(event.project_id);
+              lastChanged = event;
+            }
           }
-          // Optional forward-compatible presence contract.
-          // Server may emit: { type: "artifact_presence", artifact_id, viewer_user_ids: [] }.
-          if (
-            data.type === "artifact_presence" &&
-            data.artifact_id &&
-            Array.isArray(data.viewer_user_ids)
-          ) {
-            useRealtimeStore.getState().setArtifactPresence(data.artifact_id, data.viewer_user_ids);
-          }
-          if (data.type === "artifact_state_changed" && data.project_id) {
+          if (changedProjects.size > 0) {
             queryClient.invalidateQueries({
               predicate: (query) =>
                 Array.isArray(query.queryKey) &&
                 query.queryKey[0] === "orgs" &&
                 query.queryKey[2] === "projects" &&
-                query.queryKey[3] === data.project_id,
+                changedProjects.has(query.queryKey[3] as string),
             });
-            // C2: toast for real-time feed
+            // C2: toast for real-time feed (one per frame)
+            const changedCount = events.filter((e) => e.type === "artifact_state_changed").length;
             const msg =
-              data.to_state != null
-                ? `Artifact updated: state changed to ${data.to_state}`
-                : "Artifact updated";
+              changedCount > 1
+                ? `${changedCount} artifacts updated`
+                : lastChanged?.to_state != null
+                  ? `Artifact updated: state changed to ${lastChanged.to_state}`
+                  : "Artifact updated";
             useNotificationStore.getState().showNotification(msg, "info");
           }
         } catch {